@@ -4,692 +4,841 @@
 #include <array>
 #include "primitives.h"
 
-// Atan lookup table with 513 entries
+#if defined(__AVX2__)
+#include <immintrin.h>
+#endif
+
+// Set to 1 to evaluate LookupAtanFast with a table-free minimax polynomial
+// instead of the lookup table (smaller footprint, slower per call)
+#ifndef FIXED64_MATH_ATAN_FAST_USE_POLY
+#define FIXED64_MATH_ATAN_FAST_USE_POLY 0
+#endif
+
+// Atan lookup table with 513 segments (512 intervals plus the atan(1) end sentinel)
 // Covers the range [0,1] with values in Q31.32 format
-// Generated with mpmath library at 100 digits precision
+// Generated with mpmath library at 30 digits precision
 
 namespace math::fp::detail {
-// Table maps x in [0,1] to atan(x)
+// The table splits [0,1] into 2^kAtanLutBits intervals
+inline constexpr int kAtanLutBits = 9;
+
+// Cubic Hermite segment of atan in the local variable t in [0,1):
+// atan(x) ~= ((a*t + b)*t + c)*t + d, with the derivatives scaled by the step size
+struct AtanSegment {
+    int32_t a;
+    int32_t b;
+    int32_t c;
+    uint32_t d;
+};
+
+// Table maps each interval of [0,1] to its Hermite coefficients, built from
+// the endpoint values atan(x) and derivatives atan'(x) = 1/(1+x^2)
 // Values stored in Q31.32 fixed-point format
-inline constexpr std::array<int64_t, 513> kAtanLut = {
-    0x0000000000000000LL,  // atan(0.00000000000) = 0.00000000000
-    0x0000000000804015LL,  // atan(0.00195694716) = 0.00195694466
-    0x0000000001007FEALL,  // atan(0.00391389432) = 0.00391387434
-    0x000000000180BF3ELL,  // atan(0.00587084149) = 0.00587077404
-    0x000000000200FDD1LL,  // atan(0.00782778865) = 0.00782762877
-    0x0000000002813B63LL,  // atan(0.00978473581) = 0.00978442356
-    0x00000000030177B3LL,  // atan(0.01174168297) = 0.01174114342
-    0x000000000381B280LL,  // atan(0.01369863014) = 0.01369777337
-    0x000000000401EB8BLL,  // atan(0.01565557730) = 0.01565429844
-    0x0000000004822294LL,  // atan(0.01761252446) = 0.01761070366
-    0x0000000005025759LL,  // atan(0.01956947162) = 0.01956697406
-    0x000000000582899BLL,  // atan(0.02152641879) = 0.02152309469
-    0x000000000602B91ALL,  // atan(0.02348336595) = 0.02347905060
-    0x000000000682E595LL,  // atan(0.02544031311) = 0.02543482684
-    0x0000000007030ECCLL,  // atan(0.02739726027) = 0.02739040847
-    0x000000000783347FLL,  // atan(0.02935420744) = 0.02934578058
-    0x000000000803566FLL,  // atan(0.03131115460) = 0.03130092825
-    0x000000000883745ALL,  // atan(0.03326810176) = 0.03325583656
-    0x0000000009038E01LL,  // atan(0.03522504892) = 0.03521049063
-    0x000000000983A325LL,  // atan(0.03718199609) = 0.03716487557
-    0x000000000A03B384LL,  // atan(0.03913894325) = 0.03911897651
-    0x000000000A83BEE0LL,  // atan(0.04109589041) = 0.04107277859
-    0x000000000B03C4F9LL,  // atan(0.04305283757) = 0.04302626697
-    0x000000000B83C58FLL,  // atan(0.04500978474) = 0.04497942681
-    0x000000000C03C062LL,  // atan(0.04696673190) = 0.04693224330
-    0x000000000C83B532LL,  // atan(0.04892367906) = 0.04888470165
-    0x000000000D03A3C1LL,  // atan(0.05088062622) = 0.05083678706
-    0x000000000D838BCFLL,  // atan(0.05283757339) = 0.05278848478
-    0x000000000E036D1DLL,  // atan(0.05479452055) = 0.05473978005
-    0x000000000E83476ALL,  // atan(0.05675146771) = 0.05669065814
-    0x000000000F031A79LL,  // atan(0.05870841487) = 0.05864110435
-    0x000000000F82E60ALL,  // atan(0.06066536204) = 0.06059110398
-    0x000000001002A9DDLL,  // atan(0.06262230920) = 0.06254064235
-    0x00000000108265B5LL,  // atan(0.06457925636) = 0.06448970483
-    0x0000000011021951LL,  // atan(0.06653620352) = 0.06643827678
-    0x000000001181C475LL,  // atan(0.06849315068) = 0.06838634359
-    0x00000000120166E0LL,  // atan(0.07045009785) = 0.07033389068
-    0x0000000012810054LL,  // atan(0.07240704501) = 0.07228090350
-    0x0000000013009093LL,  // atan(0.07436399217) = 0.07422736750
-    0x000000001380175FLL,  // atan(0.07632093933) = 0.07617326817
-    0x0000000013FF9479LL,  // atan(0.07827788650) = 0.07811859104
-    0x00000000147F07A4LL,  // atan(0.08023483366) = 0.08006332163
-    0x0000000014FE70A0LL,  // atan(0.08219178082) = 0.08200744553
-    0x00000000157DCF31LL,  // atan(0.08414872798) = 0.08395094831
-    0x0000000015FD2318LL,  // atan(0.08610567515) = 0.08589381561
-    0x00000000167C6C19LL,  // atan(0.08806262231) = 0.08783603308
-    0x0000000016FBA9F5LL,  // atan(0.09001956947) = 0.08977758639
-    0x00000000177ADC6FLL,  // atan(0.09197651663) = 0.09171846126
-    0x0000000017FA034ALL,  // atan(0.09393346380) = 0.09365864343
-    0x0000000018791E49LL,  // atan(0.09589041096) = 0.09559811866
-    0x0000000018F82D2ELL,  // atan(0.09784735812) = 0.09753687277
-    0x0000000019772FBELL,  // atan(0.09980430528) = 0.09947489159
-    0x0000000019F625BALL,  // atan(0.10176125245) = 0.10141216099
-    0x000000001A750EE8LL,  // atan(0.10371819961) = 0.10334866687
-    0x000000001AF3EB09LL,  // atan(0.10567514677) = 0.10528439516
-    0x000000001B72B9E3LL,  // atan(0.10763209393) = 0.10721933184
-    0x000000001BF17B39LL,  // atan(0.10958904110) = 0.10915346291
-    0x000000001C702ECFLL,  // atan(0.11154598826) = 0.11108677441
-    0x000000001CEED468LL,  // atan(0.11350293542) = 0.11301925243
-    0x000000001D6D6BCBLL,  // atan(0.11545988258) = 0.11495088307
-    0x000000001DEBF4BALL,  // atan(0.11741682975) = 0.11688165248
-    0x000000001E6A6EFCLL,  // atan(0.11937377691) = 0.11881154687
-    0x000000001EE8DA54LL,  // atan(0.12133072407) = 0.12074055246
-    0x000000001F673687LL,  // atan(0.12328767123) = 0.12266865550
-    0x000000001FE5835CLL,  // atan(0.12524461840) = 0.12459584233
-    0x000000002063C096LL,  // atan(0.12720156556) = 0.12652209927
-    0x0000000020E1EDFCLL,  // atan(0.12915851272) = 0.12844741272
-    0x0000000021600B54LL,  // atan(0.13111545988) = 0.13037176911
-    0x0000000021DE1863LL,  // atan(0.13307240705) = 0.13229515491
-    0x00000000225C14F0LL,  // atan(0.13502935421) = 0.13421755664
-    0x0000000022DA00C0LL,  // atan(0.13698630137) = 0.13613896085
-    0x000000002357DB9ALL,  // atan(0.13894324853) = 0.13805935415
-    0x0000000023D5A546LL,  // atan(0.14090019569) = 0.13997872317
-    0x0000000024535D88LL,  // atan(0.14285714286) = 0.14189705460
-    0x0000000024D1042ALL,  // atan(0.14481409002) = 0.14381433519
-    0x00000000254E98F1LL,  // atan(0.14677103718) = 0.14573055171
-    0x0000000025CC1BA6LL,  // atan(0.14872798434) = 0.14764569098
-    0x0000000026498C0FLL,  // atan(0.15068493151) = 0.14955973987
-    0x0000000026C6E9F5LL,  // atan(0.15264187867) = 0.15147268531
-    0x0000000027443520LL,  // atan(0.15459882583) = 0.15338451426
-    0x0000000027C16D58LL,  // atan(0.15655577299) = 0.15529521374
-    0x00000000283E9265LL,  // atan(0.15851272016) = 0.15720477080
-    0x0000000028BBA410LL,  // atan(0.16046966732) = 0.15911317256
-    0x000000002938A222LL,  // atan(0.16242661448) = 0.16102040617
-    0x0000000029B58C64LL,  // atan(0.16438356164) = 0.16292645885
-    0x000000002A32629FLL,  // atan(0.16634050881) = 0.16483131786
-    0x000000002AAF249DLL,  // atan(0.16829745597) = 0.16673497050
-    0x000000002B2BD227LL,  // atan(0.17025440313) = 0.16863740414
-    0x000000002BA86B08LL,  // atan(0.17221135029) = 0.17053860620
-    0x000000002C24EF09LL,  // atan(0.17416829746) = 0.17243856413
-    0x000000002CA15DF5LL,  // atan(0.17612524462) = 0.17433726545
-    0x000000002D1DB797LL,  // atan(0.17808219178) = 0.17623469774
-    0x000000002D99FBB9LL,  // atan(0.18003913894) = 0.17813084861
-    0x000000002E162A26LL,  // atan(0.18199608611) = 0.18002570575
-    0x000000002E9242AALL,  // atan(0.18395303327) = 0.18191925688
-    0x000000002F0E4511LL,  // atan(0.18590998043) = 0.18381148979
-    0x000000002F8A3125LL,  // atan(0.18786692759) = 0.18570239232
-    0x00000000300606B4LL,  // atan(0.18982387476) = 0.18759195237
-    0x000000003081C589LL,  // atan(0.19178082192) = 0.18948015788
-    0x0000000030FD6D71LL,  // atan(0.19373776908) = 0.19136699686
-    0x000000003178FE38LL,  // atan(0.19569471624) = 0.19325245738
-    0x0000000031F477ACLL,  // atan(0.19765166341) = 0.19513652755
-    0x00000000326FD999LL,  // atan(0.19960861057) = 0.19701919555
-    0x0000000032EB23CELL,  // atan(0.20156555773) = 0.19890044961
-    0x0000000033665617LL,  // atan(0.20352250489) = 0.20078027803
-    0x0000000033E17044LL,  // atan(0.20547945205) = 0.20265866915
-    0x00000000345C7221LL,  // atan(0.20743639922) = 0.20453561138
-    0x0000000034D75B7ELL,  // atan(0.20939334638) = 0.20641109319
-    0x0000000035522C2ALL,  // atan(0.21135029354) = 0.20828510311
-    0x0000000035CCE3F2LL,  // atan(0.21330724070) = 0.21015762971
-    0x00000000364782A7LL,  // atan(0.21526418787) = 0.21202866165
-    0x0000000036C20818LL,  // atan(0.21722113503) = 0.21389818763
-    0x00000000373C7415LL,  // atan(0.21917808219) = 0.21576619641
-    0x0000000037B6C66DLL,  // atan(0.22113502935) = 0.21763267681
-    0x000000003830FEF1LL,  // atan(0.22309197652) = 0.21949761774
-    0x0000000038AB1D72LL,  // atan(0.22504892368) = 0.22136100812
-    0x00000000392521C0LL,  // atan(0.22700587084) = 0.22322283698
-    0x00000000399F0BACLL,  // atan(0.22896281800) = 0.22508309337
-    0x000000003A18DB08LL,  // atan(0.23091976517) = 0.22694176645
-    0x000000003A928FA6LL,  // atan(0.23287671233) = 0.22879884539
-    0x000000003B0C2956LL,  // atan(0.23483365949) = 0.23065431945
-    0x000000003B85A7ECLL,  // atan(0.23679060665) = 0.23250817797
-    0x000000003BFF0B39LL,  // atan(0.23874755382) = 0.23436041031
-    0x000000003C785311LL,  // atan(0.24070450098) = 0.23621100593
-    0x000000003CF17F46LL,  // atan(0.24266144814) = 0.23805995434
-    0x000000003D6A8FABLL,  // atan(0.24461839530) = 0.23990724510
-    0x000000003DE38415LL,  // atan(0.24657534247) = 0.24175286786
-    0x000000003E5C5C56LL,  // atan(0.24853228963) = 0.24359681233
-    0x000000003ED51843LL,  // atan(0.25048923679) = 0.24543906825
-    0x000000003F4DB7B0LL,  // atan(0.25244618395) = 0.24727962547
-    0x000000003FC63A72LL,  // atan(0.25440313112) = 0.24911847388
-    0x00000000403EA05DLL,  // atan(0.25636007828) = 0.25095560345
-    0x0000000040B6E947LL,  // atan(0.25831702544) = 0.25279100419
-    0x00000000412F1506LL,  // atan(0.26027397260) = 0.25462466619
-    0x0000000041A7236ELL,  // atan(0.26223091977) = 0.25645657963
-    0x00000000421F1456LL,  // atan(0.26418786693) = 0.25828673470
-    0x000000004296E794LL,  // atan(0.26614481409) = 0.26011512172
-    0x00000000430E9D00LL,  // atan(0.26810176125) = 0.26194173102
-    0x000000004386346FLL,  // atan(0.27005870841) = 0.26376655303
-    0x0000000043FDADB8LL,  // atan(0.27201565558) = 0.26558957823
-    0x00000000447508B4LL,  // atan(0.27397260274) = 0.26741079718
-    0x0000000044EC453ALL,  // atan(0.27592954990) = 0.26923020050
-    0x0000000045636321LL,  // atan(0.27788649706) = 0.27104777888
-    0x0000000045DA6243LL,  // atan(0.27984344423) = 0.27286352306
-    0x0000000046514278LL,  // atan(0.28180039139) = 0.27467742388
-    0x0000000046C80398LL,  // atan(0.28375733855) = 0.27648947221
-    0x00000000473EA57DLL,  // atan(0.28571428571) = 0.27829965901
-    0x0000000047B52801LL,  // atan(0.28767123288) = 0.28010797530
-    0x00000000482B8AFCLL,  // atan(0.28962818004) = 0.28191441217
-    0x0000000048A1CE49LL,  // atan(0.29158512720) = 0.28371896079
-    0x000000004917F1C3LL,  // atan(0.29354207436) = 0.28552161237
-    0x00000000498DF543LL,  // atan(0.29549902153) = 0.28732235821
-    0x000000004A03D8A6LL,  // atan(0.29745596869) = 0.28912118967
-    0x000000004A799BC5LL,  // atan(0.29941291585) = 0.29091809818
-    0x000000004AEF3E7DLL,  // atan(0.30136986301) = 0.29271307522
-    0x000000004B64C0A9LL,  // atan(0.30332681018) = 0.29450611238
-    0x000000004BDA2225LL,  // atan(0.30528375734) = 0.29629720128
-    0x000000004C4F62CELL,  // atan(0.30724070450) = 0.29808633362
-    0x000000004CC48280LL,  // atan(0.30919765166) = 0.29987350117
-    0x000000004D398118LL,  // atan(0.31115459883) = 0.30165869576
-    0x000000004DAE5E74LL,  // atan(0.31311154599) = 0.30344190932
-    0x000000004E231A71LL,  // atan(0.31506849315) = 0.30522313379
-    0x000000004E97B4EDLL,  // atan(0.31702544031) = 0.30700236124
-    0x000000004F0C2DC5LL,  // atan(0.31898238748) = 0.30877958377
-    0x000000004F8084D9LL,  // atan(0.32093933464) = 0.31055479356
-    0x000000004FF4BA07LL,  // atan(0.32289628180) = 0.31232798285
-    0x000000005068CD2FLL,  // atan(0.32485322896) = 0.31409914397
-    0x0000000050DCBE2ELL,  // atan(0.32681017613) = 0.31586826930
-    0x0000000051508CE5LL,  // atan(0.32876712329) = 0.31763535129
-    0x0000000051C43934LL,  // atan(0.33072407045) = 0.31940038246
-    0x000000005237C2FCLL,  // atan(0.33268101761) = 0.32116335540
-    0x0000000052AB2A1BLL,  // atan(0.33463796477) = 0.32292426278
-    0x00000000531E6E74LL,  // atan(0.33659491194) = 0.32468309731
-    0x0000000053918FE7LL,  // atan(0.33855185910) = 0.32643985179
-    0x0000000054048E56LL,  // atan(0.34050880626) = 0.32819451910
-    0x00000000547769A2LL,  // atan(0.34246575342) = 0.32994709215
-    0x0000000054EA21ADLL,  // atan(0.34442270059) = 0.33169756395
-    0x00000000555CB659LL,  // atan(0.34637964775) = 0.33344592756
-    0x0000000055CF278ALL,  // atan(0.34833659491) = 0.33519217613
-    0x0000000056417521LL,  // atan(0.35029354207) = 0.33693630286
-    0x0000000056B39F02LL,  // atan(0.35225048924) = 0.33867830103
-    0x000000005725A511LL,  // atan(0.35420743640) = 0.34041816396
-    0x0000000057978730LL,  // atan(0.35616438356) = 0.34215588508
-    0x0000000058094544LL,  // atan(0.35812133072) = 0.34389145786
-    0x00000000587ADF32LL,  // atan(0.36007827789) = 0.34562487585
-    0x0000000058EC54DDLL,  // atan(0.36203522505) = 0.34735613265
-    0x00000000595DA62BLL,  // atan(0.36399217221) = 0.34908522196
-    0x0000000059CED301LL,  // atan(0.36594911937) = 0.35081213751
-    0x000000005A3FDB44LL,  // atan(0.36790606654) = 0.35253687312
-    0x000000005AB0BEDALL,  // atan(0.36986301370) = 0.35425942268
-    0x000000005B217DA9LL,  // atan(0.37181996086) = 0.35597978014
-    0x000000005B921798LL,  // atan(0.37377690802) = 0.35769793951
-    0x000000005C028C8CLL,  // atan(0.37573385519) = 0.35941389488
-    0x000000005C72DC6DLL,  // atan(0.37769080235) = 0.36112764041
-    0x000000005CE30722LL,  // atan(0.37964774951) = 0.36283917031
-    0x000000005D530C92LL,  // atan(0.38160469667) = 0.36454847886
-    0x000000005DC2ECA6LL,  // atan(0.38356164384) = 0.36625556043
-    0x000000005E32A744LL,  // atan(0.38551859100) = 0.36796040943
-    0x000000005EA23C56LL,  // atan(0.38747553816) = 0.36966302034
-    0x000000005F11ABC5LL,  // atan(0.38943248532) = 0.37136338773
-    0x000000005F80F578LL,  // atan(0.39138943249) = 0.37306150620
-    0x000000005FF0195ALL,  // atan(0.39334637965) = 0.37475737045
-    0x00000000605F1753LL,  // atan(0.39530332681) = 0.37645097521
-    0x0000000060CDEF4DLL,  // atan(0.39726027397) = 0.37814231532
-    0x00000000613CA133LL,  // atan(0.39921722114) = 0.37983138565
-    0x0000000061AB2CEELL,  // atan(0.40117416830) = 0.38151818115
-    0x000000006219926ALL,  // atan(0.40313111546) = 0.38320269683
-    0x000000006287D191LL,  // atan(0.40508806262) = 0.38488492778
-    0x0000000062F5EA4ELL,  // atan(0.40704500978) = 0.38656486912
-    0x000000006363DC8DLL,  // atan(0.40900195695) = 0.38824251608
-    0x0000000063D1A839LL,  // atan(0.41095890411) = 0.38991786393
-    0x00000000643F4D3FLL,  // atan(0.41291585127) = 0.39159090800
-    0x0000000064ACCB8ALL,  // atan(0.41487279843) = 0.39326164370
-    0x00000000651A2307LL,  // atan(0.41682974560) = 0.39493006648
-    0x00000000658753A3LL,  // atan(0.41878669276) = 0.39659617189
-    0x0000000065F45D4CLL,  // atan(0.42074363992) = 0.39825995552
-    0x0000000066613FEDLL,  // atan(0.42270058708) = 0.39992141301
-    0x0000000066CDFB76LL,  // atan(0.42465753425) = 0.40158054011
-    0x00000000673A8FD3LL,  // atan(0.42661448141) = 0.40323733258
-    0x0000000067A6FCF4LL,  // atan(0.42857142857) = 0.40489178629
-    0x00000000681342C6LL,  // atan(0.43052837573) = 0.40654389713
-    0x00000000687F6138LL,  // atan(0.43248532290) = 0.40819366108
-    0x0000000068EB583ALL,  // atan(0.43444227006) = 0.40984107418
-    0x00000000695727B9LL,  // atan(0.43639921722) = 0.41148613253
-    0x0000000069C2CFA7LL,  // atan(0.43835616438) = 0.41312883228
-    0x000000006A2E4FF3LL,  // atan(0.44031311155) = 0.41476916966
-    0x000000006A99A88CLL,  // atan(0.44227005871) = 0.41640714096
-    0x000000006B04D963LL,  // atan(0.44422700587) = 0.41804274251
-    0x000000006B6FE269LL,  // atan(0.44618395303) = 0.41967597073
-    0x000000006BDAC38ELL,  // atan(0.44814090020) = 0.42130682208
-    0x000000006C457CC4LL,  // atan(0.45009784736) = 0.42293529310
-    0x000000006CB00DFBLL,  // atan(0.45205479452) = 0.42456138036
-    0x000000006D1A7726LL,  // atan(0.45401174168) = 0.42618508053
-    0x000000006D84B837LL,  // atan(0.45596868885) = 0.42780639031
-    0x000000006DEED11FLL,  // atan(0.45792563601) = 0.42942530647
-    0x000000006E58C1D1LL,  // atan(0.45988258317) = 0.43104182584
-    0x000000006EC28A3FLL,  // atan(0.46183953033) = 0.43265594531
-    0x000000006F2C2A5DLL,  // atan(0.46379647750) = 0.43426766183
-    0x000000006F95A21DLL,  // atan(0.46575342466) = 0.43587697241
-    0x000000006FFEF173LL,  // atan(0.46771037182) = 0.43748387410
-    0x0000000070681853LL,  // atan(0.46966731898) = 0.43908836405
-    0x0000000070D116B0LL,  // atan(0.47162426614) = 0.44069043942
-    0x000000007139EC7FLL,  // atan(0.47358121331) = 0.44229009746
-    0x0000000071A299B4LL,  // atan(0.47553816047) = 0.44388733547
-    0x00000000720B1E44LL,  // atan(0.47749510763) = 0.44548215081
-    0x0000000072737A23LL,  // atan(0.47945205479) = 0.44707454089
-    0x0000000072DBAD48LL,  // atan(0.48140900196) = 0.44866450318
-    0x000000007343B7A6LL,  // atan(0.48336594912) = 0.45025203520
-    0x0000000073AB9933LL,  // atan(0.48532289628) = 0.45183713455
-    0x00000000741351E7LL,  // atan(0.48727984344) = 0.45341979886
-    0x00000000747AE1B6LL,  // atan(0.48923679061) = 0.45500002582
-    0x0000000074E24897LL,  // atan(0.49119373777) = 0.45657781320
-    0x0000000075498681LL,  // atan(0.49315068493) = 0.45815315880
-    0x0000000075B09B6ALL,  // atan(0.49510763209) = 0.45972606048
-    0x000000007617874ALL,  // atan(0.49706457926) = 0.46129651615
-    0x00000000767E4A18LL,  // atan(0.49902152642) = 0.46286452380
-    0x0000000076E4E3CBLL,  // atan(0.50097847358) = 0.46443008145
-    0x00000000774B545BLL,  // atan(0.50293542074) = 0.46599318719
-    0x0000000077B19BC0LL,  // atan(0.50489236791) = 0.46755383913
-    0x000000007817B9F2LL,  // atan(0.50684931507) = 0.46911203549
-    0x00000000787DAEEALL,  // atan(0.50880626223) = 0.47066777449
-    0x0000000078E37AA1LL,  // atan(0.51076320939) = 0.47222105443
-    0x0000000079491D0FLL,  // atan(0.51272015656) = 0.47377187366
-    0x0000000079AE962DLL,  // atan(0.51467710372) = 0.47532023059
-    0x000000007A13E5F5LL,  // atan(0.51663405088) = 0.47686612366
-    0x000000007A790C61LL,  // atan(0.51859099804) = 0.47840955139
-    0x000000007ADE096ALL,  // atan(0.52054794521) = 0.47995051232
-    0x000000007B42DD0ALL,  // atan(0.52250489237) = 0.48148900507
-    0x000000007BA7873BLL,  // atan(0.52446183953) = 0.48302502829
-    0x000000007C0C07F9LL,  // atan(0.52641878669) = 0.48455858070
-    0x000000007C705F3DLL,  // atan(0.52837573386) = 0.48608966106
-    0x000000007CD48D02LL,  // atan(0.53033268102) = 0.48761826818
-    0x000000007D389144LL,  // atan(0.53228962818) = 0.48914440092
-    0x000000007D9C6BFFLL,  // atan(0.53424657534) = 0.49066805819
-    0x000000007E001D2CLL,  // atan(0.53620352250) = 0.49218923895
-    0x000000007E63A4C9LL,  // atan(0.53816046967) = 0.49370794222
-    0x000000007EC702D1LL,  // atan(0.54011741683) = 0.49522416705
-    0x000000007F2A3741LL,  // atan(0.54207436399) = 0.49673791255
-    0x000000007F8D4214LL,  // atan(0.54403131115) = 0.49824917788
-    0x000000007FF02347LL,  // atan(0.54598825832) = 0.49975796223
-    0x000000008052DAD8LL,  // atan(0.54794520548) = 0.50126426487
-    0x0000000080B568C2LL,  // atan(0.54990215264) = 0.50276808509
-    0x000000008117CD04LL,  // atan(0.55185909980) = 0.50426942224
-    0x00000000817A079BLL,  // atan(0.55381604697) = 0.50576827571
-    0x0000000081DC1884LL,  // atan(0.55577299413) = 0.50726464495
-    0x00000000823DFFBDLL,  // atan(0.55772994129) = 0.50875852943
-    0x00000000829FBD44LL,  // atan(0.55968688845) = 0.51024992869
-    0x0000000083015117LL,  // atan(0.56164383562) = 0.51173884232
-    0x000000008362BB35LL,  // atan(0.56360078278) = 0.51322526992
-    0x0000000083C3FB9CLL,  // atan(0.56555772994) = 0.51470921118
-    0x000000008425124CLL,  // atan(0.56751467710) = 0.51619066581
-    0x000000008485FF42LL,  // atan(0.56947162427) = 0.51766963356
-    0x0000000084E6C27ELL,  // atan(0.57142857143) = 0.51914611425
-    0x0000000085475C00LL,  // atan(0.57338551859) = 0.52062010770
-    0x0000000085A7CBC6LL,  // atan(0.57534246575) = 0.52209161383
-    0x00000000860811D2LL,  // atan(0.57729941292) = 0.52356063255
-    0x0000000086682E22LL,  // atan(0.57925636008) = 0.52502716386
-    0x0000000086C820B6LL,  // atan(0.58121330724) = 0.52649120776
-    0x000000008727E990LL,  // atan(0.58317025440) = 0.52795276432
-    0x00000000878788AFLL,  // atan(0.58512720157) = 0.52941183365
-    0x0000000087E6FE14LL,  // atan(0.58708414873) = 0.53086841589
-    0x00000000884649C0LL,  // atan(0.58904109589) = 0.53232251123
-    0x0000000088A56BB4LL,  // atan(0.59099804305) = 0.53377411991
-    0x00000000890463F1LL,  // atan(0.59295499022) = 0.53522324219
-    0x0000000089633278LL,  // atan(0.59491193738) = 0.53666987839
-    0x0000000089C1D74BLL,  // atan(0.59686888454) = 0.53811402885
-    0x000000008A20526CLL,  // atan(0.59882583170) = 0.53955569398
-    0x000000008A7EA3DBLL,  // atan(0.60078277886) = 0.54099487420
-    0x000000008ADCCB9DLL,  // atan(0.60273972603) = 0.54243156999
-    0x000000008B3AC9B2LL,  // atan(0.60469667319) = 0.54386578186
-    0x000000008B989E1DLL,  // atan(0.60665362035) = 0.54529751036
-    0x000000008BF648E1LL,  // atan(0.60861056751) = 0.54672675608
-    0x000000008C53CA00LL,  // atan(0.61056751468) = 0.54815351965
-    0x000000008CB1217DLL,  // atan(0.61252446184) = 0.54957780174
-    0x000000008D0E4F5BLL,  // atan(0.61448140900) = 0.55099960305
-    0x000000008D6B539DLL,  // atan(0.61643835616) = 0.55241892432
-    0x000000008DC82E47LL,  // atan(0.61839530333) = 0.55383576634
-    0x000000008E24DF5DLL,  // atan(0.62035225049) = 0.55525012991
-    0x000000008E8166E1LL,  // atan(0.62230919765) = 0.55666201590
-    0x000000008EDDC4D8LL,  // atan(0.62426614481) = 0.55807142519
-    0x000000008F39F945LL,  // atan(0.62622309198) = 0.55947835872
-    0x000000008F96042DLL,  // atan(0.62818003914) = 0.56088281743
-    0x000000008FF1E595LL,  // atan(0.63013698630) = 0.56228480234
-    0x00000000904D9D7FLL,  // atan(0.63209393346) = 0.56368431447
-    0x0000000090A92BF2LL,  // atan(0.63405088063) = 0.56508135490
-    0x00000000910490F2LL,  // atan(0.63600782779) = 0.56647592472
-    0x00000000915FCC84LL,  // atan(0.63796477495) = 0.56786802508
-    0x0000000091BADEACLL,  // atan(0.63992172211) = 0.56925765714
-    0x000000009215C770LL,  // atan(0.64187866928) = 0.57064482212
-    0x00000000927086D6LL,  // atan(0.64383561644) = 0.57202952125
-    0x0000000092CB1CE2LL,  // atan(0.64579256360) = 0.57341175580
-    0x000000009325899ALL,  // atan(0.64774951076) = 0.57479152709
-    0x00000000937FCD05LL,  // atan(0.64970645793) = 0.57616883644
-    0x0000000093D9E728LL,  // atan(0.65166340509) = 0.57754368525
-    0x000000009433D808LL,  // atan(0.65362035225) = 0.57891607490
-    0x00000000948D9FADLL,  // atan(0.65557729941) = 0.58028600683
-    0x0000000094E73E1DLL,  // atan(0.65753424658) = 0.58165348251
-    0x000000009540B35DLL,  // atan(0.65949119374) = 0.58301850345
-    0x000000009599FF75LL,  // atan(0.66144814090) = 0.58438107117
-    0x0000000095F3226BLL,  // atan(0.66340508806) = 0.58574118723
-    0x00000000964C1C46LL,  // atan(0.66536203523) = 0.58709885323
-    0x0000000096A4ED0DLL,  // atan(0.66731898239) = 0.58845407079
-    0x0000000096FD94C7LL,  // atan(0.66927592955) = 0.58980684155
-    0x000000009756137BLL,  // atan(0.67123287671) = 0.59115716722
-    0x0000000097AE6932LL,  // atan(0.67318982387) = 0.59250504948
-    0x00000000980695F1LL,  // atan(0.67514677104) = 0.59385049010
-    0x00000000985E99C1LL,  // atan(0.67710371820) = 0.59519349084
-    0x0000000098B674AALL,  // atan(0.67906066536) = 0.59653405349
-    0x00000000990E26B3LL,  // atan(0.68101761252) = 0.59787217989
-    0x000000009965AFE5LL,  // atan(0.68297455969) = 0.59920787189
-    0x0000000099BD1047LL,  // atan(0.68493150685) = 0.60054113138
-    0x000000009A1447E1LL,  // atan(0.68688845401) = 0.60187196027
-    0x000000009A6B56BDLL,  // atan(0.68884540117) = 0.60320036049
-    0x000000009AC23CE2LL,  // atan(0.69080234834) = 0.60452633402
-    0x000000009B18FA59LL,  // atan(0.69275929550) = 0.60584988284
-    0x000000009B6F8F2ALL,  // atan(0.69471624266) = 0.60717100899
-    0x000000009BC5FB5FLL,  // atan(0.69667318982) = 0.60848971450
-    0x000000009C1C3F01LL,  // atan(0.69863013699) = 0.60980600145
-    0x000000009C725A17LL,  // atan(0.70058708415) = 0.61111987193
-    0x000000009CC84CADLL,  // atan(0.70254403131) = 0.61243132808
-    0x000000009D1E16CALL,  // atan(0.70450097847) = 0.61374037203
-    0x000000009D73B878LL,  // atan(0.70645792564) = 0.61504700598
-    0x000000009DC931C0LL,  // atan(0.70841487280) = 0.61635123211
-    0x000000009E1E82ADLL,  // atan(0.71037181996) = 0.61765305265
-    0x000000009E73AB47LL,  // atan(0.71232876712) = 0.61895246985
-    0x000000009EC8AB99LL,  // atan(0.71428571429) = 0.62024948598
-    0x000000009F1D83ACLL,  // atan(0.71624266145) = 0.62154410335
-    0x000000009F72338BLL,  // atan(0.71819960861) = 0.62283632426
-    0x000000009FC6BB3FLL,  // atan(0.72015655577) = 0.62412615107
-    0x00000000A01B1AD2LL,  // atan(0.72211350294) = 0.62541358615
-    0x00000000A06F5250LL,  // atan(0.72407045010) = 0.62669863188
-    0x00000000A0C361C1LL,  // atan(0.72602739726) = 0.62798129067
-    0x00000000A1174932LL,  // atan(0.72798434442) = 0.62926156497
-    0x00000000A16B08ABLL,  // atan(0.72994129159) = 0.63053945722
-    0x00000000A1BEA038LL,  // atan(0.73189823875) = 0.63181496992
-    0x00000000A2120FE4LL,  // atan(0.73385518591) = 0.63308810556
-    0x00000000A26557BALL,  // atan(0.73581213307) = 0.63435886666
-    0x00000000A2B877C3LL,  // atan(0.73776908023) = 0.63562725577
-    0x00000000A30B700DLL,  // atan(0.73972602740) = 0.63689327545
-    0x00000000A35E40A0LL,  // atan(0.74168297456) = 0.63815692830
-    0x00000000A3B0E98ALL,  // atan(0.74363992172) = 0.63941821691
-    0x00000000A4036AD4LL,  // atan(0.74559686888) = 0.64067714391
-    0x00000000A455C48BLL,  // atan(0.74755381605) = 0.64193371196
-    0x00000000A4A7F6B9LL,  // atan(0.74951076321) = 0.64318792371
-    0x00000000A4FA016BLL,  // atan(0.75146771037) = 0.64443978186
-    0x00000000A54BE4ACLL,  // atan(0.75342465753) = 0.64568928911
-    0x00000000A59DA087LL,  // atan(0.75538160470) = 0.64693644818
-    0x00000000A5EF3509LL,  // atan(0.75733855186) = 0.64818126183
-    0x00000000A640A23DLL,  // atan(0.75929549902) = 0.64942373281
-    0x00000000A691E830LL,  // atan(0.76125244618) = 0.65066386390
-    0x00000000A6E306ECLL,  // atan(0.76320939335) = 0.65190165791
-    0x00000000A733FE80LL,  // atan(0.76516634051) = 0.65313711766
-    0x00000000A784CEF5LL,  // atan(0.76712328767) = 0.65437024597
-    0x00000000A7D5785ALL,  // atan(0.76908023483) = 0.65560104571
-    0x00000000A825FABALL,  // atan(0.77103718200) = 0.65682951974
-    0x00000000A8765621LL,  // atan(0.77299412916) = 0.65805567095
-    0x00000000A8C68A9DLL,  // atan(0.77495107632) = 0.65927950225
-    0x00000000A9169839LL,  // atan(0.77690802348) = 0.66050101656
-    0x00000000A9667F02LL,  // atan(0.77886497065) = 0.66172021682
-    0x00000000A9B63F05LL,  // atan(0.78082191781) = 0.66293710598
-    0x00000000AA05D84FLL,  // atan(0.78277886497) = 0.66415168702
-    0x00000000AA554AECLL,  // atan(0.78473581213) = 0.66536396292
-    0x00000000AAA496EALL,  // atan(0.78669275930) = 0.66657393668
-    0x00000000AAF3BC55LL,  // atan(0.78864970646) = 0.66778161133
-    0x00000000AB42BB3BLL,  // atan(0.79060665362) = 0.66898698990
-    0x00000000AB9193A8LL,  // atan(0.79256360078) = 0.67019007544
-    0x00000000ABE045A9LL,  // atan(0.79452054795) = 0.67139087100
-    0x00000000AC2ED14DLL,  // atan(0.79647749511) = 0.67258937968
-    0x00000000AC7D36A0LL,  // atan(0.79843444227) = 0.67378560456
-    0x00000000ACCB75AFLL,  // atan(0.80039138943) = 0.67497954876
-    0x00000000AD198E88LL,  // atan(0.80234833659) = 0.67617121538
-    0x00000000AD678139LL,  // atan(0.80430528376) = 0.67736060758
-    0x00000000ADB54DCELL,  // atan(0.80626223092) = 0.67854772850
-    0x00000000AE02F456LL,  // atan(0.80821917808) = 0.67973258130
-    0x00000000AE5074DELL,  // atan(0.81017612524) = 0.68091516916
-    0x00000000AE9DCF74LL,  // atan(0.81213307241) = 0.68209549527
-    0x00000000AEEB0426LL,  // atan(0.81409001957) = 0.68327356283
-    0x00000000AF381301LL,  // atan(0.81604696673) = 0.68444937506
-    0x00000000AF84FC14LL,  // atan(0.81800391389) = 0.68562293518
-    0x00000000AFD1BF6BLL,  // atan(0.81996086106) = 0.68679424645
-    0x00000000B01E5D16LL,  // atan(0.82191780822) = 0.68796331211
-    0x00000000B06AD522LL,  // atan(0.82387475538) = 0.68913013542
-    0x00000000B0B7279DLL,  // atan(0.82583170254) = 0.69029471966
-    0x00000000B1035496LL,  // atan(0.82778864971) = 0.69145706813
-    0x00000000B14F5C1ALL,  // atan(0.82974559687) = 0.69261718412
-    0x00000000B19B3E38LL,  // atan(0.83170254403) = 0.69377507095
-    0x00000000B1E6FAFELL,  // atan(0.83365949119) = 0.69493073193
-    0x00000000B232927BLL,  // atan(0.83561643836) = 0.69608417040
-    0x00000000B27E04BCLL,  // atan(0.83757338552) = 0.69723538972
-    0x00000000B2C951D0LL,  // atan(0.83953033268) = 0.69838439322
-    0x00000000B31479C7LL,  // atan(0.84148727984) = 0.69953118428
-    0x00000000B35F7CADLL,  // atan(0.84344422701) = 0.70067576628
-    0x00000000B3AA5A92LL,  // atan(0.84540117417) = 0.70181814259
-    0x00000000B3F51384LL,  // atan(0.84735812133) = 0.70295831663
-    0x00000000B43FA792LL,  // atan(0.84931506849) = 0.70409629179
-    0x00000000B48A16CBLL,  // atan(0.85127201566) = 0.70523207149
-    0x00000000B4D4613DLL,  // atan(0.85322896282) = 0.70636565915
-    0x00000000B51E86F7LL,  // atan(0.85518590998) = 0.70749705822
-    0x00000000B5688807LL,  // atan(0.85714285714) = 0.70862627213
-    0x00000000B5B2647ELL,  // atan(0.85909980431) = 0.70975330433
-    0x00000000B5FC1C69LL,  // atan(0.86105675147) = 0.71087815830
-    0x00000000B645AFD7LL,  // atan(0.86301369863) = 0.71200083750
-    0x00000000B68F1ED8LL,  // atan(0.86497064579) = 0.71312134540
-    0x00000000B6D8697ALL,  // atan(0.86692759295) = 0.71423968550
-    0x00000000B7218FCDLL,  // atan(0.86888454012) = 0.71535586129
-    0x00000000B76A91DFLL,  // atan(0.87084148728) = 0.71646987628
-    0x00000000B7B36FBFLL,  // atan(0.87279843444) = 0.71758173397
-    0x00000000B7FC297DLL,  // atan(0.87475538160) = 0.71869143789
-    0x00000000B844BF28LL,  // atan(0.87671232877) = 0.71979899157
-    0x00000000B88D30CFLL,  // atan(0.87866927593) = 0.72090439853
-    0x00000000B8D57E81LL,  // atan(0.88062622309) = 0.72200766232
-    0x00000000B91DA84DLL,  // atan(0.88258317025) = 0.72310878648
-    0x00000000B965AE43LL,  // atan(0.88454011742) = 0.72420777458
-    0x00000000B9AD9072LL,  // atan(0.88649706458) = 0.72530463018
-    0x00000000B9F54EE9LL,  // atan(0.88845401174) = 0.72639935684
-    0x00000000BA3CE9B8LL,  // atan(0.89041095890) = 0.72749195815
-    0x00000000BA8460EELL,  // atan(0.89236790607) = 0.72858243768
-    0x00000000BACBB49ALL,  // atan(0.89432485323) = 0.72967079902
-    0x00000000BB12E4CCLL,  // atan(0.89628180039) = 0.73075704577
-    0x00000000BB59F194LL,  // atan(0.89823874755) = 0.73184118152
-    0x00000000BBA0DB00LL,  // atan(0.90019569472) = 0.73292320989
-    0x00000000BBE7A121LL,  // atan(0.90215264188) = 0.73400313449
-    0x00000000BC2E4406LL,  // atan(0.90410958904) = 0.73508095894
-    0x00000000BC74C3BELL,  // atan(0.90606653620) = 0.73615668685
-    0x00000000BCBB2059LL,  // atan(0.90802348337) = 0.73723032186
-    0x00000000BD0159E7LL,  // atan(0.90998043053) = 0.73830186760
-    0x00000000BD477078LL,  // atan(0.91193737769) = 0.73937132771
-    0x00000000BD8D641ALL,  // atan(0.91389432485) = 0.74043870584
-    0x00000000BDD334DELL,  // atan(0.91585127202) = 0.74150400562
-    0x00000000BE18E2D3LL,  // atan(0.91780821918) = 0.74256723073
-    0x00000000BE5E6E09LL,  // atan(0.91976516634) = 0.74362838481
-    0x00000000BEA3D68FLL,  // atan(0.92172211350) = 0.74468747152
-    0x00000000BEE91C77LL,  // atan(0.92367906067) = 0.74574449454
-    0x00000000BF2E3FCELL,  // atan(0.92563600783) = 0.74679945754
-    0x00000000BF7340A6LL,  // atan(0.92759295499) = 0.74785236418
-    0x00000000BFB81F0DLL,  // atan(0.92954990215) = 0.74890321816
-    0x00000000BFFCDB14LL,  // atan(0.93150684932) = 0.74995202314
-    0x00000000C04174CBLL,  // atan(0.93346379648) = 0.75099878282
-    0x00000000C085EC41LL,  // atan(0.93542074364) = 0.75204350089
-    0x00000000C0CA4186LL,  // atan(0.93737769080) = 0.75308618103
-    0x00000000C10E74AALL,  // atan(0.93933463796) = 0.75412682696
-    0x00000000C15285BELL,  // atan(0.94129158513) = 0.75516544236
-    0x00000000C19674D0LL,  // atan(0.94324853229) = 0.75620203094
-    0x00000000C1DA41F0LL,  // atan(0.94520547945) = 0.75723659641
-    0x00000000C21DED30LL,  // atan(0.94716242661) = 0.75826914247
-    0x00000000C261769ELL,  // atan(0.94911937378) = 0.75929967284
-    0x00000000C2A4DE4BLL,  // atan(0.95107632094) = 0.76032819123
-    0x00000000C2E82446LL,  // atan(0.95303326810) = 0.76135470136
-    0x00000000C32B48A0LL,  // atan(0.95499021526) = 0.76237920694
-    0x00000000C36E4B69LL,  // atan(0.95694716243) = 0.76340171170
-    0x00000000C3B12CB0LL,  // atan(0.95890410959) = 0.76442221936
-    0x00000000C3F3EC86LL,  // atan(0.96086105675) = 0.76544073365
-    0x00000000C4368AFALL,  // atan(0.96281800391) = 0.76645725830
-    0x00000000C479081CLL,  // atan(0.96477495108) = 0.76747179703
-    0x00000000C4BB63FELL,  // atan(0.96673189824) = 0.76848435358
-    0x00000000C4FD9EADLL,  // atan(0.96868884540) = 0.76949493168
-    0x00000000C53FB83CLL,  // atan(0.97064579256) = 0.77050353506
-    0x00000000C581B0B9LL,  // atan(0.97260273973) = 0.77151016747
-    0x00000000C5C38835LL,  // atan(0.97455968689) = 0.77251483263
-    0x00000000C6053EC0LL,  // atan(0.97651663405) = 0.77351753429
-    0x00000000C646D46ALL,  // atan(0.97847358121) = 0.77451827619
-    0x00000000C6884943LL,  // atan(0.98043052838) = 0.77551706207
-    0x00000000C6C99D5ALL,  // atan(0.98238747554) = 0.77651389567
-    0x00000000C70AD0C1LL,  // atan(0.98434442270) = 0.77750878074
-    0x00000000C74BE387LL,  // atan(0.98630136986) = 0.77850172101
-    0x00000000C78CD5BCLL,  // atan(0.98825831703) = 0.77949272024
-    0x00000000C7CDA771LL,  // atan(0.99021526419) = 0.78048178216
-    0x00000000C80E58B5LL,  // atan(0.99217221135) = 0.78146891053
-    0x00000000C84EE999LL,  // atan(0.99412915851) = 0.78245410910
-    0x00000000C88F5A2CLL,  // atan(0.99608610568) = 0.78343738160
-    0x00000000C8CFAA7FLL,  // atan(0.99804305284) = 0.78441873178
-    0x00000000C90FDAA2LL,  // atan(1.00000000000) = 0.78539816340
-    0x00000000C90FDAA2LL   // atan(1.00000000000) = 0.78539816340
+// On ELF targets the table gets its own .rodata.math_trig_lut.* input section so a
+// linker script can group the trig tables, e.g. KEEP(*(SORT(.rodata.math_trig_lut.*)))
+// inside .rodata; the default scripts simply fold it into .rodata
+#if defined(__GNUC__) && defined(__ELF__)
+[[gnu::section(".rodata.math_trig_lut.atan")]]
+#endif
+alignas(64) inline constexpr std::array<AtanSegment, 513> kAtanTable = {{
+    {-10, -1, 8388608, 0x00000000},    // [0.00000000000, 0.00195312500]
+    {-12, -30, 8388576, 0x007FFFF5},   // [0.00195312500, 0.00390625000]
+    {-10, -65, 8388480, 0x00FFFFAB},   // [0.00390625000, 0.00585937500]
+    {-10, -97, 8388320, 0x017FFEE0},   // [0.00585937500, 0.00781250000]
+    {-12, -126, 8388096, 0x01FFFD55},  // [0.00781250000, 0.00976562500]
+    {-10, -161, 8387808, 0x027FFACB},  // [0.00976562500, 0.01171875000]
+    {-12, -190, 8387456, 0x02FFF700},  // [0.01171875000, 0.01367187500]
+    {-10, -225, 8387040, 0x037FF1B6},  // [0.01367187500, 0.01562500000]
+    {-11, -255, 8386560, 0x03FFEAAB},  // [0.01562500000, 0.01757812500]
+    {-12, -286, 8386017, 0x047FE1A1},  // [0.01757812500, 0.01953125000]
+    {-11, -319, 8385409, 0x04FFD658},  // [0.01953125000, 0.02148437500]
+    {-9, -354, 8384738, 0x057FC88F},   // [0.02148437500, 0.02343750000]
+    {-10, -385, 8384003, 0x05FFB806},  // [0.02343750000, 0.02539062500]
+    {-12, -413, 8383203, 0x067FA47E},  // [0.02539062500, 0.02734375000]
+    {-11, -447, 8382341, 0x06FF8DB8},  // [0.02734375000, 0.02929687500]
+    {-10, -480, 8381414, 0x077F7373},  // [0.02929687500, 0.03125000000]
+    {-10, -512, 8380424, 0x07FF556F},  // [0.03125000000, 0.03320312500]
+    {-11, -542, 8379370, 0x087F336D},  // [0.03320312500, 0.03515625000]
+    {-11, -574, 8378253, 0x08FF0D2E},  // [0.03515625000, 0.03710937500]
+    {-10, -607, 8377072, 0x097EE272},  // [0.03710937500, 0.03906250000]
+    {-10, -639, 8375828, 0x09FEB2F9},  // [0.03906250000, 0.04101562500]
+    {-9, -672, 8374520, 0x0A7E7E84},   // [0.04101562500, 0.04296875000]
+    {-11, -701, 8373149, 0x0AFE44D3},  // [0.04296875000, 0.04492187500]
+    {-10, -734, 8371714, 0x0B7E05A8},  // [0.04492187500, 0.04687500000]
+    {-10, -765, 8370216, 0x0BFDC0C2},  // [0.04687500000, 0.04882812500]
+    {-10, -797, 8368656, 0x0C7D75E3},  // [0.04882812500, 0.05078125000]
+    {-11, -827, 8367032, 0x0CFD24CC},  // [0.05078125000, 0.05273437500]
+    {-10, -860, 8365345, 0x0D7CCD3E},  // [0.05273437500, 0.05468750000]
+    {-9, -893, 8363595, 0x0DFC6EF9},   // [0.05468750000, 0.05664062500]
+    {-11, -921, 8361782, 0x0E7C09BE},  // [0.05664062500, 0.05859375000]
+    {-9, -956, 8359907, 0x0EFB9D50},   // [0.05859375000, 0.06054687500]
+    {-12, -982, 8357968, 0x0F7B296E},  // [0.06054687500, 0.06250000000]
+    {-10, -1017, 8355968, 0x0FFAADDC}, // [0.06250000000, 0.06445312500]
+    {-10, -1048, 8353904, 0x107A2A59}, // [0.06445312500, 0.06640625000]
+    {-12, -1076, 8351778, 0x10F99EA7}, // [0.06640625000, 0.06835937500]
+    {-10, -1110, 8349590, 0x11790A89}, // [0.06835937500, 0.07031250000]
+    {-10, -1141, 8347340, 0x11F86DBF}, // [0.07031250000, 0.07226562500]
+    {-11, -1171, 8345028, 0x1277C80C}, // [0.07226562500, 0.07421875000]
+    {-10, -1203, 8342653, 0x12F71932}, // [0.07421875000, 0.07617187500]
+    {-8, -1237, 8340217, 0x137660F2},  // [0.07617187500, 0.07812500000]
+    {-10, -1265, 8337719, 0x13F59F0E}, // [0.07812500000, 0.08007812500]
+    {-10, -1296, 8335159, 0x1474D34A}, // [0.08007812500, 0.08203125000]
+    {-11, -1325, 8332537, 0x14F3FD67}, // [0.08203125000, 0.08398437500]
+    {-12, -1354, 8329854, 0x15731D28}, // [0.08398437500, 0.08593750000]
+    {-9, -1389, 8327110, 0x15F23250},  // [0.08593750000, 0.08789062500]
+    {-11, -1417, 8324305, 0x16713CA0}, // [0.08789062500, 0.08984375000]
+    {-9, -1450, 8321438, 0x16F03BDD},  // [0.08984375000, 0.09179687500]
+    {-11, -1478, 8318511, 0x176F2FC8}, // [0.09179687500, 0.09375000000]
+    {-11, -1508, 8315522, 0x17EE1826}, // [0.09375000000, 0.09570312500]
+    {-9, -1541, 8312473, 0x186CF4B9},  // [0.09570312500, 0.09765625000]
+    {-10, -1570, 8309364, 0x18EBC544}, // [0.09765625000, 0.09960937500]
+    {-11, -1599, 8306194, 0x196A898C}, // [0.09960937500, 0.10156250000]
+    {-10, -1630, 8302963, 0x19E94154}, // [0.10156250000, 0.10351562500]
+    {-10, -1660, 8299673, 0x1A67EC5F}, // [0.10351562500, 0.10546875000]
+    {-9, -1692, 8296323, 0x1AE68A72},  // [0.10546875000, 0.10742187500]
+    {-10, -1720, 8292912, 0x1B651B50}, // [0.10742187500, 0.10937500000]
+    {-11, -1748, 8289442, 0x1BE39EBE}, // [0.10937500000, 0.11132812500]
+    {-9, -1781, 8285913, 0x1C621481},  // [0.11132812500, 0.11328125000]
+    {-10, -1809, 8282324, 0x1CE07C5C}, // [0.11328125000, 0.11523437500]
+    {-9, -1840, 8278676, 0x1D5ED615},  // [0.11523437500, 0.11718750000]
+    {-10, -1868, 8274969, 0x1DDD2170}, // [0.11718750000, 0.11914062500]
+    {-9, -1899, 8271203, 0x1E5B5E33},  // [0.11914062500, 0.12109375000]
+    {-8, -1930, 8267378, 0x1ED98C22},  // [0.12109375000, 0.12304687500]
+    {-12, -1953, 8263494, 0x1F57AB02}, // [0.12304687500, 0.12500000000]
+    {-10, -1985, 8259552, 0x1FD5BA9B}, // [0.12500000000, 0.12695312500]
+    {-10, -2014, 8255552, 0x2053BAB0}, // [0.12695312500, 0.12890625000]
+    {-10, -2043, 8251494, 0x20D1AB08}, // [0.12890625000, 0.13085937500]
+    {-11, -2070, 8247378, 0x214F8B69}, // [0.13085937500, 0.13281250000]
+    {-9, -2102, 8243205, 0x21CD5B9A},  // [0.13281250000, 0.13476562500]
+    {-9, -2131, 8238974, 0x224B1B60},  // [0.13476562500, 0.13671875000]
+    {-10, -2158, 8234685, 0x22C8CA82}, // [0.13671875000, 0.13867187500]
+    {-10, -2186, 8230339, 0x234668C7}, // [0.13867187500, 0.14062500000]
+    {-9, -2216, 8225937, 0x23C3F5F6},  // [0.14062500000, 0.14257812500]
+    {-8, -2246, 8221478, 0x244171D6},  // [0.14257812500, 0.14453125000]
+    {-9, -2273, 8216962, 0x24BEDC2E},  // [0.14453125000, 0.14648437500]
+    {-10, -2299, 8212389, 0x253C34C6}, // [0.14648437500, 0.14843750000]
+    {-9, -2329, 8207761, 0x25B97B66},  // [0.14843750000, 0.15039062500]
+    {-10, -2355, 8203076, 0x2636AFD5}, // [0.15039062500, 0.15234375000]
+    {-8, -2386, 8198336, 0x26B3D1DC},  // [0.15234375000, 0.15429687500]
+    {-11, -2409, 8193540, 0x2730E142}, // [0.15429687500, 0.15625000000]
+    {-9, -2440, 8188689, 0x27ADDDD2},  // [0.15625000000, 0.15820312500]
+    {-9, -2467, 8183782, 0x282AC752},  // [0.15820312500, 0.16015625000]
+    {-10, -2493, 8178821, 0x28A79D8C}, // [0.16015625000, 0.16210937500]
+    {-9, -2522, 8173805, 0x2924604A},  // [0.16210937500, 0.16406250000]
+    {-9, -2549, 8168734, 0x29A10F54},  // [0.16406250000, 0.16601562500]
+    {-9, -2576, 8163609, 0x2A1DAA74},  // [0.16601562500, 0.16796875000]
+    {-9, -2603, 8158430, 0x2A9A3174},  // [0.16796875000, 0.16992187500]
+    {-9, -2630, 8153197, 0x2B16A41E},  // [0.16992187500, 0.17187500000]
+    {-10, -2655, 8147910, 0x2B93023C}, // [0.17187500000, 0.17382812500]
+    {-9, -2683, 8142570, 0x2C0F4B99},  // [0.17382812500, 0.17578125000]
+    {-10, -2708, 8137177, 0x2C8B7FFF}, // [0.17578125000, 0.17773437500]
+    {-7, -2739, 8131731, 0x2D079F3A},  // [0.17773437500, 0.17968750000]
+    {-8, -2764, 8126232, 0x2D83A913},  // [0.17968750000, 0.18164062500]
+    {-8, -2790, 8120680, 0x2DFF9D57},  // [0.18164062500, 0.18359375000]
+    {-8, -2816, 8115076, 0x2E7B7BD1},  // [0.18359375000, 0.18554687500]
+    {-10, -2839, 8109420, 0x2EF7444D}, // [0.18554687500, 0.18750000000]
+    {-8, -2868, 8103712, 0x2F72F698},  // [0.18750000000, 0.18945312500]
+    {-9, -2892, 8097952, 0x2FEE927C},  // [0.18945312500, 0.19140625000]
+    {-10, -2916, 8092141, 0x306A17C7}, // [0.19140625000, 0.19335937500]
+    {-9, -2943, 8086279, 0x30E58646},  // [0.19335937500, 0.19531250000]
+    {-9, -2968, 8080366, 0x3160DDC5},  // [0.19531250000, 0.19726562500]
+    {-8, -2995, 8074403, 0x31DC1E12},  // [0.19726562500, 0.19921875000]
+    {-8, -3020, 8068389, 0x325746FA},  // [0.19921875000, 0.20117187500]
+    {-8, -3045, 8062325, 0x32D2584B},  // [0.20117187500, 0.20312500000]
+    {-8, -3070, 8056211, 0x334D51D3},  // [0.20312500000, 0.20507812500]
+    {-7, -3096, 8050047, 0x33C83360},  // [0.20507812500, 0.20703125000]
+    {-9, -3118, 8043834, 0x3442FCC0},  // [0.20703125000, 0.20898437500]
+    {-9, -3142, 8037571, 0x34BDADC3},  // [0.20898437500, 0.21093750000]
+    {-8, -3168, 8031260, 0x35384637},  // [0.21093750000, 0.21289062500]
+    {-8, -3192, 8024900, 0x35B2C5EB},  // [0.21289062500, 0.21484375000]
+    {-7, -3218, 8018492, 0x362D2CAF},  // [0.21484375000, 0.21679687500]
+    {-8, -3240, 8012035, 0x36A77A52},  // [0.21679687500, 0.21875000000]
+    {-8, -3264, 8005531, 0x3721AEA5},  // [0.21875000000, 0.22070312500]
+    {-8, -3288, 7998979, 0x379BC978},  // [0.22070312500, 0.22265625000]
+    {-8, -3311, 7992379, 0x3815CA9B},  // [0.22265625000, 0.22460937500]
+    {-8, -3335, 7985733, 0x388FB1DF},  // [0.22460937500, 0.22656250000]
+    {-8, -3358, 7979039, 0x39097F15},  // [0.22656250000, 0.22851562500]
+    {-8, -3381, 7972299, 0x3983320E},  // [0.22851562500, 0.23046875000]
+    {-8, -3404, 7965513, 0x39FCCA9C},  // [0.23046875000, 0.23242187500]
+    {-7, -3429, 7958681, 0x3A764891},  // [0.23242187500, 0.23437500000]
+    {-9, -3448, 7951802, 0x3AEFABBE},  // [0.23437500000, 0.23632812500]
+    {-7, -3474, 7944879, 0x3B68F3F7},  // [0.23632812500, 0.23828125000]
+    {-6, -3498, 7937910, 0x3BE2210D},  // [0.23828125000, 0.24023437500]
+    {-7, -3519, 7930896, 0x3C5B32D3},  // [0.24023437500, 0.24218750000]
+    {-7, -3541, 7923837, 0x3CD4291D},  // [0.24218750000, 0.24414062500]
+    {-7, -3563, 7916734, 0x3D4D03BE},  // [0.24414062500, 0.24609375000]
+    {-8, -3584, 7909587, 0x3DC5C28A},  // [0.24609375000, 0.24804687500]
+    {-7, -3607, 7902395, 0x3E3E6555},  // [0.24804687500, 0.25000000000]
+    {-8, -3627, 7895160, 0x3EB6EBF2},  // [0.25000000000, 0.25195312500]
+    {-9, -3647, 7887882, 0x3F2F5637},  // [0.25195312500, 0.25390625000]
+    {-6, -3673, 7880561, 0x3FA7A3F9},  // [0.25390625000, 0.25585937500]
+    {-7, -3693, 7873197, 0x401FD50B},  // [0.25585937500, 0.25781250000]
+    {-7, -3714, 7865790, 0x4097E944},  // [0.25781250000, 0.25976562500]
+    {-8, -3733, 7858341, 0x410FE079},  // [0.25976562500, 0.26171875000]
+    {-7, -3756, 7850851, 0x4187BA81},  // [0.26171875000, 0.26367187500]
+    {-6, -3778, 7843318, 0x41FF7731},  // [0.26367187500, 0.26562500000]
+    {-7, -3797, 7835744, 0x4277165F},  // [0.26562500000, 0.26757812500]
+    {-8, -3816, 7828129, 0x42EE97E3},  // [0.26757812500, 0.26953125000]
+    {-8, -3836, 7820473, 0x4365FB94},  // [0.26953125000, 0.27148437500]
+    {-7, -3858, 7812777, 0x43DD4149},  // [0.27148437500, 0.27343750000]
+    {-6, -3879, 7805040, 0x445468D9},  // [0.27343750000, 0.27539062500]
+    {-5, -3901, 7797264, 0x44CB721C},  // [0.27539062500, 0.27734375000]
+    {-8, -3916, 7789447, 0x45425CEA},  // [0.27734375000, 0.27929687500]
+    {-7, -3937, 7781591, 0x45B9291D},  // [0.27929687500, 0.28125000000]
+    {-7, -3956, 7773696, 0x462FD68C},  // [0.28125000000, 0.28320312500]
+    {-7, -3976, 7765763, 0x46A66511},  // [0.28320312500, 0.28515625000]
+    {-6, -3996, 7757790, 0x471CD485},  // [0.28515625000, 0.28710937500]
+    {-7, -4014, 7749780, 0x479324C1},  // [0.28710937500, 0.28906250000]
+    {-6, -4034, 7741731, 0x480955A0},  // [0.28906250000, 0.29101562500]
+    {-6, -4053, 7733645, 0x487F66FB},  // [0.29101562500, 0.29296875000]
+    {-7, -4070, 7725521, 0x48F558AD},  // [0.29296875000, 0.29492187500]
+    {-5, -4091, 7717360, 0x496B2A91},  // [0.29492187500, 0.29687500000]
+    {-6, -4108, 7709163, 0x49E0DC81},  // [0.29687500000, 0.29882812500]
+    {-5, -4128, 7700929, 0x4A566E5A},  // [0.29882812500, 0.30078125000]
+    {-6, -4144, 7692658, 0x4ACBDFF6},  // [0.30078125000, 0.30273437500]
+    {-6, -4162, 7684352, 0x4B413132},  // [0.30273437500, 0.30468750000]
+    {-6, -4180, 7676010, 0x4BB661EA},  // [0.30468750000, 0.30664062500]
+    {-6, -4197, 7667632, 0x4C2B71FA},  // [0.30664062500, 0.30859375000]
+    {-6, -4215, 7659220, 0x4CA0613F},  // [0.30859375000, 0.31054687500]
+    {-5, -4233, 7650772, 0x4D152F96},  // [0.31054687500, 0.31250000000]
+    {-6, -4249, 7642291, 0x4D89DCDC},  // [0.31250000000, 0.31445312500]
+    {-4, -4269, 7633775, 0x4DFE68F0},  // [0.31445312500, 0.31640625000]
+    {-4, -4286, 7625225, 0x4E72D3AE},  // [0.31640625000, 0.31835937500]
+    {-7, -4298, 7616641, 0x4EE71CF5},  // [0.31835937500, 0.32031250000]
+    {-4, -4319, 7608024, 0x4F5B44A5},  // [0.32031250000, 0.32226562500]
+    {-7, -4331, 7599374, 0x4FCF4A9A},  // [0.32226562500, 0.32421875000]
+    {-5, -4350, 7590691, 0x50432EB6},  // [0.32421875000, 0.32617187500]
+    {-5, -4366, 7581976, 0x50B6F0D6},  // [0.32617187500, 0.32812500000]
+    {-6, -4381, 7573229, 0x512A90DB},  // [0.32812500000, 0.33007812500]
+    {-4, -4399, 7564449, 0x519E0EA5},  // [0.33007812500, 0.33203125000]
+    {-5, -4414, 7555639, 0x52116A13},  // [0.33203125000, 0.33398437500]
+    {-7, -4426, 7546796, 0x5284A307},  // [0.33398437500, 0.33593750000]
+    {-4, -4446, 7537923, 0x52F7B962},  // [0.33593750000, 0.33789062500]
+    {-6, -4458, 7529019, 0x536AAD03},  // [0.33789062500, 0.33984375000]
+    {-4, -4476, 7520085, 0x53DD7DCE},  // [0.33984375000, 0.34179687500]
+    {-5, -4490, 7511121, 0x54502BA3},  // [0.34179687500, 0.34375000000]
+    {-6, -4503, 7502126, 0x54C2B665},  // [0.34375000000, 0.34570312500]
+    {-5, -4519, 7493102, 0x55351DF6},  // [0.34570312500, 0.34765625000]
+    {-6, -4532, 7484049, 0x55A76238},  // [0.34765625000, 0.34960937500]
+    {-4, -4549, 7474967, 0x5619830F},  // [0.34960937500, 0.35156250000]
+    {-6, -4561, 7465857, 0x568B805D},  // [0.35156250000, 0.35351562500]
+    {-5, -4576, 7456717, 0x56FD5A07},  // [0.35351562500, 0.35546875000]
+    {-5, -4590, 7447550, 0x576F0FEF},  // [0.35546875000, 0.35742187500]
+    {-4, -4605, 7438355, 0x57E0A1FA},  // [0.35742187500, 0.35937500000]
+    {-4, -4619, 7429133, 0x5852100C},  // [0.35937500000, 0.36132812500]
+    {-5, -4631, 7419883, 0x58C35A0A},  // [0.36132812500, 0.36328125000]
+    {-3, -4647, 7410606, 0x59347FD9},  // [0.36328125000, 0.36523437500]
+    {-4, -4659, 7401303, 0x59A5815D},  // [0.36523437500, 0.36718750000]
+    {-6, -4669, 7391973, 0x5A165E7D},  // [0.36718750000, 0.36914062500]
+    {-3, -4686, 7382617, 0x5A87171F},  // [0.36914062500, 0.37109375000]
+    {-4, -4698, 7373236, 0x5AF7AB27},  // [0.37109375000, 0.37304687500]
+    {-6, -4707, 7363828, 0x5B681A7D},  // [0.37304687500, 0.37500000000]
+    {-3, -4724, 7354396, 0x5BD86508},  // [0.37500000000, 0.37695312500]
+    {-4, -4735, 7344939, 0x5C488AAD},  // [0.37695312500, 0.37890625000]
+    {-4, -4747, 7335457, 0x5CB88B55},  // [0.37890625000, 0.38085937500]
+    {-3, -4761, 7325951, 0x5D2866E7},  // [0.38085937500, 0.38281250000]
+    {-4, -4771, 7316420, 0x5D981D4A},  // [0.38281250000, 0.38476562500]
+    {-4, -4783, 7306866, 0x5E07AE67},  // [0.38476562500, 0.38671875000]
+    {-5, -4793, 7297288, 0x5E771A26},  // [0.38671875000, 0.38867187500]
+    {-5, -4804, 7287687, 0x5EE66070},  // [0.38867187500, 0.39062500000]
+    {-3, -4819, 7278064, 0x5F55812E},  // [0.39062500000, 0.39257812500]
+    {-3, -4830, 7268417, 0x5FC47C48},  // [0.39257812500, 0.39453125000]
+    {-5, -4838, 7258748, 0x603351A8},  // [0.39453125000, 0.39648437500]
+    {-3, -4852, 7249057, 0x60A20139},  // [0.39648437500, 0.39843750000]
+    {-4, -4861, 7239344, 0x61108AE3},  // [0.39843750000, 0.40039062500]
+    {-4, -4872, 7229610, 0x617EEE92},  // [0.40039062500, 0.40234375000]
+    {-4, -4882, 7219854, 0x61ED2C30},  // [0.40234375000, 0.40429687500]
+    {-4, -4893, 7210078, 0x625B43A8},  // [0.40429687500, 0.40625000000]
+    {-3, -4904, 7200280, 0x62C934E5},  // [0.40625000000, 0.40820312500]
+    {-4, -4913, 7190463, 0x6336FFD2},  // [0.40820312500, 0.41015625000]
+    {-2, -4926, 7180625, 0x63A4A45C},  // [0.41015625000, 0.41210937500]
+    {-3, -4934, 7170767, 0x6412226D},  // [0.41210937500, 0.41406250000]
+    {-3, -4944, 7160890, 0x647F79F3},  // [0.41406250000, 0.41601562500]
+    {-4, -4952, 7150993, 0x64ECAADA},  // [0.41601562500, 0.41796875000]
+    {-3, -4963, 7141077, 0x6559B50F},  // [0.41796875000, 0.41992187500]
+    {-3, -4972, 7131142, 0x65C6987E},  // [0.41992187500, 0.42187500000]
+    {-3, -4981, 7121189, 0x66335515},  // [0.42187500000, 0.42382812500]
+    {-3, -4990, 7111218, 0x669FEAC2},  // [0.42382812500, 0.42578125000]
+    {-3, -4999, 7101229, 0x670C5973},  // [0.42578125000, 0.42773437500]
+    {-1, -5011, 7091222, 0x6778A116},  // [0.42773437500, 0.42968750000]
+    {-4, -5015, 7081197, 0x67E4C198},  // [0.42968750000, 0.43164062500]
+    {-2, -5026, 7071155, 0x6850BAEA},  // [0.43164062500, 0.43359375000]
+    {-3, -5033, 7061097, 0x68BC8CF9},  // [0.43359375000, 0.43554687500]
+    {-2, -5043, 7051022, 0x692837B6},  // [0.43554687500, 0.43750000000]
+    {-4, -5048, 7040930, 0x6993BB0F},  // [0.43750000000, 0.43945312500]
+    {-1, -5060, 7030822, 0x69FF16F5},  // [0.43945312500, 0.44140625000]
+    {-3, -5065, 7020699, 0x6A6A4B56},  // [0.44140625000, 0.44335937500]
+    {-3, -5073, 7010560, 0x6AD55825},  // [0.44335937500, 0.44531250000]
+    {-1, -5083, 7000405, 0x6B403D51},  // [0.44531250000, 0.44726562500]
+    {-3, -5088, 6990236, 0x6BAAFACA},  // [0.44726562500, 0.44921875000]
+    {-3, -5095, 6980051, 0x6C159083},  // [0.44921875000, 0.45117187500]
+    {-3, -5102, 6969852, 0x6C7FFE6C},  // [0.45117187500, 0.45312500000]
+    {-1, -5112, 6959639, 0x6CEA4477},  // [0.45312500000, 0.45507812500]
+    {-3, -5116, 6949412, 0x6D546295},  // [0.45507812500, 0.45703125000]
+    {-3, -5123, 6939171, 0x6DBE58BA},  // [0.45703125000, 0.45898437500]
+    {-1, -5132, 6928916, 0x6E2826D7},  // [0.45898437500, 0.46093750000]
+    {-1, -5139, 6918649, 0x6E91CCDE},  // [0.46093750000, 0.46289062500]
+    {-2, -5144, 6908368, 0x6EFB4AC3},  // [0.46289062500, 0.46484375000]
+    {-2, -5150, 6898074, 0x6F64A079},  // [0.46484375000, 0.46679687500]
+    {-2, -5156, 6887768, 0x6FCDCDF3},  // [0.46679687500, 0.46875000000]
+    {-3, -5161, 6877450, 0x7036D325},  // [0.46875000000, 0.47070312500]
+    {-2, -5168, 6867119, 0x709FB003},  // [0.47070312500, 0.47265625000]
+    {-2, -5174, 6856777, 0x71086480},  // [0.47265625000, 0.47460937500]
+    {-3, -5178, 6846423, 0x7170F091},  // [0.47460937500, 0.47656250000]
+    {-2, -5185, 6836058, 0x71D9542B},  // [0.47656250000, 0.47851562500]
+    {-2, -5190, 6825682, 0x72418F42},  // [0.47851562500, 0.48046875000]
+    {-2, -5196, 6815296, 0x72A9A1CC},  // [0.48046875000, 0.48242187500]
+    {-2, -5201, 6804898, 0x73118BBE},  // [0.48242187500, 0.48437500000]
+    {-1, -5207, 6794490, 0x73794D0D},  // [0.48437500000, 0.48632812500]
+    {-2, -5211, 6784073, 0x73E0E5AF},  // [0.48632812500, 0.48828125000]
+    {-1, -5217, 6773645, 0x7448559B},  // [0.48828125000, 0.49023437500]
+    {-3, -5219, 6763208, 0x74AF9CC6},  // [0.49023437500, 0.49218750000]
+    {-1, -5226, 6752761, 0x7516BB28},  // [0.49218750000, 0.49414062500]
+    {-1, -5231, 6742306, 0x757DB0B6},  // [0.49414062500, 0.49609375000]
+    {-3, -5232, 6731841, 0x75E47D68},  // [0.49609375000, 0.49804687500]
+    {-2, -5238, 6721368, 0x764B2136},  // [0.49804687500, 0.50000000000]
+    {-1, -5243, 6710886, 0x76B19C16},  // [0.50000000000, 0.50195312500]
+    {0, -5249, 6700397, 0x7717EE00},   // [0.50195312500, 0.50390625000]
+    {-2, -5250, 6689899, 0x777E16EC},  // [0.50390625000, 0.50585937500]
+    {-1, -5255, 6679393, 0x77E416D3},  // [0.50585937500, 0.50781250000]
+    {-2, -5257, 6668880, 0x7849EDAC},  // [0.50781250000, 0.50976562500]
+    {-1, -5262, 6658360, 0x78AF9B71},  // [0.50976562500, 0.51171875000]
+    {-1, -5266, 6647833, 0x7915201A},  // [0.51171875000, 0.51367187500]
+    {0, -5270, 6637298, 0x797A7BA0},   // [0.51367187500, 0.51562500000]
+    {-2, -5271, 6626758, 0x79DFADFC},  // [0.51562500000, 0.51757812500]
+    {-1, -5275, 6616210, 0x7A44B729},  // [0.51757812500, 0.51953125000]
+    {-1, -5278, 6605657, 0x7AA9971F},  // [0.51953125000, 0.52148437500]
+    {-1, -5281, 6595098, 0x7B0E4DD9},  // [0.52148437500, 0.52343750000]
+    {-1, -5284, 6584533, 0x7B72DB51},  // [0.52343750000, 0.52539062500]
+    {-2, -5285, 6573962, 0x7BD73F81},  // [0.52539062500, 0.52734375000]
+    {0, -5290, 6563386, 0x7C3B7A64},   // [0.52734375000, 0.52929687500]
+    {0, -5293, 6552806, 0x7C9F8BF4},   // [0.52929687500, 0.53125000000]
+    {-1, -5294, 6542220, 0x7D03742D},  // [0.53125000000, 0.53320312500]
+    {-2, -5294, 6531629, 0x7D67330A},  // [0.53320312500, 0.53515625000]
+    {0, -5300, 6521035, 0x7DCAC887},   // [0.53515625000, 0.53710937500]
+    {-1, -5300, 6510435, 0x7E2E349E},  // [0.53710937500, 0.53906250000]
+    {-1, -5302, 6499832, 0x7E91774C},  // [0.53906250000, 0.54101562500]
+    {0, -5305, 6489225, 0x7EF4908D},   // [0.54101562500, 0.54296875000]
+    {-2, -5304, 6478615, 0x7F57805D},  // [0.54296875000, 0.54492187500]
+    {1, -5310, 6468001, 0x7FBA46BA},   // [0.54492187500, 0.54687500000]
+    {-1, -5309, 6457384, 0x801CE39E},  // [0.54687500000, 0.54882812500]
+    {0, -5311, 6446763, 0x807F5708},   // [0.54882812500, 0.55078125000]
+    {0, -5313, 6436141, 0x80E1A0F4},   // [0.55078125000, 0.55273437500]
+    {0, -5314, 6425515, 0x8143C160},   // [0.55273437500, 0.55468750000]
+    {0, -5315, 6414887, 0x81A5B849},   // [0.55468750000, 0.55664062500]
+    {0, -5316, 6404257, 0x820785AD},   // [0.55664062500, 0.55859375000]
+    {0, -5317, 6393625, 0x8269298A},   // [0.55859375000, 0.56054687500]
+    {0, -5318, 6382991, 0x82CAA3DE},   // [0.56054687500, 0.56250000000]
+    {1, -5320, 6372355, 0x832BF4A7},   // [0.56250000000, 0.56445312500]
+    {0, -5319, 6361718, 0x838D1BE3},   // [0.56445312500, 0.56640625000]
+    {-2, -5317, 6351080, 0x83EE1992},  // [0.56640625000, 0.56835937500]
+    {0, -5320, 6340440, 0x844EEDB3},   // [0.56835937500, 0.57031250000]
+    {-1, -5319, 6329800, 0x84AF9843},  // [0.57031250000, 0.57226562500]
+    {-1, -5319, 6319159, 0x85101943},  // [0.57226562500, 0.57421875000]
+    {1, -5322, 6308518, 0x857070B2},   // [0.57421875000, 0.57617187500]
+    {0, -5321, 6297877, 0x85D09E8F},   // [0.57617187500, 0.57812500000]
+    {0, -5321, 6287235, 0x8630A2DB},   // [0.57812500000, 0.58007812500]
+    {1, -5322, 6276593, 0x86907D95},   // [0.58007812500, 0.58203125000]
+    {-1, -5319, 6265952, 0x86F02EBD},  // [0.58203125000, 0.58398437500]
+    {2, -5323, 6255311, 0x874FB655},   // [0.58398437500, 0.58593750000]
+    {0, -5320, 6244671, 0x87AF145B},   // [0.58593750000, 0.58789062500]
+    {-1, -5318, 6234031, 0x880E48D2},  // [0.58789062500, 0.58984375000]
+    {1, -5320, 6223392, 0x886D53BA},   // [0.58984375000, 0.59179687500]
+    {0, -5318, 6212755, 0x88CC3513},   // [0.59179687500, 0.59375000000]
+    {1, -5319, 6202119, 0x892AECE0},   // [0.59375000000, 0.59570312500]
+    {-1, -5315, 6191484, 0x89897B21},  // [0.59570312500, 0.59765625000]
+    {1, -5317, 6180851, 0x89E7DFD9},   // [0.59765625000, 0.59960937500]
+    {-1, -5313, 6170220, 0x8A461B08},  // [0.59960937500, 0.60156250000]
+    {1, -5315, 6159591, 0x8AA42CB2},   // [0.60156250000, 0.60351562500]
+    {-1, -5311, 6148964, 0x8B0214D7},  // [0.60351562500, 0.60546875000]
+    {0, -5311, 6138339, 0x8B5FD37B},   // [0.60546875000, 0.60742187500]
+    {1, -5311, 6127717, 0x8BBD689F},   // [0.60742187500, 0.60937500000]
+    {1, -5310, 6117098, 0x8C1AD446},   // [0.60937500000, 0.61132812500]
+    {1, -5308, 6106481, 0x8C781673},   // [0.61132812500, 0.61328125000]
+    {1, -5307, 6095868, 0x8CD52F29},   // [0.61328125000, 0.61523437500]
+    {-1, -5302, 6085257, 0x8D321E6B},  // [0.61523437500, 0.61718750000]
+    {2, -5305, 6074650, 0x8D8EE43D},   // [0.61718750000, 0.61914062500]
+    {0, -5300, 6064046, 0x8DEB80A0},   // [0.61914062500, 0.62109375000]
+    {0, -5298, 6053446, 0x8E47F39A},   // [0.62109375000, 0.62304687500]
+    {1, -5298, 6042850, 0x8EA43D2E},   // [0.62304687500, 0.62500000000]
+    {0, -5294, 6032257, 0x8F005D5F},   // [0.62500000000, 0.62695312500]
+    {0, -5292, 6021669, 0x8F5C5432},   // [0.62695312500, 0.62890625000]
+    {1, -5291, 6011085, 0x8FB821AB},   // [0.62890625000, 0.63085937500]
+    {2, -5291, 6000506, 0x9013C5CE},   // [0.63085937500, 0.63281250000]
+    {0, -5285, 5989930, 0x906F409F},   // [0.63281250000, 0.63476562500]
+    {0, -5283, 5979360, 0x90CA9224},   // [0.63476562500, 0.63671875000]
+    {0, -5280, 5968794, 0x9125BA61},   // [0.63671875000, 0.63867187500]
+    {2, -5281, 5958234, 0x9180B95B},   // [0.63867187500, 0.64062500000]
+    {0, -5275, 5947678, 0x91DB8F16},   // [0.64062500000, 0.64257812500]
+    {0, -5272, 5937128, 0x92363B99},   // [0.64257812500, 0.64453125000]
+    {2, -5273, 5926584, 0x9290BEE9},   // [0.64453125000, 0.64648437500]
+    {1, -5268, 5916044, 0x92EB190A},   // [0.64648437500, 0.64843750000]
+    {0, -5264, 5905511, 0x93454A03},   // [0.64843750000, 0.65039062500]
+    {0, -5261, 5894983, 0x939F51DA},   // [0.65039062500, 0.65234375000]
+    {1, -5259, 5884461, 0x93F93094},   // [0.65234375000, 0.65429687500]
+    {1, -5256, 5873946, 0x9452E637},   // [0.65429687500, 0.65625000000]
+    {3, -5256, 5863437, 0x94AC72CA},   // [0.65625000000, 0.65820312500]
+    {1, -5250, 5852934, 0x9505D652},   // [0.65820312500, 0.66015625000]
+    {0, -5245, 5842437, 0x955F10D7},   // [0.66015625000, 0.66210937500]
+    {1, -5243, 5831947, 0x95B8225F},   // [0.66210937500, 0.66406250000]
+    {0, -5238, 5821464, 0x96110AF0},   // [0.66406250000, 0.66601562500]
+    {1, -5236, 5810988, 0x9669CA92},   // [0.66601562500, 0.66796875000]
+    {0, -5231, 5800519, 0x96C2614B},   // [0.66796875000, 0.66992187500]
+    {2, -5230, 5790057, 0x971ACF23},   // [0.66992187500, 0.67187500000]
+    {1, -5225, 5779603, 0x97731420},   // [0.67187500000, 0.67382812500]
+    {2, -5223, 5769156, 0x97CB304B},   // [0.67382812500, 0.67578125000]
+    {2, -5219, 5758716, 0x982323AA},   // [0.67578125000, 0.67773437500]
+    {2, -5215, 5748284, 0x987AEE45},   // [0.67773437500, 0.67968750000]
+    {1, -5210, 5737860, 0x98D29024},   // [0.67968750000, 0.68164062500]
+    {0, -5204, 5727443, 0x992A094F},   // [0.68164062500, 0.68359375000]
+    {2, -5203, 5717035, 0x998159CE},   // [0.68359375000, 0.68554687500]
+    {2, -5199, 5706635, 0x99D881A8},   // [0.68554687500, 0.68750000000]
+    {1, -5193, 5696243, 0x9A2F80E6},   // [0.68750000000, 0.68945312500]
+    {3, -5192, 5685860, 0x9A865791},   // [0.68945312500, 0.69140625000]
+    {1, -5185, 5675485, 0x9ADD05B0},   // [0.69140625000, 0.69335937500]
+    {0, -5179, 5665118, 0x9B338B4D},   // [0.69335937500, 0.69531250000]
+    {2, -5177, 5654760, 0x9B89E870},   // [0.69531250000, 0.69726562500]
+    {2, -5173, 5644412, 0x9BE01D21},   // [0.69726562500, 0.69921875000]
+    {3, -5170, 5634072, 0x9C36296A},   // [0.69921875000, 0.70117187500]
+    {0, -5161, 5623741, 0x9C8C0D53},   // [0.70117187500, 0.70312500000]
+    {2, -5159, 5613419, 0x9CE1C8E7},   // [0.70312500000, 0.70507812500]
+    {3, -5156, 5603107, 0x9D375C2D},   // [0.70507812500, 0.70703125000]
+    {2, -5150, 5592804, 0x9D8CC72F},   // [0.70703125000, 0.70898437500]
+    {2, -5145, 5582510, 0x9DE209F7},   // [0.70898437500, 0.71093750000]
+    {2, -5140, 5572226, 0x9E37248E},   // [0.71093750000, 0.71289062500]
+    {1, -5134, 5561952, 0x9E8C16FE},   // [0.71289062500, 0.71484375000]
+    {1, -5129, 5551687, 0x9EE0E151},   // [0.71484375000, 0.71679687500]
+    {2, -5125, 5541432, 0x9F358390},   // [0.71679687500, 0.71875000000]
+    {1, -5119, 5531188, 0x9F89FDC5},   // [0.71875000000, 0.72070312500]
+    {2, -5115, 5520953, 0x9FDE4FFB},   // [0.72070312500, 0.72265625000]
+    {2, -5110, 5510729, 0xA0327A3B},   // [0.72265625000, 0.72460937500]
+    {4, -5108, 5500515, 0xA0867C90},   // [0.72460937500, 0.72656250000]
+    {1, -5098, 5490311, 0xA0DA5703},   // [0.72656250000, 0.72851562500]
+    {3, -5096, 5480118, 0xA12E09A1},   // [0.72851562500, 0.73046875000]
+    {2, -5089, 5469935, 0xA1819472},   // [0.73046875000, 0.73242187500]
+    {1, -5082, 5459763, 0xA1D4F782},   // [0.73242187500, 0.73437500000]
+    {3, -5080, 5449602, 0xA22832DC},   // [0.73437500000, 0.73632812500]
+    {1, -5071, 5439451, 0xA27B4689},   // [0.73632812500, 0.73828125000]
+    {3, -5069, 5429312, 0xA2CE3296},   // [0.73828125000, 0.74023437500]
+    {1, -5060, 5419183, 0xA320F70C},   // [0.74023437500, 0.74218750000]
+    {2, -5056, 5409066, 0xA37393F8},   // [0.74218750000, 0.74414062500]
+    {3, -5052, 5398960, 0xA3C60964},   // [0.74414062500, 0.74609375000]
+    {2, -5045, 5388865, 0xA418575B},   // [0.74609375000, 0.74804687500]
+    {2, -5039, 5378781, 0xA46A7DE9},   // [0.74804687500, 0.75000000000]
+    {2, -5033, 5368709, 0xA4BC7D19},   // [0.75000000000, 0.75195312500]
+    {3, -5029, 5358649, 0xA50E54F7},   // [0.75195312500, 0.75390625000]
+    {2, -5022, 5348600, 0xA560058E},   // [0.75390625000, 0.75585937500]
+    {1, -5014, 5338562, 0xA5B18EEA},   // [0.75585937500, 0.75781250000]
+    {2, -5010, 5328537, 0xA602F117},   // [0.75781250000, 0.75976562500]
+    {1, -5002, 5318523, 0xA6542C20},   // [0.75976562500, 0.76171875000]
+    {4, -5001, 5308522, 0xA6A54012},   // [0.76171875000, 0.76367187500]
+    {0, -4989, 5298532, 0xA6F62CF7},   // [0.76367187500, 0.76562500000]
+    {3, -4987, 5288554, 0xA746F2DE},   // [0.76562500000, 0.76757812500]
+    {1, -4978, 5278589, 0xA79791D0},   // [0.76757812500, 0.76953125000]
+    {3, -4975, 5268636, 0xA7E809DC},   // [0.76953125000, 0.77148437500]
+    {2, -4967, 5258695, 0xA8385B0C},   // [0.77148437500, 0.77343750000]
+    {2, -4961, 5248767, 0xA888856E},   // [0.77343750000, 0.77539062500]
+    {2, -4955, 5238851, 0xA8D8890E},   // [0.77539062500, 0.77734375000]
+    {3, -4950, 5228947, 0xA92865F8},   // [0.77734375000, 0.77929687500]
+    {2, -4942, 5219056, 0xA9781C38},   // [0.77929687500, 0.78125000000]
+    {1, -4934, 5209178, 0xA9C7ABDC},   // [0.78125000000, 0.78320312500]
+    {3, -4931, 5199313, 0xAA1714F1},   // [0.78320312500, 0.78515625000]
+    {2, -4923, 5189460, 0xAA665782},   // [0.78515625000, 0.78710937500]
+    {3, -4918, 5179620, 0xAAB5739D},   // [0.78710937500, 0.78906250000]
+    {2, -4910, 5169793, 0xAB04694E},   // [0.78906250000, 0.79101562500]
+    {2, -4903, 5159979, 0xAB5338A3},   // [0.79101562500, 0.79296875000]
+    {2, -4897, 5150179, 0xABA1E1A9},   // [0.79296875000, 0.79492187500]
+    {1, -4889, 5140391, 0xABF0646D},   // [0.79492187500, 0.79687500000]
+    {3, -4885, 5130616, 0xAC3EC0FC},   // [0.79687500000, 0.79882812500]
+    {2, -4877, 5120855, 0xAC8CF762},   // [0.79882812500, 0.80078125000]
+    {2, -4870, 5111107, 0xACDB07AE},   // [0.80078125000, 0.80273437500]
+    {1, -4862, 5101373, 0xAD28F1ED},   // [0.80273437500, 0.80468750000]
+    {4, -4860, 5091652, 0xAD76B62D},   // [0.80468750000, 0.80664062500]
+    {2, -4850, 5081944, 0xADC45479},   // [0.80664062500, 0.80859375000]
+    {2, -4843, 5072250, 0xAE11CCE1},   // [0.80859375000, 0.81054687500]
+    {3, -4838, 5062570, 0xAE5F1F72},   // [0.81054687500, 0.81250000000]
+    {3, -4831, 5052903, 0xAEAC4C39},   // [0.81250000000, 0.81445312500]
+    {2, -4823, 5043250, 0xAEF95344},   // [0.81445312500, 0.81640625000]
+    {3, -4817, 5033610, 0xAF4634A1},   // [0.81640625000, 0.81835937500]
+    {2, -4809, 5023985, 0xAF92F05D},   // [0.81835937500, 0.82031250000]
+    {2, -4802, 5014373, 0xAFDF8687},   // [0.82031250000, 0.82226562500]
+    {3, -4796, 5004775, 0xB02BF72C},   // [0.82226562500, 0.82421875000]
+    {2, -4788, 4995192, 0xB078425A},   // [0.82421875000, 0.82617187500]
+    {2, -4781, 4985622, 0xB0C46820},   // [0.82617187500, 0.82812500000]
+    {3, -4775, 4976066, 0xB110688B},   // [0.82812500000, 0.83007812500]
+    {3, -4768, 4966525, 0xB15C43A9},   // [0.83007812500, 0.83203125000]
+    {2, -4760, 4956998, 0xB1A7F989},   // [0.83203125000, 0.83398437500]
+    {2, -4752, 4947484, 0xB1F38A39},   // [0.83398437500, 0.83593750000]
+    {3, -4747, 4937986, 0xB23EF5C7},   // [0.83593750000, 0.83789062500]
+    {2, -4738, 4928501, 0xB28A3C41},   // [0.83789062500, 0.83984375000]
+    {2, -4731, 4919031, 0xB2D55DB6},   // [0.83984375000, 0.84179687500]
+    {3, -4725, 4909575, 0xB3205A34},   // [0.84179687500, 0.84375000000]
+    {3, -4718, 4900134, 0xB36B31C9},   // [0.84375000000, 0.84570312500]
+    {2, -4709, 4890707, 0xB3B5E484},   // [0.84570312500, 0.84765625000]
+    {2, -4702, 4881295, 0xB4007274},   // [0.84765625000, 0.84960937500]
+    {3, -4696, 4871897, 0xB44ADBA7},   // [0.84960937500, 0.85156250000]
+    {3, -4689, 4862514, 0xB495202B},   // [0.85156250000, 0.85351562500]
+    {3, -4681, 4853145, 0xB4DF400F},   // [0.85351562500, 0.85546875000]
+    {3, -4674, 4843792, 0xB5293B62},   // [0.85546875000, 0.85742187500]
+    {3, -4667, 4834453, 0xB5731233},   // [0.85742187500, 0.85937500000]
+    {1, -4656, 4825128, 0xB5BCC490},   // [0.85937500000, 0.86132812500]
+    {3, -4652, 4815819, 0xB6065289},   // [0.86132812500, 0.86328125000]
+    {2, -4643, 4806524, 0xB64FBC2B},   // [0.86328125000, 0.86523437500]
+    {2, -4635, 4797244, 0xB6990186},   // [0.86523437500, 0.86718750000]
+    {4, -4631, 4787980, 0xB6E222A9},   // [0.86718750000, 0.86914062500]
+    {3, -4622, 4778730, 0xB72B1FA2},   // [0.86914062500, 0.87109375000]
+    {2, -4613, 4769495, 0xB773F881},   // [0.87109375000, 0.87304687500]
+    {3, -4607, 4760275, 0xB7BCAD55},   // [0.87304687500, 0.87500000000]
+    {2, -4598, 4751070, 0xB8053E2C},   // [0.87500000000, 0.87695312500]
+    {4, -4593, 4741880, 0xB84DAB16},   // [0.87695312500, 0.87890625000]
+    {2, -4583, 4732706, 0xB895F421},   // [0.87890625000, 0.88085937500]
+    {4, -4578, 4723546, 0xB8DE195E},   // [0.88085937500, 0.88281250000]
+    {3, -4569, 4714402, 0xB9261ADA},   // [0.88281250000, 0.88476562500]
+    {2, -4560, 4705273, 0xB96DF8A6},   // [0.88476562500, 0.88671875000]
+    {3, -4554, 4696159, 0xB9B5B2D1},   // [0.88671875000, 0.88867187500]
+    {3, -4546, 4687060, 0xB9FD4969},   // [0.88867187500, 0.89062500000]
+    {4, -4540, 4677977, 0xBA44BC7E},   // [0.89062500000, 0.89257812500]
+    {3, -4531, 4668909, 0xBA8C0C1F},   // [0.89257812500, 0.89453125000]
+    {2, -4522, 4659856, 0xBAD3385C},   // [0.89453125000, 0.89648437500]
+    {3, -4515, 4650818, 0xBB1A4144},   // [0.89648437500, 0.89843750000]
+    {3, -4508, 4641797, 0xBB6126E6},   // [0.89843750000, 0.90039062500]
+    {3, -4500, 4632790, 0xBBA7E952},   // [0.90039062500, 0.90234375000]
+    {2, -4491, 4623799, 0xBBEE8897},   // [0.90234375000, 0.90429687500]
+    {2, -4483, 4614823, 0xBC3504C5},   // [0.90429687500, 0.90625000000]
+    {3, -4477, 4605863, 0xBC7B5DEB},   // [0.90625000000, 0.90820312500]
+    {1, -4466, 4596918, 0xBCC19418},   // [0.90820312500, 0.91015625000]
+    {3, -4461, 4587989, 0xBD07A75D},   // [0.91015625000, 0.91210937500]
+    {4, -4455, 4579076, 0xBD4D97C8},   // [0.91210937500, 0.91406250000]
+    {1, -4443, 4570178, 0xBD936569},   // [0.91406250000, 0.91601562500]
+    {3, -4438, 4561295, 0xBDD91051},   // [0.91601562500, 0.91796875000]
+    {1, -4427, 4552428, 0xBE1E988D},   // [0.91796875000, 0.91992187500]
+    {3, -4422, 4543577, 0xBE63FE2F},   // [0.91992187500, 0.92187500000]
+    {2, -4413, 4534742, 0xBEA94145},   // [0.92187500000, 0.92382812500]
+    {4, -4408, 4525922, 0xBEEE61E0},   // [0.92382812500, 0.92578125000]
+    {3, -4399, 4517118, 0xBF33600E},   // [0.92578125000, 0.92773437500]
+    {2, -4389, 4508329, 0xBF783BE0},   // [0.92773437500, 0.92968750000]
+    {4, -4385, 4499557, 0xBFBCF566},   // [0.92968750000, 0.93164062500]
+    {1, -4372, 4490799, 0xC0018CAE},   // [0.93164062500, 0.93359375000]
+    {3, -4367, 4482058, 0xC04601CA},   // [0.93359375000, 0.93554687500]
+    {2, -4358, 4473333, 0xC08A54C8},   // [0.93554687500, 0.93750000000]
+    {4, -4353, 4464623, 0xC0CE85B9},   // [0.93750000000, 0.93945312500]
+    {2, -4342, 4455929, 0xC11294AB},   // [0.93945312500, 0.94140625000]
+    {4, -4337, 4447251, 0xC15681B0},   // [0.94140625000, 0.94335937500]
+    {3, -4328, 4438589, 0xC19A4CD6},   // [0.94335937500, 0.94531250000]
+    {1, -4317, 4429942, 0xC1DDF62E},   // [0.94531250000, 0.94726562500]
+    {2, -4310, 4421311, 0xC2217DC8},   // [0.94726562500, 0.94921875000]
+    {3, -4304, 4412697, 0xC264E3B3},   // [0.94921875000, 0.95117187500]
+    {5, -4299, 4404098, 0xC2A827FF},   // [0.95117187500, 0.95312500000]
+    {3, -4288, 4395515, 0xC2EB4ABB},   // [0.95312500000, 0.95507812500]
+    {2, -4279, 4386948, 0xC32E4BF9},   // [0.95507812500, 0.95703125000]
+    {3, -4272, 4378396, 0xC3712BC8},   // [0.95703125000, 0.95898437500]
+    {2, -4263, 4369861, 0xC3B3EA37},   // [0.95898437500, 0.96093750000]
+    {3, -4256, 4361341, 0xC3F68757},   // [0.96093750000, 0.96289062500]
+    {2, -4247, 4352838, 0xC4390337},   // [0.96289062500, 0.96484375000]
+    {3, -4240, 4344350, 0xC47B5DE8},   // [0.96484375000, 0.96679687500]
+    {2, -4231, 4335879, 0xC4BD9779},   // [0.96679687500, 0.96875000000]
+    {2, -4223, 4327423, 0xC4FFAFFB},   // [0.96875000000, 0.97070312500]
+    {4, -4218, 4318983, 0xC541A77D},   // [0.97070312500, 0.97265625000]
+    {1, -4205, 4310559, 0xC5837E0E},   // [0.97265625000, 0.97460937500]
+    {4, -4202, 4302152, 0xC5C533C1},   // [0.97460937500, 0.97656250000]
+    {4, -4194, 4293760, 0xC606C8A3},   // [0.97656250000, 0.97851562500]
+    {2, -4183, 4285384, 0xC6483CC5},   // [0.97851562500, 0.98046875000]
+    {4, -4178, 4277024, 0xC6899038},   // [0.98046875000, 0.98242187500]
+    {2, -4167, 4268680, 0xC6CAC30A},   // [0.98242187500, 0.98437500000]
+    {2, -4159, 4260352, 0xC70BD54D},   // [0.98437500000, 0.98632812500]
+    {4, -4154, 4252040, 0xC74CC710},   // [0.98632812500, 0.98828125000]
+    {2, -4143, 4243744, 0xC78D9862},   // [0.98828125000, 0.99023437500]
+    {4, -4138, 4235464, 0xC7CE4955},   // [0.99023437500, 0.99218750000]
+    {2, -4127, 4227200, 0xC80ED9F7},   // [0.99218750000, 0.99414062500]
+    {2, -4119, 4218952, 0xC84F4A5A},   // [0.99414062500, 0.99609375000]
+    {4, -4114, 4210720, 0xC88F9A8D},   // [0.99609375000, 0.99804687500]
+    {2, -4103, 4202504, 0xC8CFCA9F},   // [0.99804687500, 1.00000000000]
+    {0, 0, 0, 0xC90FDAA2}              // [1.00000000000, 1.00000000000]
+}};
+
+// Minimax polynomial atan(x) ~= x * sum(kAtanPoly[k] * x^(2k)) on [0,1], max error 2.5e-07
+// Coefficients fitted with the Remez algorithm, stored in Q31.32 fixed-point format
+inline constexpr std::array<int64_t, 7> kAtanPoly = {
+    4294950596LL,   // x^1: 0.999996111710
+    -1430970082LL,  // x^3: -0.333173685334
+    850739388LL,    // x^5: 0.198078199359
+    -568368444LL,   // x^7: -0.132333590626
+    341982420LL,    // x^9: 0.079623987037
+    -144330211LL,   // x^11: -0.033604496011
+    29256822LL      // x^13: 0.006811884640
 };
 
 // Fast lookup atan(x) with linear interpolation between table entries
-// Input x is in fixed-point format with specified fraction bits representing a value in [-1,1]
+// Input x is in fixed-point format with InputFractionBits fraction bits representing any value;
+// |x| > 1 is reduced to [0,1] with atan(x) = pi/2 - atan(1/x)
 // Output is in fixed-point format with the same fraction bits representing atan(x)
 // Precision: ~3.1e-7 when fraction_bits=32
-inline constexpr auto LookupAtanFast(int64_t x, int input_fraction_bits) noexcept -> int64_t {
+// With FIXED64_MATH_ATAN_FAST_USE_POLY the table is replaced by kAtanPoly (~2.5e-07)
+template <int InputFractionBits = 32>
+inline constexpr auto LookupAtanFast(int64_t x) noexcept -> int64_t {
     // Constants
     constexpr int kOutputFractionBits = 32;  // Internal calculation format
     constexpr int64_t kOne = 1LL << kOutputFractionBits;
+    constexpr int64_t kPiOver2 = 0x00000001921FB544LL;  // pi/2 = 1.5707963267948966
 
-    // Handle negative input
-    bool is_negative = false;
-    if (x < 0) {
-        x = -x;
-        is_negative = true;
-    }
+    // Handle negative input without branching: sign_mask is 0 or -1
+    const int64_t sign_mask = x >> 63;
+    x = (x ^ sign_mask) - sign_mask;
 
-    // Convert input to internal format if needed
-    if (input_fraction_bits != kOutputFractionBits) {
-        if (input_fraction_bits < kOutputFractionBits) {
-            x <<= (kOutputFractionBits - input_fraction_bits);
-        } else {
-            x >>= (input_fraction_bits - kOutputFractionBits);
-        }
+    // Convert input to internal format
+    if constexpr (InputFractionBits != kOutputFractionBits) {
+        x = Primitives::ShiftFractionBits(x, InputFractionBits, kOutputFractionBits);
     }
 
     // 1. Ensure x is in [0,1] range
-    if (x <= 0) {
+    if (x <= 0) [[unlikely]] {
         return 0;
     }
     bool use_reciprocal = false;
-    if (x >= kOne) {
+    if (x > kOne) [[unlikely]] {
         // For x > 1, use atan(x) = π/2 - atan(1/x)
         use_reciprocal = true;
-        // Calculate 1/x in fixed-point
-        x = Primitives::Fixed64Div(kOne, x, kOutputFractionBits);
+        // Calculate 1/x = 2^64 / x in fixed-point with one 64-bit division:
+        // (2^64 - 1) / x is one short of it only when x is a power of two
+        const uint64_t ux = static_cast<uint64_t>(x);
+        x = static_cast<int64_t>(UINT64_MAX / ux + ((ux & (ux - 1)) == 0 ? 1 : 0));
     }
 
-    // 2. Scale x to table index
-    constexpr int64_t kScale = static_cast<int64_t>(kAtanLut.size() - 2);
-    const int64_t idx_scaled = Primitives::Fixed64Mul(x, kScale << kOutputFractionBits, kOutputFractionBits);
-    const int64_t idx = idx_scaled >> kOutputFractionBits;
-    const int64_t t = idx_scaled & ((1LL << kOutputFractionBits) - 1);  // Fractional part [0,1)
+    int64_t result;
+    if constexpr (FIXED64_MATH_ATAN_FAST_USE_POLY) {
+        // 2. Evaluate x * P(x^2) with Horner's method
+        const int64_t x2 = Primitives::Fixed64Mul(x, x, kOutputFractionBits);
+        int64_t y = kAtanPoly[6];
+        y = kAtanPoly[5] + Primitives::Fixed64Mul(x2, y, kOutputFractionBits);
+        y = kAtanPoly[4] + Primitives::Fixed64Mul(x2, y, kOutputFractionBits);
+        y = kAtanPoly[3] + Primitives::Fixed64Mul(x2, y, kOutputFractionBits);
+        y = kAtanPoly[2] + Primitives::Fixed64Mul(x2, y, kOutputFractionBits);
+        y = kAtanPoly[1] + Primitives::Fixed64Mul(x2, y, kOutputFractionBits);
+        y = kAtanPoly[0] + Primitives::Fixed64Mul(x2, y, kOutputFractionBits);
+        result = Primitives::Fixed64Mul(x, y, kOutputFractionBits);
+    } else {
+        // 2. Split x into table index and fraction
+        const int64_t idx = x >> (kOutputFractionBits - kAtanLutBits);
+        const int64_t t = (x << kAtanLutBits) & ((1LL << kOutputFractionBits) - 1);  // Fractional part [0,1)
 
-    // 4. Get table values for interpolation
-    const int64_t y0 = kAtanLut[idx];
-    const int64_t y1 = kAtanLut[idx + 1];
+        // 4. Get the segment endpoints: p(0) = d and p(1) - p(0) = a + b + c
+        const AtanSegment& seg = kAtanTable[idx];
+        const int64_t y0 = seg.d;
+        const int64_t dy = int64_t{seg.a} + seg.b + seg.c;
 
-    // 5. Linear interpolation
-    int64_t result = y0 + (((y1 - y0) * t) >> kOutputFractionBits);
+        // 5. Linear interpolation, rounded to nearest
+        result = y0 + Primitives::Fixed64MulNarrow(dy, t, kOutputFractionBits);
+    }
 
     // Apply reciprocal formula if needed
-    if (use_reciprocal) {
-        // π/2 in our fixed-point format
-        constexpr int64_t kHalfPi = 0x00000001921FB544LL;  // pi/2 = 1.5707963267948966
-        result = kHalfPi - result;
+    if (use_reciprocal) [[unlikely]] {
+        result = kPiOver2 - result;
     }
 
-    // 6. Convert result back to input format if needed
-    if (input_fraction_bits != kOutputFractionBits) {
-        if (input_fraction_bits < kOutputFractionBits) {
-            result >>= (kOutputFractionBits - input_fraction_bits);
-        } else {
-            result <<= (input_fraction_bits - kOutputFractionBits);
-        }
+    // 6. Convert result back to input format
+    if constexpr (InputFractionBits != kOutputFractionBits) {
+        result = Primitives::ShiftFractionBits(result, kOutputFractionBits, InputFractionBits);
     }
 
     // Apply sign
-    return is_negative ? -result : result;
+    return (result ^ sign_mask) - sign_mask;
 }
 
-// High precision lookup atan(x) with quadratic interpolation between table entries
-// Input x is in fixed-point format with specified fraction bits representing a value in [-1,1]
+// High precision lookup atan(x) with Hermite cubic interpolation between table entries
+// Input x is in fixed-point format with InputFractionBits fraction bits representing any value;
+// |x| > 1 is reduced to [0,1] with atan(x) = pi/2 - atan(1/x)
 // Output is in fixed-point format with the same fraction bits representing atan(x)
-// Precision: ~5.5e-10 when fraction_bits=32
-inline constexpr auto LookupAtan(int64_t x, int input_fraction_bits) noexcept -> int64_t {
+// Precision: ~4.2e-10 when fraction_bits=32
+template <int InputFractionBits = 32>
+inline constexpr auto LookupAtan(int64_t x) noexcept -> int64_t {
     // Constants
     constexpr int kOutputFractionBits = 32;  // Internal calculation format
     constexpr int64_t kOne = 1LL << kOutputFractionBits;
+    constexpr int64_t kPiOver2 = 0x00000001921FB544LL;  // pi/2 = 1.5707963267948966
 
-    // Handle negative input
-    bool is_negative = false;
-    if (x < 0) {
-        x = -x;
-        is_negative = true;
-    }
+    // Handle negative input without branching: sign_mask is 0 or -1
+    const int64_t sign_mask = x >> 63;
+    x = (x ^ sign_mask) - sign_mask;
 
-    // Convert input to internal format if needed
-    if (input_fraction_bits != kOutputFractionBits) {
-        if (input_fraction_bits < kOutputFractionBits) {
-            x <<= (kOutputFractionBits - input_fraction_bits);
-        } else {
-            x >>= (input_fraction_bits - kOutputFractionBits);
-        }
+    // Convert input to internal format
+    if constexpr (InputFractionBits != kOutputFractionBits) {
+        x = Primitives::ShiftFractionBits(x, InputFractionBits, kOutputFractionBits);
     }
 
     // 1. Ensure x is in [0,1] range
-    if (x <= 0) {
+    if (x <= 0) [[unlikely]] {
         return 0;
     }
     bool use_reciprocal = false;
-    if (x >= kOne) {
+    if (x > kOne) [[unlikely]] {
         // For x > 1, use atan(x) = π/2 - atan(1/x)
         use_reciprocal = true;
-        // Calculate 1/x in fixed-point
-        x = Primitives::Fixed64Div(kOne, x, kOutputFractionBits);
+        // Calculate 1/x = 2^64 / x in fixed-point with one 64-bit division:
+        // (2^64 - 1) / x is one short of it only when x is a power of two
+        const uint64_t ux = static_cast<uint64_t>(x);
+        x = static_cast<int64_t>(UINT64_MAX / ux + ((ux & (ux - 1)) == 0 ? 1 : 0));
     }
 
-    // 2. Scale x to table index
-    constexpr int64_t kScale = static_cast<int64_t>(kAtanLut.size() - 2);
-    const int64_t idx_scaled = Primitives::Fixed64Mul(x, kScale << kOutputFractionBits, kOutputFractionBits);
-    const int64_t idx = idx_scaled >> kOutputFractionBits;
-    const int64_t t = idx_scaled & ((1LL << kOutputFractionBits) - 1);  // Fractional part [0,1)
-
-    // 4. Get table values for quadratic interpolation
-    // Need three points: (x0,y0), (x1,y1), (x2,y2)
-    const int64_t y1 = kAtanLut[idx];       // Current point
-    const int64_t y2 = kAtanLut[idx + 1];   // Next point
-    // For the previous point, handle the boundary case
-    int64_t y0;
-    if (idx > 0) {
-        y0 = kAtanLut[idx - 1];  // Previous point
-    } else {
-        // At the boundary, mirror the slope for better extrapolation
-        y0 = y1 - (y2 - y1);
-    }
+    // 2. Split x into table index and fraction
+    const int64_t idx = x >> (kOutputFractionBits - kAtanLutBits);
+    const int64_t t = (x << kAtanLutBits) & ((1LL << kOutputFractionBits) - 1);  // Fractional part [0,1)
+
+    // 4. Get the precomputed Hermite coefficients of this segment
+    const AtanSegment& seg = kAtanTable[idx];
 
-    // 5. Quadratic interpolation
-    // The correct Lagrange quadratic formula coefficients for points at (-1,y0), (0,y1), (1,y2):
-    // a = (y0 + y2)/2 - y1
-    // b = (y2 - y0)/2
-    // c = y1
-    // c = y0
-    const int64_t a = (y0 + y2)/2 - y1;
-    const int64_t b = (y2 - y0)/2;
-    const int64_t c = y1;
-
-    // Calculate polynomial a*t^2 + b*t + c
-    const int64_t t_squared = Primitives::Fixed64Mul(t, t, kOutputFractionBits);
-    int64_t result = c;
-    result += Primitives::Fixed64Mul(b, t, kOutputFractionBits);
-    result += Primitives::Fixed64Mul(a, t_squared, kOutputFractionBits);
+    // 5. Evaluate the cubic p(t) = ((a*t + b)*t + c)*t + d using
+    // Horner's method; the generator checked that every operand stays below
+    // 2^24, so t * operand fits in 64 bits
+    int64_t result = Primitives::Fixed64MulNarrow(t, seg.a, kOutputFractionBits) + seg.b;
+    result = Primitives::Fixed64MulNarrow(t, result, kOutputFractionBits) + seg.c;
+    result = Primitives::Fixed64MulNarrow(t, result, kOutputFractionBits) + seg.d;
 
     // Apply reciprocal formula if needed
-    if (use_reciprocal) {
-        // π/2 in our fixed-point format
-    constexpr int64_t kHalfPi = 0x00000001921FB544LL;  // pi/2 = 1.5707963267948966
-        result = kHalfPi - result;
+    if (use_reciprocal) [[unlikely]] {
+        result = kPiOver2 - result;
     }
 
-    // 6. Convert result back to input format if needed
-    if (input_fraction_bits != kOutputFractionBits) {
-        if (input_fraction_bits < kOutputFractionBits) {
-            result >>= (kOutputFractionBits - input_fraction_bits);
-        } else {
-            result <<= (input_fraction_bits - kOutputFractionBits);
-        }
+    // 6. Convert result back to input format
+    if constexpr (InputFractionBits != kOutputFractionBits) {
+        result = Primitives::ShiftFractionBits(result, kOutputFractionBits, InputFractionBits);
     }
 
     // Apply sign
-    return is_negative ? -result : result;
+    return (result ^ sign_mask) - sign_mask;
 }
 
-// Fast lookup atan(x) with linear interpolation between table entries
-// Input x is in fixed-point format with specified fraction bits representing a value in [-1,1]
-// Output is in fixed-point format with the same fraction bits representing atan(x)
-}  // namespace math::fp::detail
\ No newline at end of file
+// Four LookupAtanFast evaluations at once, bit-identical to calling it per element
+// With AVX2 the table interpolation runs in 64-bit vector lanes; if any lane needs
+// the |x| > 1 reduction, or without AVX2, each element goes through LookupAtanFast
+template <int InputFractionBits = 32>
+inline auto LookupAtanFastx4(const int64_t* x, int64_t* out) noexcept -> void {
+#if defined(__AVX2__)
+    if constexpr (!FIXED64_MATH_ATAN_FAST_USE_POLY) {
+        constexpr int kOutputFractionBits = 32;  // Internal calculation format
+        const __m256i zero = _mm256_setzero_si256();
+        __m256i v = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(x));
+
+        // Handle negative input without branching: sign_mask is 0 or -1
+        const __m256i sign_mask = _mm256_cmpgt_epi64(zero, v);
+        v = _mm256_sub_epi64(_mm256_xor_si256(v, sign_mask), sign_mask);
+
+        // Convert input to internal format; v is non-negative, so logical shifts
+        // match the scalar arithmetic ones
+        if constexpr (InputFractionBits < kOutputFractionBits) {
+            v = _mm256_slli_epi64(v, kOutputFractionBits - InputFractionBits);
+        } else if constexpr (InputFractionBits > kOutputFractionBits) {
+            v = _mm256_srli_epi64(v, InputFractionBits - kOutputFractionBits);
+        }
+
+        // Only take the vector path when every lane is already in [0,1]
+        const __m256i one = _mm256_set1_epi64x(1LL << kOutputFractionBits);
+        const __m256i outside = _mm256_or_si256(_mm256_cmpgt_epi64(v, one), _mm256_cmpgt_epi64(zero, v));
+        if (_mm256_testz_si256(outside, outside)) {
+            // Split x into table index and fraction
+            const __m256i idx = _mm256_srli_epi64(v, kOutputFractionBits - kAtanLutBits);
+            const __m256i low_mask = _mm256_set1_epi64x(0xFFFFFFFFLL);
+            const __m256i t = _mm256_and_si256(_mm256_slli_epi64(v, kAtanLutBits), low_mask);
+
+            // Each AtanSegment is two 64-bit words, {a, b} and {c, d}
+            static_assert(sizeof(AtanSegment) == 16);
+            const auto* words = reinterpret_cast<const long long*>(kAtanTable.data());
+            const __m256i word_idx = _mm256_slli_epi64(idx, 1);
+            const __m256i ab = _mm256_i64gather_epi64(words, word_idx, 8);
+            const __m256i cd = _mm256_i64gather_epi64(words + 1, word_idx, 8);
+
+            // Sign-extend a, b and c from 32 bits: (v ^ 2^31) - 2^31
+            const __m256i bias = _mm256_set1_epi64x(0x80000000LL);
+            const auto sign_extend = [&](__m256i w) {
+                return _mm256_sub_epi64(_mm256_xor_si256(w, bias), bias);
+            };
+            const __m256i a = sign_extend(_mm256_and_si256(ab, low_mask));
+            const __m256i b = sign_extend(_mm256_srli_epi64(ab, 32));
+            const __m256i c = sign_extend(_mm256_and_si256(cd, low_mask));
+            const __m256i d = _mm256_srli_epi64(cd, 32);
+
+            // Linear interpolation: p(1) - p(0) = a + b + c is in [0, 2^32), and so is t,
+            // so one 32x32->64 multiply per lane is exact; round to nearest like the scalar path
+            const __m256i dy = _mm256_add_epi64(_mm256_add_epi64(a, b), c);
+            const __m256i half = _mm256_set1_epi64x(1LL << (kOutputFractionBits - 1));
+            const __m256i step = _mm256_add_epi64(_mm256_mul_epu32(dy, t), half);
+            __m256i result = _mm256_add_epi64(d, _mm256_srli_epi64(step, kOutputFractionBits));
+
+            // Convert result back to input format
+            if constexpr (InputFractionBits < kOutputFractionBits) {
+                result = _mm256_srli_epi64(result, kOutputFractionBits - InputFractionBits);
+            } else if constexpr (InputFractionBits > kOutputFractionBits) {
+                result = _mm256_slli_epi64(result, InputFractionBits - kOutputFractionBits);
+            }
+
+            // Apply sign
+            result = _mm256_sub_epi64(_mm256_xor_si256(result, sign_mask), sign_mask);
+            _mm256_storeu_si256(reinterpret_cast<__m256i*>(out), result);
+            return;
+        }
+    }
+#endif
+    for (int i = 0; i < 4; ++i) {
+        out[i] = LookupAtanFast<InputFractionBits>(x[i]);
+    }
+}
+
+// LookupAtanFast over count elements, four at a time through LookupAtanFastx4
+// and the remaining tail per element; out may be the same array as x
+template <int InputFractionBits = 32>
+inline auto LookupAtanFastBatch(const int64_t* x, int64_t* out, size_t count) noexcept -> void {
+    size_t i = 0;
+    for (; i + 4 <= count; i += 4) {
+        LookupAtanFastx4<InputFractionBits>(x + i, out + i);
+    }
+    for (; i < count; ++i) {
+        out[i] = LookupAtanFast<InputFractionBits>(x[i]);
+    }
+}
+
+// LookupAtanFast for input_fraction_bits known only at runtime
+inline constexpr auto LookupAtanFast(int64_t x, int input_fraction_bits) noexcept -> int64_t {
+    // Formats of the Fixed64 aliases get their shifts folded at compile time
+    switch (input_fraction_bits) {
+        case 16:
+            return LookupAtanFast<16>(x);
+        case 32:
+            return LookupAtanFast<32>(x);
+        case 40:
+            return LookupAtanFast<40>(x);
+        default:
+            break;
+    }
+
+    constexpr int kOutputFractionBits = 32;
+    const int64_t sign_mask = x >> 63;
+    x = (x ^ sign_mask) - sign_mask;
+    x = Primitives::ShiftFractionBits(x, input_fraction_bits, kOutputFractionBits);
+    int64_t result = LookupAtanFast<kOutputFractionBits>(x);
+    result = Primitives::ShiftFractionBits(result, kOutputFractionBits, input_fraction_bits);
+    return (result ^ sign_mask) - sign_mask;
+}
+
+// LookupAtan for input_fraction_bits known only at runtime
+inline constexpr auto LookupAtan(int64_t x, int input_fraction_bits) noexcept -> int64_t {
+    // Formats of the Fixed64 aliases get their shifts folded at compile time
+    switch (input_fraction_bits) {
+        case 16:
+            return LookupAtan<16>(x);
+        case 32:
+            return LookupAtan<32>(x);
+        case 40:
+            return LookupAtan<40>(x);
+        default:
+            break;
+    }
+
+    constexpr int kOutputFractionBits = 32;
+    const int64_t sign_mask = x >> 63;
+    x = (x ^ sign_mask) - sign_mask;
+    x = Primitives::ShiftFractionBits(x, input_fraction_bits, kOutputFractionBits);
+    int64_t result = LookupAtan<kOutputFractionBits>(x);
+    result = Primitives::ShiftFractionBits(result, kOutputFractionBits, input_fraction_bits);
+    return (result ^ sign_mask) - sign_mask;
+}
+
+}  // namespace math::fp::detail
@@ -4,694 +4,2111 @@
 #include <array>
 #include "primitives.h"
 
-// Sin lookup table with 512 entries
-// Covers the range [0,pi/2] with values in Q31.32 format
+#if defined(__AVX2__)
+#include <immintrin.h>
+#endif
+
+// Sin lookup tables with 512 entries, one per interval
+// Cover the range [0,pi/2] with values in Q31.32 format
 // Generated with mpmath library at 100 digits precision
 
 namespace math::fp::detail {
-// Table maps x in [0,pi/2] to sin(x)
-// Values stored in Q31.32 fixed-point format
-inline constexpr std::array<int64_t, 513> kSinLut = {
-    0x0000000000000000LL, // sin(0.00000000000000) = 0.00000000000000
-    0x0000000000C97480LL, // sin(0.00307396541447) = 0.00307396057336
-    0x000000000192E883LL, // sin(0.00614793082894) = 0.00614789210007
-    0x00000000025C5B8DLL, // sin(0.00922189624341) = 0.00922176553378
-    0x000000000325CD20LL, // sin(0.01229586165789) = 0.01229555182867
-    0x0000000003EF3CC1LL, // sin(0.01536982707236) = 0.01536922193974
-    0x0000000004B8A9F2LL, // sin(0.01844379248683) = 0.01844274682310
-    0x0000000005821436LL, // sin(0.02151775790130) = 0.02151609743622
-    0x00000000064B7B11LL, // sin(0.02459172331577) = 0.02458924473824
-    0x000000000714DE07LL, // sin(0.02766568873024) = 0.02766215969018
-    0x0000000007DE3C99LL, // sin(0.03073965414471) = 0.03073481325530
-    0x0000000008A7964DLL, // sin(0.03381361955919) = 0.03380717639931
-    0x000000000970EAA4LL, // sin(0.03688758497366) = 0.03687922009065
-    0x000000000A3A3922LL, // sin(0.03996155038813) = 0.03995091530080
-    0x000000000B03814BLL, // sin(0.04303551580260) = 0.04302223300453
-    0x000000000BCCC2A2LL, // sin(0.04610948121707) = 0.04609314418017
-    0x000000000C95FCABLL, // sin(0.04918344663154) = 0.04916361980989
-    0x000000000D5F2EE8LL, // sin(0.05225741204601) = 0.05223363087999
-    0x000000000E2858DDLL, // sin(0.05533137746049) = 0.05530314838114
-    0x000000000EF17A0ELL, // sin(0.05840534287496) = 0.05837214330869
-    0x000000000FBA91FELL, // sin(0.06147930828943) = 0.06144058666292
-    0x000000001083A030LL, // sin(0.06455327370390) = 0.06450844944932
-    0x00000000114CA429LL, // sin(0.06762723911837) = 0.06757570267887
-    0x0000000012159D6ALL, // sin(0.07070120453284) = 0.07064231736831
-    0x0000000012DE8B79LL, // sin(0.07377516994731) = 0.07370826454041
-    0x0000000013A76DD9LL, // sin(0.07684913536179) = 0.07677351522426
-    0x000000001470440CLL, // sin(0.07992310077626) = 0.07983804045552
-    0x0000000015390D98LL, // sin(0.08299706619073) = 0.08290181127670
-    0x000000001601C9FFLL, // sin(0.08607103160520) = 0.08596479873745
-    0x0000000016CA78C5LL, // sin(0.08914499701967) = 0.08902697389481
-    0x000000001793196ELL, // sin(0.09221896243414) = 0.09208830781351
-    0x00000000185BAB7ELL, // sin(0.09529292784861) = 0.09514877156623
-    0x0000000019242E78LL, // sin(0.09836689326309) = 0.09820833623385
-    0x0000000019ECA1E0LL, // sin(0.10144085867756) = 0.10126697290576
-    0x000000001AB5053BLL, // sin(0.10451482409203) = 0.10432465268013
-    0x000000001B7D580CLL, // sin(0.10758878950650) = 0.10738134666416
-    0x000000001C4599D6LL, // sin(0.11066275492097) = 0.11043702597437
-    0x000000001D0DCA1FLL, // sin(0.11373672033544) = 0.11349166173685
-    0x000000001DD5E86ALL, // sin(0.11681068574991) = 0.11654522508757
-    0x000000001E9DF43BLL, // sin(0.11988465116439) = 0.11959768717263
-    0x000000001F65ED16LL, // sin(0.12295861657886) = 0.12264901914854
-    0x00000000202DD27FLL, // sin(0.12603258199333) = 0.12569919218248
-    0x0000000020F5A3FBLL, // sin(0.12910654740780) = 0.12874817745258
-    0x0000000021BD610ELL, // sin(0.13218051282227) = 0.13179594614820
-    0x000000002285093CLL, // sin(0.13525447823674) = 0.13484246947020
-    0x00000000234C9C0ALL, // sin(0.13832844365121) = 0.13788771863119
-    0x00000000241418FBLL, // sin(0.14140240906569) = 0.14093166485584
-    0x0000000024DB7F95LL, // sin(0.14447637448016) = 0.14397427938112
-    0x0000000025A2CF5CLL, // sin(0.14755033989463) = 0.14701553345659
-    0x00000000266A07D4LL, // sin(0.15062430530910) = 0.15005539834465
-    0x0000000027312882LL, // sin(0.15369827072357) = 0.15309384532086
-    0x0000000027F830ECLL, // sin(0.15677223613804) = 0.15613084567413
-    0x0000000028BF2094LL, // sin(0.15984620155251) = 0.15916637070709
-    0x000000002985F701LL, // sin(0.16292016696699) = 0.16220039173628
-    0x000000002A4CB3B8LL, // sin(0.16599413238146) = 0.16523288009245
-    0x000000002B13563CLL, // sin(0.16906809779593) = 0.16826380712085
-    0x000000002BD9DE14LL, // sin(0.17214206321040) = 0.17129314418148
-    0x000000002CA04AC4LL, // sin(0.17521602862487) = 0.17432086264934
-    0x000000002D669BD1LL, // sin(0.17828999403934) = 0.17734693391477
-    0x000000002E2CD0C0LL, // sin(0.18136395945381) = 0.18037132938362
-    0x000000002EF2E918LL, // sin(0.18443792486829) = 0.18339402047762
-    0x000000002FB8E45CLL, // sin(0.18751189028276) = 0.18641497863459
-    0x00000000307EC213LL, // sin(0.19058585569723) = 0.18943417530871
-    0x00000000314481C2LL, // sin(0.19365982111170) = 0.19245158197083
-    0x00000000320A22EFLL, // sin(0.19673378652617) = 0.19546717010870
-    0x0000000032CFA51ELL, // sin(0.19980775194064) = 0.19848091122725
-    0x00000000339507D6LL, // sin(0.20288171735511) = 0.20149277684887
-    0x00000000345A4A9DLL, // sin(0.20595568276959) = 0.20450273851368
-    0x00000000351F6CF9LL, // sin(0.20902964818406) = 0.20751076777978
-    0x0000000035E46E6ELL, // sin(0.21210361359853) = 0.21051683622352
-    0x0000000036A94E84LL, // sin(0.21517757901300) = 0.21352091543980
-    0x00000000376E0CC1LL, // sin(0.21825154442747) = 0.21652297704230
-    0x000000003832A8AALL, // sin(0.22132550984194) = 0.21952299266378
-    0x0000000038F721C6LL, // sin(0.22439947525641) = 0.22252093395631
-    0x0000000039BB779ALL, // sin(0.22747344067089) = 0.22551677259160
-    0x000000003A7FA9AFLL, // sin(0.23054740608536) = 0.22851048026118
-    0x000000003B43B78ALL, // sin(0.23362137149983) = 0.23150202867675
-    0x000000003C07A0B1LL, // sin(0.23669533691430) = 0.23449138957041
-    0x000000003CCB64ACLL, // sin(0.23976930232877) = 0.23747853469491
-    0x000000003D8F0300LL, // sin(0.24284326774324) = 0.24046343582396
-    0x000000003E527B36LL, // sin(0.24591723315771) = 0.24344606475247
-    0x000000003F15CCD4LL, // sin(0.24899119857219) = 0.24642639329680
-    0x000000003FD8F760LL, // sin(0.25206516398666) = 0.24940439329508
-    0x00000000409BFA63LL, // sin(0.25513912940113) = 0.25238003660741
-    0x00000000415ED563LL, // sin(0.25821309481560) = 0.25535329511619
-    0x00000000422187E8LL, // sin(0.26128706023007) = 0.25832414072633
-    0x0000000042E41179LL, // sin(0.26436102564454) = 0.26129254536555
-    0x0000000043A6719DLL, // sin(0.26743499105901) = 0.26425848098463
-    0x000000004468A7DDLL, // sin(0.27050895647349) = 0.26722191955770
-    0x00000000452AB3C0LL, // sin(0.27358292188796) = 0.27018283308246
-    0x0000000045EC94CDLL, // sin(0.27665688730243) = 0.27314119358049
-    0x0000000046AE4A8DLL, // sin(0.27973085271690) = 0.27609697309747
-    0x00000000476FD489LL, // sin(0.28280481813137) = 0.27905014370349
-    0x0000000048313247LL, // sin(0.28587878354584) = 0.28200067749329
-    0x0000000048F26350LL, // sin(0.28895274896031) = 0.28494854658651
-    0x0000000049B3672DLL, // sin(0.29202671437479) = 0.28789372312799
-    0x000000004A743D66LL, // sin(0.29510067978926) = 0.29083617928800
-    0x000000004B34E584LL, // sin(0.29817464520373) = 0.29377588726252
-    0x000000004BF55F0FLL, // sin(0.30124861061820) = 0.29671281927349
-    0x000000004CB5A990LL, // sin(0.30432257603267) = 0.29964694756910
-    0x000000004D75C490LL, // sin(0.30739654144714) = 0.30257824442401
-    0x000000004E35AF98LL, // sin(0.31047050686161) = 0.30550668213965
-    0x000000004EF56A31LL, // sin(0.31354447227609) = 0.30843223304446
-    0x000000004FB4F3E5LL, // sin(0.31661843769056) = 0.31135486949417
-    0x0000000050744C3DLL, // sin(0.31969240310503) = 0.31427456387203
-    0x00000000513372C3LL, // sin(0.32276636851950) = 0.31719128858911
-    0x0000000051F266FFLL, // sin(0.32584033393397) = 0.32010501608452
-    0x0000000052B1287CLL, // sin(0.32891429934844) = 0.32301571882571
-    0x00000000536FB6C4LL, // sin(0.33198826476291) = 0.32592336930870
-    0x00000000542E1160LL, // sin(0.33506223017739) = 0.32882794005836
-    0x0000000054EC37DBLL, // sin(0.33813619559186) = 0.33172940362866
-    0x0000000055AA29BFLL, // sin(0.34121016100633) = 0.33462773260293
-    0x000000005667E697LL, // sin(0.34428412642080) = 0.33752289959411
-    0x0000000057256DECLL, // sin(0.34735809183527) = 0.34041487724503
-    0x0000000057E2BF4ALL, // sin(0.35043205724974) = 0.34330363822866
-    0x00000000589FDA3CLL, // sin(0.35350602266421) = 0.34618915524834
-    0x00000000595CBE4BLL, // sin(0.35657998807868) = 0.34907140103810
-    0x000000005A196B04LL, // sin(0.35965395349316) = 0.35195034836285
-    0x000000005AD5DFF1LL, // sin(0.36272791890763) = 0.35482597001869
-    0x000000005B921C9DLL, // sin(0.36580188432210) = 0.35769823883313
-    0x000000005C4E2095LL, // sin(0.36887584973657) = 0.36056712766536
-    0x000000005D09EB63LL, // sin(0.37194981515104) = 0.36343260940652
-    0x000000005DC57C94LL, // sin(0.37502378056551) = 0.36629465697994
-    0x000000005E80D3B3LL, // sin(0.37809774597998) = 0.36915324334141
-    0x000000005F3BF04CLL, // sin(0.38117171139446) = 0.37200834147940
-    0x000000005FF6D1EBLL, // sin(0.38424567680893) = 0.37485992441536
-    0x0000000060B1781DLL, // sin(0.38731964222340) = 0.37770796520396
-    0x00000000616BE26FLL, // sin(0.39039360763787) = 0.38055243693334
-    0x000000006226106BLL, // sin(0.39346757305234) = 0.38339331272534
-    0x0000000062E001A0LL, // sin(0.39654153846681) = 0.38623056573581
-    0x000000006399B59ALL, // sin(0.39961550388128) = 0.38906416915481
-    0x0000000064532BE6LL, // sin(0.40268946929576) = 0.39189409620691
-    0x00000000650C6412LL, // sin(0.40576343471023) = 0.39472032015140
-    0x0000000065C55DAALL, // sin(0.40883740012470) = 0.39754281428256
-    0x00000000667E183CLL, // sin(0.41191136553917) = 0.40036155192992
-    0x0000000067369355LL, // sin(0.41498533095364) = 0.40317650645852
-    0x0000000067EECE84LL, // sin(0.41805929636811) = 0.40598765126912
-    0x0000000068A6C957LL, // sin(0.42113326178258) = 0.40879495979851
-    0x00000000695E835ALL, // sin(0.42420722719706) = 0.41159840551969
-    0x000000006A15FC1ELL, // sin(0.42728119261153) = 0.41439796194220
-    0x000000006ACD332FLL, // sin(0.43035515802600) = 0.41719360261232
-    0x000000006B84281DLL, // sin(0.43342912344047) = 0.41998530111331
-    0x000000006C3ADA76LL, // sin(0.43650308885494) = 0.42277303106570
-    0x000000006CF149C9LL, // sin(0.43957705426941) = 0.42555676612752
-    0x000000006DA775A5LL, // sin(0.44265101968388) = 0.42833647999455
-    0x000000006E5D5D99LL, // sin(0.44572498509836) = 0.43111214640056
-    0x000000006F130135LL, // sin(0.44879895051283) = 0.43388373911756
-    0x000000006FC86009LL, // sin(0.45187291592730) = 0.43665123195606
-    0x00000000707D79A3LL, // sin(0.45494688134177) = 0.43941459876533
-    0x0000000071324D93LL, // sin(0.45802084675624) = 0.44217381343359
-    0x0000000071E6DB6BLL, // sin(0.46109481217071) = 0.44492884988832
-    0x00000000729B22B9LL, // sin(0.46416877758518) = 0.44767968209648
-    0x00000000734F230FLL, // sin(0.46724274299966) = 0.45042628406475
-    0x000000007402DBFCLL, // sin(0.47031670841413) = 0.45316862983979
-    0x0000000074B64D12LL, // sin(0.47339067382860) = 0.45590669350846
-    0x00000000756975E1LL, // sin(0.47646463924307) = 0.45864044919810
-    0x00000000761C55FBLL, // sin(0.47953860465754) = 0.46136987107677
-    0x0000000076CEECF0LL, // sin(0.48261257007201) = 0.46409493335344
-    0x0000000077813A53LL, // sin(0.48568653548648) = 0.46681561027831
-    0x0000000078333DB4LL, // sin(0.48876050090096) = 0.46953187614301
-    0x0000000078E4F6A5LL, // sin(0.49183446631543) = 0.47224370528085
-    0x00000000799664B9LL, // sin(0.49490843172990) = 0.47495107206705
-    0x000000007A478782LL, // sin(0.49798239714437) = 0.47765395091902
-    0x000000007AF85E91LL, // sin(0.50105636255884) = 0.48035231629656
-    0x000000007BA8E979LL, // sin(0.50413032797331) = 0.48304614270213
-    0x000000007C5927CDLL, // sin(0.50720429338778) = 0.48573540468107
-    0x000000007D091920LL, // sin(0.51027825880226) = 0.48842007682186
-    0x000000007DB8BD05LL, // sin(0.51335222421673) = 0.49110013375635
-    0x000000007E68130FLL, // sin(0.51642618963120) = 0.49377555015998
-    0x000000007F171AD1LL, // sin(0.51950015504567) = 0.49644630075206
-    0x000000007FC5D3E0LL, // sin(0.52257412046014) = 0.49911236029600
-    0x0000000080743DCELL, // sin(0.52564808587461) = 0.50177370359951
-    0x0000000081225831LL, // sin(0.52872205128908) = 0.50443030551487
-    0x0000000081D0229BLL, // sin(0.53179601670356) = 0.50708214093918
-    0x00000000827D9CA2LL, // sin(0.53486998211803) = 0.50972918481456
-    0x00000000832AC5DALL, // sin(0.53794394753250) = 0.51237141212842
-    0x0000000083D79DD8LL, // sin(0.54101791294697) = 0.51500879791368
-    0x0000000084842430LL, // sin(0.54409187836144) = 0.51764131724900
-    0x0000000085305879LL, // sin(0.54716584377591) = 0.52026894525903
-    0x0000000085DC3A46LL, // sin(0.55023980919038) = 0.52289165711465
-    0x000000008687C92FLL, // sin(0.55331377460486) = 0.52550942803318
-    0x00000000873304C8LL, // sin(0.55638774001933) = 0.52812223327863
-    0x0000000087DDECA7LL, // sin(0.55946170543380) = 0.53073004816193
-    0x0000000088888064LL, // sin(0.56253567084827) = 0.53333284804118
-    0x000000008932BF93LL, // sin(0.56560963626274) = 0.53593060832186
-    0x0000000089DCA9CCLL, // sin(0.56868360167721) = 0.53852330445706
-    0x000000008A863EA6LL, // sin(0.57175756709168) = 0.54111091194772
-    0x000000008B2F7DB7LL, // sin(0.57483153250616) = 0.54369340634290
-    0x000000008BD86696LL, // sin(0.57790549792063) = 0.54627076323993
-    0x000000008C80F8DCLL, // sin(0.58097946333510) = 0.54884295828472
-    0x000000008D29341FLL, // sin(0.58405342874957) = 0.55140996717193
-    0x000000008DD117F8LL, // sin(0.58712739416404) = 0.55397176564523
-    0x000000008E78A3FELL, // sin(0.59020135957851) = 0.55652832949755
-    0x000000008F1FD7CALL, // sin(0.59327532499298) = 0.55907963457125
-    0x000000008FC6B2F4LL, // sin(0.59634929040746) = 0.56162565675839
-    0x00000000906D3515LL, // sin(0.59942325582193) = 0.56416637200097
-    0x0000000091135DC5LL, // sin(0.60249722123640) = 0.56670175629112
-    0x0000000091B92C9FLL, // sin(0.60557118665087) = 0.56923178567133
-    0x00000000925EA13ALL, // sin(0.60864515206534) = 0.57175643623472
-    0x000000009303BB32LL, // sin(0.61171911747981) = 0.57427568412521
-    0x0000000093A87A1ELL, // sin(0.61479308289428) = 0.57678950553779
-    0x00000000944CDD9BLL, // sin(0.61786704830876) = 0.57929787671872
-    0x0000000094F0E540LL, // sin(0.62094101372323) = 0.58180077396575
-    0x00000000959490AALL, // sin(0.62401497913770) = 0.58429817362837
-    0x000000009637DF73LL, // sin(0.62708894455217) = 0.58679005210800
-    0x0000000096DAD135LL, // sin(0.63016290996664) = 0.58927638585826
-    0x00000000977D658CLL, // sin(0.63323687538111) = 0.59175715138514
-    0x00000000981F9C13LL, // sin(0.63631084079558) = 0.59423232524724
-    0x0000000098C17465LL, // sin(0.63938480621006) = 0.59670188405602
-    0x000000009962EE1FLL, // sin(0.64245877162453) = 0.59916580447599
-    0x000000009A0408DCLL, // sin(0.64553273703900) = 0.60162406322492
-    0x000000009AA4C438LL, // sin(0.64860670245347) = 0.60407663707411
-    0x000000009B451FD0LL, // sin(0.65168066786794) = 0.60652350284856
-    0x000000009BE51B42LL, // sin(0.65475463328241) = 0.60896463742720
-    0x000000009C84B628LL, // sin(0.65782859869688) = 0.61140001774313
-    0x000000009D23F022LL, // sin(0.66090256411136) = 0.61382962078381
-    0x000000009DC2C8CCLL, // sin(0.66397652952583) = 0.61625342359132
-    0x000000009E613FC3LL, // sin(0.66705049494030) = 0.61867140326250
-    0x000000009EFF54A7LL, // sin(0.67012446035477) = 0.62108353694927
-    0x000000009F9D0714LL, // sin(0.67319842576924) = 0.62348980185873
-    0x00000000A03A56A9LL, // sin(0.67627239118371) = 0.62589017525350
-    0x00000000A0D74305LL, // sin(0.67934635659818) = 0.62828463445181
-    0x00000000A173CBC7LL, // sin(0.68242032201266) = 0.63067315682781
-    0x00000000A20FF08DLL, // sin(0.68549428742713) = 0.63305571981175
-    0x00000000A2ABB0F7LL, // sin(0.68856825284160) = 0.63543230089018
-    0x00000000A3470CA4LL, // sin(0.69164221825607) = 0.63780287760617
-    0x00000000A3E20335LL, // sin(0.69471618367054) = 0.64016742755953
-    0x00000000A47C9449LL, // sin(0.69779014908501) = 0.64252592840704
-    0x00000000A516BF80LL, // sin(0.70086411449948) = 0.64487835786261
-    0x00000000A5B0847CLL, // sin(0.70393807991396) = 0.64722469369753
-    0x00000000A649E2DDLL, // sin(0.70701204532843) = 0.64956491374068
-    0x00000000A6E2DA43LL, // sin(0.71008601074290) = 0.65189899587871
-    0x00000000A77B6A51LL, // sin(0.71315997615737) = 0.65422691805630
-    0x00000000A81392A7LL, // sin(0.71623394157184) = 0.65654865827630
-    0x00000000A8AB52E8LL, // sin(0.71930790698631) = 0.65886419459999
-    0x00000000A942AAB5LL, // sin(0.72238187240078) = 0.66117350514729
-    0x00000000A9D999B1LL, // sin(0.72545583781526) = 0.66347656809693
-    0x00000000AA701F7ELL, // sin(0.72852980322973) = 0.66577336168668
-    0x00000000AB063BC0LL, // sin(0.73160376864420) = 0.66806386421353
-    0x00000000AB9BEE19LL, // sin(0.73467773405867) = 0.67034805403396
-    0x00000000AC31362CLL, // sin(0.73775169947314) = 0.67262590956407
-    0x00000000ACC6139DLL, // sin(0.74082566488761) = 0.67489740927981
-    0x00000000AD5A860FLL, // sin(0.74389963030208) = 0.67716253171720
-    0x00000000ADEE8D28LL, // sin(0.74697359571656) = 0.67942125547253
-    0x00000000AE82288BLL, // sin(0.75004756113103) = 0.68167355920253
-    0x00000000AF1557DCLL, // sin(0.75312152654550) = 0.68391942162461
-    0x00000000AFA81AC2LL, // sin(0.75619549195997) = 0.68615882151704
-    0x00000000B03A70E0LL, // sin(0.75926945737444) = 0.68839173771916
-    0x00000000B0CC59DCLL, // sin(0.76234342278891) = 0.69061814913157
-    0x00000000B15DD55CLL, // sin(0.76541738820338) = 0.69283803471634
-    0x00000000B1EEE306LL, // sin(0.76849135361786) = 0.69505137349720
-    0x00000000B27F827FLL, // sin(0.77156531903233) = 0.69725814455975
-    0x00000000B30FB36FLL, // sin(0.77463928444680) = 0.69945832705165
-    0x00000000B39F757CLL, // sin(0.77771324986127) = 0.70165190018280
-    0x00000000B42EC84DLL, // sin(0.78078721527574) = 0.70383884322557
-    0x00000000B4BDAB89LL, // sin(0.78386118069021) = 0.70601913551498
-    0x00000000B54C1ED8LL, // sin(0.78693514610468) = 0.70819275644889
-    0x00000000B5DA21E1LL, // sin(0.79000911151916) = 0.71035968548820
-    0x00000000B667B44DLL, // sin(0.79308307693363) = 0.71251990215703
-    0x00000000B6F4D5C4LL, // sin(0.79615704234810) = 0.71467338604296
-    0x00000000B78185EELL, // sin(0.79923100776257) = 0.71682011679716
-    0x00000000B80DC475LL, // sin(0.80230497317704) = 0.71896007413462
-    0x00000000B8999101LL, // sin(0.80537893859151) = 0.72109323783433
-    0x00000000B924EB3DLL, // sin(0.80845290400598) = 0.72321958773949
-    0x00000000B9AFD2D1LL, // sin(0.81152686942046) = 0.72533910375768
-    0x00000000BA3A4767LL, // sin(0.81460083483493) = 0.72745176586104
-    0x00000000BAC448ABLL, // sin(0.81767480024940) = 0.72955755408649
-    0x00000000BB4DD646LL, // sin(0.82074876566387) = 0.73165644853589
-    0x00000000BBD6EFE3LL, // sin(0.82382273107834) = 0.73374842937626
-    0x00000000BC5F952ELL, // sin(0.82689669649281) = 0.73583347683994
-    0x00000000BCE7C5D1LL, // sin(0.82997066190728) = 0.73791157122477
-    0x00000000BD6F8179LL, // sin(0.83304462732176) = 0.73998269289431
-    0x00000000BDF6C7D1LL, // sin(0.83611859273623) = 0.74204682227800
-    0x00000000BE7D9886LL, // sin(0.83919255815070) = 0.74410393987136
-    0x00000000BF03F344LL, // sin(0.84226652356517) = 0.74615402623615
-    0x00000000BF89D7B8LL, // sin(0.84534048897964) = 0.74819706200059
-    0x00000000C00F458FLL, // sin(0.84841445439411) = 0.75023302785950
-    0x00000000C0943C76LL, // sin(0.85148841980858) = 0.75226190457453
-    0x00000000C118BC1BLL, // sin(0.85456238522306) = 0.75428367297430
-    0x00000000C19CC42CLL, // sin(0.85763635063753) = 0.75629831395459
-    0x00000000C2205457LL, // sin(0.86071031605200) = 0.75830580847856
-    0x00000000C2A36C4BLL, // sin(0.86378428146647) = 0.76030613757688
-    0x00000000C3260BB7LL, // sin(0.86685824688094) = 0.76229928234791
-    0x00000000C3A83249LL, // sin(0.86993221229541) = 0.76428522395793
-    0x00000000C429DFB2LL, // sin(0.87300617770988) = 0.76626394364127
-    0x00000000C4AB13A0LL, // sin(0.87608014312436) = 0.76823542270050
-    0x00000000C52BCDC3LL, // sin(0.87915410853883) = 0.77019964250660
-    0x00000000C5AC0DCDLL, // sin(0.88222807395330) = 0.77215658449916
-    0x00000000C62BD36ELL, // sin(0.88530203936777) = 0.77410623018655
-    0x00000000C6AB1E56LL, // sin(0.88837600478224) = 0.77604856114604
-    0x00000000C729EE36LL, // sin(0.89144997019671) = 0.77798355902407
-    0x00000000C7A842C1LL, // sin(0.89452393561118) = 0.77991120553634
-    0x00000000C8261BA8LL, // sin(0.89759790102566) = 0.78183148246803
-    0x00000000C8A3789CLL, // sin(0.90067186644013) = 0.78374437167395
-    0x00000000C9205951LL, // sin(0.90374583185460) = 0.78564985507871
-    0x00000000C99CBD79LL, // sin(0.90681979726907) = 0.78754791467693
-    0x00000000CA18A4C7LL, // sin(0.90989376268354) = 0.78943853253334
-    0x00000000CA940EEELL, // sin(0.91296772809801) = 0.79132169078302
-    0x00000000CB0EFBA2LL, // sin(0.91604169351248) = 0.79319737163153
-    0x00000000CB896A97LL, // sin(0.91911565892696) = 0.79506555735506
-    0x00000000CC035B80LL, // sin(0.92218962434143) = 0.79692623030067
-    0x00000000CC7CCE13LL, // sin(0.92526358975590) = 0.79877937288636
-    0x00000000CCF5C204LL, // sin(0.92833755517037) = 0.80062496760134
-    0x00000000CD6E3708LL, // sin(0.93141152058484) = 0.80246299700609
-    0x00000000CDE62CD5LL, // sin(0.93448548599931) = 0.80429344373261
-    0x00000000CE5DA320LL, // sin(0.93755945141378) = 0.80611629048454
-    0x00000000CED4999FLL, // sin(0.94063341682826) = 0.80793152003733
-    0x00000000CF4B100ALL, // sin(0.94370738224273) = 0.80973911523841
-    0x00000000CFC10615LL, // sin(0.94678134765720) = 0.81153905900736
-    0x00000000D0367B79LL, // sin(0.94985531307167) = 0.81333133433605
-    0x00000000D0AB6FEDLL, // sin(0.95292927848614) = 0.81511592428880
-    0x00000000D11FE327LL, // sin(0.95600324390061) = 0.81689281200257
-    0x00000000D193D4E1LL, // sin(0.95907720931508) = 0.81866198068709
-    0x00000000D20744D2LL, // sin(0.96215117472956) = 0.82042341362505
-    0x00000000D27A32B2LL, // sin(0.96522514014403) = 0.82217709417219
-    0x00000000D2EC9E3CLL, // sin(0.96829910555850) = 0.82392300575755
-    0x00000000D35E8727LL, // sin(0.97137307097297) = 0.82566113188357
-    0x00000000D3CFED2DLL, // sin(0.97444703638744) = 0.82739145612624
-    0x00000000D440D008LL, // sin(0.97752100180191) = 0.82911396213529
-    0x00000000D4B12F72LL, // sin(0.98059496721638) = 0.83082863363432
-    0x00000000D5210B25LL, // sin(0.98366893263085) = 0.83253545442095
-    0x00000000D59062DDLL, // sin(0.98674289804533) = 0.83423440836701
-    0x00000000D5FF3653LL, // sin(0.98981686345980) = 0.83592547941864
-    0x00000000D66D8545LL, // sin(0.99289082887427) = 0.83760865159647
-    0x00000000D6DB4F6DLL, // sin(0.99596479428874) = 0.83928390899579
-    0x00000000D7489487LL, // sin(0.99903875970321) = 0.84095123578665
-    0x00000000D7B5544FLL, // sin(1.00211272511768) = 0.84261061621407
-    0x00000000D8218E83LL, // sin(1.00518669053215) = 0.84426203459812
-    0x00000000D88D42E0LL, // sin(1.00826065594663) = 0.84590547533414
-    0x00000000D8F87121LL, // sin(1.01133462136110) = 0.84754092289283
-    0x00000000D9631906LL, // sin(1.01440858677557) = 0.84916836182043
-    0x00000000D9CD3A4CLL, // sin(1.01748255219004) = 0.85078777673885
-    0x00000000DA36D4B2LL, // sin(1.02055651760451) = 0.85239915234583
-    0x00000000DA9FE7F6LL, // sin(1.02363048301898) = 0.85400247341507
-    0x00000000DB0873D6LL, // sin(1.02670444843345) = 0.85559772479637
-    0x00000000DB707813LL, // sin(1.02977841384793) = 0.85718489141579
-    0x00000000DBD7F46BLL, // sin(1.03285237926240) = 0.85876395827580
-    0x00000000DC3EE8A0LL, // sin(1.03592634467687) = 0.86033491045539
-    0x00000000DCA55470LL, // sin(1.03900031009134) = 0.86189773311022
-    0x00000000DD0B379CLL, // sin(1.04207427550581) = 0.86345241147279
-    0x00000000DD7091E7LL, // sin(1.04514824092028) = 0.86499893085254
-    0x00000000DDD5630FLL, // sin(1.04822220633475) = 0.86653727663601
-    0x00000000DE39AAD8LL, // sin(1.05129617174923) = 0.86806743428699
-    0x00000000DE9D6904LL, // sin(1.05437013716370) = 0.86958938934661
-    0x00000000DF009D53LL, // sin(1.05744410257817) = 0.87110312743354
-    0x00000000DF63478ALL, // sin(1.06051806799264) = 0.87260863424408
-    0x00000000DFC5676ALL, // sin(1.06359203340711) = 0.87410589555231
-    0x00000000E026FCB8LL, // sin(1.06666599882158) = 0.87559489721023
-    0x00000000E0880736LL, // sin(1.06973996423605) = 0.87707562514787
-    0x00000000E0E886A8LL, // sin(1.07281392965053) = 0.87854806537346
-    0x00000000E1487AD4LL, // sin(1.07588789506500) = 0.88001220397354
-    0x00000000E1A7E37CLL, // sin(1.07896186047947) = 0.88146802711307
-    0x00000000E206C067LL, // sin(1.08203582589394) = 0.88291552103563
-    0x00000000E265115ALL, // sin(1.08510979130841) = 0.88435467206347
-    0x00000000E2C2D61ALL, // sin(1.08818375672288) = 0.88578546659768
-    0x00000000E3200E6DLL, // sin(1.09125772213735) = 0.88720789111831
-    0x00000000E37CBA19LL, // sin(1.09433168755183) = 0.88862193218453
-    0x00000000E3D8D8E5LL, // sin(1.09740565296630) = 0.89002757643468
-    0x00000000E4346A98LL, // sin(1.10047961838077) = 0.89142481058647
-    0x00000000E48F6EF9LL, // sin(1.10355358379524) = 0.89281362143709
-    0x00000000E4E9E5D0LL, // sin(1.10662754920971) = 0.89419399586331
-    0x00000000E543CEE5LL, // sin(1.10970151462418) = 0.89556592082161
-    0x00000000E59D2A00LL, // sin(1.11277548003865) = 0.89692938334832
-    0x00000000E5F5F6EALL, // sin(1.11584944545313) = 0.89828437055974
-    0x00000000E64E356BLL, // sin(1.11892341086760) = 0.89963086965224
-    0x00000000E6A5E54ELL, // sin(1.12199737628207) = 0.90096886790242
-    0x00000000E6FD065BLL, // sin(1.12507134169654) = 0.90229835266718
-    0x00000000E753985ELL, // sin(1.12814530711101) = 0.90361931138388
-    0x00000000E7A99B20LL, // sin(1.13121927252548) = 0.90493173157044
-    0x00000000E7FF0E6CLL, // sin(1.13429323793995) = 0.90623560082548
-    0x00000000E853F20CLL, // sin(1.13736720335443) = 0.90753090682839
-    0x00000000E8A845CELL, // sin(1.14044116876890) = 0.90881763733950
-    0x00000000E8FC097CLL, // sin(1.14351513418337) = 0.91009578020017
-    0x00000000E94F3CE2LL, // sin(1.14658909959784) = 0.91136532333288
-    0x00000000E9A1DFCDLL, // sin(1.14966306501231) = 0.91262625474141
-    0x00000000E9F3F20ALL, // sin(1.15273703042678) = 0.91387856251090
-    0x00000000EA457366LL, // sin(1.15581099584125) = 0.91512223480795
-    0x00000000EA9663AELL, // sin(1.15888496125573) = 0.91635725988081
-    0x00000000EAE6C2B1LL, // sin(1.16195892667020) = 0.91758362605939
-    0x00000000EB36903CLL, // sin(1.16503289208467) = 0.91880132175546
-    0x00000000EB85CC1ELL, // sin(1.16810685749914) = 0.92001033546269
-    0x00000000EBD47627LL, // sin(1.17118082291361) = 0.92121065575680
-    0x00000000EC228E24LL, // sin(1.17425478832808) = 0.92240227129566
-    0x00000000EC7013E7LL, // sin(1.17732875374255) = 0.92358517081939
-    0x00000000ECBD073FLL, // sin(1.18040271915703) = 0.92475934315048
-    0x00000000ED0967FCLL, // sin(1.18347668457150) = 0.92592477719385
-    0x00000000ED5535EFLL, // sin(1.18655064998597) = 0.92708146193703
-    0x00000000EDA070E9LL, // sin(1.18962461540044) = 0.92822938645022
-    0x00000000EDEB18BCLL, // sin(1.19269858081491) = 0.92936853988637
-    0x00000000EE352D39LL, // sin(1.19577254622938) = 0.93049891148133
-    0x00000000EE7EAE33LL, // sin(1.19884651164385) = 0.93162049055394
-    0x00000000EEC79B7BLL, // sin(1.20192047705833) = 0.93273326650611
-    0x00000000EF0FF4E5LL, // sin(1.20499444247280) = 0.93383722882293
-    0x00000000EF57BA44LL, // sin(1.20806840788727) = 0.93493236707277
-    0x00000000EF9EEB6BLL, // sin(1.21114237330174) = 0.93601867090741
-    0x00000000EFE5882FLL, // sin(1.21421633871621) = 0.93709613006206
-    0x00000000F02B9064LL, // sin(1.21729030413068) = 0.93816473435556
-    0x00000000F07103DELL, // sin(1.22036426954515) = 0.93922447369038
-    0x00000000F0B5E272LL, // sin(1.22343823495963) = 0.94027533805277
-    0x00000000F0FA2BF5LL, // sin(1.22651220037410) = 0.94131731751285
-    0x00000000F13DE03ELL, // sin(1.22958616578857) = 0.94235040222468
-    0x00000000F180FF23LL, // sin(1.23266013120304) = 0.94337458242639
-    0x00000000F1C38879LL, // sin(1.23573409661751) = 0.94438984844024
-    0x00000000F2057C18LL, // sin(1.23880806203198) = 0.94539619067271
-    0x00000000F246D9D7LL, // sin(1.24188202744645) = 0.94639359961462
-    0x00000000F287A18DLL, // sin(1.24495599286093) = 0.94738206584120
-    0x00000000F2C7D312LL, // sin(1.24802995827540) = 0.94836158001217
-    0x00000000F3076E3FLL, // sin(1.25110392368987) = 0.94933213287187
-    0x00000000F34672ECLL, // sin(1.25417788910434) = 0.95029371524927
-    0x00000000F384E0F2LL, // sin(1.25725185451881) = 0.95124631805816
-    0x00000000F3C2B82ALL, // sin(1.26032581993328) = 0.95218993229714
-    0x00000000F3FFF86FLL, // sin(1.26339978534775) = 0.95312454904975
-    0x00000000F43CA199LL, // sin(1.26647375076223) = 0.95405015948456
-    0x00000000F478B384LL, // sin(1.26954771617670) = 0.95496675485526
-    0x00000000F4B42E0BLL, // sin(1.27262168159117) = 0.95587432650068
-    0x00000000F4EF1108LL, // sin(1.27569564700564) = 0.95677286584495
-    0x00000000F5295C57LL, // sin(1.27876961242011) = 0.95766236439755
-    0x00000000F5630FD4LL, // sin(1.28184357783458) = 0.95854281375337
-    0x00000000F59C2B5CLL, // sin(1.28491754324905) = 0.95941420559283
-    0x00000000F5D4AECALL, // sin(1.28799150866353) = 0.96027653168192
-    0x00000000F60C99FCLL, // sin(1.29106547407800) = 0.96112978387230
-    0x00000000F643ECD0LL, // sin(1.29413943949247) = 0.96197395410137
-    0x00000000F67AA723LL, // sin(1.29721340490694) = 0.96280903439235
-    0x00000000F6B0C8D2LL, // sin(1.30028737032141) = 0.96363501685436
-    0x00000000F6E651BDLL, // sin(1.30336133573588) = 0.96445189368247
-    0x00000000F71B41C3LL, // sin(1.30643530115035) = 0.96525965715780
-    0x00000000F74F98C3LL, // sin(1.30950926656483) = 0.96605829964760
-    0x00000000F783569BLL, // sin(1.31258323197930) = 0.96684781360528
-    0x00000000F7B67B2DLL, // sin(1.31565719739377) = 0.96762819157052
-    0x00000000F7E90658LL, // sin(1.31873116280824) = 0.96839942616934
-    0x00000000F81AF7FELL, // sin(1.32180512822271) = 0.96916151011415
-    0x00000000F84C4FFFLL, // sin(1.32487909363718) = 0.96991443620380
-    0x00000000F87D0E3DLL, // sin(1.32795305905165) = 0.97065819732372
-    0x00000000F8AD3299LL, // sin(1.33102702446613) = 0.97139278644591
-    0x00000000F8DCBCF6LL, // sin(1.33410098988060) = 0.97211819662906
-    0x00000000F90BAD36LL, // sin(1.33717495529507) = 0.97283442101858
-    0x00000000F93A033DLL, // sin(1.34024892070954) = 0.97354145284667
-    0x00000000F967BEEDLL, // sin(1.34332288612401) = 0.97423928543242
-    0x00000000F994E02ALL, // sin(1.34639685153848) = 0.97492791218182
-    0x00000000F9C166D9LL, // sin(1.34947081695295) = 0.97560732658787
-    0x00000000F9ED52DDLL, // sin(1.35254478236743) = 0.97627752223061
-    0x00000000FA18A41CLL, // sin(1.35561874778190) = 0.97693849277718
-    0x00000000FA435A7BLL, // sin(1.35869271319637) = 0.97759023198191
-    0x00000000FA6D75DFLL, // sin(1.36176667861084) = 0.97823273368634
-    0x00000000FA96F62ELL, // sin(1.36484064402531) = 0.97886599181931
-    0x00000000FABFDB4ELL, // sin(1.36791460943978) = 0.97949000039701
-    0x00000000FAE82527LL, // sin(1.37098857485425) = 0.98010475352301
-    0x00000000FB0FD39ELL, // sin(1.37406254026873) = 0.98071024538836
-    0x00000000FB36E69DLL, // sin(1.37713650568320) = 0.98130647027161
-    0x00000000FB5D5E09LL, // sin(1.38021047109767) = 0.98189342253888
-    0x00000000FB8339CDLL, // sin(1.38328443651214) = 0.98247109664390
-    0x00000000FBA879CFLL, // sin(1.38635840192661) = 0.98303948712809
-    0x00000000FBCD1DFALL, // sin(1.38943236734108) = 0.98359858862057
-    0x00000000FBF12636LL, // sin(1.39250633275555) = 0.98414839583827
-    0x00000000FC14926DLL, // sin(1.39558029817003) = 0.98468890358589
-    0x00000000FC376289LL, // sin(1.39865426358450) = 0.98522010675606
-    0x00000000FC599675LL, // sin(1.40172822899897) = 0.98574200032929
-    0x00000000FC7B2E1BLL, // sin(1.40480219441344) = 0.98625457937409
-    0x00000000FC9C2967LL, // sin(1.40787615982791) = 0.98675783904695
-    0x00000000FCBC8844LL, // sin(1.41095012524238) = 0.98725177459245
-    0x00000000FCDC4A9ELL, // sin(1.41402409065685) = 0.98773638134326
-    0x00000000FCFB7062LL, // sin(1.41709805607133) = 0.98821165472022
-    0x00000000FD19F97CLL, // sin(1.42017202148580) = 0.98867759023234
-    0x00000000FD37E5D9LL, // sin(1.42324598690027) = 0.98913418347688
-    0x00000000FD553567LL, // sin(1.42631995231474) = 0.98958143013937
-    0x00000000FD71E813LL, // sin(1.42939391772921) = 0.99001932599367
-    0x00000000FD8DFDCCLL, // sin(1.43246788314368) = 0.99044786690198
-    0x00000000FDA97681LL, // sin(1.43554184855815) = 0.99086704881491
-    0x00000000FDC45220LL, // sin(1.43861581397263) = 0.99127686777151
-    0x00000000FDDE9099LL, // sin(1.44168977938710) = 0.99167731989929
-    0x00000000FDF831DBLL, // sin(1.44476374480157) = 0.99206840141427
-    0x00000000FE1135D7LL, // sin(1.44783771021604) = 0.99245010862103
-    0x00000000FE299C7DLL, // sin(1.45091167563051) = 0.99282243791272
-    0x00000000FE4165BELL, // sin(1.45398564104498) = 0.99318538577110
-    0x00000000FE58918CLL, // sin(1.45705960645945) = 0.99353894876658
-    0x00000000FE6F1FD7LL, // sin(1.46013357187393) = 0.99388312355827
-    0x00000000FE851093LL, // sin(1.46320753728840) = 0.99421790689395
-    0x00000000FE9A63B1LL, // sin(1.46628150270287) = 0.99454329561019
-    0x00000000FEAF1924LL, // sin(1.46935546811734) = 0.99485928663229
-    0x00000000FEC330DFLL, // sin(1.47242943353181) = 0.99516587697438
-    0x00000000FED6AAD7LL, // sin(1.47550339894628) = 0.99546306373940
-    0x00000000FEE986FELL, // sin(1.47857736436075) = 0.99575084411917
-    0x00000000FEFBC549LL, // sin(1.48165132977523) = 0.99602921539437
-    0x00000000FF0D65AELL, // sin(1.48472529518970) = 0.99629817493461
-    0x00000000FF1E6820LL, // sin(1.48779926060417) = 0.99655772019841
-    0x00000000FF2ECC96LL, // sin(1.49087322601864) = 0.99680784873326
-    0x00000000FF3E9305LL, // sin(1.49394719143311) = 0.99704855817563
-    0x00000000FF4DBB64LL, // sin(1.49702115684758) = 0.99727984625101
-    0x00000000FF5C45A9LL, // sin(1.50009512226205) = 0.99750171077389
-    0x00000000FF6A31CBLL, // sin(1.50316908767653) = 0.99771414964781
-    0x00000000FF777FC2LL, // sin(1.50624305309100) = 0.99791716086539
-    0x00000000FF842F84LL, // sin(1.50931701850547) = 0.99811074250832
-    0x00000000FF90410CLL, // sin(1.51239098391994) = 0.99829489274740
-    0x00000000FF9BB450LL, // sin(1.51546494933441) = 0.99846960984255
-    0x00000000FFA6894ALL, // sin(1.51853891474888) = 0.99863489214282
-    0x00000000FFB0BFF3LL, // sin(1.52161288016335) = 0.99879073808641
-    0x00000000FFBA5845LL, // sin(1.52468684557783) = 0.99893714620069
-    0x00000000FFC3523ALL, // sin(1.52776081099230) = 0.99907411510223
-    0x00000000FFCBADCCLL, // sin(1.53083477640677) = 0.99920164349676
-    0x00000000FFD36AF7LL, // sin(1.53390874182124) = 0.99931973017924
-    0x00000000FFDA89B5LL, // sin(1.53698270723571) = 0.99942837403383
-    0x00000000FFE10A01LL, // sin(1.54005667265018) = 0.99952757403393
-    0x00000000FFE6EBD9LL, // sin(1.54313063806465) = 0.99961732924218
-    0x00000000FFEC2F38LL, // sin(1.54620460347913) = 0.99969763881046
-    0x00000000FFF0D41BLL, // sin(1.54927856889360) = 0.99976850197989
-    0x00000000FFF4DA7FLL, // sin(1.55235253430807) = 0.99982991808088
-    0x00000000FFF84262LL, // sin(1.55542649972254) = 0.99988188653309
-    0x00000000FFFB0BC1LL, // sin(1.55850046513701) = 0.99992440684545
-    0x00000000FFFD369CLL, // sin(1.56157443055148) = 0.99995747861619
-    0x00000000FFFEC2EFLL, // sin(1.56464839596595) = 0.99998110153279
-    0x00000000FFFFB0BBLL, // sin(1.56772236138043) = 0.99999527537204
-    0x0000000100000000LL, // sin(1.57079632679490) = 1.00000000000000
-    0x0000000100000000LL  // sin(1.57079632679490) = 1.00000000000000
+// Table maps x in [0,pi/2) to sin(x), rounded to nearest
+// Values stored as the fraction bits of Q31.32, sin(x) < 1 on [0,pi/2)
+// The sin tables are aligned to cache lines and, on ELF targets, each get their own
+// .rodata.math_trig_lut.* input section like kAtanTable, so a linker script can
+// group the trig tables; the default scripts simply fold them into .rodata
+#if defined(__GNUC__) && defined(__ELF__)
+[[gnu::section(".rodata.math_trig_lut.sin")]]
+#endif
+alignas(64) inline constexpr std::array<uint32_t, 512> kSinLut = {
+    0x00000000, // sin(0) = 0
+    0x00C90FC6, // sin(0.0030679615757712823) = 0.0030679567629659761
+    0x01921F10, // sin(0.0061359231515425647) = 0.0061358846491544753
+    0x025B2D62, // sin(0.009203884727313847) = 0.0092037547820598194
+    0x03243A40, // sin(0.012271846303085129) = 0.012271538285719925
+    0x03ED452D, // sin(0.015339807878856412) = 0.015339206284988102
+    0x04B64DAF, // sin(0.018407769454627694) = 0.01840672990580482
+    0x057F5348, // sin(0.021475731030398976) = 0.021474080275469508
+    0x0648557E, // sin(0.024543692606170259) = 0.024541228522912288
+    0x071153D3, // sin(0.027611654181941541) = 0.027608145778965743
+    0x07DA4DCC, // sin(0.030679615757712823) = 0.030674803176636626
+    0x08A342EE, // sin(0.033747577333484109) = 0.033741171851377587
+    0x096C32BB, // sin(0.036815538909255388) = 0.036807222941358832
+    0x0A351CB8, // sin(0.039883500485026674) = 0.039872927587739811
+    0x0AFE0069, // sin(0.042951462060797953) = 0.04293825693494082
+    0x0BC6DD53, // sin(0.046019423636569239) = 0.04600318213091463
+    0x0C8FB2F9, // sin(0.049087385212340517) = 0.049067674327418015
+    0x0D5880DF, // sin(0.052155346788111803) = 0.052131704680283324
+    0x0E214689, // sin(0.055223308363883082) = 0.055195244349689941
+    0x0EEA037D, // sin(0.058291269939654368) = 0.058258264500435759
+    0x0FB2B73D, // sin(0.061359231515425647) = 0.061320736302208578
+    0x107B614E, // sin(0.064427193091196933) = 0.064382630929857465
+    0x11440135, // sin(0.067495154666968218) = 0.067443919563664065
+    0x120C9675, // sin(0.07056311624273949) = 0.07050457338961387
+    0x12D52093, // sin(0.073631077818510776) = 0.073564563599667426
+    0x139D9F13, // sin(0.076699039394282062) = 0.076623861392031492
+    0x14661179, // sin(0.079767000970053348) = 0.079682437971430126
+    0x152E774A, // sin(0.08283496254582462) = 0.082740264549375692
+    0x15F6D00B, // sin(0.085902924121595906) = 0.085797312344439894
+    0x16BF1B3E, // sin(0.088970885697367191) = 0.0888535525825246
+    0x1787586A, // sin(0.092038847273138477) = 0.091908956497132724
+    0x184F8713, // sin(0.095106808848909763) = 0.094963495329639006
+    0x1917A6BC, // sin(0.098174770424681035) = 0.098017140329560604
+    0x19DFB6EB, // sin(0.10124273200045232) = 0.10106986275482782
+    0x1AA7B724, // sin(0.10431069357622361) = 0.10412163387205457
+    0x1B6FA6EC, // sin(0.10737865515199489) = 0.10717242495680884
+    0x1C3785C8, // sin(0.11044661672776616) = 0.11022220729388306
+    0x1CFF533B, // sin(0.11351457830353745) = 0.11327095217756435
+    0x1DC70ECC, // sin(0.11658253987930874) = 0.11631863091190477
+    0x1E8EB7FE, // sin(0.11965050145508002) = 0.11936521481099137
+    0x1F564E57, // sin(0.12271846303085129) = 0.1224106751992162
+    0x201DD15B, // sin(0.12578642460662259) = 0.12545498341154623
+    0x20E5408F, // sin(0.12885438618239387) = 0.12849811079379317
+    0x21AC9B79, // sin(0.13192234775816514) = 0.13154002870288312
+    0x2273E19E, // sin(0.13499030933393644) = 0.1345807085071262
+    0x233B1281, // sin(0.13805827090970771) = 0.13762012158648604
+    0x24022DAA, // sin(0.14112623248547898) = 0.14065823933284924
+    0x24C9329C, // sin(0.14419419406125028) = 0.14369503315029444
+    0x259020DD, // sin(0.14726215563702155) = 0.14673047445536175
+    0x2656F7F3, // sin(0.15033011721279285) = 0.14976453467732151
+    0x271DB762, // sin(0.15339807878856412) = 0.15279718525844344
+    0x27E45EB0, // sin(0.1564660403643354) = 0.15582839765426523
+    0x28AAED62, // sin(0.1595340019401067) = 0.15885814333386145
+    0x297162FF, // sin(0.16260196351587797) = 0.16188639378011183
+    0x2A37BF0B, // sin(0.16566992509164924) = 0.16491312048996992
+    0x2AFE010D, // sin(0.16873788666742054) = 0.16793829497473117
+    0x2BC42889, // sin(0.17180584824319181) = 0.17096188876030122
+    0x2C8A3506, // sin(0.17487380981896311) = 0.17398387338746382
+    0x2D50260A, // sin(0.17794177139473438) = 0.17700422041214875
+    0x2E15FB1A, // sin(0.18100973297050565) = 0.18002290140569951
+    0x2EDBB3BD, // sin(0.18407769454627695) = 0.18303988795514095
+    0x2FA14F78, // sin(0.18714565612204823) = 0.18605515166344666
+    0x3066CDD1, // sin(0.19021361769781953) = 0.18906866414980622
+    0x312C2E50, // sin(0.1932815792735908) = 0.19208039704989244
+    0x31F17079, // sin(0.19634954084936207) = 0.19509032201612828
+    0x32B693D3, // sin(0.19941750242513337) = 0.19809841071795359
+    0x337B97E6, // sin(0.20248546400090464) = 0.2011046348420919
+    0x34407C36, // sin(0.20555342557667591) = 0.20410896609281687
+    0x3505404B, // sin(0.20862138715244721) = 0.20711137619221856
+    0x35C9E3AC, // sin(0.21168934872821848) = 0.21011183688046961
+    0x368E65DE, // sin(0.21475731030398978) = 0.21311031991609136
+    0x3752C66A, // sin(0.21782527187976106) = 0.21610679707621952
+    0x381704D5, // sin(0.22089323345553233) = 0.2191012401568698
+    0x38DB20A7, // sin(0.22396119503130363) = 0.22209362097320354
+    0x399F1966, // sin(0.2270291566070749) = 0.22508391135979283
+    0x3A62EE9A, // sin(0.23009711818284617) = 0.22807208317088573
+    0x3B269FCB, // sin(0.23316507975861747) = 0.23105810828067111
+    0x3BEA2C7E, // sin(0.23623304133438874) = 0.23404195858354343
+    0x3CAD943C, // sin(0.23930100291016004) = 0.2370236059943672
+    0x3D70D68C, // sin(0.24236896448593132) = 0.2400030224487415
+    0x3E33F2F6, // sin(0.24543692606170259) = 0.2429801799032639
+    0x3EF6E901, // sin(0.24850488763747389) = 0.24595505033579462
+    0x3FB9B836, // sin(0.25157284921324519) = 0.24892760574572018
+    0x407C601B, // sin(0.25464081078901646) = 0.25189781815421697
+    0x413EE039, // sin(0.25770877236478773) = 0.25486565960451457
+    0x42013818, // sin(0.260776733940559) = 0.25783110216215899
+    0x42C3673F, // sin(0.26384469551633027) = 0.26079411791527551
+    0x43856D38, // sin(0.26691265709210155) = 0.2637546789748314
+    0x4447498B, // sin(0.26998061866787287) = 0.26671275747489837
+    0x4508FBBF, // sin(0.27304858024364415) = 0.26966832557291509
+    0x45CA835E, // sin(0.27611654181941542) = 0.27262135544994898
+    0x468BDFF0, // sin(0.27918450339518669) = 0.27557181931095814
+    0x474D10FD, // sin(0.28225246497095796) = 0.27851968938505312
+    0x480E160F, // sin(0.28532042654672929) = 0.281464937925758
+    0x48CEEEAF, // sin(0.28838838812250056) = 0.28440753721127182
+    0x498F9A65, // sin(0.29145634969827183) = 0.28734745954472951
+    0x4A5018BB, // sin(0.2945243112740431) = 0.29028467725446239
+    0x4B10693A, // sin(0.29759227284981438) = 0.29321916269425863
+    0x4BD08B6C, // sin(0.3006602344255857) = 0.29615088824362384
+    0x4C907ED9, // sin(0.30372819600135698) = 0.29907982630804048
+    0x4D50430C, // sin(0.30679615757712825) = 0.30200594931922808
+    0x4E0FD78D, // sin(0.30986411915289952) = 0.30492922973540243
+    0x4ECF3BE8, // sin(0.31293208072867079) = 0.30784964004153487
+    0x4F8E6FA6, // sin(0.31600004230444212) = 0.31076715274961147
+    0x504D7250, // sin(0.31906800388021339) = 0.31368174039889146
+    0x510C4372, // sin(0.32213596545598466) = 0.31659337555616585
+    0x51CAE295, // sin(0.32520392703175593) = 0.31950203081601569
+    0x52894F44, // sin(0.32827188860752721) = 0.32240767880106985
+    0x5347890A, // sin(0.33133985018329848) = 0.32531029216226293
+    0x54058F70, // sin(0.33440781175906981) = 0.32820984357909255
+    0x54C36203, // sin(0.33747577333484108) = 0.33110630575987643
+    0x5581004C, // sin(0.34054373491061235) = 0.33399965144200938
+    0x563E69D7, // sin(0.34361169648638362) = 0.33688985339222005
+    0x56FB9E2E, // sin(0.34667965806215489) = 0.33977688440682685
+    0x57B89CDE, // sin(0.34974761963792622) = 0.34266071731199438
+    0x58756572, // sin(0.35281558121369749) = 0.34554132496398904
+    0x5931F775, // sin(0.35588354278946877) = 0.34841868024943456
+    0x59EE5273, // sin(0.35895150436524004) = 0.35129275608556715
+    0x5AAA75F7, // sin(0.36201946594101131) = 0.3541635254204904
+    0x5B66618E, // sin(0.36508742751678264) = 0.35703096123343003
+    0x5C2214C4, // sin(0.36815538909255391) = 0.35989503653498817
+    0x5CDD8F25, // sin(0.37122335066832518) = 0.36275572436739723
+    0x5D98D03D, // sin(0.37429131224409645) = 0.36561299780477385
+    0x5E53D798, // sin(0.37735927381986772) = 0.36846682995337232
+    0x5F0EA4C4, // sin(0.38042723539563905) = 0.37131719395183754
+    0x5FC9374E, // sin(0.38349519697141032) = 0.37416406297145799
+    0x60838EC1, // sin(0.3865631585471816) = 0.37700741021641826
+    0x613DAAAC, // sin(0.38963112012295287) = 0.37984720892405116
+    0x61F78A9B, // sin(0.39269908169872414) = 0.38268343236508978
+    0x62B12E1B, // sin(0.39576704327449541) = 0.38551605384391885
+    0x636A94BB, // sin(0.39883500485026674) = 0.3883450466988263
+    0x6423BE08, // sin(0.40190296642603801) = 0.39117038430225387
+    0x64DCA98F, // sin(0.40497092800180928) = 0.3939920400610481
+    0x659556DF, // sin(0.40803888957758055) = 0.39680998741671031
+    0x664DC585, // sin(0.41110685115335183) = 0.39962419984564684
+    0x6705F510, // sin(0.41417481272912315) = 0.40243465085941843
+    0x67BDE50F, // sin(0.41724277430489443) = 0.40524131400498986
+    0x6875950F, // sin(0.4203107358806657) = 0.40804416286497869
+    0x692D049F, // sin(0.42337869745643697) = 0.41084317105790397
+    0x69E4334F, // sin(0.42644665903220824) = 0.41363831223843456
+    0x6A9B20AE, // sin(0.42951462060797957) = 0.41642956009763721
+    0x6B51CC49, // sin(0.43258258218375084) = 0.41921688836322396
+    0x6C0835B2, // sin(0.43565054375952211) = 0.42200027079979968
+    0x6CBE5C77, // sin(0.43871850533529339) = 0.42477968120910881
+    0x6D744028, // sin(0.44178646691106466) = 0.42755509343028208
+    0x6E29E054, // sin(0.44485442848683593) = 0.43032648134008261
+    0x6EDF3C8C, // sin(0.44792239006260726) = 0.43309381885315196
+    0x6F945460, // sin(0.45099035163837853) = 0.43585707992225547
+    0x70492760, // sin(0.4540583132141498) = 0.43861623853852766
+    0x70FDB51D, // sin(0.45712627478992107) = 0.44137126873171667
+    0x71B1FD26, // sin(0.46019423636569234) = 0.44412214457042926
+    0x7265FF0E, // sin(0.46326219794146367) = 0.44686884016237421
+    0x7319BA65, // sin(0.46633015951723494) = 0.4496113296546066
+    0x73CD2EBC, // sin(0.46939812109300622) = 0.45234958723377089
+    0x74805BA4, // sin(0.47246608266877749) = 0.45508358712634384
+    0x753340AF, // sin(0.47553404424454876) = 0.45781330359887723
+    0x75E5DD6E, // sin(0.47860200582032009) = 0.46053871095824001
+    0x76983174, // sin(0.48166996739609136) = 0.4632597835518602
+    0x774A3C52, // sin(0.48473792897186263) = 0.46597649576796618
+    0x77FBFD9B, // sin(0.4878058905476339) = 0.46868882203582796
+    0x78AD74E0, // sin(0.49087385212340517) = 0.47139673682599764
+    0x795EA1B5, // sin(0.4939418136991765) = 0.47410021465055002
+    0x7A0F83AC, // sin(0.49700977527494777) = 0.47679923006332214
+    0x7AC01A58, // sin(0.50007773685071899) = 0.47949375766015301
+    0x7B70654C, // sin(0.50314569842649037) = 0.48218377207912277
+    0x7C20641B, // sin(0.50621366000226165) = 0.48486924800079112
+    0x7CD01659, // sin(0.50928162157803292) = 0.48755016014843594
+    0x7D7F7B99, // sin(0.51234958315380419) = 0.49022648328829116
+    0x7E2E9370, // sin(0.51541754472957546) = 0.49289819222978404
+    0x7EDD5D71, // sin(0.51848550630534673) = 0.49556526182577254
+    0x7F8BD930, // sin(0.521553467881118) = 0.49822766697278187
+    0x803A0641, // sin(0.52462142945688928) = 0.50088538261124083
+    0x80E7E43A, // sin(0.52768939103266055) = 0.50353838372571758
+    0x819572AF, // sin(0.53075735260843182) = 0.50618664534515534
+    0x8242B135, // sin(0.53382531418420309) = 0.50883014254310699
+    0x82EF9F62, // sin(0.53689327575997448) = 0.51146885043797041
+    0x839C3CC9, // sin(0.53996123733574575) = 0.51410274419322177
+    0x84488902, // sin(0.54302919891151702) = 0.51673179901764987
+    0x84F483A1, // sin(0.54609716048728829) = 0.51935599016558964
+    0x85A02C3C, // sin(0.54916512206305956) = 0.52197529293715439
+    0x864B826B, // sin(0.55223308363883084) = 0.52458968267846895
+    0x86F685C2, // sin(0.55530104521460211) = 0.52719913478190139
+    0x87A135D9, // sin(0.55836900679037338) = 0.52980362468629472
+    0x884B9247, // sin(0.56143696836614465) = 0.53240312787719801
+    0x88F59AA1, // sin(0.56450492994191592) = 0.53499761988709726
+    0x899F4E7F, // sin(0.56757289151768731) = 0.53758707629564551
+    0x8A48AD7A, // sin(0.57064085309345858) = 0.54017147272989285
+    0x8AF1B727, // sin(0.57370881466922985) = 0.54275078486451589
+    0x8B9A6B1F, // sin(0.57677677624500112) = 0.54532498842204646
+    0x8C42C8FA, // sin(0.57984473782077239) = 0.54789405917310019
+    0x8CEAD050, // sin(0.58291269939654367) = 0.55045797293660481
+    0x8D9280B9, // sin(0.58598066097231494) = 0.55301670558002758
+    0x8E39D9CD, // sin(0.58904862254808621) = 0.55557023301960218
+    0x8EE0DB27, // sin(0.59211658412385748) = 0.5581185312205561
+    0x8F87845E, // sin(0.59518454569962875) = 0.56066157619733603
+    0x902DD50C, // sin(0.59825250727540003) = 0.56319934401383409
+    0x90D3CCCA, // sin(0.60132046885117141) = 0.56573181078361323
+    0x91796B31, // sin(0.60438843042694268) = 0.5682589526701316
+    0x921EAFDD, // sin(0.60745639200271395) = 0.57078074588696726
+    0x92C39A66, // sin(0.61052435357848522) = 0.5732971666980422
+    0x93682A67, // sin(0.6135923151542565) = 0.57580819141784534
+    0x940C5F7A, // sin(0.61666027673002777) = 0.57831379641165559
+    0x94B0393B, // sin(0.61972823830579904) = 0.58081395809576453
+    0x9553B744, // sin(0.62279619988157031) = 0.58330865293769829
+    0x95F6D930, // sin(0.62586416145734158) = 0.58579785745643886
+    0x96999E9A, // sin(0.62893212303311286) = 0.58828154822264533
+    0x973C071F, // sin(0.63200008460888424) = 0.59075970185887428
+    0x97DE125A, // sin(0.63506804618465551) = 0.5932322950397998
+    0x987FBFE7, // sin(0.63813600776042678) = 0.59569930449243336
+    0x99210F62, // sin(0.64120396933619805) = 0.59816070699634227
+    0x99C20068, // sin(0.64427193091196933) = 0.60061647938386897
+    0x9A629296, // sin(0.6473398924877406) = 0.60306659854034816
+    0x9B02C588, // sin(0.65040785406351187) = 0.60551104140432555
+    0x9BA298DC, // sin(0.65347581563928314) = 0.60794978496777363
+    0x9C420C2F, // sin(0.65654377721505441) = 0.61038280627630948
+    0x9CE11F1F, // sin(0.65961173879082569) = 0.61281008242940971
+    0x9D7FD149, // sin(0.66267970036659696) = 0.61523159058062682
+    0x9E1E224C, // sin(0.66574766194236834) = 0.61764730793780398
+    0x9EBC11C6, // sin(0.66881562351813961) = 0.62005721176328921
+    0x9F599F56, // sin(0.67188358509391088) = 0.62246127937414997
+    0x9FF6CA9A, // sin(0.67495154666968216) = 0.62485948814238634
+    0xA0939332, // sin(0.67801950824545343) = 0.62725181549514408
+    0xA12FF8BC, // sin(0.6810874698212247) = 0.62963823891492698
+    0xA1CBFAD9, // sin(0.68415543139699597) = 0.63201873593980906
+    0xA2679928, // sin(0.68722339297276724) = 0.63439328416364549
+    0xA302D349, // sin(0.69029135454853852) = 0.6367618612362842
+    0xA39DA8DD, // sin(0.69335931612430979) = 0.63912444486377573
+    0xA4381983, // sin(0.69642727770008117) = 0.64148101280858316
+    0xA4D224DD, // sin(0.69949523927585244) = 0.6438315428897915
+    0xA56BCA8B, // sin(0.70256320085162371) = 0.64617601298331639
+    0xA6050A2F, // sin(0.70563116242739499) = 0.64851440102211244
+    0xA69DE36B, // sin(0.70869912400316626) = 0.65084668499638088
+    0xA73655DF, // sin(0.71176708557893753) = 0.65317284295377676
+    0xA7CE612E, // sin(0.7148350471547088) = 0.65549285299961535
+    0xA86604FB, // sin(0.71790300873048007) = 0.65780669329707864
+    0xA8FD40E7, // sin(0.72097097030625135) = 0.66011434206742048
+    0xA9941495, // sin(0.72403893188202262) = 0.66241577759017178
+    0xAA2A7FA9, // sin(0.72710689345779389) = 0.6647109782033449
+    0xAAC081C5, // sin(0.73017485503356527) = 0.66699992230363747
+    0xAB561A8D, // sin(0.73324281660933655) = 0.66928258834663612
+    0xABEB49A4, // sin(0.73631077818510782) = 0.67155895484701844
+    0xAC800EB0, // sin(0.73937873976087909) = 0.67382900037875604
+    0xAD146953, // sin(0.74244670133665036) = 0.67609270357531592
+    0xADA85932, // sin(0.74551466291242163) = 0.67835004312986147
+    0xAE3BDDF3, // sin(0.7485826244881929) = 0.68060099779545302
+    0xAECEF73A, // sin(0.75165058606396418) = 0.68284554638524808
+    0xAF61A4AC, // sin(0.75471854763973545) = 0.68508366777270036
+    0xAFF3E5EF, // sin(0.75778650921550672) = 0.68731534089175916
+    0xB085BAA9, // sin(0.7608544707912781) = 0.68954054473706694
+    0xB117227F, // sin(0.76392243236704938) = 0.69175925836415775
+    0xB1A81D19, // sin(0.76699039394282065) = 0.693971460889654
+    0xB238AA1C, // sin(0.77005835551859192) = 0.69617713149146299
+    0xB2C8C930, // sin(0.77312631709436319) = 0.6983762494089728
+    0xB35879FB, // sin(0.77619427867013446) = 0.70056879394324834
+    0xB3E7BC25, // sin(0.77926224024590574) = 0.7027547444572253
+    0xB4768F55, // sin(0.78233020182167701) = 0.70493408037590488
+    0xB504F334, // sin(0.78539816339744828) = 0.70710678118654757
+    0xB592E769, // sin(0.78846612497321955) = 0.70927282643886569
+    0xB6206B9E, // sin(0.79153408654899082) = 0.71143219574521643
+    0xB6AD7F7A, // sin(0.79460204812476221) = 0.71358486878079364
+    0xB73A22A7, // sin(0.79767000970053348) = 0.71573082528381871
+    0xB7C654CE, // sin(0.80073797127630475) = 0.71787004505573171
+    0xB8521599, // sin(0.80380593285207602) = 0.72000250796138165
+    0xB8DD64B0, // sin(0.80687389442784729) = 0.72212819392921535
+    0xB96841BF, // sin(0.80994185600361857) = 0.72424708295146689
+    0xB9F2AC70, // sin(0.81300981757938984) = 0.72635915508434601
+    0xBA7CA46D, // sin(0.81607777915516111) = 0.7284643904482252
+    0xBB062962, // sin(0.81914574073093238) = 0.73056276922782759
+    0xBB8F3AF8, // sin(0.82221370230670365) = 0.73265427167241282
+    0xBC17D8DD, // sin(0.82528166388247504) = 0.7347388780959635
+    0xBCA002BA, // sin(0.82834962545824631) = 0.7368165688773699
+    0xBD27B83E, // sin(0.83141758703401758) = 0.73888732446061511
+    0xBDAEF913, // sin(0.83448554860978885) = 0.74095112535495911
+    0xBE35C4E7, // sin(0.83755351018556012) = 0.74300795213512172
+    0xBEBC1B66, // sin(0.8406214717613314) = 0.74505778544146595
+    0xBF41FC3E, // sin(0.84368943333710267) = 0.74710060598018013
+    0xBFC7671B, // sin(0.84675739491287394) = 0.74913639452345937
+    0xC04C5BAB, // sin(0.84982535648864521) = 0.75116513190968637
+    0xC0D0D99E, // sin(0.85289331806441648) = 0.75318679904361252
+    0xC154E0A0, // sin(0.85596127964018776) = 0.75520137689653655
+    0xC1D87060, // sin(0.85902924121595914) = 0.75720884650648457
+    0xC25B888D, // sin(0.86209720279173041) = 0.75920918897838807
+    0xC2DE28D7, // sin(0.86516516436750168) = 0.76120238548426178
+    0xC36050ED, // sin(0.86823312594327295) = 0.76318841726338127
+    0xC3E2007E, // sin(0.87130108751904423) = 0.76516726562245896
+    0xC463373A, // sin(0.8743690490948155) = 0.7671389119358204
+    0xC4E3F4D2, // sin(0.87743701067058677) = 0.76910333764557959
+    0xC56438F7, // sin(0.88050497224635804) = 0.77106052426181382
+    0xC5E40359, // sin(0.88357293382212931) = 0.77301045336273699
+    0xC66353A9, // sin(0.88664089539790059) = 0.77495310659487393
+    0xC6E22999, // sin(0.88970885697367186) = 0.77688846567323244
+    0xC76084DA, // sin(0.89277681854944324) = 0.77881651238147598
+    0xC7DE651F, // sin(0.89584478012521451) = 0.78073722857209449
+    0xC85BCA1B, // sin(0.89891274170098578) = 0.78265059616657573
+    0xC8D8B37F, // sin(0.90198070327675706) = 0.78455659715557524
+    0xC95520FE, // sin(0.90504866485252833) = 0.78645521359908577
+    0xC9D1124D, // sin(0.9081166264282996) = 0.78834642762660623
+    0xCA4C871D, // sin(0.91118458800407087) = 0.79023022143731003
+    0xCAC77F24, // sin(0.91425254957984214) = 0.79210657730021239
+    0xCB41FA16, // sin(0.91732051115561342) = 0.79397547755433717
+    0xCBBBF7A6, // sin(0.92038847273138469) = 0.79583690460888357
+    0xCC35778A, // sin(0.92345643430715607) = 0.79769084094339116
+    0xCCAE7977, // sin(0.92652439588292734) = 0.79953726910790501
+    0xCD26FD21, // sin(0.92959235745869861) = 0.80137617172314024
+    0xCD9F0240, // sin(0.93266031903446989) = 0.80320753148064494
+    0xCE168888, // sin(0.93572828061024116) = 0.80503133114296355
+    0xCE8D8FAF, // sin(0.93879624218601243) = 0.80684755354379922
+    0xCF04176E, // sin(0.9418642037617837) = 0.80865618158817498
+    0xCF7A1F79, // sin(0.94493216533755497) = 0.81045719825259477
+    0xCFEFA78A, // sin(0.94800012691332625) = 0.81225058658520388
+    0xD064AF56, // sin(0.95106808848909752) = 0.81403632970594841
+    0xD0D93696, // sin(0.95413605006486879) = 0.81581441080673378
+    0xD14D3D02, // sin(0.95720401164064017) = 0.81758481315158371
+    0xD1C0C253, // sin(0.96027197321641145) = 0.81934752007679701
+    0xD233C641, // sin(0.96333993479218272) = 0.82110251499110465
+    0xD2A64885, // sin(0.96640789636795399) = 0.82284978137582632
+    0xD31848D8, // sin(0.96947585794372526) = 0.82458930278502529
+    0xD389C6F5, // sin(0.97254381951949653) = 0.82632106284566353
+    0xD3FAC295, // sin(0.9756117810952678) = 0.8280450452577558
+    0xD46B3B73, // sin(0.97867974267103908) = 0.82976123379452305
+    0xD4DB3148, // sin(0.98174770424681035) = 0.83146961230254524
+    0xD54AA3D1, // sin(0.98481566582258162) = 0.83317016470191319
+    0xD5B992C9, // sin(0.987883627398353) = 0.83486287498638001
+    0xD627FDEA, // sin(0.99095158897412428) = 0.83654772722351201
+    0xD695E4F1, // sin(0.99401955054989555) = 0.83822470555483808
+    0xD703479A, // sin(0.99708751212566682) = 0.83989379419599952
+    0xD77025A2, // sin(1.000155473701438) = 0.84155497743689844
+    0xD7DC7EC5, // sin(1.0032234352772094) = 0.84320823964184544
+    0xD84852C1, // sin(1.0062913968529807) = 0.84485356524970712
+    0xD8B3A152, // sin(1.0093593584287519) = 0.84649093877405213
+    0xD91E6A38, // sin(1.0124273200045233) = 0.84812034480329723
+    0xD988AD30, // sin(1.0154952815802945) = 0.84974176800085244
+    0xD9F269F8, // sin(1.0185632431560658) = 0.8513551931052652
+    0xDA5BA04F, // sin(1.021631204731837) = 0.85296060493036363
+    0xDAC44FF5, // sin(1.0246991663076084) = 0.85455798836540053
+    0xDB2C78A8, // sin(1.0277671278833795) = 0.85614732837519447
+    0xDB941A29, // sin(1.0308350894591509) = 0.85772861000027212
+    0xDBFB3437, // sin(1.0339030510349221) = 0.85930181835700836
+    0xDC61C694, // sin(1.0369710126106935) = 0.86086693863776731
+    0xDCC7D0FF, // sin(1.0400389741864648) = 0.8624239561110405
+    0xDD2D533A, // sin(1.043106935762236) = 0.8639728561215867
+    0xDD924D06, // sin(1.0461748973380074) = 0.86551362409056909
+    0xDDF6BE25, // sin(1.0492428589137786) = 0.86704624551569265
+    0xDE5AA658, // sin(1.0523108204895499) = 0.8685707059713409
+    0xDEBE0563, // sin(1.0553787820653211) = 0.87008699110871146
+    0xDF20DB09, // sin(1.0584467436410925) = 0.87159508665595109
+    0xDF83270B, // sin(1.0615147052168636) = 0.87309497841829009
+    0xDFE4E92D, // sin(1.064582666792635) = 0.87458665227817611
+    0xE0462134, // sin(1.0676506283684062) = 0.8760700941954066
+    0xE0A6CEE2, // sin(1.0707185899441776) = 0.87754529020726124
+    0xE106F1FD, // sin(1.073786551519949) = 0.87901222642863353
+    0xE1668A4A, // sin(1.0768545130957201) = 0.88047088905216075
+    0xE1C5978C, // sin(1.0799224746714915) = 0.88192126434835505
+    0xE224198A, // sin(1.0829904362472627) = 0.88336333866573158
+    0xE2821009, // sin(1.086058397823034) = 0.88479709843093779
+    0xE2DF7AD0, // sin(1.0891263593988052) = 0.88622253014888064
+    0xE33C59A4, // sin(1.0921943209745766) = 0.88763962040285393
+    0xE398AC4D, // sin(1.0952622825503477) = 0.88904835585466457
+    0xE3F47291, // sin(1.0983302441261191) = 0.89044872324475788
+    0xE44FAC38, // sin(1.1013982057018905) = 0.89184070939234272
+    0xE4AA590A, // sin(1.1044661672776617) = 0.89322430119551532
+    0xE50478CE, // sin(1.1075341288534331) = 0.8945994856313827
+    0xE55E0B4D, // sin(1.1106020904292042) = 0.89596624975618511
+    0xE5B71050, // sin(1.1136700520049756) = 0.89732458070541832
+    0xE60F87A0, // sin(1.1167380135807468) = 0.89867446569395382
+    0xE6677106, // sin(1.1198059751565181) = 0.90001589201616028
+    0xE6BECC4C, // sin(1.1228739367322893) = 0.90134884704602203
+    0xE715993D, // sin(1.1259418983080607) = 0.90267331823725883
+    0xE76BD7A2, // sin(1.1290098598838318) = 0.90398929312344334
+    0xE7C18746, // sin(1.1320778214596032) = 0.90529675931811882
+    0xE816A7F6, // sin(1.1351457830353746) = 0.90659570451491533
+    0xE86B397B, // sin(1.1382137446111458) = 0.90788611648766626
+    0xE8BF3BA2, // sin(1.1412817061869172) = 0.90916798309052238
+    0xE912AE37, // sin(1.1443496677626883) = 0.91044129225806725
+    0xE9659107, // sin(1.1474176293384597) = 0.91170603200542988
+    0xE9B7E3DE, // sin(1.1504855909142309) = 0.91296219042839821
+    0xEA09A68A, // sin(1.1535535524900022) = 0.91420975570353069
+    0xEA5AD8D9, // sin(1.1566215140657734) = 0.91544871608826783
+    0xEAAB7A97, // sin(1.1596894756415448) = 0.9166790599210427
+    0xEAFB8B94, // sin(1.1627574372173159) = 0.9179007756213905
+    0xEB4B0B9E, // sin(1.1658253987930873) = 0.91911385169005777
+    0xEB99FA84, // sin(1.1688933603688587) = 0.92031827670911059
+    0xEBE85816, // sin(1.1719613219446299) = 0.9215140393420419
+    0xEC362422, // sin(1.1750292835204013) = 0.92270112833387852
+    0xEC835E7A, // sin(1.1780972450961724) = 0.92387953251128674
+    0xECD006EC, // sin(1.1811652066719438) = 0.92504924078267758
+    0xED1C1D4B, // sin(1.184233168247715) = 0.92621024213831138
+    0xED67A167, // sin(1.1873011298234863) = 0.92736252565040111
+    0xEDB29312, // sin(1.1903690913992575) = 0.92850608047321559
+    0xEDFCF21D, // sin(1.1934370529750289) = 0.92964089584318121
+    0xEE46BE5A, // sin(1.1965050145508001) = 0.93076696107898371
+    0xEE8FF79C, // sin(1.1995729761265714) = 0.93188426558166815
+    0xEED89DB6, // sin(1.2026409377023428) = 0.93299279883473885
+    0xEF20B07B, // sin(1.205708899278114) = 0.93409255040425887
+    0xEF682FBF, // sin(1.2087768608538854) = 0.93518350993894761
+    0xEFAF1B55, // sin(1.2118448224296565) = 0.93626566717027826
+    0xEFF57311, // sin(1.2149127840054279) = 0.93733901191257496
+    0xF03B36C9, // sin(1.2179807455811991) = 0.93840353406310806
+    0xF0806651, // sin(1.2210487071569704) = 0.93945922360218992
+    0xF0C5017F, // sin(1.2241166687327416) = 0.9405060705932683
+    0xF1090828, // sin(1.227184630308513) = 0.94154406518302081
+    0xF14C7A22, // sin(1.2302525918842844) = 0.94257319760144687
+    0xF18F5744, // sin(1.2333205534600555) = 0.94359345816196039
+    0xF1D19F64, // sin(1.2363885150358269) = 0.94460483726148026
+    0xF2135259, // sin(1.2394564766115981) = 0.94560732538052128
+    0xF2546FFC, // sin(1.2425244381873695) = 0.94660091308328353
+    0xF294F824, // sin(1.2455923997631406) = 0.94758559101774109
+    0xF2D4EAA8, // sin(1.248660361338912) = 0.94856134991573027
+    0xF3144762, // sin(1.2517283229146832) = 0.94952818059303667
+    0xF3530E2B, // sin(1.2547962844904545) = 0.9504860739494817
+    0xF3913EDB, // sin(1.2578642460662257) = 0.95143502096900834
+    0xF3CED94D, // sin(1.2609322076419971) = 0.95237501271976588
+    0xF40BDD5A, // sin(1.2640001692177685) = 0.95330604035419386
+    0xF4484ADD, // sin(1.2670681307935396) = 0.95422809510910567
+    0xF48421B1, // sin(1.270136092369311) = 0.95514116830577067
+    0xF4BF61B0, // sin(1.2732040539450822) = 0.95604525134999641
+    0xF4FA0AB6, // sin(1.2762720155208536) = 0.95694033573220882
+    0xF5341C9F, // sin(1.2793399770966247) = 0.95782641302753291
+    0xF56D9747, // sin(1.2824079386723961) = 0.9587034748958716
+    0xF5A67A8B, // sin(1.2854759002481673) = 0.95957151308198452
+    0xF5DEC647, // sin(1.2885438618239387) = 0.96043051941556579
+    0xF6167A59, // sin(1.2916118233997098) = 0.96128048581132064
+    0xF64D969E, // sin(1.2946797849754812) = 0.96212140426904158
+    0xF6841AF5, // sin(1.2977477465512526) = 0.96295326687368388
+    0xF6BA073B, // sin(1.3008157081270237) = 0.96377606579543984
+    0xF6EF5B50, // sin(1.3038836697027951) = 0.96458979328981276
+    0xF7241713, // sin(1.3069516312785663) = 0.9653944416976894
+    0xF7583A63, // sin(1.3100195928543377) = 0.9661900034454125
+    0xF78BC51F, // sin(1.3130875544301088) = 0.96697647104485207
+    0xF7BEB729, // sin(1.3161555160058802) = 0.96775383709347551
+    0xF7F11060, // sin(1.3192234775816514) = 0.96852209427441727
+    0xF822D0A6, // sin(1.3222914391574228) = 0.96928123535654853
+    0xF853F7DD, // sin(1.3253594007331939) = 0.97003125319454397
+    0xF88485E4, // sin(1.3284273623089653) = 0.97077214072895035
+    0xF8B47AA0, // sin(1.3314953238847367) = 0.97150389098625178
+    0xF8E3D5F1, // sin(1.3345632854605078) = 0.97222649707893627
+    0xF91297BC, // sin(1.3376312470362792) = 0.97293995220556018
+    0xF940BFE2, // sin(1.3406992086120504) = 0.97364424965081198
+    0xF96E4E48, // sin(1.3437671701878218) = 0.97433938278557586
+    0xF99B42D2, // sin(1.3468351317635929) = 0.97502534506699412
+    0xF9C79D63, // sin(1.3499030933393643) = 0.97570213003852857
+    0xF9F35DE1, // sin(1.3529710549151355) = 0.97636973133002114
+    0xFA1E8430, // sin(1.3560390164909069) = 0.97702814265775439
+    0xFA491036, // sin(1.3591069780666782) = 0.97767735782450993
+    0xFA7301D8, // sin(1.3621749396424494) = 0.97831737071962765
+    0xFA9C58FD, // sin(1.3652429012182208) = 0.9789481753190622
+    0xFAC5158C, // sin(1.3683108627939919) = 0.97956976568544052
+    0xFAED376A, // sin(1.3713788243697633) = 0.98018213596811743
+    0xFB14BE80, // sin(1.3744467859455345) = 0.98078528040323043
+    0xFB3BAAB4, // sin(1.3775147475213059) = 0.98137919331375456
+    0xFB61FBF0, // sin(1.380582709097077) = 0.98196386910955524
+    0xFB87B21A, // sin(1.3836506706728484) = 0.98253930228744124
+    0xFBACCD1D, // sin(1.3867186322486196) = 0.98310548743121629
+    0xFBD14CE1, // sin(1.389786593824391) = 0.98366241921173025
+    0xFBF5314F, // sin(1.3928545554001623) = 0.98421009238692903
+    0xFC187A52, // sin(1.3959225169759335) = 0.98474850180190421
+    0xFC3B27D4, // sin(1.3989904785517049) = 0.98527764238894122
+    0xFC5D39BE, // sin(1.402058440127476) = 0.98579750916756748
+    0xFC7EAFFD, // sin(1.4051264017032474) = 0.98630809724459867
+    0xFC9F8A7C, // sin(1.4081943632790186) = 0.98680940181418553
+    0xFCBFC926, // sin(1.41126232485479) = 0.98730141815785843
+    0xFCDF6BE8, // sin(1.4143302864305611) = 0.98778414164457218
+    0xFCFE72AD, // sin(1.4173982480063325) = 0.98825756773074946
+    0xFD1CDD64, // sin(1.4204662095821037) = 0.98872169196032378
+    0xFD3AABF8, // sin(1.4235341711578751) = 0.98917650996478101
+    0xFD57DE58, // sin(1.4266021327336464) = 0.98962201746320089
+    0xFD747472, // sin(1.4296700943094176) = 0.99005821026229712
+    0xFD906E34, // sin(1.432738055885189) = 0.99048508425645709
+    0xFDABCB8D, // sin(1.4358060174609601) = 0.99090263542778001
+    0xFDC68C6B, // sin(1.4388739790367315) = 0.99131085984611544
+    0xFDE0B0BF, // sin(1.4419419406125027) = 0.99170975366909953
+    0xFDFA3878, // sin(1.4450099021882741) = 0.9920993131421918
+    0xFE132387, // sin(1.4480778637640452) = 0.99247953459870997
+    0xFE2B71DC, // sin(1.4511458253398166) = 0.9928504144598651
+    0xFE432368, // sin(1.4542137869155878) = 0.9932119492347945
+    0xFE5A381D, // sin(1.4572817484913592) = 0.9935641355205953
+    0xFE70AFEB, // sin(1.4603497100671305) = 0.99390697000235606
+    0xFE868AC7, // sin(1.4634176716429017) = 0.9942404494531879
+    0xFE9BC8A1, // sin(1.4664856332186731) = 0.99456457073425542
+    0xFEB0696D, // sin(1.4695535947944443) = 0.99487933079480562
+    0xFEC46D1F, // sin(1.4726215563702156) = 0.99518472667219693
+    0xFED7D3A9, // sin(1.4756895179459868) = 0.99548075549192694
+    0xFEEA9D00, // sin(1.4787574795217582) = 0.99576741446765982
+    0xFEFCC918, // sin(1.4818254410975293) = 0.99604470090125197
+    0xFF0E57E6, // sin(1.4848934026733007) = 0.996312612182778
+    0xFF1F495F, // sin(1.4879613642490719) = 0.99657114579055484
+    0xFF2F9D79, // sin(1.4910293258248433) = 0.99682029929116567
+    0xFF3F542A, // sin(1.4940972874006146) = 0.99706007033948296
+    0xFF4E6D68, // sin(1.4971652489763858) = 0.99729045667869021
+    0xFF5CE92A, // sin(1.5002332105521572) = 0.99751145614030345
+    0xFF6AC766, // sin(1.5033011721279284) = 0.99772306664419164
+    0xFF780814, // sin(1.5063691337036997) = 0.997925286198596
+    0xFF84AB2C, // sin(1.5094370952794709) = 0.99811811290014918
+    0xFF90B0A7, // sin(1.5125050568552423) = 0.99830154493389289
+    0xFF9C187C, // sin(1.5155730184310134) = 0.99847558057329477
+    0xFFA6E2A6, // sin(1.5186409800067848) = 0.99864021818026527
+    0xFFB10F1C, // sin(1.5217089415825562) = 0.99879545620517241
+    0xFFBA9DD9, // sin(1.5247769031583274) = 0.99894129318685687
+    0xFFC38ED7, // sin(1.5278448647340988) = 0.99907772775264536
+    0xFFCBE210, // sin(1.5309128263098699) = 0.99920475861836389
+    0xFFD39780, // sin(1.5339807878856413) = 0.99932238458834954
+    0xFFDAAF21, // sin(1.5370487494614125) = 0.99943060455546173
+    0xFFE128F0, // sin(1.5401167110371838) = 0.99952941750109314
+    0xFFE704E7, // sin(1.543184672612955) = 0.99961882249517864
+    0xFFEC4304, // sin(1.5462526341887264) = 0.99969881869620425
+    0xFFF0E344, // sin(1.5493205957644975) = 0.99976940535121528
+    0xFFF4E5A2, // sin(1.5523885573402689) = 0.9998305817958234
+    0xFFF84A1E, // sin(1.5554565189160403) = 0.99988234745421256
+    0xFFFB10B5, // sin(1.5585244804918115) = 0.9999247018391445
+    0xFFFD3965, // sin(1.5615924420675829) = 0.9999576445519639
+    0xFFFEC42C, // sin(1.564660403643354) = 0.99998117528260111
+    0xFFFFB10B, // sin(1.5677283652191254) = 0.99999529380957619
+};
+
+// Difference to the next kSinLut entry, kept as a parallel array so linear
+// interpolation reads base and slope from two gathers and skips the subtract;
+// the last one ends at sin(pi/2)
+#if defined(__GNUC__) && defined(__ELF__)
+[[gnu::section(".rodata.math_trig_lut.sin_delta")]]
+#endif
+alignas(64) inline constexpr std::array<int32_t, 512> kSinLutDelta = {
+    13176774, // sin(x[1]) - sin(x[0])
+    13176650, // sin(x[2]) - sin(x[1])
+    13176402, // sin(x[3]) - sin(x[2])
+    13176030, // sin(x[4]) - sin(x[3])
+    13175533, // sin(x[5]) - sin(x[4])
+    13174914, // sin(x[6]) - sin(x[5])
+    13174169, // sin(x[7]) - sin(x[6])
+    13173302, // sin(x[8]) - sin(x[7])
+    13172309, // sin(x[9]) - sin(x[8])
+    13171193, // sin(x[10]) - sin(x[9])
+    13169954, // sin(x[11]) - sin(x[10])
+    13168589, // sin(x[12]) - sin(x[11])
+    13167101, // sin(x[13]) - sin(x[12])
+    13165489, // sin(x[14]) - sin(x[13])
+    13163754, // sin(x[15]) - sin(x[14])
+    13161894, // sin(x[16]) - sin(x[15])
+    13159910, // sin(x[17]) - sin(x[16])
+    13157802, // sin(x[18]) - sin(x[17])
+    13155572, // sin(x[19]) - sin(x[18])
+    13153216, // sin(x[20]) - sin(x[19])
+    13150737, // sin(x[21]) - sin(x[20])
+    13148135, // sin(x[22]) - sin(x[21])
+    13145408, // sin(x[23]) - sin(x[22])
+    13142558, // sin(x[24]) - sin(x[23])
+    13139584, // sin(x[25]) - sin(x[24])
+    13136486, // sin(x[26]) - sin(x[25])
+    13133265, // sin(x[27]) - sin(x[26])
+    13129921, // sin(x[28]) - sin(x[27])
+    13126451, // sin(x[29]) - sin(x[28])
+    13122860, // sin(x[30]) - sin(x[29])
+    13119145, // sin(x[31]) - sin(x[30])
+    13115305, // sin(x[32]) - sin(x[31])
+    13111343, // sin(x[33]) - sin(x[32])
+    13107257, // sin(x[34]) - sin(x[33])
+    13103048, // sin(x[35]) - sin(x[34])
+    13098716, // sin(x[36]) - sin(x[35])
+    13094259, // sin(x[37]) - sin(x[36])
+    13089681, // sin(x[38]) - sin(x[37])
+    13084978, // sin(x[39]) - sin(x[38])
+    13080153, // sin(x[40]) - sin(x[39])
+    13075204, // sin(x[41]) - sin(x[40])
+    13070132, // sin(x[42]) - sin(x[41])
+    13064938, // sin(x[43]) - sin(x[42])
+    13059621, // sin(x[44]) - sin(x[43])
+    13054179, // sin(x[45]) - sin(x[44])
+    13048617, // sin(x[46]) - sin(x[45])
+    13042930, // sin(x[47]) - sin(x[46])
+    13037121, // sin(x[48]) - sin(x[47])
+    13031190, // sin(x[49]) - sin(x[48])
+    13025135, // sin(x[50]) - sin(x[49])
+    13018958, // sin(x[51]) - sin(x[50])
+    13012658, // sin(x[52]) - sin(x[51])
+    13006237, // sin(x[53]) - sin(x[52])
+    12999692, // sin(x[54]) - sin(x[53])
+    12993026, // sin(x[55]) - sin(x[54])
+    12986236, // sin(x[56]) - sin(x[55])
+    12979325, // sin(x[57]) - sin(x[56])
+    12972292, // sin(x[58]) - sin(x[57])
+    12965136, // sin(x[59]) - sin(x[58])
+    12957859, // sin(x[60]) - sin(x[59])
+    12950459, // sin(x[61]) - sin(x[60])
+    12942937, // sin(x[62]) - sin(x[61])
+    12935295, // sin(x[63]) - sin(x[62])
+    12927529, // sin(x[64]) - sin(x[63])
+    12919642, // sin(x[65]) - sin(x[64])
+    12911635, // sin(x[66]) - sin(x[65])
+    12903504, // sin(x[67]) - sin(x[66])
+    12895253, // sin(x[68]) - sin(x[67])
+    12886881, // sin(x[69]) - sin(x[68])
+    12878386, // sin(x[70]) - sin(x[69])
+    12869772, // sin(x[71]) - sin(x[70])
+    12861035, // sin(x[72]) - sin(x[71])
+    12852178, // sin(x[73]) - sin(x[72])
+    12843199, // sin(x[74]) - sin(x[73])
+    12834100, // sin(x[75]) - sin(x[74])
+    12824881, // sin(x[76]) - sin(x[75])
+    12815539, // sin(x[77]) - sin(x[76])
+    12806078, // sin(x[78]) - sin(x[77])
+    12796496, // sin(x[79]) - sin(x[78])
+    12786794, // sin(x[80]) - sin(x[79])
+    12776971, // sin(x[81]) - sin(x[80])
+    12767029, // sin(x[82]) - sin(x[81])
+    12756965, // sin(x[83]) - sin(x[82])
+    12746782, // sin(x[84]) - sin(x[83])
+    12736479, // sin(x[85]) - sin(x[84])
+    12726055, // sin(x[86]) - sin(x[85])
+    12715513, // sin(x[87]) - sin(x[86])
+    12704851, // sin(x[88]) - sin(x[87])
+    12694068, // sin(x[89]) - sin(x[88])
+    12683167, // sin(x[90]) - sin(x[89])
+    12672146, // sin(x[91]) - sin(x[90])
+    12661005, // sin(x[92]) - sin(x[91])
+    12649746, // sin(x[93]) - sin(x[92])
+    12638368, // sin(x[94]) - sin(x[93])
+    12626870, // sin(x[95]) - sin(x[94])
+    12615254, // sin(x[96]) - sin(x[95])
+    12603519, // sin(x[97]) - sin(x[96])
+    12591666, // sin(x[98]) - sin(x[97])
+    12579693, // sin(x[99]) - sin(x[98])
+    12567603, // sin(x[100]) - sin(x[99])
+    12555393, // sin(x[101]) - sin(x[100])
+    12543067, // sin(x[102]) - sin(x[101])
+    12530622, // sin(x[103]) - sin(x[102])
+    12518058, // sin(x[104]) - sin(x[103])
+    12505378, // sin(x[105]) - sin(x[104])
+    12492579, // sin(x[106]) - sin(x[105])
+    12479663, // sin(x[107]) - sin(x[106])
+    12466630, // sin(x[108]) - sin(x[107])
+    12453478, // sin(x[109]) - sin(x[108])
+    12440211, // sin(x[110]) - sin(x[109])
+    12426825, // sin(x[111]) - sin(x[110])
+    12413323, // sin(x[112]) - sin(x[111])
+    12399703, // sin(x[113]) - sin(x[112])
+    12385968, // sin(x[114]) - sin(x[113])
+    12372116, // sin(x[115]) - sin(x[114])
+    12358147, // sin(x[116]) - sin(x[115])
+    12344062, // sin(x[117]) - sin(x[116])
+    12329860, // sin(x[118]) - sin(x[117])
+    12315543, // sin(x[119]) - sin(x[118])
+    12301110, // sin(x[120]) - sin(x[119])
+    12286561, // sin(x[121]) - sin(x[120])
+    12271896, // sin(x[122]) - sin(x[121])
+    12257115, // sin(x[123]) - sin(x[122])
+    12242220, // sin(x[124]) - sin(x[123])
+    12227210, // sin(x[125]) - sin(x[124])
+    12212083, // sin(x[126]) - sin(x[125])
+    12196843, // sin(x[127]) - sin(x[126])
+    12181487, // sin(x[128]) - sin(x[127])
+    12166016, // sin(x[129]) - sin(x[128])
+    12150432, // sin(x[130]) - sin(x[129])
+    12134733, // sin(x[131]) - sin(x[130])
+    12118919, // sin(x[132]) - sin(x[131])
+    12102992, // sin(x[133]) - sin(x[132])
+    12086950, // sin(x[134]) - sin(x[133])
+    12070795, // sin(x[135]) - sin(x[134])
+    12054527, // sin(x[136]) - sin(x[135])
+    12038144, // sin(x[137]) - sin(x[136])
+    12021648, // sin(x[138]) - sin(x[137])
+    12005040, // sin(x[139]) - sin(x[138])
+    11988319, // sin(x[140]) - sin(x[139])
+    11971483, // sin(x[141]) - sin(x[140])
+    11954537, // sin(x[142]) - sin(x[141])
+    11937477, // sin(x[143]) - sin(x[142])
+    11920305, // sin(x[144]) - sin(x[143])
+    11903020, // sin(x[145]) - sin(x[144])
+    11885624, // sin(x[146]) - sin(x[145])
+    11868116, // sin(x[147]) - sin(x[146])
+    11850496, // sin(x[148]) - sin(x[147])
+    11832765, // sin(x[149]) - sin(x[148])
+    11814921, // sin(x[150]) - sin(x[149])
+    11796968, // sin(x[151]) - sin(x[150])
+    11778903, // sin(x[152]) - sin(x[151])
+    11760727, // sin(x[153]) - sin(x[152])
+    11742440, // sin(x[154]) - sin(x[153])
+    11724043, // sin(x[155]) - sin(x[154])
+    11705535, // sin(x[156]) - sin(x[155])
+    11686918, // sin(x[157]) - sin(x[156])
+    11668190, // sin(x[158]) - sin(x[157])
+    11649353, // sin(x[159]) - sin(x[158])
+    11630405, // sin(x[160]) - sin(x[159])
+    11611349, // sin(x[161]) - sin(x[160])
+    11592183, // sin(x[162]) - sin(x[161])
+    11572908, // sin(x[163]) - sin(x[162])
+    11553524, // sin(x[164]) - sin(x[163])
+    11534031, // sin(x[165]) - sin(x[164])
+    11514430, // sin(x[166]) - sin(x[165])
+    11494720, // sin(x[167]) - sin(x[166])
+    11474903, // sin(x[168]) - sin(x[167])
+    11454977, // sin(x[169]) - sin(x[168])
+    11434943, // sin(x[170]) - sin(x[169])
+    11414801, // sin(x[171]) - sin(x[170])
+    11394553, // sin(x[172]) - sin(x[171])
+    11374197, // sin(x[173]) - sin(x[172])
+    11353734, // sin(x[174]) - sin(x[173])
+    11333165, // sin(x[175]) - sin(x[174])
+    11312487, // sin(x[176]) - sin(x[175])
+    11291705, // sin(x[177]) - sin(x[176])
+    11270815, // sin(x[178]) - sin(x[177])
+    11249819, // sin(x[179]) - sin(x[178])
+    11228719, // sin(x[180]) - sin(x[179])
+    11207511, // sin(x[181]) - sin(x[180])
+    11186199, // sin(x[182]) - sin(x[181])
+    11164782, // sin(x[183]) - sin(x[182])
+    11143258, // sin(x[184]) - sin(x[183])
+    11121630, // sin(x[185]) - sin(x[184])
+    11099899, // sin(x[186]) - sin(x[185])
+    11078061, // sin(x[187]) - sin(x[186])
+    11056120, // sin(x[188]) - sin(x[187])
+    11034075, // sin(x[189]) - sin(x[188])
+    11011926, // sin(x[190]) - sin(x[189])
+    10989673, // sin(x[191]) - sin(x[190])
+    10967316, // sin(x[192]) - sin(x[191])
+    10944858, // sin(x[193]) - sin(x[192])
+    10922295, // sin(x[194]) - sin(x[193])
+    10899630, // sin(x[195]) - sin(x[194])
+    10876862, // sin(x[196]) - sin(x[195])
+    10853991, // sin(x[197]) - sin(x[196])
+    10831020, // sin(x[198]) - sin(x[197])
+    10807945, // sin(x[199]) - sin(x[198])
+    10784769, // sin(x[200]) - sin(x[199])
+    10761491, // sin(x[201]) - sin(x[200])
+    10738113, // sin(x[202]) - sin(x[201])
+    10714633, // sin(x[203]) - sin(x[202])
+    10691052, // sin(x[204]) - sin(x[203])
+    10667370, // sin(x[205]) - sin(x[204])
+    10643589, // sin(x[206]) - sin(x[205])
+    10619707, // sin(x[207]) - sin(x[206])
+    10595725, // sin(x[208]) - sin(x[207])
+    10571643, // sin(x[209]) - sin(x[208])
+    10547462, // sin(x[210]) - sin(x[209])
+    10523182, // sin(x[211]) - sin(x[210])
+    10498802, // sin(x[212]) - sin(x[211])
+    10474324, // sin(x[213]) - sin(x[212])
+    10449747, // sin(x[214]) - sin(x[213])
+    10425072, // sin(x[215]) - sin(x[214])
+    10400298, // sin(x[216]) - sin(x[215])
+    10375427, // sin(x[217]) - sin(x[216])
+    10350458, // sin(x[218]) - sin(x[217])
+    10325392, // sin(x[219]) - sin(x[218])
+    10300228, // sin(x[220]) - sin(x[219])
+    10274968, // sin(x[221]) - sin(x[220])
+    10249610, // sin(x[222]) - sin(x[221])
+    10224157, // sin(x[223]) - sin(x[222])
+    10198607, // sin(x[224]) - sin(x[223])
+    10172961, // sin(x[225]) - sin(x[224])
+    10147220, // sin(x[226]) - sin(x[225])
+    10121382, // sin(x[227]) - sin(x[226])
+    10095450, // sin(x[228]) - sin(x[227])
+    10069422, // sin(x[229]) - sin(x[228])
+    10043300, // sin(x[230]) - sin(x[229])
+    10017084, // sin(x[231]) - sin(x[230])
+    9990772,  // sin(x[232]) - sin(x[231])
+    9964367,  // sin(x[233]) - sin(x[232])
+    9937869,  // sin(x[234]) - sin(x[233])
+    9911276,  // sin(x[235]) - sin(x[234])
+    9884590,  // sin(x[236]) - sin(x[235])
+    9857812,  // sin(x[237]) - sin(x[236])
+    9830940,  // sin(x[238]) - sin(x[237])
+    9803976,  // sin(x[239]) - sin(x[238])
+    9776919,  // sin(x[240]) - sin(x[239])
+    9749772,  // sin(x[241]) - sin(x[240])
+    9722531,  // sin(x[242]) - sin(x[241])
+    9695199,  // sin(x[243]) - sin(x[242])
+    9667777,  // sin(x[244]) - sin(x[243])
+    9640263,  // sin(x[245]) - sin(x[244])
+    9612658,  // sin(x[246]) - sin(x[245])
+    9584963,  // sin(x[247]) - sin(x[246])
+    9557178,  // sin(x[248]) - sin(x[247])
+    9529302,  // sin(x[249]) - sin(x[248])
+    9501338,  // sin(x[250]) - sin(x[249])
+    9473283,  // sin(x[251]) - sin(x[250])
+    9445140,  // sin(x[252]) - sin(x[251])
+    9416907,  // sin(x[253]) - sin(x[252])
+    9388586,  // sin(x[254]) - sin(x[253])
+    9360176,  // sin(x[255]) - sin(x[254])
+    9331679,  // sin(x[256]) - sin(x[255])
+    9303093,  // sin(x[257]) - sin(x[256])
+    9274421,  // sin(x[258]) - sin(x[257])
+    9245660,  // sin(x[259]) - sin(x[258])
+    9216813,  // sin(x[260]) - sin(x[259])
+    9187879,  // sin(x[261]) - sin(x[260])
+    9158859,  // sin(x[262]) - sin(x[261])
+    9129751,  // sin(x[263]) - sin(x[262])
+    9100559,  // sin(x[264]) - sin(x[263])
+    9071281,  // sin(x[265]) - sin(x[264])
+    9041917,  // sin(x[266]) - sin(x[265])
+    9012469,  // sin(x[267]) - sin(x[266])
+    8982934,  // sin(x[268]) - sin(x[267])
+    8953317,  // sin(x[269]) - sin(x[268])
+    8923613,  // sin(x[270]) - sin(x[269])
+    8893828,  // sin(x[271]) - sin(x[270])
+    8863957,  // sin(x[272]) - sin(x[271])
+    8834004,  // sin(x[273]) - sin(x[272])
+    8803967,  // sin(x[274]) - sin(x[273])
+    8773848,  // sin(x[275]) - sin(x[274])
+    8743645,  // sin(x[276]) - sin(x[275])
+    8713360,  // sin(x[277]) - sin(x[276])
+    8682995,  // sin(x[278]) - sin(x[277])
+    8652546,  // sin(x[279]) - sin(x[278])
+    8622016,  // sin(x[280]) - sin(x[279])
+    8591405,  // sin(x[281]) - sin(x[280])
+    8560714,  // sin(x[282]) - sin(x[281])
+    8529942,  // sin(x[283]) - sin(x[282])
+    8499089,  // sin(x[284]) - sin(x[283])
+    8468156,  // sin(x[285]) - sin(x[284])
+    8437144,  // sin(x[286]) - sin(x[285])
+    8406053,  // sin(x[287]) - sin(x[286])
+    8374882,  // sin(x[288]) - sin(x[287])
+    8343632,  // sin(x[289]) - sin(x[288])
+    8312304,  // sin(x[290]) - sin(x[289])
+    8280897,  // sin(x[291]) - sin(x[290])
+    8249413,  // sin(x[292]) - sin(x[291])
+    8217852,  // sin(x[293]) - sin(x[292])
+    8186212,  // sin(x[294]) - sin(x[293])
+    8154495,  // sin(x[295]) - sin(x[294])
+    8122703,  // sin(x[296]) - sin(x[295])
+    8090832,  // sin(x[297]) - sin(x[296])
+    8058887,  // sin(x[298]) - sin(x[297])
+    8026866,  // sin(x[299]) - sin(x[298])
+    7994768,  // sin(x[300]) - sin(x[299])
+    7962596,  // sin(x[301]) - sin(x[300])
+    7930349,  // sin(x[302]) - sin(x[301])
+    7898026,  // sin(x[303]) - sin(x[302])
+    7865631,  // sin(x[304]) - sin(x[303])
+    7833160,  // sin(x[305]) - sin(x[304])
+    7800615,  // sin(x[306]) - sin(x[305])
+    7767999,  // sin(x[307]) - sin(x[306])
+    7735307,  // sin(x[308]) - sin(x[307])
+    7702545,  // sin(x[309]) - sin(x[308])
+    7669708,  // sin(x[310]) - sin(x[309])
+    7636800,  // sin(x[311]) - sin(x[310])
+    7603820,  // sin(x[312]) - sin(x[311])
+    7570769,  // sin(x[313]) - sin(x[312])
+    7537646,  // sin(x[314]) - sin(x[313])
+    7504452,  // sin(x[315]) - sin(x[314])
+    7471187,  // sin(x[316]) - sin(x[315])
+    7437853,  // sin(x[317]) - sin(x[316])
+    7404448,  // sin(x[318]) - sin(x[317])
+    7370974,  // sin(x[319]) - sin(x[318])
+    7337429,  // sin(x[320]) - sin(x[319])
+    7303817,  // sin(x[321]) - sin(x[320])
+    7270136,  // sin(x[322]) - sin(x[321])
+    7236385,  // sin(x[323]) - sin(x[322])
+    7202567,  // sin(x[324]) - sin(x[323])
+    7168681,  // sin(x[325]) - sin(x[324])
+    7134728,  // sin(x[326]) - sin(x[325])
+    7100707,  // sin(x[327]) - sin(x[326])
+    7066620,  // sin(x[328]) - sin(x[327])
+    7032465,  // sin(x[329]) - sin(x[328])
+    6998246,  // sin(x[330]) - sin(x[329])
+    6963960,  // sin(x[331]) - sin(x[330])
+    6929608,  // sin(x[332]) - sin(x[331])
+    6895191,  // sin(x[333]) - sin(x[332])
+    6860710,  // sin(x[334]) - sin(x[333])
+    6826163,  // sin(x[335]) - sin(x[334])
+    6791553,  // sin(x[336]) - sin(x[335])
+    6756878,  // sin(x[337]) - sin(x[336])
+    6722141,  // sin(x[338]) - sin(x[337])
+    6687339,  // sin(x[339]) - sin(x[338])
+    6652475,  // sin(x[340]) - sin(x[339])
+    6617548,  // sin(x[341]) - sin(x[340])
+    6582559,  // sin(x[342]) - sin(x[341])
+    6547507,  // sin(x[343]) - sin(x[342])
+    6512395,  // sin(x[344]) - sin(x[343])
+    6477222,  // sin(x[345]) - sin(x[344])
+    6441986,  // sin(x[346]) - sin(x[345])
+    6406690,  // sin(x[347]) - sin(x[346])
+    6371335,  // sin(x[348]) - sin(x[347])
+    6335918,  // sin(x[349]) - sin(x[348])
+    6300443,  // sin(x[350]) - sin(x[349])
+    6264909,  // sin(x[351]) - sin(x[350])
+    6229314,  // sin(x[352]) - sin(x[351])
+    6193662,  // sin(x[353]) - sin(x[352])
+    6157951,  // sin(x[354]) - sin(x[353])
+    6122183,  // sin(x[355]) - sin(x[354])
+    6086356,  // sin(x[356]) - sin(x[355])
+    6050473,  // sin(x[357]) - sin(x[356])
+    6014532,  // sin(x[358]) - sin(x[357])
+    5978535,  // sin(x[359]) - sin(x[358])
+    5942482,  // sin(x[360]) - sin(x[359])
+    5906372,  // sin(x[361]) - sin(x[360])
+    5870207,  // sin(x[362]) - sin(x[361])
+    5833987,  // sin(x[363]) - sin(x[362])
+    5797712,  // sin(x[364]) - sin(x[363])
+    5761382,  // sin(x[365]) - sin(x[364])
+    5724998,  // sin(x[366]) - sin(x[365])
+    5688561,  // sin(x[367]) - sin(x[366])
+    5652069,  // sin(x[368]) - sin(x[367])
+    5615524,  // sin(x[369]) - sin(x[368])
+    5578928,  // sin(x[370]) - sin(x[369])
+    5542277,  // sin(x[371]) - sin(x[370])
+    5505575,  // sin(x[372]) - sin(x[371])
+    5468821,  // sin(x[373]) - sin(x[372])
+    5432016,  // sin(x[374]) - sin(x[373])
+    5395159,  // sin(x[375]) - sin(x[374])
+    5358252,  // sin(x[376]) - sin(x[375])
+    5321295,  // sin(x[377]) - sin(x[376])
+    5284286,  // sin(x[378]) - sin(x[377])
+    5247229,  // sin(x[379]) - sin(x[378])
+    5210122,  // sin(x[380]) - sin(x[379])
+    5172966,  // sin(x[381]) - sin(x[380])
+    5135762,  // sin(x[382]) - sin(x[381])
+    5098508,  // sin(x[383]) - sin(x[382])
+    5061208,  // sin(x[384]) - sin(x[383])
+    5023858,  // sin(x[385]) - sin(x[384])
+    4986463,  // sin(x[386]) - sin(x[385])
+    4949020,  // sin(x[387]) - sin(x[386])
+    4911531,  // sin(x[388]) - sin(x[387])
+    4873995,  // sin(x[389]) - sin(x[388])
+    4836413,  // sin(x[390]) - sin(x[389])
+    4798786,  // sin(x[391]) - sin(x[390])
+    4761114,  // sin(x[392]) - sin(x[391])
+    4723397,  // sin(x[393]) - sin(x[392])
+    4685636,  // sin(x[394]) - sin(x[393])
+    4647830,  // sin(x[395]) - sin(x[394])
+    4609980,  // sin(x[396]) - sin(x[395])
+    4572088,  // sin(x[397]) - sin(x[396])
+    4534152,  // sin(x[398]) - sin(x[397])
+    4496174,  // sin(x[399]) - sin(x[398])
+    4458153,  // sin(x[400]) - sin(x[399])
+    4420090,  // sin(x[401]) - sin(x[400])
+    4381986,  // sin(x[402]) - sin(x[401])
+    4343840,  // sin(x[403]) - sin(x[402])
+    4305653,  // sin(x[404]) - sin(x[403])
+    4267427,  // sin(x[405]) - sin(x[404])
+    4229160,  // sin(x[406]) - sin(x[405])
+    4190852,  // sin(x[407]) - sin(x[406])
+    4152506,  // sin(x[408]) - sin(x[407])
+    4114121,  // sin(x[409]) - sin(x[408])
+    4075696,  // sin(x[410]) - sin(x[409])
+    4037234,  // sin(x[411]) - sin(x[410])
+    3998733,  // sin(x[412]) - sin(x[411])
+    3960195,  // sin(x[413]) - sin(x[412])
+    3921620,  // sin(x[414]) - sin(x[413])
+    3883007,  // sin(x[415]) - sin(x[414])
+    3844358,  // sin(x[416]) - sin(x[415])
+    3805673,  // sin(x[417]) - sin(x[416])
+    3766952,  // sin(x[418]) - sin(x[417])
+    3728196,  // sin(x[419]) - sin(x[418])
+    3689404,  // sin(x[420]) - sin(x[419])
+    3650578,  // sin(x[421]) - sin(x[420])
+    3611717,  // sin(x[422]) - sin(x[421])
+    3572823,  // sin(x[423]) - sin(x[422])
+    3533894,  // sin(x[424]) - sin(x[423])
+    3494933,  // sin(x[425]) - sin(x[424])
+    3455939,  // sin(x[426]) - sin(x[425])
+    3416912,  // sin(x[427]) - sin(x[426])
+    3377852,  // sin(x[428]) - sin(x[427])
+    3338762,  // sin(x[429]) - sin(x[428])
+    3299639,  // sin(x[430]) - sin(x[429])
+    3260486,  // sin(x[431]) - sin(x[430])
+    3221303,  // sin(x[432]) - sin(x[431])
+    3182087,  // sin(x[433]) - sin(x[432])
+    3142844,  // sin(x[434]) - sin(x[433])
+    3103569,  // sin(x[435]) - sin(x[434])
+    3064267,  // sin(x[436]) - sin(x[435])
+    3024934,  // sin(x[437]) - sin(x[436])
+    2985574,  // sin(x[438]) - sin(x[437])
+    2946186,  // sin(x[439]) - sin(x[438])
+    2906769,  // sin(x[440]) - sin(x[439])
+    2867326,  // sin(x[441]) - sin(x[440])
+    2827855,  // sin(x[442]) - sin(x[441])
+    2788358,  // sin(x[443]) - sin(x[442])
+    2748834,  // sin(x[444]) - sin(x[443])
+    2709285,  // sin(x[445]) - sin(x[444])
+    2669711,  // sin(x[446]) - sin(x[445])
+    2630110,  // sin(x[447]) - sin(x[446])
+    2590486,  // sin(x[448]) - sin(x[447])
+    2550836,  // sin(x[449]) - sin(x[448])
+    2511164,  // sin(x[450]) - sin(x[449])
+    2471466,  // sin(x[451]) - sin(x[450])
+    2431747,  // sin(x[452]) - sin(x[451])
+    2392004,  // sin(x[453]) - sin(x[452])
+    2352238,  // sin(x[454]) - sin(x[453])
+    2312451,  // sin(x[455]) - sin(x[454])
+    2272642,  // sin(x[456]) - sin(x[455])
+    2232810,  // sin(x[457]) - sin(x[456])
+    2192959,  // sin(x[458]) - sin(x[457])
+    2153087,  // sin(x[459]) - sin(x[458])
+    2113194,  // sin(x[460]) - sin(x[459])
+    2073282,  // sin(x[461]) - sin(x[460])
+    2033349,  // sin(x[462]) - sin(x[461])
+    1993399,  // sin(x[463]) - sin(x[462])
+    1953428,  // sin(x[464]) - sin(x[463])
+    1913440,  // sin(x[465]) - sin(x[464])
+    1873434,  // sin(x[466]) - sin(x[465])
+    1833410,  // sin(x[467]) - sin(x[466])
+    1793369,  // sin(x[468]) - sin(x[467])
+    1753310,  // sin(x[469]) - sin(x[468])
+    1713236,  // sin(x[470]) - sin(x[469])
+    1673145,  // sin(x[471]) - sin(x[470])
+    1633039,  // sin(x[472]) - sin(x[471])
+    1592917,  // sin(x[473]) - sin(x[472])
+    1552780,  // sin(x[474]) - sin(x[473])
+    1512629,  // sin(x[475]) - sin(x[474])
+    1472462,  // sin(x[476]) - sin(x[475])
+    1432284,  // sin(x[477]) - sin(x[476])
+    1392090,  // sin(x[478]) - sin(x[477])
+    1351884,  // sin(x[479]) - sin(x[478])
+    1311666,  // sin(x[480]) - sin(x[479])
+    1271434,  // sin(x[481]) - sin(x[480])
+    1231191,  // sin(x[482]) - sin(x[481])
+    1190936,  // sin(x[483]) - sin(x[482])
+    1150670,  // sin(x[484]) - sin(x[483])
+    1110393,  // sin(x[485]) - sin(x[484])
+    1070106,  // sin(x[486]) - sin(x[485])
+    1029809,  // sin(x[487]) - sin(x[486])
+    989502,   // sin(x[488]) - sin(x[487])
+    949186,   // sin(x[489]) - sin(x[488])
+    908860,   // sin(x[490]) - sin(x[489])
+    868526,   // sin(x[491]) - sin(x[490])
+    828184,   // sin(x[492]) - sin(x[491])
+    787835,   // sin(x[493]) - sin(x[492])
+    747477,   // sin(x[494]) - sin(x[493])
+    707114,   // sin(x[495]) - sin(x[494])
+    666742,   // sin(x[496]) - sin(x[495])
+    626365,   // sin(x[497]) - sin(x[496])
+    585982,   // sin(x[498]) - sin(x[497])
+    545593,   // sin(x[499]) - sin(x[498])
+    505200,   // sin(x[500]) - sin(x[499])
+    464801,   // sin(x[501]) - sin(x[500])
+    424399,   // sin(x[502]) - sin(x[501])
+    383991,   // sin(x[503]) - sin(x[502])
+    343581,   // sin(x[504]) - sin(x[503])
+    303168,   // sin(x[505]) - sin(x[504])
+    262750,   // sin(x[506]) - sin(x[505])
+    222332,   // sin(x[507]) - sin(x[506])
+    181911,   // sin(x[508]) - sin(x[507])
+    141488,   // sin(x[509]) - sin(x[508])
+    101063,   // sin(x[510]) - sin(x[509])
+    60639,    // sin(x[511]) - sin(x[510])
+    20213,    // sin(x[512]) - sin(x[511])
+};
+
+// Cubic Hermite segment of sin in the local variable t in [0,1):
+// sin(x) ~= ((a*t + b)*t + c)*t + d, with the derivatives scaled by the step size
+struct SinSegment {
+    int32_t a;
+    int32_t b;
+    int32_t c;
+    uint32_t d;
+};
+
+// Table maps each kSinLut interval of [0,pi/2] to its Hermite coefficients, built
+// from the endpoint values sin(x) and derivatives sin'(x) = cos(x)
+#if defined(__GNUC__) && defined(__ELF__)
+[[gnu::section(".rodata.math_trig_lut.sin_hermite")]]
+#endif
+alignas(64) inline constexpr std::array<SinSegment, 512> kSinTable = {{
+    {-20, -1, 13176795, 0x00000000},     // [0.00000000000, 0.00306796158]
+    {-20, -63, 13176733, 0x00C90FC6},    // [0.00306796158, 0.00613592315]
+    {-20, -125, 13176547, 0x01921F10},   // [0.00613592315, 0.00920388473]
+    {-21, -186, 13176237, 0x025B2D62},   // [0.00920388473, 0.01227184630]
+    {-20, -249, 13175802, 0x03243A40},   // [0.01227184630, 0.01533980788]
+    {-22, -308, 13175244, 0x03ED452D},   // [0.01533980788, 0.01840776945]
+    {-20, -373, 13174562, 0x04B64DAF},   // [0.01840776945, 0.02147573103]
+    {-22, -432, 13173756, 0x057F5348},   // [0.02147573103, 0.02454369261]
+    {-20, -497, 13172826, 0x0648557E},   // [0.02454369261, 0.02761165418]
+    {-20, -559, 13171772, 0x071153D3},   // [0.02761165418, 0.03067961576]
+    {-22, -618, 13170594, 0x07DA4DCC},   // [0.03067961576, 0.03374757733]
+    {-20, -683, 13169292, 0x08A342EE},   // [0.03374757733, 0.03681553891]
+    {-20, -745, 13167866, 0x096C32BB},   // [0.03681553891, 0.03988350049]
+    {-20, -807, 13166316, 0x0A351CB8},   // [0.03988350049, 0.04295146206]
+    {-22, -866, 13164642, 0x0AFE0069},   // [0.04295146206, 0.04601942364]
+    {-21, -929, 13162844, 0x0BC6DD53},   // [0.04601942364, 0.04908738521]
+    {-20, -993, 13160923, 0x0C8FB2F9},   // [0.04908738521, 0.05215534679]
+    {-19, -1056, 13158877, 0x0D5880DF},  // [0.05215534679, 0.05522330836]
+    {-22, -1114, 13156708, 0x0E214689},  // [0.05522330836, 0.05829126994]
+    {-21, -1177, 13154414, 0x0EEA037D},  // [0.05829126994, 0.06135923152]
+    {-20, -1240, 13151997, 0x0FB2B73D},  // [0.06135923152, 0.06442719309]
+    {-21, -1301, 13149457, 0x107B614E},  // [0.06442719309, 0.06749515467]
+    {-20, -1364, 13146792, 0x11440135},  // [0.06749515467, 0.07056311624]
+    {-20, -1426, 13144004, 0x120C9675},  // [0.07056311624, 0.07363107782]
+    {-20, -1488, 13141092, 0x12D52093},  // [0.07363107782, 0.07669903939]
+    {-20, -1550, 13138056, 0x139D9F13},  // [0.07669903939, 0.07976700097]
+    {-21, -1610, 13134896, 0x14661179},  // [0.07976700097, 0.08283496255]
+    {-22, -1670, 13131613, 0x152E774A},  // [0.08283496255, 0.08590292412]
+    {-19, -1737, 13128207, 0x15F6D00B},  // [0.08590292412, 0.08897088570]
+    {-21, -1795, 13124676, 0x16BF1B3E},  // [0.08897088570, 0.09203884727]
+    {-22, -1856, 13121023, 0x1787586A},  // [0.09203884727, 0.09510680885]
+    {-20, -1920, 13117245, 0x184F8713},  // [0.09510680885, 0.09817477042]
+    {-20, -1982, 13113345, 0x1917A6BC},  // [0.09817477042, 0.10124273200]
+    {-20, -2044, 13109321, 0x19DFB6EB},  // [0.10124273200, 0.10431069358]
+    {-21, -2104, 13105173, 0x1AA7B724},  // [0.10431069358, 0.10737865515]
+    {-22, -2164, 13100902, 0x1B6FA6EC},  // [0.10737865515, 0.11044661673]
+    {-19, -2230, 13096508, 0x1C3785C8},  // [0.11044661673, 0.11351457830]
+    {-21, -2289, 13091991, 0x1CFF533B},  // [0.11351457830, 0.11658253988]
+    {-20, -2352, 13087350, 0x1DC70ECC},  // [0.11658253988, 0.11965050146]
+    {-21, -2412, 13082586, 0x1E8EB7FE},  // [0.11965050146, 0.12271846303]
+    {-20, -2475, 13077699, 0x1F564E57},  // [0.12271846303, 0.12578642461]
+    {-19, -2538, 13072689, 0x201DD15B},  // [0.12578642461, 0.12885438618]
+    {-20, -2598, 13067556, 0x20E5408F},  // [0.12885438618, 0.13192234776]
+    {-21, -2658, 13062300, 0x21AC9B79},  // [0.13192234776, 0.13499030933]
+    {-18, -2724, 13056921, 0x2273E19E},  // [0.13499030933, 0.13805827091]
+    {-21, -2781, 13051419, 0x233B1281},  // [0.13805827091, 0.14112623249]
+    {-20, -2844, 13045794, 0x24022DAA},  // [0.14112623249, 0.14419419406]
+    {-20, -2905, 13040046, 0x24C9329C},  // [0.14419419406, 0.14726215564]
+    {-21, -2965, 13034176, 0x259020DD},  // [0.14726215564, 0.15033011721]
+    {-20, -3028, 13028183, 0x2656F7F3},  // [0.15033011721, 0.15339807879]
+    {-20, -3089, 13022067, 0x271DB762},  // [0.15339807879, 0.15646604036]
+    {-19, -3152, 13015829, 0x27E45EB0},  // [0.15646604036, 0.15953400194]
+    {-21, -3210, 13009468, 0x28AAED62},  // [0.15953400194, 0.16260196352]
+    {-20, -3273, 13002985, 0x297162FF},  // [0.16260196352, 0.16566992509]
+    {-22, -3331, 12996379, 0x2A37BF0B},  // [0.16566992509, 0.16873788667]
+    {-20, -3395, 12989651, 0x2AFE010D},  // [0.16873788667, 0.17180584824]
+    {-20, -3456, 12982801, 0x2BC42889},  // [0.17180584824, 0.17487380982]
+    {-21, -3516, 12975829, 0x2C8A3506},  // [0.17487380982, 0.17794177139]
+    {-20, -3578, 12968734, 0x2D50260A},  // [0.17794177139, 0.18100973297]
+    {-21, -3638, 12961518, 0x2E15FB1A},  // [0.18100973297, 0.18407769455]
+    {-20, -3700, 12954179, 0x2EDBB3BD},  // [0.18407769455, 0.18714565612]
+    {-19, -3763, 12946719, 0x2FA14F78},  // [0.18714565612, 0.19021361770]
+    {-22, -3819, 12939136, 0x3066CDD1},  // [0.19021361770, 0.19328157927]
+    {-20, -3883, 12931432, 0x312C2E50},  // [0.19328157927, 0.19634954085]
+    {-19, -3945, 12923606, 0x31F17079},  // [0.19634954085, 0.19941750243]
+    {-21, -4003, 12915659, 0x32B693D3},  // [0.19941750243, 0.20248546400]
+    {-19, -4067, 12907590, 0x337B97E6},  // [0.20248546400, 0.20555342558]
+    {-20, -4126, 12899399, 0x34407C36},  // [0.20555342558, 0.20862138715]
+    {-21, -4185, 12891087, 0x3505404B},  // [0.20862138715, 0.21168934873]
+    {-19, -4249, 12882654, 0x35C9E3AC},  // [0.21168934873, 0.21475731030]
+    {-22, -4305, 12874099, 0x368E65DE},  // [0.21475731030, 0.21782527188]
+    {-20, -4368, 12865423, 0x3752C66A},  // [0.21782527188, 0.22089323346]
+    {-20, -4429, 12856627, 0x381704D5},  // [0.22089323346, 0.22396119503]
+    {-19, -4491, 12847709, 0x38DB20A7},  // [0.22396119503, 0.22702915661]
+    {-20, -4550, 12838670, 0x399F1966},  // [0.22702915661, 0.23009711818]
+    {-22, -4607, 12829510, 0x3A62EE9A},  // [0.23009711818, 0.23316507976]
+    {-19, -4672, 12820230, 0x3B269FCB},  // [0.23316507976, 0.23623304133]
+    {-20, -4731, 12810829, 0x3BEA2C7E},  // [0.23623304133, 0.23930100291]
+    {-20, -4791, 12801307, 0x3CAD943C},  // [0.23930100291, 0.24236896449]
+    {-20, -4851, 12791665, 0x3D70D68C},  // [0.24236896449, 0.24543692606]
+    {-19, -4913, 12781903, 0x3E33F2F6},  // [0.24543692606, 0.24850488764]
+    {-21, -4970, 12772020, 0x3EF6E901},  // [0.24850488764, 0.25157284921]
+    {-19, -5033, 12762017, 0x3FB9B836},  // [0.25157284921, 0.25464081079]
+    {-20, -5092, 12751894, 0x407C601B},  // [0.25464081079, 0.25770877236]
+    {-21, -5150, 12741650, 0x413EE039},  // [0.25770877236, 0.26077673394]
+    {-19, -5213, 12731287, 0x42013818},  // [0.26077673394, 0.26384469552]
+    {-20, -5271, 12720804, 0x42C3673F},  // [0.26384469552, 0.26691265709]
+    {-21, -5330, 12710202, 0x43856D38},  // [0.26691265709, 0.26998061867]
+    {-20, -5391, 12699479, 0x4447498B},  // [0.26998061867, 0.27304858024]
+    {-21, -5449, 12688637, 0x4508FBBF},  // [0.27304858024, 0.27611654182]
+    {-20, -5510, 12677676, 0x45CA835E},  // [0.27611654182, 0.27918450340]
+    {-18, -5573, 12666596, 0x468BDFF0},  // [0.27918450340, 0.28225246497]
+    {-19, -5631, 12655396, 0x474D10FD},  // [0.28225246497, 0.28532042655]
+    {-20, -5689, 12644077, 0x480E160F},  // [0.28532042655, 0.28838838812]
+    {-19, -5750, 12632639, 0x48CEEEAF},  // [0.28838838812, 0.29145634970]
+    {-20, -5808, 12621082, 0x498F9A65},  // [0.29145634970, 0.29452431127]
+    {-20, -5867, 12609406, 0x4A5018BB},  // [0.29452431127, 0.29759227285]
+    {-21, -5925, 12597612, 0x4B10693A},  // [0.29759227285, 0.30066023443]
+    {-19, -5987, 12585699, 0x4BD08B6C},  // [0.30066023443, 0.30372819600]
+    {-20, -6045, 12573668, 0x4C907ED9},  // [0.30372819600, 0.30679615758]
+    {-18, -6107, 12561518, 0x4D50430C},  // [0.30679615758, 0.30986411915]
+    {-20, -6163, 12549250, 0x4E0FD78D},  // [0.30986411915, 0.31293208073]
+    {-20, -6222, 12536864, 0x4ECF3BE8},  // [0.31293208073, 0.31600004230]
+    {-18, -6284, 12524360, 0x4F8E6FA6},  // [0.31600004230, 0.31906800388]
+    {-20, -6340, 12511738, 0x504D7250},  // [0.31906800388, 0.32213596546]
+    {-19, -6400, 12498998, 0x510C4372},  // [0.32213596546, 0.32520392703]
+    {-19, -6459, 12486141, 0x51CAE295},  // [0.32520392703, 0.32827188861]
+    {-20, -6516, 12473166, 0x52894F44},  // [0.32827188861, 0.33133985018]
+    {-18, -6578, 12460074, 0x5347890A},  // [0.33133985018, 0.33440781176]
+    {-21, -6632, 12446864, 0x54058F70},  // [0.33440781176, 0.33747577333]
+    {-20, -6692, 12433537, 0x54C36203},  // [0.33747577333, 0.34054373491]
+    {-20, -6750, 12420093, 0x5581004C},  // [0.34054373491, 0.34361169649]
+    {-18, -6812, 12406533, 0x563E69D7},  // [0.34361169649, 0.34667965806]
+    {-20, -6867, 12392855, 0x56FB9E2E},  // [0.34667965806, 0.34974761964]
+    {-20, -6925, 12379061, 0x57B89CDE},  // [0.34974761964, 0.35281558121]
+    {-19, -6985, 12365151, 0x58756572},  // [0.35281558121, 0.35588354279]
+    {-20, -7042, 12351124, 0x5931F775},  // [0.35588354279, 0.35895150437]
+    {-19, -7101, 12336980, 0x59EE5273},  // [0.35895150437, 0.36201946594]
+    {-19, -7159, 12322721, 0x5AAA75F7},  // [0.36201946594, 0.36508742752]
+    {-19, -7217, 12308346, 0x5B66618E},  // [0.36508742752, 0.36815538909]
+    {-19, -7275, 12293855, 0x5C2214C4},  // [0.36815538909, 0.37122335067]
+    {-19, -7333, 12279248, 0x5CDD8F25},  // [0.37122335067, 0.37429131224]
+    {-18, -7392, 12264525, 0x5D98D03D},  // [0.37429131224, 0.37735927382]
+    {-19, -7448, 12249687, 0x5E53D798},  // [0.37735927382, 0.38042723540]
+    {-20, -7504, 12234734, 0x5F0EA4C4},  // [0.38042723540, 0.38349519697]
+    {-18, -7565, 12219666, 0x5FC9374E},  // [0.38349519697, 0.38656315855]
+    {-20, -7619, 12204482, 0x60838EC1},  // [0.38656315855, 0.38963112012]
+    {-19, -7678, 12189184, 0x613DAAAC},  // [0.38963112012, 0.39269908170]
+    {-18, -7737, 12173771, 0x61F78A9B},  // [0.39269908170, 0.39576704327]
+    {-20, -7791, 12158243, 0x62B12E1B},  // [0.39576704327, 0.39883500485]
+    {-20, -7848, 12142601, 0x636A94BB},  // [0.39883500485, 0.40190296643]
+    {-19, -7907, 12126845, 0x6423BE08},  // [0.40190296643, 0.40497092800]
+    {-20, -7962, 12110974, 0x64DCA98F},  // [0.40497092800, 0.40803888958]
+    {-18, -8022, 12094990, 0x659556DF},  // [0.40803888958, 0.41110685115]
+    {-18, -8079, 12078892, 0x664DC585},  // [0.41110685115, 0.41417481273]
+    {-20, -8133, 12062680, 0x6705F510},  // [0.41417481273, 0.41724277430]
+    {-19, -8191, 12046354, 0x67BDE50F},  // [0.41724277430, 0.42031073588]
+    {-18, -8249, 12029915, 0x6875950F},  // [0.42031073588, 0.42337869746]
+    {-19, -8304, 12013363, 0x692D049F},  // [0.42337869746, 0.42644665903]
+    {-20, -8359, 11996698, 0x69E4334F},  // [0.42644665903, 0.42951462061]
+    {-17, -8420, 11979920, 0x6A9B20AE},  // [0.42951462061, 0.43258258218]
+    {-20, -8472, 11963029, 0x6B51CC49},  // [0.43258258218, 0.43565054376]
+    {-20, -8528, 11946025, 0x6C0835B2},  // [0.43565054376, 0.43871850534]
+    {-20, -8584, 11928909, 0x6CBE5C77},  // [0.43871850534, 0.44178646691]
+    {-18, -8643, 11911681, 0x6D744028},  // [0.44178646691, 0.44485442849]
+    {-18, -8699, 11894341, 0x6E29E054},  // [0.44485442849, 0.44792239006]
+    {-18, -8755, 11876889, 0x6EDF3C8C},  // [0.44792239006, 0.45099035164]
+    {-18, -8811, 11859325, 0x6F945460},  // [0.45099035164, 0.45405831321]
+    {-19, -8865, 11841649, 0x70492760},  // [0.45405831321, 0.45712627479]
+    {-17, -8924, 11823862, 0x70FDB51D},  // [0.45712627479, 0.46019423637]
+    {-19, -8976, 11805963, 0x71B1FD26},  // [0.46019423637, 0.46326219794]
+    {-19, -9032, 11787954, 0x7265FF0E},  // [0.46326219794, 0.46633015952]
+    {-19, -9087, 11769833, 0x7319BA65},  // [0.46633015952, 0.46939812109]
+    {-18, -9144, 11751602, 0x73CD2EBC},  // [0.46939812109, 0.47246608267]
+    {-18, -9199, 11733260, 0x74805BA4},  // [0.47246608267, 0.47553404424]
+    {-17, -9256, 11714808, 0x753340AF},  // [0.47553404424, 0.47860200582]
+    {-19, -9308, 11696245, 0x75E5DD6E},  // [0.47860200582, 0.48166996740]
+    {-18, -9364, 11677572, 0x76983174},  // [0.48166996740, 0.48473792897]
+    {-19, -9418, 11658790, 0x774A3C52},  // [0.48473792897, 0.48780589055]
+    {-18, -9474, 11639897, 0x77FBFD9B},  // [0.48780589055, 0.49087385212]
+    {-19, -9527, 11620895, 0x78AD74E0},  // [0.49087385212, 0.49394181370]
+    {-18, -9583, 11601784, 0x795EA1B5},  // [0.49394181370, 0.49700977527]
+    {-18, -9638, 11582564, 0x7A0F83AC},  // [0.49700977527, 0.50007773685]
+    {-18, -9692, 11563234, 0x7AC01A58},  // [0.50007773685, 0.50314569843]
+    {-17, -9748, 11543796, 0x7B70654C},  // [0.50314569843, 0.50621366000]
+    {-18, -9801, 11524249, 0x7C20641B},  // [0.50621366000, 0.50928162158]
+    {-18, -9855, 11504593, 0x7CD01659},  // [0.50928162158, 0.51234958315]
+    {-19, -9907, 11484829, 0x7D7F7B99},  // [0.51234958315, 0.51541754473]
+    {-18, -9963, 11464958, 0x7E2E9370},  // [0.51541754473, 0.51848550631]
+    {-18, -10017, 11444978, 0x7EDD5D71}, // [0.51848550631, 0.52155346788]
+    {-17, -10072, 11424890, 0x7F8BD930}, // [0.52155346788, 0.52462142946]
+    {-18, -10124, 11404695, 0x803A0641}, // [0.52462142946, 0.52768939103]
+    {-18, -10178, 11384393, 0x80E7E43A}, // [0.52768939103, 0.53075735261]
+    {-18, -10231, 11363983, 0x819572AF}, // [0.53075735261, 0.53382531418]
+    {-19, -10283, 11343467, 0x8242B135}, // [0.53382531418, 0.53689327576]
+    {-16, -10341, 11322844, 0x82EF9F62}, // [0.53689327576, 0.53996123734]
+    {-18, -10391, 11302114, 0x839C3CC9}, // [0.53996123734, 0.54302919891]
+    {-17, -10446, 11281278, 0x84488902}, // [0.54302919891, 0.54609716049]
+    {-16, -10500, 11260335, 0x84F483A1}, // [0.54609716049, 0.54916512206]
+    {-18, -10550, 11239287, 0x85A02C3C}, // [0.54916512206, 0.55223308364]
+    {-16, -10606, 11218133, 0x864B826B}, // [0.55223308364, 0.55530104521]
+    {-17, -10657, 11196873, 0x86F685C2}, // [0.55530104521, 0.55836900679]
+    {-19, -10707, 11175508, 0x87A135D9}, // [0.55836900679, 0.56143696837]
+    {-17, -10762, 11154037, 0x884B9247}, // [0.56143696837, 0.56450492994]
+    {-16, -10816, 11132462, 0x88F59AA1}, // [0.56450492994, 0.56757289152]
+    {-19, -10864, 11110782, 0x899F4E7F}, // [0.56757289152, 0.57064085309]
+    {-17, -10919, 11088997, 0x8A48AD7A}, // [0.57064085309, 0.57370881467]
+    {-17, -10971, 11067108, 0x8AF1B727}, // [0.57370881467, 0.57677677625]
+    {-17, -11023, 11045115, 0x8B9A6B1F}, // [0.57677677625, 0.57984473782]
+    {-17, -11075, 11023018, 0x8C42C8FA}, // [0.57984473782, 0.58291269940]
+    {-17, -11127, 11000817, 0x8CEAD050}, // [0.58291269940, 0.58598066097]
+    {-16, -11180, 10978512, 0x8D9280B9}, // [0.58598066097, 0.58904862255]
+    {-19, -11227, 10956104, 0x8E39D9CD}, // [0.58904862255, 0.59211658412]
+    {-17, -11281, 10933593, 0x8EE0DB27}, // [0.59211658412, 0.59518454570]
+    {-17, -11333, 10910980, 0x8F87845E}, // [0.59518454570, 0.59825250728]
+    {-17, -11384, 10888263, 0x902DD50C}, // [0.59825250728, 0.60132046885]
+    {-15, -11438, 10865444, 0x90D3CCCA}, // [0.60132046885, 0.60438843043]
+    {-18, -11485, 10842523, 0x91796B31}, // [0.60438843043, 0.60745639200]
+    {-17, -11537, 10819499, 0x921EAFDD}, // [0.60745639200, 0.61052435358]
+    {-17, -11588, 10796374, 0x92C39A66}, // [0.61052435358, 0.61359231515]
+    {-16, -11640, 10773147, 0x93682A67}, // [0.61359231515, 0.61666027673]
+    {-17, -11689, 10749819, 0x940C5F7A}, // [0.61666027673, 0.61972823831]
+    {-17, -11740, 10726390, 0x94B0393B}, // [0.61972823831, 0.62279619988]
+    {-17, -11790, 10702859, 0x9553B744}, // [0.62279619988, 0.62586416146]
+    {-16, -11842, 10679228, 0x95F6D930}, // [0.62586416146, 0.62893212303]
+    {-17, -11890, 10655496, 0x96999E9A}, // [0.62893212303, 0.63200008461]
+    {-16, -11942, 10631665, 0x973C071F}, // [0.63200008461, 0.63506804618]
+    {-16, -11992, 10607733, 0x97DE125A}, // [0.63506804618, 0.63813600776]
+    {-16, -12042, 10583701, 0x987FBFE7}, // [0.63813600776, 0.64120396934]
+    {-17, -12090, 10559569, 0x99210F62}, // [0.64120396934, 0.64427193091]
+    {-18, -12138, 10535338, 0x99C20068}, // [0.64427193091, 0.64733989249]
+    {-17, -12189, 10511008, 0x9A629296}, // [0.64733989249, 0.65040785406]
+    {-17, -12238, 10486579, 0x9B02C588}, // [0.65040785406, 0.65347581564]
+    {-16, -12289, 10462052, 0x9BA298DC}, // [0.65347581564, 0.65654377722]
+    {-17, -12337, 10437426, 0x9C420C2F}, // [0.65654377722, 0.65961173879]
+    {-16, -12387, 10412701, 0x9CE11F1F}, // [0.65961173879, 0.66267970037]
+    {-16, -12436, 10387879, 0x9D7FD149}, // [0.66267970037, 0.66574766194]
+    {-16, -12485, 10362959, 0x9E1E224C}, // [0.66574766194, 0.66881562352]
+    {-17, -12532, 10337941, 0x9EBC11C6}, // [0.66881562352, 0.67188358509]
+    {-16, -12582, 10312826, 0x9F599F56}, // [0.67188358509, 0.67495154667]
+    {-17, -12629, 10287614, 0x9FF6CA9A}, // [0.67495154667, 0.67801950825]
+    {-15, -12680, 10262305, 0xA0939332}, // [0.67801950825, 0.68108746982]
+    {-16, -12727, 10236900, 0xA12FF8BC}, // [0.68108746982, 0.68415543140]
+    {-16, -12775, 10211398, 0xA1CBFAD9}, // [0.68415543140, 0.68722339297]
+    {-16, -12823, 10185800, 0xA2679928}, // [0.68722339297, 0.69029135455]
+    {-17, -12869, 10160106, 0xA302D349}, // [0.69029135455, 0.69335931612]
+    {-15, -12920, 10134317, 0xA39DA8DD}, // [0.69335931612, 0.69642727770]
+    {-16, -12966, 10108432, 0xA4381983}, // [0.69642727770, 0.69949523928]
+    {-15, -13015, 10082452, 0xA4D224DD}, // [0.69949523928, 0.70256320085]
+    {-15, -13062, 10056377, 0xA56BCA8B}, // [0.70256320085, 0.70563116243]
+    {-16, -13108, 10030208, 0xA6050A2F}, // [0.70563116243, 0.70869912400]
+    {-15, -13157, 10003944, 0xA69DE36B}, // [0.70869912400, 0.71176708558]
+    {-16, -13202, 9977585, 0xA73655DF},  // [0.71176708558, 0.71483504715]
+    {-17, -13247, 9951133, 0xA7CE612E},  // [0.71483504715, 0.71790300873]
+    {-15, -13297, 9924588, 0xA86604FB},  // [0.71790300873, 0.72097097031]
+    {-15, -13344, 9897949, 0xA8FD40E7},  // [0.72097097031, 0.72403893188]
+    {-17, -13387, 9871216, 0xA9941495},  // [0.72403893188, 0.72710689346]
+    {-16, -13435, 9844391, 0xAA2A7FA9},  // [0.72710689346, 0.73017485503]
+    {-16, -13481, 9817473, 0xAAC081C5},  // [0.73017485503, 0.73324281661]
+    {-14, -13530, 9790463, 0xAB561A8D},  // [0.73324281661, 0.73631077819]
+    {-16, -13573, 9763361, 0xABEB49A4},  // [0.73631077819, 0.73937873976]
+    {-14, -13622, 9736167, 0xAC800EB0},  // [0.73937873976, 0.74244670134]
+    {-14, -13668, 9708881, 0xAD146953},  // [0.74244670134, 0.74551466291]
+    {-16, -13710, 9681503, 0xADA85932},  // [0.74551466291, 0.74858262449]
+    {-15, -13757, 9654035, 0xAE3BDDF3},  // [0.74858262449, 0.75165058606]
+    {-14, -13804, 9626476, 0xAECEF73A},  // [0.75165058606, 0.75471854764]
+    {-15, -13848, 9598826, 0xAF61A4AC},  // [0.75471854764, 0.75778650922]
+    {-16, -13891, 9571085, 0xAFF3E5EF},  // [0.75778650922, 0.76085447079]
+    {-14, -13939, 9543255, 0xB085BAA9},  // [0.76085447079, 0.76392243237]
+    {-16, -13981, 9515335, 0xB117227F},  // [0.76392243237, 0.76699039394]
+    {-15, -14027, 9487325, 0xB1A81D19},  // [0.76699039394, 0.77005835552]
+    {-16, -14070, 9459226, 0xB238AA1C},  // [0.77005835552, 0.77312631709]
+    {-15, -14116, 9431038, 0xB2C8C930},  // [0.77312631709, 0.77619427867]
+    {-15, -14160, 9402761, 0xB35879FB},  // [0.77619427867, 0.77926224025]
+    {-14, -14206, 9374396, 0xB3E7BC25},  // [0.77926224025, 0.78233020182]
+    {-15, -14248, 9345942, 0xB4768F55},  // [0.78233020182, 0.78539816340]
+    {-13, -14295, 9317401, 0xB504F334},  // [0.78539816340, 0.78846612497]
+    {-15, -14336, 9288772, 0xB592E769},  // [0.78846612497, 0.79153408655]
+    {-14, -14381, 9260055, 0xB6206B9E},  // [0.79153408655, 0.79460204812]
+    {-15, -14423, 9231251, 0xB6AD7F7A},  // [0.79460204812, 0.79767000970]
+    {-15, -14466, 9202360, 0xB73A22A7},  // [0.79767000970, 0.80073797128]
+    {-16, -14508, 9173383, 0xB7C654CE},  // [0.80073797128, 0.80380593285]
+    {-13, -14555, 9144319, 0xB8521599},  // [0.80380593285, 0.80687389443]
+    {-14, -14597, 9115170, 0xB8DD64B0},  // [0.80687389443, 0.80994185600]
+    {-15, -14638, 9085934, 0xB96841BF},  // [0.80994185600, 0.81300981758]
+    {-14, -14682, 9056613, 0xB9F2AC70},  // [0.81300981758, 0.81607777916]
+    {-15, -14723, 9027207, 0xBA7CA46D},  // [0.81607777916, 0.81914574073]
+    {-12, -14770, 8997716, 0xBB062962},  // [0.81914574073, 0.82221370231]
+    {-15, -14808, 8968140, 0xBB8F3AF8},  // [0.82221370231, 0.82528166388]
+    {-12, -14854, 8938479, 0xBC17D8DD},  // [0.82528166388, 0.82834962546]
+    {-15, -14892, 8908735, 0xBCA002BA},  // [0.82834962546, 0.83141758703]
+    {-14, -14935, 8878906, 0xBD27B83E},  // [0.83141758703, 0.83448554861]
+    {-15, -14975, 8848994, 0xBDAEF913},  // [0.83448554861, 0.83755351019]
+    {-14, -15018, 8818999, 0xBE35C4E7},  // [0.83755351019, 0.84062147176]
+    {-15, -15058, 8788921, 0xBEBC1B66},  // [0.84062147176, 0.84368943334]
+    {-13, -15102, 8758760, 0xBF41FC3E},  // [0.84368943334, 0.84675739491]
+    {-12, -15145, 8728517, 0xBFC7671B},  // [0.84675739491, 0.84982535649]
+    {-15, -15181, 8698191, 0xC04C5BAB},  // [0.84982535649, 0.85289331806]
+    {-13, -15225, 8667784, 0xC0D0D99E},  // [0.85289331806, 0.85596127964]
+    {-13, -15266, 8637295, 0xC154E0A0},  // [0.85596127964, 0.85902924122]
+    {-13, -15306, 8606724, 0xC1D87060},  // [0.85902924122, 0.86209720279]
+    {-14, -15345, 8576073, 0xC25B888D},  // [0.86209720279, 0.86516516437]
+    {-14, -15385, 8545341, 0xC2DE28D7},  // [0.86516516437, 0.86823312594]
+    {-13, -15427, 8514529, 0xC36050ED},  // [0.86823312594, 0.87130108752]
+    {-12, -15468, 8483636, 0xC3E2007E},  // [0.87130108752, 0.87436904909]
+    {-12, -15508, 8452664, 0xC463373A},  // [0.87436904909, 0.87743701067]
+    {-14, -15545, 8421612, 0xC4E3F4D2},  // [0.87743701067, 0.88050497225]
+    {-14, -15584, 8390480, 0xC56438F7},  // [0.88050497225, 0.88357293382]
+    {-13, -15625, 8359270, 0xC5E40359},  // [0.88357293382, 0.88664089540]
+    {-13, -15664, 8327981, 0xC66353A9},  // [0.88664089540, 0.88970885697]
+    {-12, -15705, 8296614, 0xC6E22999},  // [0.88970885697, 0.89277681855]
+    {-13, -15742, 8265168, 0xC76084DA},  // [0.89277681855, 0.89584478013]
+    {-15, -15778, 8233645, 0xC7DE651F},  // [0.89584478013, 0.89891274170]
+    {-13, -15819, 8202044, 0xC85BCA1B},  // [0.89891274170, 0.90198070328]
+    {-11, -15861, 8170367, 0xC8D8B37F},  // [0.90198070328, 0.90504866485]
+    {-14, -15895, 8138612, 0xC95520FE},  // [0.90504866485, 0.90811662643]
+    {-11, -15937, 8106780, 0xC9D1124D},  // [0.90811662643, 0.91118458800]
+    {-12, -15974, 8074873, 0xCA4C871D},  // [0.91118458800, 0.91425254958]
+    {-14, -16009, 8042889, 0xCAC77F24},  // [0.91425254958, 0.91732051116]
+    {-12, -16049, 8010829, 0xCB41FA16},  // [0.91732051116, 0.92038847273]
+    {-12, -16087, 7978695, 0xCBBBF7A6},  // [0.92038847273, 0.92345643431]
+    {-13, -16123, 7946485, 0xCC35778A},  // [0.92345643431, 0.92652439588]
+    {-11, -16163, 7914200, 0xCCAE7977},  // [0.92652439588, 0.92959235746]
+    {-14, -16196, 7881841, 0xCD26FD21},  // [0.92959235746, 0.93266031903]
+    {-13, -16234, 7849407, 0xCD9F0240},  // [0.93266031903, 0.93572828061]
+    {-11, -16274, 7816900, 0xCE168888},  // [0.93572828061, 0.93879624219]
+    {-14, -16306, 7784319, 0xCE8D8FAF},  // [0.93879624219, 0.94186420376]
+    {-11, -16347, 7751665, 0xCF04176E},  // [0.94186420376, 0.94493216534]
+    {-14, -16379, 7718938, 0xCF7A1F79},  // [0.94493216534, 0.94800012691]
+    {-12, -16418, 7686138, 0xCFEFA78A},  // [0.94800012691, 0.95106808849]
+    {-12, -16454, 7653266, 0xD064AF56},  // [0.95106808849, 0.95413605006]
+    {-12, -16490, 7620322, 0xD0D93696},  // [0.95413605006, 0.95720401164]
+    {-13, -16524, 7587306, 0xD14D3D02},  // [0.95720401164, 0.96027197322]
+    {-12, -16561, 7554219, 0xD1C0C253},  // [0.96027197322, 0.96333993479]
+    {-11, -16598, 7521061, 0xD233C641},  // [0.96333993479, 0.96640789637]
+    {-10, -16635, 7487832, 0xD2A64885},  // [0.96640789637, 0.96947585794]
+    {-12, -16667, 7454532, 0xD31848D8},  // [0.96947585794, 0.97254381952]
+    {-12, -16702, 7421162, 0xD389C6F5},  // [0.97254381952, 0.97561178110]
+    {-13, -16735, 7387722, 0xD3FAC295},  // [0.97561178110, 0.97867974267]
+    {-10, -16774, 7354213, 0xD46B3B73},  // [0.97867974267, 0.98174770425]
+    {-11, -16807, 7320635, 0xD4DB3148},  // [0.98174770425, 0.98481566582]
+    {-12, -16840, 7286988, 0xD54AA3D1},  // [0.98481566582, 0.98788362740]
+    {-11, -16876, 7253272, 0xD5B992C9},  // [0.98788362740, 0.99095158897]
+    {-12, -16908, 7219487, 0xD627FDEA},  // [0.99095158897, 0.99401955055]
+    {-11, -16943, 7185635, 0xD695E4F1},  // [0.99401955055, 0.99708751213]
+    {-11, -16977, 7151716, 0xD703479A},  // [0.99708751213, 1.00015547370]
+    {-10, -17012, 7117729, 0xD77025A2},  // [1.00015547370, 1.00322343528]
+    {-11, -17044, 7083675, 0xD7DC7EC5},  // [1.00322343528, 1.00629139685]
+    {-9, -17080, 7049554, 0xD84852C1},   // [1.00629139685, 1.00935935843]
+    {-11, -17110, 7015367, 0xD8B3A152},  // [1.00935935843, 1.01242732000]
+    {-11, -17143, 6981114, 0xD91E6A38},  // [1.01242732000, 1.01549528158]
+    {-10, -17177, 6946795, 0xD988AD30},  // [1.01549528158, 1.01856324316]
+    {-10, -17210, 6912411, 0xD9F269F8},  // [1.01856324316, 1.02163120473]
+    {-12, -17239, 6877961, 0xDA5BA04F},  // [1.02163120473, 1.02469916631]
+    {-10, -17274, 6843447, 0xDAC44FF5},  // [1.02469916631, 1.02776712788]
+    {-11, -17305, 6808869, 0xDB2C78A8},  // [1.02776712788, 1.03083508946]
+    {-10, -17338, 6774226, 0xDB941A29},  // [1.03083508946, 1.03390305103]
+    {-12, -17367, 6739520, 0xDBFB3437},  // [1.03390305103, 1.03697101261]
+    {-11, -17400, 6704750, 0xDC61C694},  // [1.03697101261, 1.04003897419]
+    {-11, -17431, 6669917, 0xDCC7D0FF},  // [1.04003897419, 1.04310693576]
+    {-10, -17464, 6635022, 0xDD2D533A},  // [1.04310693576, 1.04617489734]
+    {-10, -17495, 6600064, 0xDD924D06},  // [1.04617489734, 1.04924285891]
+    {-8, -17529, 6565044, 0xDDF6BE25},   // [1.04924285891, 1.05231082049]
+    {-10, -17557, 6529962, 0xDE5AA658},  // [1.05231082049, 1.05537878207]
+    {-12, -17584, 6494818, 0xDEBE0563},  // [1.05537878207, 1.05844674364]
+    {-10, -17618, 6459614, 0xDF20DB09},  // [1.05844674364, 1.06151470522]
+    {-9, -17649, 6424348, 0xDF83270B},   // [1.06151470522, 1.06458266679]
+    {-10, -17678, 6389023, 0xDFE4E92D},  // [1.06458266679, 1.06765062837]
+    {-8, -17711, 6353637, 0xE0462134},   // [1.06765062837, 1.07071858994]
+    {-9, -17739, 6318191, 0xE0A6CEE2},   // [1.07071858994, 1.07378655152]
+    {-11, -17766, 6282686, 0xE106F1FD},  // [1.07378655152, 1.07685451310]
+    {-9, -17798, 6247121, 0xE1668A4A},   // [1.07685451310, 1.07992247467]
+    {-10, -17826, 6211498, 0xE1C5978C},  // [1.07992247467, 1.08299043625]
+    {-9, -17856, 6175816, 0xE224198A},   // [1.08299043625, 1.08605839782]
+    {-10, -17884, 6140077, 0xE2821009},  // [1.08605839782, 1.08912635940]
+    {-9, -17914, 6104279, 0xE2DF7AD0},   // [1.08912635940, 1.09219432097]
+    {-10, -17941, 6068424, 0xE33C59A4},  // [1.09219432097, 1.09526228255]
+    {-9, -17971, 6032512, 0xE398AC4D},   // [1.09526228255, 1.09833024413]
+    {-9, -17999, 5996543, 0xE3F47291},   // [1.09833024413, 1.10139820570]
+    {-10, -18026, 5960518, 0xE44FAC38},  // [1.10139820570, 1.10446616728]
+    {-9, -18055, 5924436, 0xE4AA590A},   // [1.10446616728, 1.10753412885]
+    {-9, -18083, 5888299, 0xE50478CE},   // [1.10753412885, 1.11060209043]
+    {-9, -18110, 5852106, 0xE55E0B4D},   // [1.11060209043, 1.11367005200]
+    {-9, -18138, 5815859, 0xE5B71050},   // [1.11367005200, 1.11673801358]
+    {-9, -18165, 5779556, 0xE60F87A0},   // [1.11673801358, 1.11980597516]
+    {-9, -18192, 5743199, 0xE6677106},   // [1.11980597516, 1.12287393673]
+    {-10, -18217, 5706788, 0xE6BECC4C},  // [1.12287393673, 1.12594189831]
+    {-8, -18247, 5670324, 0xE715993D},   // [1.12594189831, 1.12900985988]
+    {-7, -18275, 5633806, 0xE76BD7A2},   // [1.12900985988, 1.13207782146]
+    {-10, -18297, 5597235, 0xE7C18746},  // [1.13207782146, 1.13514578304]
+    {-8, -18326, 5560611, 0xE816A7F6},   // [1.13514578304, 1.13821374461]
+    {-8, -18352, 5523935, 0xE86B397B},   // [1.13821374461, 1.14128170619]
+    {-8, -18378, 5487207, 0xE8BF3BA2},   // [1.14128170619, 1.14434966776]
+    {-9, -18402, 5450427, 0xE912AE37},   // [1.14434966776, 1.14741762934]
+    {-8, -18429, 5413596, 0xE9659107},   // [1.14741762934, 1.15048559091]
+    {-8, -18454, 5376714, 0xE9B7E3DE},   // [1.15048559091, 1.15355355249]
+    {-9, -18478, 5339782, 0xEA09A68A},   // [1.15355355249, 1.15662151407]
+    {-7, -18506, 5302799, 0xEA5AD8D9},   // [1.15662151407, 1.15968947564]
+    {-8, -18529, 5265766, 0xEAAB7A97},   // [1.15968947564, 1.16275743722]
+    {-8, -18554, 5228684, 0xEAFB8B94},   // [1.16275743722, 1.16582539879]
+    {-8, -18578, 5191552, 0xEB4B0B9E},   // [1.16582539879, 1.16889336037]
+    {-9, -18601, 5154372, 0xEB99FA84},   // [1.16889336037, 1.17196132194]
+    {-7, -18628, 5117143, 0xEBE85816},   // [1.17196132194, 1.17502928352]
+    {-9, -18649, 5079866, 0xEC362422},   // [1.17502928352, 1.17809724510]
+    {-6, -18677, 5042541, 0xEC835E7A},   // [1.17809724510, 1.18116520667]
+    {-8, -18698, 5005169, 0xECD006EC},   // [1.18116520667, 1.18423316825]
+    {-8, -18721, 4967749, 0xED1C1D4B},   // [1.18423316825, 1.18730112982]
+    {-9, -18743, 4930283, 0xED67A167},   // [1.18730112982, 1.19036909140]
+    {-8, -18767, 4892770, 0xEDB29312},   // [1.19036909140, 1.19343705298]
+    {-7, -18792, 4855212, 0xEDFCF21D},   // [1.19343705298, 1.19650501455]
+    {-7, -18814, 4817607, 0xEE46BE5A},   // [1.19650501455, 1.19957297613]
+    {-7, -18837, 4779958, 0xEE8FF79C},   // [1.19957297613, 1.20264093770]
+    {-7, -18859, 4742263, 0xEED89DB6},   // [1.20264093770, 1.20570889928]
+    {-8, -18880, 4704524, 0xEF20B07B},   // [1.20570889928, 1.20877686085]
+    {-7, -18903, 4666740, 0xEF682FBF},   // [1.20877686085, 1.21184482243]
+    {-6, -18927, 4628913, 0xEFAF1B55},   // [1.21184482243, 1.21491278401]
+    {-8, -18945, 4591041, 0xEFF57311},   // [1.21491278401, 1.21798074558]
+    {-7, -18968, 4553127, 0xF03B36C9},   // [1.21798074558, 1.22104870716]
+    {-8, -18988, 4515170, 0xF0806651},   // [1.22104870716, 1.22411666873]
+    {-8, -19009, 4477170, 0xF0C5017F},   // [1.22411666873, 1.22718463031]
+    {-7, -19031, 4439128, 0xF1090828},   // [1.22718463031, 1.23025259188]
+    {-7, -19052, 4401045, 0xF14C7A22},   // [1.23025259188, 1.23332055346]
+    {-6, -19074, 4362920, 0xF18F5744},   // [1.23332055346, 1.23638851504]
+    {-5, -19096, 4324754, 0xF1D19F64},   // [1.23638851504, 1.23945647661]
+    {-7, -19113, 4286547, 0xF2135259},   // [1.23945647661, 1.24252443819]
+    {-7, -19133, 4248300, 0xF2546FFC},   // [1.24252443819, 1.24559239976]
+    {-5, -19156, 4210013, 0xF294F824},   // [1.24559239976, 1.24866036134]
+    {-6, -19174, 4171686, 0xF2D4EAA8},   // [1.24866036134, 1.25172832291]
+    {-7, -19192, 4133320, 0xF3144762},   // [1.25172832291, 1.25479628449]
+    {-6, -19213, 4094915, 0xF3530E2B},   // [1.25479628449, 1.25786424607]
+    {-7, -19230, 4056471, 0xF3913EDB},   // [1.25786424607, 1.26093220764]
+    {-6, -19251, 4017990, 0xF3CED94D},   // [1.26093220764, 1.26400016922]
+    {-7, -19268, 3979470, 0xF40BDD5A},   // [1.26400016922, 1.26706813079]
+    {-8, -19285, 3940913, 0xF4484ADD},   // [1.26706813079, 1.27013609237]
+    {-6, -19306, 3902319, 0xF48421B1},   // [1.27013609237, 1.27320405395]
+    {-5, -19326, 3863689, 0xF4BF61B0},   // [1.27320405395, 1.27627201552]
+    {-6, -19343, 3825022, 0xF4FA0AB6},   // [1.27627201552, 1.27933997710]
+    {-6, -19360, 3786318, 0xF5341C9F},   // [1.27933997710, 1.28240793867]
+    {-6, -19378, 3747580, 0xF56D9747},   // [1.28240793867, 1.28547590025]
+    {-5, -19397, 3708806, 0xF5A67A8B},   // [1.28547590025, 1.28854386182]
+    {-6, -19413, 3669997, 0xF5DEC647},   // [1.28854386182, 1.29161182340]
+    {-5, -19431, 3631153, 0xF6167A59},   // [1.29161182340, 1.29467978498]
+    {-6, -19447, 3592276, 0xF64D969E},   // [1.29467978498, 1.29774774655]
+    {-5, -19465, 3553364, 0xF6841AF5},   // [1.29774774655, 1.30081570813]
+    {-6, -19480, 3514419, 0xF6BA073B},   // [1.30081570813, 1.30388366970]
+    {-6, -19496, 3475441, 0xF6EF5B50},   // [1.30388366970, 1.30695163128]
+    {-6, -19513, 3436431, 0xF7241713},   // [1.30695163128, 1.31001959285]
+    {-5, -19530, 3397387, 0xF7583A63},   // [1.31001959285, 1.31308755443]
+    {-6, -19544, 3358312, 0xF78BC51F},   // [1.31308755443, 1.31615551601]
+    {-4, -19563, 3319206, 0xF7BEB729},   // [1.31615551601, 1.31922347758]
+    {-5, -19577, 3280068, 0xF7F11060},   // [1.31922347758, 1.32229143916]
+    {-7, -19589, 3240899, 0xF822D0A6},   // [1.32229143916, 1.32535940073]
+    {-3, -19610, 3201700, 0xF853F7DD},   // [1.32535940073, 1.32842736231]
+    {-6, -19621, 3162471, 0xF88485E4},   // [1.32842736231, 1.33149532388]
+    {-4, -19638, 3123211, 0xF8B47AA0},   // [1.33149532388, 1.33456328546]
+    {-6, -19650, 3083923, 0xF8E3D5F1},   // [1.33456328546, 1.33763124704]
+    {-4, -19667, 3044605, 0xF91297BC},   // [1.33763124704, 1.34069920861]
+    {-5, -19680, 3005259, 0xF940BFE2},   // [1.34069920861, 1.34376717019]
+    {-6, -19692, 2965884, 0xF96E4E48},   // [1.34376717019, 1.34683513176]
+    {-4, -19709, 2926482, 0xF99B42D2},   // [1.34683513176, 1.34990309334]
+    {-5, -19721, 2887052, 0xF9C79D63},   // [1.34990309334, 1.35297105492]
+    {-4, -19736, 2847595, 0xF9F35DE1},   // [1.35297105492, 1.35603901649]
+    {-4, -19749, 2808111, 0xFA1E8430},   // [1.35603901649, 1.35910697807]
+    {-3, -19764, 2768601, 0xFA491036},   // [1.35910697807, 1.36217493964]
+    {-4, -19775, 2729064, 0xFA7301D8},   // [1.36217493964, 1.36524290122]
+    {-6, -19785, 2689502, 0xFA9C58FD},   // [1.36524290122, 1.36831086279]
+    {-4, -19800, 2649914, 0xFAC5158C},   // [1.36831086279, 1.37137882437]
+    {-5, -19811, 2610302, 0xFAED376A},   // [1.37137882437, 1.37444678595]
+    {-3, -19826, 2570665, 0xFB14BE80},   // [1.37444678595, 1.37751474752]
+    {-5, -19835, 2531004, 0xFB3BAAB4},   // [1.37751474752, 1.38058270910]
+    {-2, -19851, 2491319, 0xFB61FBF0},   // [1.38058270910, 1.38365067067]
+    {-4, -19860, 2451611, 0xFB87B21A},   // [1.38365067067, 1.38671863225]
+    {-4, -19871, 2411879, 0xFBACCD1D},   // [1.38671863225, 1.38978659382]
+    {-3, -19884, 2372125, 0xFBD14CE1},   // [1.38978659382, 1.39285455540]
+    {-4, -19893, 2332348, 0xFBF5314F},   // [1.39285455540, 1.39592251698]
+    {-4, -19904, 2292550, 0xFC187A52},   // [1.39592251698, 1.39899047855]
+    {-2, -19918, 2252730, 0xFC3B27D4},   // [1.39899047855, 1.40205844013]
+    {-4, -19925, 2212888, 0xFC5D39BE},   // [1.40205844013, 1.40512640170]
+    {-4, -19935, 2173026, 0xFC7EAFFD},   // [1.40512640170, 1.40819436328]
+    {-3, -19947, 2133144, 0xFC9F8A7C},   // [1.40819436328, 1.41126232485]
+    {-4, -19955, 2093241, 0xFCBFC926},   // [1.41126232485, 1.41433028643]
+    {-2, -19968, 2053319, 0xFCDF6BE8},   // [1.41433028643, 1.41739824801]
+    {-4, -19974, 2013377, 0xFCFE72AD},   // [1.41739824801, 1.42046620958]
+    {-2, -19987, 1973417, 0xFD1CDD64},   // [1.42046620958, 1.42353417116]
+    {-3, -19994, 1933437, 0xFD3AABF8},   // [1.42353417116, 1.42660213273]
+    {-3, -20003, 1893440, 0xFD57DE58},   // [1.42660213273, 1.42967009431]
+    {-3, -20012, 1853425, 0xFD747472},   // [1.42967009431, 1.43273805589]
+    {-4, -20019, 1813392, 0xFD906E34},   // [1.43273805589, 1.43580601746]
+    {-2, -20030, 1773342, 0xFDABCB8D},   // [1.43580601746, 1.43887397904]
+    {-3, -20037, 1733276, 0xFDC68C6B},   // [1.43887397904, 1.44194194061]
+    {-2, -20046, 1693193, 0xFDE0B0BF},   // [1.44194194061, 1.44500990219]
+    {-3, -20053, 1653095, 0xFDFA3878},   // [1.44500990219, 1.44807786376]
+    {-3, -20060, 1612980, 0xFE132387},   // [1.44807786376, 1.45114582534]
+    {-2, -20069, 1572851, 0xFE2B71DC},   // [1.45114582534, 1.45421378692]
+    {-3, -20075, 1532707, 0xFE432368},   // [1.45421378692, 1.45728174849]
+    {-1, -20085, 1492548, 0xFE5A381D},   // [1.45728174849, 1.46034971007]
+    {-4, -20087, 1452375, 0xFE70AFEB},   // [1.46034971007, 1.46341767164]
+    {-2, -20097, 1412189, 0xFE868AC7},   // [1.46341767164, 1.46648563322]
+    {-2, -20103, 1371989, 0xFE9BC8A1},   // [1.46648563322, 1.46955359479]
+    {-3, -20108, 1331777, 0xFEB0696D},   // [1.46955359479, 1.47262155637]
+    {-2, -20116, 1291552, 0xFEC46D1F},   // [1.47262155637, 1.47568951795]
+    {-3, -20120, 1251314, 0xFED7D3A9},   // [1.47568951795, 1.47875747952]
+    {-2, -20127, 1211065, 0xFEEA9D00},   // [1.47875747952, 1.48182544110]
+    {-1, -20134, 1170805, 0xFEFCC918},   // [1.48182544110, 1.48489340267]
+    {-1, -20140, 1130534, 0xFF0E57E6},   // [1.48489340267, 1.48796136425]
+    {-2, -20143, 1090251, 0xFF1F495F},   // [1.48796136425, 1.49102932582]
+    {-2, -20148, 1049959, 0xFF2F9D79},   // [1.49102932582, 1.49409728740]
+    {-2, -20153, 1009657, 0xFF3F542A},   // [1.49409728740, 1.49716524898]
+    {-3, -20156, 969345, 0xFF4E6D68},    // [1.49716524898, 1.50023321055]
+    {-1, -20163, 929024, 0xFF5CE92A},    // [1.50023321055, 1.50330117213]
+    {0, -20169, 888695, 0xFF6AC766},     // [1.50330117213, 1.50636913370]
+    {0, -20173, 848357, 0xFF780814},     // [1.50636913370, 1.50943709528]
+    {-2, -20174, 808011, 0xFF84AB2C},    // [1.50943709528, 1.51250505686]
+    {-1, -20179, 767657, 0xFF90B0A7},    // [1.51250505686, 1.51557301843]
+    {-3, -20179, 727296, 0xFF9C187C},    // [1.51557301843, 1.51864098001]
+    {0, -20187, 686929, 0xFFA6E2A6},     // [1.51864098001, 1.52170894158]
+    {-1, -20189, 646555, 0xFFB10F1C},    // [1.52170894158, 1.52477690316]
+    {-1, -20191, 606174, 0xFFBA9DD9},    // [1.52477690316, 1.52784486473]
+    {0, -20196, 565789, 0xFFC38ED7},     // [1.52784486473, 1.53091282631]
+    {-2, -20195, 525397, 0xFFCBE210},    // [1.53091282631, 1.53398078789]
+    {-1, -20199, 485001, 0xFFD39780},    // [1.53398078789, 1.53704874946]
+    {-2, -20199, 444600, 0xFFDAAF21},    // [1.53704874946, 1.54011671104]
+    {1, -20206, 404196, 0xFFE128F0},     // [1.54011671104, 1.54318467261]
+    {0, -20206, 363787, 0xFFE704E7},     // [1.54318467261, 1.54625263419]
+    {-1, -20206, 323375, 0xFFEC4304},    // [1.54625263419, 1.54932059576]
+    {2, -20212, 282960, 0xFFF0E344},     // [1.54932059576, 1.55238855734]
+    {0, -20210, 242542, 0xFFF4E5A2},     // [1.55238855734, 1.55545651892]
+    {0, -20211, 202122, 0xFFF84A1E},     // [1.55545651892, 1.55852448049]
+    {0, -20212, 161700, 0xFFFB10B5},     // [1.55852448049, 1.56159244207]
+    {1, -20214, 121276, 0xFFFD3965},     // [1.56159244207, 1.56466040364]
+    {-1, -20211, 80851, 0xFFFEC42C},     // [1.56466040364, 1.56772836522]
+    {0, -20213, 40426, 0xFFFFB10B},      // [1.56772836522, 1.57079632679]
+}};
+
+// Coarse table of LookupSinBipartite: sin(h) at h = i*pi/128 on [0,pi/2];
+// cos(h) is the mirrored entry sin(pi/2 - h)
+#if defined(__GNUC__) && defined(__ELF__)
+[[gnu::section(".rodata.math_trig_lut.sin_bipartite_hi")]]
+#endif
+alignas(64) inline constexpr std::array<int64_t, 65> kSinBipartiteHi = {
+    0,           // sin(0.00000000000)
+    105403774,   // sin(0.02454369261)
+    210744057,   // sin(0.04908738521)
+    315957395,   // sin(0.07363107782)
+    420980412,   // sin(0.09817477042)
+    525749847,   // sin(0.12271846303)
+    630202589,   // sin(0.14726215564)
+    734275721,   // sin(0.17180584824)
+    837906553,   // sin(0.19634954085)
+    941032661,   // sin(0.22089323346)
+    1043591926,  // sin(0.24543692606)
+    1145522571,  // sin(0.26998061867)
+    1246763195,  // sin(0.29452431127)
+    1347252816,  // sin(0.31906800388)
+    1446930903,  // sin(0.34361169649)
+    1545737412,  // sin(0.36815538909)
+    1643612827,  // sin(0.39269908170)
+    1740498191,  // sin(0.41724277430)
+    1836335144,  // sin(0.44178646691)
+    1931065957,  // sin(0.46633015952)
+    2024633568,  // sin(0.49087385212)
+    2116981616,  // sin(0.51541754473)
+    2208054473,  // sin(0.53996123734)
+    2297797281,  // sin(0.56450492994)
+    2386155981,  // sin(0.58904862255)
+    2473077351,  // sin(0.61359231515)
+    2558509031,  // sin(0.63813600776)
+    2642399561,  // sin(0.66267970037)
+    2724698408,  // sin(0.68722339297)
+    2805355999,  // sin(0.71176708558)
+    2884323748,  // sin(0.73631077819)
+    2961554089,  // sin(0.76085447079)
+    3037000500,  // sin(0.78539816340)
+    3110617535,  // sin(0.80994185600)
+    3182360851,  // sin(0.83448554861)
+    3252187232,  // sin(0.85902924122)
+    3320054617,  // sin(0.88357293382)
+    3385922125,  // sin(0.90811662643)
+    3449750080,  // sin(0.93266031903)
+    3511500034,  // sin(0.95720401164)
+    3571134792,  // sin(0.98174770425)
+    3628618433,  // sin(1.00629139685)
+    3683916329,  // sin(1.03083508946)
+    3736995171,  // sin(1.05537878207)
+    3787822988,  // sin(1.07992247467)
+    3836369162,  // sin(1.10446616728)
+    3882604450,  // sin(1.12900985988)
+    3926501002,  // sin(1.15355355249)
+    3968032378,  // sin(1.17809724510)
+    4007173558,  // sin(1.20264093770)
+    4043900968,  // sin(1.22718463031)
+    4078192482,  // sin(1.25172832291)
+    4110027446,  // sin(1.27627201552)
+    4139386683,  // sin(1.30081570813)
+    4166252509,  // sin(1.32535940073)
+    4190608739,  // sin(1.34990309334)
+    4212440704,  // sin(1.37444678595)
+    4231735252,  // sin(1.39899047855)
+    4248480760,  // sin(1.42353417116)
+    4262667143,  // sin(1.44807786376)
+    4274285855,  // sin(1.47262155637)
+    4283329896,  // sin(1.49716524898)
+    4289793820,  // sin(1.52170894158)
+    4293673732,  // sin(1.54625263419)
+    4294967296,  // sin(1.57079632679)
+};
+
+// Rotation by a fine angle l, with the versine 1 - cos(l) in place of cos(l) so both
+// stay small
+struct SinRotation {
+    int32_t sin;
+    int32_t versin;
 };
 
+// Fine table of LookupSinBipartite: l = j*pi/8192 within one coarse step
+#if defined(__GNUC__) && defined(__ELF__)
+[[gnu::section(".rodata.math_trig_lut.sin_bipartite_lo")]]
+#endif
+alignas(64) inline constexpr std::array<SinRotation, 64> kSinBipartiteLo = {{
+    {0, 0},             // l = 0.00000000000
+    {1647099, 316},     // l = 0.00038349520
+    {3294198, 1263},    // l = 0.00076699039
+    {4941297, 2842},    // l = 0.00115048559
+    {6588395, 5053},    // l = 0.00153398079
+    {8235492, 7896},    // l = 0.00191747598
+    {9882587, 11370},   // l = 0.00230097118
+    {11529681, 15476},  // l = 0.00268446638
+    {13176774, 20213},  // l = 0.00306796158
+    {14823865, 25582},  // l = 0.00345145677
+    {16470953, 31583},  // l = 0.00383495197
+    {18118039, 38215},  // l = 0.00421844717
+    {19765122, 45479},  // l = 0.00460194236
+    {21412203, 53375},  // l = 0.00498543756
+    {23059280, 61902},  // l = 0.00536893276
+    {24706354, 71061},  // l = 0.00575242795
+    {26353424, 80852},  // l = 0.00613592315
+    {28000490, 91274},  // l = 0.00651941835
+    {29647552, 102328}, // l = 0.00690291355
+    {31294610, 114013}, // l = 0.00728640874
+    {32941664, 126330}, // l = 0.00766990394
+    {34588712, 139279}, // l = 0.00805339914
+    {36235755, 152860}, // l = 0.00843689433
+    {37882793, 167072}, // l = 0.00882038953
+    {39529826, 181915}, // l = 0.00920388473
+    {41176852, 197391}, // l = 0.00958737992
+    {42823873, 213498}, // l = 0.00997087512
+    {44470887, 230236}, // l = 0.01035437032
+    {46117895, 247606}, // l = 0.01073786552
+    {47764896, 265608}, // l = 0.01112136071
+    {49411890, 284241}, // l = 0.01150485591
+    {51058876, 303506}, // l = 0.01188835111
+    {52705856, 323403}, // l = 0.01227184630
+    {54352827, 343931}, // l = 0.01265534150
+    {55999790, 365091}, // l = 0.01303883670
+    {57646746, 386883}, // l = 0.01342233189
+    {59293692, 409306}, // l = 0.01380582709
+    {60940630, 432360}, // l = 0.01418932229
+    {62587559, 456047}, // l = 0.01457281748
+    {64234479, 480364}, // l = 0.01495631268
+    {65881389, 505314}, // l = 0.01533980788
+    {67528290, 530895}, // l = 0.01572330308
+    {69175181, 557107}, // l = 0.01610679827
+    {70822061, 583952}, // l = 0.01649029347
+    {72468931, 611427}, // l = 0.01687378867
+    {74115791, 639534}, // l = 0.01725728386
+    {75762639, 668273}, // l = 0.01764077906
+    {77409477, 697644}, // l = 0.01802427426
+    {79056303, 727646}, // l = 0.01840776945
+    {80703117, 758279}, // l = 0.01879126465
+    {82349920, 789544}, // l = 0.01917475985
+    {83996710, 821441}, // l = 0.01955825505
+    {85643488, 853969}, // l = 0.01994175024
+    {87290254, 887128}, // l = 0.02032524544
+    {88937007, 920920}, // l = 0.02070874064
+    {90583746, 955342}, // l = 0.02109223583
+    {92230472, 990396}, // l = 0.02147573103
+    {93877185, 1026082},// l = 0.02185922623
+    {95523884, 1062399},// l = 0.02224272142
+    {97170569, 1099348},// l = 0.02262621662
+    {98817239, 1136928},// l = 0.02300971182
+    {100463895, 1175140},// l = 0.02339320702
+    {102110537, 1213983},// l = 0.02377670221
+    {103757163, 1253458},// l = 0.02416019741
+}};
+
 // Fast lookup sin(x) with linear interpolation between table entries
-// Input x is in fixed-point format with specified fraction bits representing angle in radians
+// Input x is in fixed-point format with InputFractionBits fraction bits representing angle in radians
 // Output is in Q31.32 fixed-point format representing sin(x)
-// Precision: ~1e-6 when input_fraction_bits=32
-inline constexpr auto LookupSinFast(int64_t x, int input_fraction_bits) noexcept -> int64_t {
+// Precision: ~1e-6 when InputFractionBits=32
+template <int InputFractionBits = 32>
+inline constexpr auto LookupSinFast(int64_t x) noexcept -> int64_t {
     // Constants
-    constexpr int64_t kPi = 0x00000003243F6A88LL;  // pi = 3.141592653589793
-    constexpr int64_t kPiOver2 = 0x00000001921FB544LL;  // pi/2 = 1.5707963267948966
-    constexpr int64_t kTwoPi = 0x00000006487ED511LL;  // 2*pi = 6.283185307179586
-    constexpr int64_t kLutInterval = 0x00000145500D592ELL;  // LUT conversion factor
+    constexpr uint64_t kRadiansToTurns = 0x28BE60DB9391054AULL;  // 2^64 / (2*pi)
     constexpr int kOutputFractionBits = 32;  // Output format: Q31.32
 
-    // Convert input to Q{int_bits}.{fraction_bits} format if needed
-    if (input_fraction_bits != kOutputFractionBits) {
-        if (input_fraction_bits < kOutputFractionBits) {
-            x <<= (kOutputFractionBits - input_fraction_bits);
-        } else {
-            x >>= (input_fraction_bits - kOutputFractionBits);
-        }
+    // Convert input to internal format
+    if constexpr (InputFractionBits != kOutputFractionBits) {
+        x = Primitives::ShiftFractionBits(x, InputFractionBits, kOutputFractionBits);
     }
 
-    // 1. Normalize angle to [0, 2*pi)
-    x = x % kTwoPi;
-    if (x < 0) {
-        x += kTwoPi;
-    }
+    // 1. Normalize angle to [0, 2*pi) as a Q0.64 phase in turns, no division needed:
+    // the product wraps modulo 2^64, one turn. The unsigned multiply reads a negative x
+    // as x + 2^64, which adds kRadiansToTurns << (64 - kOutputFractionBits) to the
+    // shifted product; subtract that back
+    const uint64_t phase =
+        Primitives::MulU64Shifted(static_cast<uint64_t>(x), kRadiansToTurns, kOutputFractionBits)
+        - ((kRadiansToTurns << (64 - kOutputFractionBits)) & static_cast<uint64_t>(x >> 63));
 
-    // 2. Determine quadrant and map to [0, pi/2]
-    bool flip_sign = false;
-    if (x > kPi) {
-        // 3rd and 4th quadrants: sin(x) = -sin(x - pi)
-        x -= kPi;
-        flip_sign = true;
-    }
-    if (x > kPiOver2) {
-        // 2nd and 4th quadrants: sin(x) = sin(pi - x)
-        x = kPi - x;
+    // 2. The top two phase bits are the quadrant, map it to [0, pi/2] with masks
+    // instead of branches, the quadrant of a mixed-angle input is unpredictable
+    // 3rd and 4th quadrants: sin(x) = -sin(x - pi)
+    const int64_t negate_mask = -static_cast<int64_t>(phase >> 63);
+    // 2nd and 4th quadrants: sin(x) = sin(pi - x)
+    const uint64_t mirror_mask = 0 - ((phase >> 62) & 1);
+    constexpr uint64_t kQuarterTurn = uint64_t{1} << 62;
+    uint64_t quarter = phase & (kQuarterTurn - 1);
+    quarter += (kQuarterTurn - 2 * quarter) & mirror_mask;
+    quarter -= quarter >> 62;  // pi/2 itself is read as the end of the last interval
+
+    // 3. Calculate lookup table index and fractional part: a quarter turn spans
+    // 512 intervals, a power of two, so the table position is a shift of it
+    const int64_t idx_scaled = static_cast<int64_t>(quarter >> 21);
+    const int idx = static_cast<int>(idx_scaled >> kOutputFractionBits);
+    const int64_t t = idx_scaled & ((1LL << kOutputFractionBits) - 1);  // Fractional part [0,1)
+
+    // 4. Linear interpolation between table entries, rounded to nearest
+    const int64_t y0 = kSinLut[idx];
+    const int64_t diff = kSinLutDelta[idx];
+    int64_t result = y0 + Primitives::Fixed64MulNarrow(diff, t, kOutputFractionBits);
+
+    // 5. Apply sign flip, a no-op for a zero mask
+    result = (result ^ negate_mask) - negate_mask;
+
+    // 6. Convert result back to original input format if needed
+    if constexpr (InputFractionBits != kOutputFractionBits) {
+        result = Primitives::ShiftFractionBits(result, kOutputFractionBits, InputFractionBits);
     }
 
-    // 3. Calculate lookup table index and fractional part
-    int64_t idx_scaled = Primitives::Fixed64Mul(x, kLutInterval, kOutputFractionBits);
-    int idx = static_cast<int>(idx_scaled >> kOutputFractionBits);
-    int64_t frac = idx_scaled & ((1LL << kOutputFractionBits) - 1);
+    return result;
+}
+
+// Four LookupSinFast evaluations at once, bit-identical to calling it per element
+// With AVX2 the reduction and the table interpolation run in 64-bit vector lanes;
+// without it each element goes through LookupSinFast
+template <int InputFractionBits = 32>
+inline auto LookupSinFastx4(const int64_t* x, int64_t* out) noexcept -> void {
+#if defined(__AVX2__)
+    constexpr uint64_t kRadiansToTurns = 0x28BE60DB9391054AULL;  // 2^64 / (2*pi)
+    constexpr int kOutputFractionBits = 32;  // Internal calculation format
+    const __m256i zero = _mm256_setzero_si256();
+    const __m256i low_mask = _mm256_set1_epi64x(0xFFFFFFFFLL);
+    __m256i v = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(x));
 
-    // 4. Linear interpolation between table entries
-    int64_t y0 = kSinLut[idx];
-    int64_t y1 = kSinLut[idx + 1];
-    int64_t diff = y1 - y0;
-    int64_t interpolated_value = y0 + ((diff * frac) >> kOutputFractionBits);
+    // AVX2 has no 64-bit arithmetic right shift: shift logically, then sign-extend
+    // from the new top bit m with (w ^ m) - m
+    const auto shift_right_arithmetic = [](__m256i w, int n) {
+        const __m256i m = _mm256_set1_epi64x(int64_t{1} << (63 - n));
+        return _mm256_sub_epi64(_mm256_xor_si256(_mm256_srli_epi64(w, n), m), m);
+    };
 
-    // 5. Apply sign flip if necessary
-    if (flip_sign) {
-        interpolated_value = -interpolated_value;
+    // Convert input to internal format
+    if constexpr (InputFractionBits < kOutputFractionBits) {
+        v = _mm256_slli_epi64(v, kOutputFractionBits - InputFractionBits);
+    } else if constexpr (InputFractionBits > kOutputFractionBits) {
+        v = shift_right_arithmetic(v, InputFractionBits - kOutputFractionBits);
     }
 
+    // 1. Phase in turns: bits 32..95 of v * kRadiansToTurns from four
+    // 32x32->64 products, then the same fix-up for negative lanes as the scalar path
+    const __m256i k_lo = _mm256_set1_epi64x(static_cast<int64_t>(kRadiansToTurns & 0xFFFFFFFF));
+    const __m256i k_hi = _mm256_set1_epi64x(static_cast<int64_t>(kRadiansToTurns >> 32));
+    const __m256i v_hi = _mm256_srli_epi64(v, 32);
+    __m256i phase = _mm256_srli_epi64(_mm256_mul_epu32(v, k_lo), 32);
+    phase = _mm256_add_epi64(phase, _mm256_mul_epu32(v, k_hi));
+    phase = _mm256_add_epi64(phase, _mm256_mul_epu32(v_hi, k_lo));
+    phase = _mm256_add_epi64(phase, _mm256_slli_epi64(_mm256_mul_epu32(v_hi, k_hi), 32));
+    const __m256i negative = _mm256_cmpgt_epi64(zero, v);
+    const __m256i wrap = _mm256_set1_epi64x(static_cast<int64_t>(kRadiansToTurns << 32));
+    phase = _mm256_sub_epi64(phase, _mm256_and_si256(wrap, negative));
+
+    // 2. Quadrant masks from the top two phase bits, fold into [0, pi/2]
+    const __m256i negate_mask = _mm256_cmpgt_epi64(zero, phase);
+    const __m256i mirror_mask = _mm256_cmpgt_epi64(zero, _mm256_slli_epi64(phase, 1));
+    const __m256i quarter_turn = _mm256_set1_epi64x(int64_t{1} << 62);
+    __m256i quarter = _mm256_and_si256(phase, _mm256_sub_epi64(quarter_turn, _mm256_set1_epi64x(1)));
+    quarter = _mm256_add_epi64(
+        quarter, _mm256_and_si256(_mm256_sub_epi64(quarter_turn, _mm256_slli_epi64(quarter, 1)), mirror_mask));
+    quarter = _mm256_sub_epi64(quarter, _mm256_srli_epi64(quarter, 62));
+
+    // 3. Table index and fraction, a shift of the quarter as in the scalar path
+    const __m256i idx_scaled = _mm256_srli_epi64(quarter, 21);
+    const __m256i idx = _mm256_srli_epi64(idx_scaled, kOutputFractionBits);
+    const __m256i t = _mm256_and_si256(idx_scaled, low_mask);
+
+    // 4. Linear interpolation: the steps are non-negative and below 2^31 and t is
+    // below 2^32, so one 32x32->64 multiply per lane is exact; round to nearest like
+    // the scalar path
+    static_assert(sizeof(kSinLut[0]) == 4 && sizeof(kSinLutDelta[0]) == 4);
+    const __m256i y0 = _mm256_cvtepu32_epi64(
+        _mm256_i64gather_epi32(reinterpret_cast<const int*>(kSinLut.data()), idx, 4));
+    const __m256i diff = _mm256_cvtepu32_epi64(
+        _mm256_i64gather_epi32(reinterpret_cast<const int*>(kSinLutDelta.data()), idx, 4));
+    const __m256i half = _mm256_set1_epi64x(1LL << (kOutputFractionBits - 1));
+    const __m256i step = _mm256_add_epi64(_mm256_mul_epu32(diff, t), half);
+    __m256i result = _mm256_add_epi64(y0, _mm256_srli_epi64(step, kOutputFractionBits));
+
+    // 5. Apply sign flip, a no-op for a zero mask
+    result = _mm256_sub_epi64(_mm256_xor_si256(result, negate_mask), negate_mask);
+
     // 6. Convert result back to original input format if needed
-    if (input_fraction_bits != kOutputFractionBits) {
-        if (input_fraction_bits < kOutputFractionBits) {
-            interpolated_value >>= (kOutputFractionBits - input_fraction_bits);
-        } else {
-            interpolated_value <<= (input_fraction_bits - kOutputFractionBits);
-        }
+    if constexpr (InputFractionBits < kOutputFractionBits) {
+        result = shift_right_arithmetic(result, kOutputFractionBits - InputFractionBits);
+    } else if constexpr (InputFractionBits > kOutputFractionBits) {
+        result = _mm256_slli_epi64(result, InputFractionBits - kOutputFractionBits);
+    }
+    _mm256_storeu_si256(reinterpret_cast<__m256i*>(out), result);
+#else
+    for (int i = 0; i < 4; ++i) {
+        out[i] = LookupSinFast<InputFractionBits>(x[i]);
     }
+#endif
+}
 
-    return interpolated_value;
+// LookupSinFast over count elements, four at a time through LookupSinFastx4
+// and the remaining tail per element; out may be the same array as x
+template <int InputFractionBits = 32>
+inline auto LookupSinFastBatch(const int64_t* x, int64_t* out, size_t count) noexcept -> void {
+    size_t i = 0;
+    for (; i + 4 <= count; i += 4) {
+        LookupSinFastx4<InputFractionBits>(x + i, out + i);
+    }
+    for (; i < count; ++i) {
+        out[i] = LookupSinFast<InputFractionBits>(x[i]);
+    }
 }
 
 // Lookup sin(x) with optimized Hermite cubic interpolation between table entries
-// Input x is in fixed-point format with specified fraction bits representing angle in radians
+// Input x is in fixed-point format with InputFractionBits fraction bits representing angle in radians
 // Output is in Q31.32 fixed-point format representing sin(x)
-// Precision: ~1.0e-9 when input_fraction_bits=32 (about 1500x more accurate than fast version)
-inline constexpr auto LookupSin(int64_t x, int input_fraction_bits) noexcept -> int64_t {
+// Precision: ~1.0e-9 when InputFractionBits=32 (about 1500x more accurate than fast version)
+template <int InputFractionBits = 32>
+inline constexpr auto LookupSin(int64_t x) noexcept -> int64_t {
     // Constants
-    constexpr int64_t kPi = 0x00000003243F6A88LL;  // pi = 3.141592653589793
-    constexpr int64_t kPiOver2 = 0x00000001921FB544LL;  // pi/2 = 1.5707963267948966
-    constexpr int64_t kTwoPi = 0x00000006487ED511LL;  // 2*pi = 6.283185307179586
-    constexpr int64_t kLutInterval = 0x00000145500D592ELL;  // LUT conversion factor
+    constexpr uint64_t kRadiansToTurns = 0x28BE60DB9391054AULL;  // 2^64 / (2*pi)
     constexpr int kOutputFractionBits = 32;  // Output format: Q31.32
 
-    // Convert input to Q{int_bits}.{fraction_bits} format if needed
-    if (input_fraction_bits != kOutputFractionBits) {
-        if (input_fraction_bits < kOutputFractionBits) {
-            x <<= (kOutputFractionBits - input_fraction_bits);
-        } else {
-            x >>= (input_fraction_bits - kOutputFractionBits);
-        }
+    // Convert input to internal format
+    if constexpr (InputFractionBits != kOutputFractionBits) {
+        x = Primitives::ShiftFractionBits(x, InputFractionBits, kOutputFractionBits);
     }
 
-    // 1. Normalize angle to [0, 2*pi)
-    x = x % kTwoPi;
-    if (x < 0) {
-        x += kTwoPi;
+    // 1. Normalize angle to [0, 2*pi) as a Q0.64 phase in turns, no division needed:
+    // the product wraps modulo 2^64, one turn. The unsigned multiply reads a negative x
+    // as x + 2^64, which adds kRadiansToTurns << (64 - kOutputFractionBits) to the
+    // shifted product; subtract that back
+    const uint64_t phase =
+        Primitives::MulU64Shifted(static_cast<uint64_t>(x), kRadiansToTurns, kOutputFractionBits)
+        - ((kRadiansToTurns << (64 - kOutputFractionBits)) & static_cast<uint64_t>(x >> 63));
+
+    // 2. The top two phase bits are the quadrant, map it to [0, pi/2] with masks
+    // instead of branches, the quadrant of a mixed-angle input is unpredictable
+    // 3rd and 4th quadrants: sin(x) = -sin(x - pi)
+    const int64_t negate_mask = -static_cast<int64_t>(phase >> 63);
+    // 2nd and 4th quadrants: sin(x) = sin(pi - x)
+    const uint64_t mirror_mask = 0 - ((phase >> 62) & 1);
+    constexpr uint64_t kQuarterTurn = uint64_t{1} << 62;
+    uint64_t quarter = phase & (kQuarterTurn - 1);
+    quarter += (kQuarterTurn - 2 * quarter) & mirror_mask;
+    quarter -= quarter >> 62;  // pi/2 itself is read as the end of the last interval
+
+    // 3. Calculate lookup table index and fractional part: a quarter turn spans
+    // 512 intervals, a power of two, so the table position is a shift of it
+    const int64_t idx_scaled = static_cast<int64_t>(quarter >> 21);
+    const int idx = static_cast<int>(idx_scaled >> kOutputFractionBits);
+    const int64_t t = idx_scaled & ((1LL << kOutputFractionBits) - 1);  // Fractional part [0,1)
+
+    // 4. Evaluate the precomputed Hermite segment p(t) = ((a*t + b)*t + c)*t + d using
+    // Horner's method; the generator checked that every operand stays below
+    // 2^24, so t * operand fits in 64 bits
+    const SinSegment& seg = kSinTable[idx];
+    int64_t result = Primitives::Fixed64MulNarrow(t, seg.a, kOutputFractionBits) + seg.b;
+    result = Primitives::Fixed64MulNarrow(t, result, kOutputFractionBits) + seg.c;
+    result = Primitives::Fixed64MulNarrow(t, result, kOutputFractionBits) + seg.d;
+
+    // 5. Apply sign flip, a no-op for a zero mask
+    result = (result ^ negate_mask) - negate_mask;
+
+    // 6. Convert result back to original input format if needed
+    if constexpr (InputFractionBits != kOutputFractionBits) {
+        result = Primitives::ShiftFractionBits(result, kOutputFractionBits, InputFractionBits);
+    }
+
+    return result;
+}
+
+// Lookup sin(x) from the two small bipartite tables instead of the 512-entry ones: about
+// 1 KiB of tables next to the 12 KiB of kSinLut, kSinLutDelta and kSinTable, for callers
+// whose working set leaves little room in L1
+// Input x is in fixed-point format with InputFractionBits fraction bits representing angle in radians
+// Output is in Q31.32 fixed-point format representing sin(x)
+// Precision: ~1e-9 when InputFractionBits=32, like LookupSin
+template <int InputFractionBits = 32>
+inline constexpr auto LookupSinBipartite(int64_t x) noexcept -> int64_t {
+    // Constants
+    constexpr uint64_t kRadiansToTurns = 0x28BE60DB9391054AULL;  // 2^64 / (2*pi)
+    constexpr int kOutputFractionBits = 32;  // Output format: Q31.32
+
+    // Convert input to internal format
+    if constexpr (InputFractionBits != kOutputFractionBits) {
+        x = Primitives::ShiftFractionBits(x, InputFractionBits, kOutputFractionBits);
     }
 
-    // 2. Determine quadrant and map to [0, pi/2]
-    bool flip_sign = false;
-    if (x > kPi) {
-        // 3rd and 4th quadrants: sin(x) = -sin(x - pi)
-        x -= kPi;
-        flip_sign = true;
+    // 1. Normalize angle to [0, 2*pi) as a Q0.64 phase in turns, no division needed:
+    // the product wraps modulo 2^64, one turn. The unsigned multiply reads a negative x
+    // as x + 2^64, which adds kRadiansToTurns << (64 - kOutputFractionBits) to the
+    // shifted product; subtract that back
+    const uint64_t phase =
+        Primitives::MulU64Shifted(static_cast<uint64_t>(x), kRadiansToTurns, kOutputFractionBits)
+        - ((kRadiansToTurns << (64 - kOutputFractionBits)) & static_cast<uint64_t>(x >> 63));
+
+    // 2. The top two phase bits are the quadrant, map it to [0, pi/2] with masks
+    // instead of branches, the quadrant of a mixed-angle input is unpredictable
+    // 3rd and 4th quadrants: sin(x) = -sin(x - pi)
+    const int64_t negate_mask = -static_cast<int64_t>(phase >> 63);
+    // 2nd and 4th quadrants: sin(x) = sin(pi - x)
+    const uint64_t mirror_mask = 0 - ((phase >> 62) & 1);
+    constexpr uint64_t kQuarterTurn = uint64_t{1} << 62;
+    uint64_t quarter = phase & (kQuarterTurn - 1);
+    quarter += (kQuarterTurn - 2 * quarter) & mirror_mask;
+    quarter -= quarter >> 62;  // pi/2 itself is read as the end of the last interval
+
+    // 3. Split the quarter into a coarse angle h = hi*pi/128, a fine angle
+    // l = lo*pi/8192 and a residual r below pi/8192 in radians
+    constexpr int64_t kResidualToRadians = 6588397;  // pi/2 * 2^22
+    const int hi = static_cast<int>(quarter >> 56);
+    const int lo = static_cast<int>(quarter >> 50) & 63;
+    const int64_t residual = static_cast<int64_t>((quarter & ((uint64_t{1} << 50) - 1)) >> 20);
+    const int64_t r = Primitives::Fixed64MulNarrow(residual, kResidualToRadians, 32);
+
+    // 4. sin and cos of h + l by the angle-addition formulas, then rotate by r with
+    // sin(r) ~= r and cos(r) ~= 1 - r^2/2; the r^3/6 term is below 1e-11
+    const int64_t sin_h = kSinBipartiteHi[hi];
+    const int64_t cos_h = kSinBipartiteHi[64 - hi];
+    const SinRotation& rot = kSinBipartiteLo[lo];
+    const int64_t sin_hl = sin_h - Primitives::Fixed64MulNarrow(sin_h, rot.versin, kOutputFractionBits)
+                           + Primitives::Fixed64MulNarrow(cos_h, rot.sin, kOutputFractionBits);
+    const int64_t cos_hl = cos_h - Primitives::Fixed64MulNarrow(cos_h, rot.versin, kOutputFractionBits)
+                           - Primitives::Fixed64MulNarrow(sin_h, rot.sin, kOutputFractionBits);
+    const int64_t half_r2 = Primitives::Fixed64MulNarrow(r, r, kOutputFractionBits + 1);
+    int64_t result = sin_hl + Primitives::Fixed64MulNarrow(cos_hl, r, kOutputFractionBits)
+                     - Primitives::Fixed64MulNarrow(sin_hl, half_r2, kOutputFractionBits);
+
+    // 5. Apply sign flip, a no-op for a zero mask
+    result = (result ^ negate_mask) - negate_mask;
+
+    // 6. Convert result back to original input format if needed
+    if constexpr (InputFractionBits != kOutputFractionBits) {
+        result = Primitives::ShiftFractionBits(result, kOutputFractionBits, InputFractionBits);
     }
-    if (x > kPiOver2) {
-        // 2nd and 4th quadrants: sin(x) = sin(pi - x)
-        x = kPi - x;
+
+    return result;
+}
+
+// Fast lookup sin(x) for an angle given as a Q0.32 fraction of a turn, such as a
+// wrapping uint32_t phase accumulator: 0 is 0 and 0x80000000 is pi. The angle is
+// already reduced modulo 2*pi, so only the quadrant fold and the interpolation remain
+// Output is in Q31.32 fixed-point format representing sin(x)
+inline constexpr auto LookupSinUnit(uint32_t unit_phase) noexcept -> int64_t {
+    constexpr int kOutputFractionBits = 32;  // Output format: Q31.32
+
+    // 1. Widen the turns to the Q0.64 phase of the radian lookups
+    const uint64_t phase = static_cast<uint64_t>(unit_phase) << 32;
+
+    // 2. The top two phase bits are the quadrant, map it to [0, pi/2] with masks
+    // instead of branches, the quadrant of a mixed-angle input is unpredictable
+    // 3rd and 4th quadrants: sin(x) = -sin(x - pi)
+    const int64_t negate_mask = -static_cast<int64_t>(phase >> 63);
+    // 2nd and 4th quadrants: sin(x) = sin(pi - x)
+    const uint64_t mirror_mask = 0 - ((phase >> 62) & 1);
+    constexpr uint64_t kQuarterTurn = uint64_t{1} << 62;
+    uint64_t quarter = phase & (kQuarterTurn - 1);
+    quarter += (kQuarterTurn - 2 * quarter) & mirror_mask;
+    quarter -= quarter >> 62;  // pi/2 itself is read as the end of the last interval
+
+    // 3. Calculate lookup table index and fractional part: a quarter turn spans
+    // 512 intervals, a power of two, so the table position is a shift of it
+    const int64_t idx_scaled = static_cast<int64_t>(quarter >> 21);
+    const int idx = static_cast<int>(idx_scaled >> kOutputFractionBits);
+    const int64_t t = idx_scaled & ((1LL << kOutputFractionBits) - 1);  // Fractional part [0,1)
+
+    // 4. Linear interpolation between table entries, rounded to nearest
+    const int64_t y0 = kSinLut[idx];
+    const int64_t diff = kSinLutDelta[idx];
+    int64_t result = y0 + Primitives::Fixed64MulNarrow(diff, t, kOutputFractionBits);
+
+    // 5. Apply sign flip, a no-op for a zero mask
+    return (result ^ negate_mask) - negate_mask;
+}
+
+// LookupSinFast for input_fraction_bits known only at runtime
+inline constexpr auto LookupSinFast(int64_t x, int input_fraction_bits) noexcept -> int64_t {
+    // Formats of the Fixed64 aliases get their shifts folded at compile time
+    switch (input_fraction_bits) {
+        case 16:
+            return LookupSinFast<16>(x);
+        case 32:
+            return LookupSinFast<32>(x);
+        case 40:
+            return LookupSinFast<40>(x);
+        default:
+            break;
     }
 
-    // 3. Calculate lookup table index and fractional part
-    int64_t idx_scaled = Primitives::Fixed64Mul(x, kLutInterval, kOutputFractionBits);
-    int idx = static_cast<int>(idx_scaled >> kOutputFractionBits);
-    int64_t t = idx_scaled & ((1LL << kOutputFractionBits) - 1);  // Fractional part [0,1)
-
-    // 4. Get points from table
-    int64_t p0 = kSinLut[idx];      // Point at left endpoint
-    int64_t p1 = kSinLut[idx + 1];  // Point at right endpoint
-
-    // 5. Compute derivatives using the fact that sin'(x) = cos(x)
-    // We can use the identity cos(x) = sin(x + pi/2)
-    // For the first quadrant, we can use cos(x) = sin(pi/2 - x) when x is in [0,pi/2]
-    int cos_idx = static_cast<int>(kSinLut.size()) - 2 - idx;
-    int64_t m0 = kSinLut[cos_idx];  // Derivative (cos) at left endpoint
-    int64_t m1 = cos_idx > 0 ? kSinLut[cos_idx - 1] : 0;  // Derivative at right endpoint
-
-    // Scale derivatives by step size
-    constexpr int64_t kStepSize = kPiOver2/(kSinLut.size() - 2);
-    m0 = (m0 * kStepSize) >> kOutputFractionBits;
-    m1 = (m1 * kStepSize) >> kOutputFractionBits;
-
-    // 6. Compute optimized Hermite coefficients
-    // p(t) = ((a*t + b)*t + c)*t + d  (Horner's method)
-    // where:
-    // a = 2(p₀-p₁) + m₀+m₁
-    // b = 3(p₁-p₀) - 2m₀-m₁
-    // c = m₀
-    // d = p₀
-    int64_t p0_minus_p1 = p0 - p1;
-    int64_t a = p0_minus_p1 * 2 + m0 + m1;
-    int64_t b = -p0_minus_p1 * 3 - m0 * 2 - m1;
-    int64_t c = m0;
-    int64_t d = p0;
-
-    // 7. Compute interpolation using Horner's method
-    int64_t result =
-        d
-        + Primitives::Fixed64Mul(
-            t,
-            c
-                + Primitives::Fixed64Mul(
-                    t, b + Primitives::Fixed64Mul(t, a, kOutputFractionBits), kOutputFractionBits),
-            kOutputFractionBits);
-
-    // 8. Apply sign flip if necessary
-    if (flip_sign) {
-        result = -result;
+    constexpr int kOutputFractionBits = 32;
+    x = Primitives::ShiftFractionBits(x, input_fraction_bits, kOutputFractionBits);
+    const int64_t result = LookupSinFast<kOutputFractionBits>(x);
+    return Primitives::ShiftFractionBits(result, kOutputFractionBits, input_fraction_bits);
+}
+
+// LookupSin for input_fraction_bits known only at runtime
+inline constexpr auto LookupSin(int64_t x, int input_fraction_bits) noexcept -> int64_t {
+    // Formats of the Fixed64 aliases get their shifts folded at compile time
+    switch (input_fraction_bits) {
+        case 16:
+            return LookupSin<16>(x);
+        case 32:
+            return LookupSin<32>(x);
+        case 40:
+            return LookupSin<40>(x);
+        default:
+            break;
     }
 
-    // 9. Convert result back to original input format if needed
-    if (input_fraction_bits != kOutputFractionBits) {
-        if (input_fraction_bits < kOutputFractionBits) {
-            result >>= (kOutputFractionBits - input_fraction_bits);
-        } else {
-            result <<= (input_fraction_bits - kOutputFractionBits);
-        }
+    constexpr int kOutputFractionBits = 32;
+    x = Primitives::ShiftFractionBits(x, input_fraction_bits, kOutputFractionBits);
+    const int64_t result = LookupSin<kOutputFractionBits>(x);
+    return Primitives::ShiftFractionBits(result, kOutputFractionBits, input_fraction_bits);
+}
+
+// LookupSinBipartite for input_fraction_bits known only at runtime
+inline constexpr auto LookupSinBipartite(int64_t x, int input_fraction_bits) noexcept -> int64_t {
+    // Formats of the Fixed64 aliases get their shifts folded at compile time
+    switch (input_fraction_bits) {
+        case 16:
+            return LookupSinBipartite<16>(x);
+        case 32:
+            return LookupSinBipartite<32>(x);
+        case 40:
+            return LookupSinBipartite<40>(x);
+        default:
+            break;
     }
 
-    return result;
+    constexpr int kOutputFractionBits = 32;
+    x = Primitives::ShiftFractionBits(x, input_fraction_bits, kOutputFractionBits);
+    const int64_t result = LookupSinBipartite<kOutputFractionBits>(x);
+    return Primitives::ShiftFractionBits(result, kOutputFractionBits, input_fraction_bits);
 }
 
-}  // namespace math::fp::detail
\ No newline at end of file
+}  // namespace math::fp::detail
@@ -2,687 +2,754 @@
 
 #include <stdint.h>
 #include <array>
+#include <limits>
 #include "primitives.h"
 
-// Tan lookup table with 513 entries
-// Covers the range [0,pi/2] with values in Q31.32 format
-// Generated with mpmath library at 100 digits precision
+#if defined(__AVX2__)
+#include <immintrin.h>
+#endif
+
+// Tan lookup table with 257 entries
+// Covers the range [0,pi/4] with values in Q31.32 format
+// Generated with mpmath library at 30 digits precision
 
 namespace math::fp::detail {
-// Table maps x in [0,pi/2] to tan(x)
+// Table maps x in [0,pi/4] to tan(x); (pi/4,pi/2] is the reciprocal of the mirrored
+// angle, so the table stays within [0,1] and the steep end of tan needs no entries
 // Values stored in Q31.32 fixed-point format
-inline constexpr std::array<int64_t, 513> kTanLut = {
+inline constexpr std::array<int64_t, 257> kTanLut = {
     0x0000000000000000LL, // tan(0.00000000000000) = 0.00000000000000
-    0x0000000000C974BELL, // tan(0.00307396541447) = 0.00307397509674
-    0x000000000192EA76LL, // tan(0.00614793082894) = 0.00614800828800
-    0x00000000025C6221LL, // tan(0.00922189624341) = 0.00922215767269
-    0x000000000325DCB9LL, // tan(0.01229586165789) = 0.01229648135848
-    0x0000000003EF5B37LL, // tan(0.01536982707236) = 0.01537103746626
-    0x0000000004B8DE95LL, // tan(0.01844379248683) = 0.01844588413447
-    0x00000000058267CCLL, // tan(0.02151775790130) = 0.02152107952352
-    0x00000000064BF7D8LL, // tan(0.02459172331577) = 0.02459668182021
-    0x0000000007158FB0LL, // tan(0.02766568873024) = 0.02767274924211
-    0x0000000007DF3051LL, // tan(0.03073965414471) = 0.03074934004198
-    0x0000000008A8DAB4LL, // tan(0.03381361955919) = 0.03382651251220
-    0x0000000009728FD4LL, // tan(0.03688758497366) = 0.03690432498919
-    0x000000000A3C50ACLL, // tan(0.03996155038813) = 0.03998283585783
-    0x000000000B061E36LL, // tan(0.04303551580260) = 0.04306210355588
-    0x000000000BCFF96ELL, // tan(0.04610948121707) = 0.04614218657848
-    0x000000000C99E34FLL, // tan(0.04918344663154) = 0.04922314348257
-    0x000000000D63DCD5LL, // tan(0.05225741204601) = 0.05230503289136
-    0x000000000E2DE6FDLL, // tan(0.05533137746049) = 0.05538791349880
-    0x000000000EF802C2LL, // tan(0.05840534287496) = 0.05847184407409
-    0x000000000FC23121LL, // tan(0.06147930828943) = 0.06155688346617
-    0x00000000108C7318LL, // tan(0.06455327370390) = 0.06464309060822
-    0x000000001156C9A3LL, // tan(0.06762723911837) = 0.06773052452220
-    0x00000000122135C2LL, // tan(0.07070120453284) = 0.07081924432340
-    0x0000000012EBB871LL, // tan(0.07377516994731) = 0.07390930922499
-    0x0000000013B652B1LL, // tan(0.07684913536179) = 0.07700077854256
-    0x0000000014810580LL, // tan(0.07992310077626) = 0.08009371169878
-    0x00000000154BD1DDLL, // tan(0.08299706619073) = 0.08318816822792
-    0x000000001616B8CALL, // tan(0.08607103160520) = 0.08628420778056
-    0x0000000016E1BB46LL, // tan(0.08914499701967) = 0.08938189012815
-    0x0000000017ACDA54LL, // tan(0.09221896243414) = 0.09248127516776
-    0x00000000187816F4LL, // tan(0.09529292784861) = 0.09558242292668
-    0x0000000019437229LL, // tan(0.09836689326309) = 0.09868539356718
-    0x000000001A0EECF7LL, // tan(0.10144085867756) = 0.10179024739123
-    0x000000001ADA8861LL, // tan(0.10451482409203) = 0.10489704484522
-    0x000000001BA6456ALL, // tan(0.10758878950650) = 0.10800584652477
-    0x000000001C722519LL, // tan(0.11066275492097) = 0.11111671317950
-    0x000000001D3E2872LL, // tan(0.11373672033544) = 0.11422970571787
-    0x000000001E0A507CLL, // tan(0.11681068574991) = 0.11734488521202
-    0x000000001ED69E3ELL, // tan(0.11988465116439) = 0.12046231290267
-    0x000000001FA312BFLL, // tan(0.12295861657886) = 0.12358205020397
-    0x00000000206FAF09LL, // tan(0.12603258199333) = 0.12670415870850
-    0x00000000213C7425LL, // tan(0.12910654740780) = 0.12982870019217
-    0x000000002209631CLL, // tan(0.13218051282227) = 0.13295573661927
-    0x0000000022D67CFALL, // tan(0.13525447823674) = 0.13608533014744
-    0x0000000023A3C2CALL, // tan(0.13832844365121) = 0.13921754313277
-    0x000000002471359ALL, // tan(0.14140240906569) = 0.14235243813487
-    0x00000000253ED676LL, // tan(0.14447637448016) = 0.14549007792198
-    0x00000000260CA66ELL, // tan(0.14755033989463) = 0.14863052547615
-    0x0000000026DAA690LL, // tan(0.15062430530910) = 0.15177384399842
-    0x0000000027A8D7EDLL, // tan(0.15369827072357) = 0.15492009691406
-    0x0000000028773B97LL, // tan(0.15677223613804) = 0.15806934787783
-    0x000000002945D2A0LL, // tan(0.15984620155251) = 0.16122166077929
-    0x000000002A149E1BLL, // tan(0.16292016696699) = 0.16437709974814
-    0x000000002AE39F1DLL, // tan(0.16599413238146) = 0.16753572915962
-    0x000000002BB2D6BCLL, // tan(0.16906809779593) = 0.17069761363992
-    0x000000002C82460DLL, // tan(0.17214206321040) = 0.17386281807167
-    0x000000002D51EE2ALL, // tan(0.17521602862487) = 0.17703140759942
-    0x000000002E21D02ALL, // tan(0.17828999403934) = 0.18020344763526
-    0x000000002EF1ED28LL, // tan(0.18136395945381) = 0.18337900386435
-    0x000000002FC2463FLL, // tan(0.18443792486829) = 0.18655814225062
-    0x000000003092DC8CLL, // tan(0.18751189028276) = 0.18974092904247
-    0x000000003163B12DLL, // tan(0.19058585569723) = 0.19292743077848
-    0x000000003234C541LL, // tan(0.19365982111170) = 0.19611771429323
-    0x00000000330619E7LL, // tan(0.19673378652617) = 0.19931184672318
-    0x0000000033D7B042LL, // tan(0.19980775194064) = 0.20250989551250
-    0x0000000034A98974LL, // tan(0.20288171735511) = 0.20571192841908
-    0x00000000357BA6A3LL, // tan(0.20595568276959) = 0.20891801352052
-    0x00000000364E08F4LL, // tan(0.20902964818406) = 0.21212821922018
-    0x000000003720B18DLL, // tan(0.21210361359853) = 0.21534261425334
-    0x0000000037F3A198LL, // tan(0.21517757901300) = 0.21856126769333
-    0x0000000038C6DA40LL, // tan(0.21825154442747) = 0.22178424895780
-    0x00000000399A5CAELL, // tan(0.22132550984194) = 0.22501162781500
-    0x000000003A6E2A12LL, // tan(0.22439947525641) = 0.22824347439015
-    0x000000003B424398LL, // tan(0.22747344067089) = 0.23147985917187
-    0x000000003C16AA73LL, // tan(0.23054740608536) = 0.23472085301864
-    0x000000003CEB5FD3LL, // tan(0.23362137149983) = 0.23796652716540
-    0x000000003DC064EDLL, // tan(0.23669533691430) = 0.24121695323011
-    0x000000003E95BAF5LL, // tan(0.23976930232877) = 0.24447220322048
-    0x000000003F6B6323LL, // tan(0.24284326774324) = 0.24773234954072
-    0x0000000040415EAFLL, // tan(0.24591723315771) = 0.25099746499836
-    0x000000004117AED4LL, // tan(0.24899119857219) = 0.25426762281116
-    0x0000000041EE54CELL, // tan(0.25206516398666) = 0.25754289661409
-    0x0000000042C551DBLL, // tan(0.25513912940113) = 0.26082336046636
-    0x00000000439CA73BLL, // tan(0.25821309481560) = 0.26410908885857
-    0x0000000044745630LL, // tan(0.26128706023007) = 0.26740015671990
-    0x00000000454C5FFDLL, // tan(0.26436102564454) = 0.27069663942542
-    0x000000004624C5E9LL, // tan(0.26743499105901) = 0.27399861280343
-    0x0000000046FD893ALL, // tan(0.27050895647349) = 0.27730615314293
-    0x0000000047D6AB3BLL, // tan(0.27358292188796) = 0.28061933720115
-    0x0000000048B02D38LL, // tan(0.27665688730243) = 0.28393824221119
-    0x00000000498A107DLL, // tan(0.27973085271690) = 0.28726294588968
-    0x000000004A64565CLL, // tan(0.28280481813137) = 0.29059352644465
-    0x000000004B3F0026LL, // tan(0.28587878354584) = 0.29393006258338
-    0x000000004C1A0F2ELL, // tan(0.28895274896031) = 0.29727263352039
-    0x000000004CF584CDLL, // tan(0.29202671437479) = 0.30062131898553
-    0x000000004DD1625ALL, // tan(0.29510067978926) = 0.30397619923215
-    0x000000004EADA930LL, // tan(0.29817464520373) = 0.30733735504540
-    0x000000004F8A5AADLL, // tan(0.30124861061820) = 0.31070486775057
-    0x0000000050677830LL, // tan(0.30432257603267) = 0.31407881922161
-    0x000000005145031CLL, // tan(0.30739654144714) = 0.31745929188969
-    0x000000005222FCD4LL, // tan(0.31047050686161) = 0.32084636875190
-    0x00000000530166C0LL, // tan(0.31354447227609) = 0.32424013338005
-    0x0000000053E0424ALL, // tan(0.31661843769056) = 0.32764066992961
-    0x0000000054BF90DCLL, // tan(0.31969240310503) = 0.33104806314867
-    0x00000000559F53E6LL, // tan(0.32276636851950) = 0.33446239838716
-    0x00000000567F8CD9LL, // tan(0.32584033393397) = 0.33788376160603
-    0x0000000057603D29LL, // tan(0.32891429934844) = 0.34131223938670
-    0x000000005841664DLL, // tan(0.33198826476291) = 0.34474791894051
-    0x00000000592309BDLL, // tan(0.33506223017739) = 0.34819088811835
-    0x000000005A0528F6LL, // tan(0.33813619559186) = 0.35164123542045
-    0x000000005AE7C576LL, // tan(0.34121016100633) = 0.35509905000619
-    0x000000005BCAE0C0LL, // tan(0.34428412642080) = 0.35856442170417
-    0x000000005CAE7C59LL, // tan(0.34735809183527) = 0.36203744102233
-    0x000000005D9299C7LL, // tan(0.35043205724974) = 0.36551819915825
-    0x000000005E773A96LL, // tan(0.35350602266421) = 0.36900678800951
-    0x000000005F5C6053LL, // tan(0.35657998807868) = 0.37250330018435
-    0x0000000060420C90LL, // tan(0.35965395349316) = 0.37600782901228
-    0x00000000612840E0LL, // tan(0.36272791890763) = 0.37952046855500
-    0x00000000620EFEDBLL, // tan(0.36580188432210) = 0.38304131361736
-    0x0000000062F6481ALL, // tan(0.36887584973657) = 0.38657045975855
-    0x0000000063DE1E3CLL, // tan(0.37194981515104) = 0.39010800330339
-    0x0000000064C682E1LL, // tan(0.37502378056551) = 0.39365404135380
-    0x0000000065AF77AFLL, // tan(0.37809774597998) = 0.39720867180047
-    0x000000006698FE4CLL, // tan(0.38117171139446) = 0.40077199333459
-    0x0000000067831865LL, // tan(0.38424567680893) = 0.40434410545987
-    0x00000000686DC7A8LL, // tan(0.38731964222340) = 0.40792510850467
-    0x0000000069590DC7LL, // tan(0.39039360763787) = 0.41151510363428
-    0x000000006A44EC7ALL, // tan(0.39346757305234) = 0.41511419286344
-    0x000000006B316579LL, // tan(0.39654153846681) = 0.41872247906901
-    0x000000006C1E7A83LL, // tan(0.39961550388128) = 0.42234006600280
-    0x000000006D0C2D58LL, // tan(0.40268946929576) = 0.42596705830464
-    0x000000006DFA7FBELL, // tan(0.40576343471023) = 0.42960356151561
-    0x000000006EE9737FLL, // tan(0.40883740012470) = 0.43324968209145
-    0x000000006FD90A67LL, // tan(0.41191136553917) = 0.43690552741624
-    0x0000000070C94648LL, // tan(0.41498533095364) = 0.44057120581616
-    0x0000000071BA28F7LL, // tan(0.41805929636811) = 0.44424682657362
-    0x0000000072ABB44ELL, // tan(0.42113326178258) = 0.44793249994143
-    0x00000000739DEA2ALL, // tan(0.42420722719706) = 0.45162833715734
-    0x000000007490CC6DLL, // tan(0.42728119261153) = 0.45533445045868
-    0x0000000075845CFELL, // tan(0.43035515802600) = 0.45905095309728
-    0x0000000076789DC8LL, // tan(0.43342912344047) = 0.46277795935464
-    0x00000000776D90BALL, // tan(0.43650308885494) = 0.46651558455726
-    0x00000000786337C8LL, // tan(0.43957705426941) = 0.47026394509230
-    0x00000000795994EALL, // tan(0.44265101968388) = 0.47402315842339
-    0x000000007A50AA1ELL, // tan(0.44572498509836) = 0.47779334310674
-    0x000000007B487966LL, // tan(0.44879895051283) = 0.48157461880753
-    0x000000007C4104C8LL, // tan(0.45187291592730) = 0.48536710631645
-    0x000000007D3A4E50LL, // tan(0.45494688134177) = 0.48917092756664
-    0x000000007E34580ELL, // tan(0.45802084675624) = 0.49298620565079
-    0x000000007F2F2419LL, // tan(0.46109481217071) = 0.49681306483853
-    0x00000000802AB48CLL, // tan(0.46416877758518) = 0.50065163059417
-    0x0000000081270B85LL, // tan(0.46724274299966) = 0.50450202959464
-    0x0000000082242B2CLL, // tan(0.47031670841413) = 0.50836438974774
-    0x00000000832215AALL, // tan(0.47339067382860) = 0.51223884021072
-    0x000000008420CD30LL, // tan(0.47646463924307) = 0.51612551140913
-    0x00000000852053F3LL, // tan(0.47953860465754) = 0.52002453505595
-    0x000000008620AC2ELL, // tan(0.48261257007201) = 0.52393604417110
-    0x000000008721D824LL, // tan(0.48568653548648) = 0.52786017310124
-    0x000000008823DA1ALL, // tan(0.48876050090096) = 0.53179705753985
-    0x000000008926B45DLL, // tan(0.49183446631543) = 0.53574683454771
-    0x000000008A2A6940LL, // tan(0.49490843172990) = 0.53970964257370
-    0x000000008B2EFB1BLL, // tan(0.49798239714437) = 0.54368562147590
-    0x000000008C346C4ELL, // tan(0.50105636255884) = 0.54767491254312
-    0x000000008D3ABF3DLL, // tan(0.50413032797331) = 0.55167765851672
-    0x000000008E41F654LL, // tan(0.50720429338778) = 0.55569400361286
-    0x000000008F4A1404LL, // tan(0.51027825880226) = 0.55972409354506
-    0x0000000090531AC7LL, // tan(0.51335222421673) = 0.56376807554719
-    0x00000000915D0D1ALL, // tan(0.51642618963120) = 0.56782609839684
-    0x000000009267ED84LL, // tan(0.51950015504567) = 0.57189831243910
-    0x000000009373BE91LL, // tan(0.52257412046014) = 0.57598486961070
-    0x00000000948082D6LL, // tan(0.52564808587461) = 0.58008592346463
-    0x00000000958E3CEBLL, // tan(0.52872205128908) = 0.58420162919514
-    0x00000000969CEF74LL, // tan(0.53179601670356) = 0.58833214366319
-    0x0000000097AC9D18LL, // tan(0.53486998211803) = 0.59247762542236
-    0x0000000098BD4889LL, // tan(0.53794394753250) = 0.59663823474514
-    0x0000000099CEF47FLL, // tan(0.54101791294697) = 0.60081413364980
-    0x000000009AE1A3B7LL, // tan(0.54409187836144) = 0.60500548592763
-    0x000000009BF558FBLL, // tan(0.54716584377591) = 0.60921245717068
-    0x000000009D0A1719LL, // tan(0.55023980919038) = 0.61343521480006
-    0x000000009E1FE0E8LL, // tan(0.55331377460486) = 0.61767392809462
-    0x000000009F36B947LL, // tan(0.55638774001933) = 0.62192876822030
-    0x00000000A04EA31ELL, // tan(0.55946170543380) = 0.62619990825982
-    0x00000000A167A15CLL, // tan(0.56253567084827) = 0.63048752324308
-    0x00000000A281B6FALL, // tan(0.56560963626274) = 0.63479179017799
-    0x00000000A39CE6F8LL, // tan(0.56868360167721) = 0.63911288808191
-    0x00000000A4B93461LL, // tan(0.57175756709168) = 0.64345099801364
-    0x00000000A5D6A245LL, // tan(0.57483153250616) = 0.64780630310598
-    0x00000000A6F533C3LL, // tan(0.57790549792063) = 0.65217898859897
-    0x00000000A814EBFDLL, // tan(0.58097946333510) = 0.65656924187360
-    0x00000000A935CE22LL, // tan(0.58405342874957) = 0.66097725248626
-    0x00000000AA57DD6BLL, // tan(0.58712739416404) = 0.66540321220378
-    0x00000000AB7B1D17LL, // tan(0.59020135957851) = 0.66984731503910
-    0x00000000AC9F9072LL, // tan(0.59327532499298) = 0.67430975728765
-    0x00000000ADC53AD2LL, // tan(0.59634929040746) = 0.67879073756437
-    0x00000000AEEC1F95LL, // tan(0.59942325582193) = 0.68329045684147
-    0x00000000B0144225LL, // tan(0.60249722123640) = 0.68780911848682
-    0x00000000B13DA5F6LL, // tan(0.60557118665087) = 0.69234692830316
-    0x00000000B2684E86LL, // tan(0.60864515206534) = 0.69690409456796
-    0x00000000B3943F5FLL, // tan(0.61171911747981) = 0.70148082807416
-    0x00000000B4C17C15LL, // tan(0.61479308289428) = 0.70607734217152
-    0x00000000B5F00847LL, // tan(0.61786704830876) = 0.71069385280893
-    0x00000000B71FE7A0LL, // tan(0.62094101372323) = 0.71533057857742
-    0x00000000B8511DD8LL, // tan(0.62401497913770) = 0.71998774075404
-    0x00000000B983AEAFLL, // tan(0.62708894455217) = 0.72466556334658
-    0x00000000BAB79DF4LL, // tan(0.63016290996664) = 0.72936427313919
-    0x00000000BBECEF80LL, // tan(0.63323687538111) = 0.73408409973882
-    0x00000000BD23A73CLL, // tan(0.63631084079558) = 0.73882527562266
-    0x00000000BE5BC919LL, // tan(0.63938480621006) = 0.74358803618641
-    0x00000000BF955917LL, // tan(0.64245877162453) = 0.74837261979361
-    0x00000000C0D05B43LL, // tan(0.64553273703900) = 0.75317926782582
-    0x00000000C20CD3B7LL, // tan(0.64860670245347) = 0.75800822473393
-    0x00000000C34AC69ALL, // tan(0.65168066786794) = 0.76285973809037
-    0x00000000C48A3821LL, // tan(0.65475463328241) = 0.76773405864245
-    0x00000000C5CB2C90LL, // tan(0.65782859869688) = 0.77263144036673
-    0x00000000C70DA836LL, // tan(0.66090256411136) = 0.77755214052449
-    0x00000000C851AF73LL, // tan(0.66397652952583) = 0.78249641971831
-    0x00000000C99746B6LL, // tan(0.66705049494030) = 0.78746454194982
-    0x00000000CADE727ALL, // tan(0.67012446035477) = 0.79245677467863
-    0x00000000CC27374CLL, // tan(0.67319842576924) = 0.79747338888240
-    0x00000000CD7199C7LL, // tan(0.67627239118371) = 0.80251465911824
-    0x00000000CEBD9E95LL, // tan(0.67934635659818) = 0.80758086358528
-    0x00000000D00B4A72LL, // tan(0.68242032201266) = 0.81267228418858
-    0x00000000D15AA229LL, // tan(0.68549428742713) = 0.81778920660437
-    0x00000000D2ABAA94LL, // tan(0.68856825284160) = 0.82293192034661
-    0x00000000D3FE68A1LL, // tan(0.69164221825607) = 0.82810071883499
-    0x00000000D552E14CLL, // tan(0.69471618367054) = 0.83329589946428
-    0x00000000D6A919A4LL, // tan(0.69779014908501) = 0.83851776367523
-    0x00000000D80116C9LL, // tan(0.70086411449948) = 0.84376661702687
-    0x00000000D95ADDEELL, // tan(0.70393807991396) = 0.84904276927043
-    0x00000000DAB67458LL, // tan(0.70701204532843) = 0.85434653442476
-    0x00000000DC13DF5ELL, // tan(0.71008601074290) = 0.85967823085341
-    0x00000000DD73246ALL, // tan(0.71315997615737) = 0.86503818134331
-    0x00000000DED448FALL, // tan(0.71623394157184) = 0.87042671318522
-    0x00000000E03752A0LL, // tan(0.71930790698631) = 0.87584415825581
-    0x00000000E19C4700LL, // tan(0.72238187240078) = 0.88129085310159
-    0x00000000E3032BD5LL, // tan(0.72545583781526) = 0.88676713902468
-    0x00000000E46C06EDLL, // tan(0.72852980322973) = 0.89227336217035
-    0x00000000E5D6DE2DLL, // tan(0.73160376864420) = 0.89780987361662
-    0x00000000E743B78DLL, // tan(0.73467773405867) = 0.90337702946570
-    0x00000000E8B2991DLL, // tan(0.73775169947314) = 0.90897519093752
-    0x00000000EA238904LL, // tan(0.74082566488761) = 0.91460472446533
-    0x00000000EB968D7DLL, // tan(0.74389963030208) = 0.92026600179337
-    0x00000000ED0BACDCLL, // tan(0.74697359571656) = 0.92595940007679
-    0x00000000EE82ED8ELL, // tan(0.75004756113103) = 0.93168530198376
-    0x00000000EFFC5615LL, // tan(0.75312152654550) = 0.93744409579992
-    0x00000000F177ED0ELL, // tan(0.75619549195997) = 0.94323617553513
-    0x00000000F2F5B92ELL, // tan(0.75926945737444) = 0.94906194103267
-    0x00000000F475C144LL, // tan(0.76234342278891) = 0.95492179808096
-    0x00000000F5F80C3ALL, // tan(0.76541738820338) = 0.96081615852778
-    0x00000000F77CA112LL, // tan(0.76849135361786) = 0.96674544039710
-    0x00000000F90386EALL, // tan(0.77156531903233) = 0.97271006800868
-    0x00000000FA8CC4FDLL, // tan(0.77463928444680) = 0.97871047210033
-    0x00000000FC1862A2LL, // tan(0.77771324986127) = 0.98474708995309
-    0x00000000FDA6674ALL, // tan(0.78078721527574) = 0.99082036551927
-    0x00000000FF36DA85LL, // tan(0.78386118069021) = 0.99693074955354
-    0x0000000100C9C402LL, // tan(0.78693514610468) = 1.00307869974703
-    0x00000001025F2B8DLL, // tan(0.79000911151916) = 1.00926468086465
-    0x0000000103F71910LL, // tan(0.79308307693363) = 1.01548916488561
-    0x0000000105919497LL, // tan(0.79615704234810) = 1.02175263114737
-    0x00000001072EA64CLL, // tan(0.79923100776257) = 1.02805556649289
-    0x0000000108CE567CLL, // tan(0.80230497317704) = 1.03439846542151
-    0x000000010A70AD93LL, // tan(0.80537893859151) = 1.04078183024343
-    0x000000010C15B421LL, // tan(0.80845290400598) = 1.04720617123793
-    0x000000010DBD72D9LL, // tan(0.81152686942046) = 1.05367200681539
-    0x000000010F67F292LL, // tan(0.81460083483493) = 1.06017986368331
-    0x0000000111153C45LL, // tan(0.81767480024940) = 1.06673027701636
-    0x0000000112C55912LL, // tan(0.82074876566387) = 1.07332379063057
-    0x000000011478523FLL, // tan(0.82382273107834) = 1.07996095716192
-    0x00000001162E3139LL, // tan(0.82689669649281) = 1.08664233824921
-    0x0000000117E6FF92LL, // tan(0.82997066190728) = 1.09336850472163
-    0x0000000119A2C707LL, // tan(0.83304462732176) = 1.10014003679088
-    0x000000011B61917CLL, // tan(0.83611859273623) = 1.10695752424815
-    0x000000011D236902LL, // tan(0.83919255815070) = 1.11382156666615
-    0x000000011EE857D2LL, // tan(0.84226652356517) = 1.12073277360608
-    0x0000000120B06851LL, // tan(0.84534048897964) = 1.12769176483001
-    0x00000001227BA514LL, // tan(0.84841445439411) = 1.13469917051859
-    0x00000001244A18D9LL, // tan(0.85148841980858) = 1.14175563149435
-    0x00000001261BCE90LL, // tan(0.85456238522306) = 1.14886179945077
-    0x0000000127F0D157LL, // tan(0.85763635063753) = 1.15601833718727
-    0x0000000129C92C7FLL, // tan(0.86071031605200) = 1.16322591885024
-    0x000000012BA4EB88LL, // tan(0.86378428146647) = 1.17048523018041
-    0x000000012D841A26LL, // tan(0.86685824688094) = 1.17779696876671
-    0x000000012F66C441LL, // tan(0.86993221229541) = 1.18516184430671
-    0x00000001314CF5F8LL, // tan(0.87300617770988) = 1.19258057887408
-    0x000000013336BB9CLL, // tan(0.87608014312436) = 1.20005390719298
-    0x00000001352421BBLL, // tan(0.87915410853883) = 1.20758257691993
-    0x0000000137153516LL, // tan(0.88222807395330) = 1.21516734893308
-    0x00000001390A02AELL, // tan(0.88530203936777) = 1.22280899762937
-    0x000000013B0297BALL, // tan(0.88837600478224) = 1.23050831122961
-    0x000000013CFF01B1LL, // tan(0.89144997019671) = 1.23826609209197
-    0x000000013EFF4E47LL, // tan(0.89452393561118) = 1.24608315703384
-    0x0000000141038B70LL, // tan(0.89759790102566) = 1.25396033766270
-    0x00000001430BC761LL, // tan(0.90067186644013) = 1.26189848071592
-    0x0000000145181091LL, // tan(0.90374583185460) = 1.26989844841004
-    0x00000001472875BALL, // tan(0.90681979726907) = 1.27796111879974
-    0x00000001493D05DFLL, // tan(0.90989376268354) = 1.28608738614681
-    0x000000014B55D046LL, // tan(0.91296772809801) = 1.29427816129945
-    0x000000014D72E482LL, // tan(0.91604169351248) = 1.30253437208225
-    0x000000014F94526CLL, // tan(0.91911565892696) = 1.31085696369722
-    0x0000000151BA2A2FLL, // tan(0.92218962434143) = 1.31924689913624
-    0x0000000153E47C3FLL, // tan(0.92526358975590) = 1.32770515960518
-    0x0000000156135963LL, // tan(0.92833755517037) = 1.33623274496037
-    0x000000015846D2B4LL, // tan(0.93141152058484) = 1.34483067415747
-    0x000000015A7EF99DLL, // tan(0.93448548599931) = 1.35349998571345
-    0x000000015CBBDFE2LL, // tan(0.93755945141378) = 1.36224173818203
-    0x000000015EFD979DLL, // tan(0.94063341682826) = 1.37105701064298
-    0x0000000161443343LL, // tan(0.94370738224273) = 1.37994690320580
-    0x00000001638FC5A5LL, // tan(0.94678134765720) = 1.38891253752836
-    0x0000000165E061F4LL, // tan(0.94985531307167) = 1.39795505735083
-    0x0000000168361BC1LL, // tan(0.95292927848614) = 1.40707562904564
-    0x000000016A910702LL, // tan(0.95600324390061) = 1.41627544218389
-    0x000000016CF13811LL, // tan(0.95907720931508) = 1.42555571011883
-    0x000000016F56C3B3LL, // tan(0.96215117472956) = 1.43491767058699
-    0x0000000171C1BF17LL, // tan(0.96522514014403) = 1.44436258632772
-    0x0000000174323FDBLL, // tan(0.96829910555850) = 1.45389174572154
-    0x0000000176A85C0DLL, // tan(0.97137307097297) = 1.46350646344824
-    0x0000000179242A30LL, // tan(0.97444703638744) = 1.47320808116532
-    0x000000017BA5C13DLL, // tan(0.97752100180191) = 1.48299796820740
-    0x000000017E2D38A7LL, // tan(0.98059496721638) = 1.49287752230766
-    0x0000000180BAA85ELL, // tan(0.98366893263085) = 1.50284817034180
-    0x00000001834E28D4LL, // tan(0.98674289804533) = 1.51291136909555
-    0x0000000185E7D2FCLL, // tan(0.98981686345980) = 1.52306860605651
-    0x000000018887C054LL, // tan(0.99289082887427) = 1.53332140023129
-    0x000000018B2E0AE2LL, // tan(0.99596479428874) = 1.54367130298885
-    0x000000018DDACD3BLL, // tan(0.99903875970321) = 1.55411989893099
-    0x00000001908E228ALL, // tan(1.00211272511768) = 1.56466880679119
-    0x000000019348268BLL, // tan(1.00518669053215) = 1.57531968036260
-    0x000000019608F59ALL, // tan(1.00826065594663) = 1.58607420945657
-    0x0000000198D0ACAFLL, // tan(1.01133462136110) = 1.59693412089273
-    0x000000019B9F6965LL, // tan(1.01440858677557) = 1.60790117952187
-    0x000000019E754A00LL, // tan(1.01748255219004) = 1.61897718928296
-    0x00000001A1526D72LL, // tan(1.02055651760451) = 1.63016399429553
-    0x00000001A436F35CLL, // tan(1.02363048301898) = 1.64146347998894
-    0x00000001A722FC15LL, // tan(1.02670444843345) = 1.65287757426983
-    0x00000001AA16A8B3LL, // tan(1.02977841384793) = 1.66440824872950
-    0x00000001AD121B0ALL, // tan(1.03285237926240) = 1.67605751989254
-    0x00000001B01575B5LL, // tan(1.03592634467687) = 1.68782745050859
-    0x00000001B320DC1CLL, // tan(1.03900031009134) = 1.69972015088892
-    0x00000001B6347279LL, // tan(1.04207427550581) = 1.71173778028951
-    0x00000001B9505DDFLL, // tan(1.04514824092028) = 1.72388254834282
-    0x00000001BC74C43ELL, // tan(1.04822220633475) = 1.73615671653995
-    0x00000001BFA1CC6DLL, // tan(1.05129617174923) = 1.74856259976548
-    0x00000001C2D79E2DLL, // tan(1.05437013716370) = 1.76110256788712
-    0x00000001C6166236LL, // tan(1.05744410257817) = 1.77377904740245
-    0x00000001C95E4238LL, // tan(1.06051806799264) = 1.78659452314517
-    0x00000001CCAF68E3LL, // tan(1.06359203340711) = 1.79955154005346
-    0x00000001D00A01F6LL, // tan(1.06666599882158) = 1.81265270500289
-    0x00000001D36E3A3FLL, // tan(1.06973996423605) = 1.82590068870695
-    0x00000001D6DC3FA7LL, // tan(1.07281392965053) = 1.83929822768787
-    0x00000001DA54413BLL, // tan(1.07588789506500) = 1.85284812632090
-    0x00000001DDD66F33LL, // tan(1.07896186047947) = 1.86655325895526
-    0x00000001E162FB00LL, // tan(1.08203582589394) = 1.88041657211514
-    0x00000001E4FA174FLL, // tan(1.08510979130841) = 1.89444108678419
-    0x00000001E89BF81CLL, // tan(1.08818375672288) = 1.90862990077742
-    0x00000001EC48D2B1LL, // tan(1.09125772213735) = 1.92298619120426
-    0x00000001F000DDBELL, // tan(1.09433168755183) = 1.93751321702699
-    0x00000001F3C4515ALL, // tan(1.09740565296630) = 1.95221432171880
-    0x00000001F7936714LL, // tan(1.10047961838077) = 1.96709293602611
-    0x00000001FB6E59FELL, // tan(1.10355358379524) = 1.98215258083995
-    0x00000001FF5566BALL, // tan(1.10662754920971) = 1.99739687018139
-    0x000000020348CB88LL, // tan(1.10970151462418) = 2.01282951430639
-    0x000000020748C852LL, // tan(1.11277548003865) = 2.02845432293569
-    0x000000020B559EBDLL, // tan(1.11584944545313) = 2.04427520861562
-    0x000000020F6F9235LL, // tan(1.11892341086760) = 2.06029619021610
-    0x000000021396E7FFLL, // tan(1.12199737628207) = 2.07652139657234
-    0x0000000217CBE74ALL, // tan(1.12507134169654) = 2.09295507027730
-    0x000000021C0ED93DLL, // tan(1.12814530711101) = 2.10960157163212
-    0x000000022060090BLL, // tan(1.13121927252548) = 2.12646538276228
-    0x0000000224BFC402LL, // tan(1.13429323793995) = 2.14355111190772
-    0x00000002292E59A6LL, // tan(1.13736720335443) = 2.16086349789549
-    0x000000022DAC1BBBLL, // tan(1.14044116876890) = 2.17840741480409
-    0x0000000232395E62LL, // tan(1.14351513418337) = 2.19618787682913
-    0x0000000236D6782ALL, // tan(1.14658909959784) = 2.21421004336053
-    0x000000023B83C229LL, // tan(1.14966306501231) = 2.23247922428213
-    0x0000000240419812LL, // tan(1.15273703042678) = 2.25100088550501
-    0x0000000245105851LL, // tan(1.15581099584125) = 2.26978065474682
-    0x0000000249F06421LL, // tan(1.15888496125573) = 2.28882432756981
-    0x000000024EE21FAALL, // tan(1.16195892667020) = 2.30813787369130
-    0x0000000253E5F21CLL, // tan(1.16503289208467) = 2.32772744358095
-    0x0000000258FC45CDLL, // tan(1.16810685749914) = 2.34759937536020
-    0x000000025E258858LL, // tan(1.17118082291361) = 2.36776020202016
-    0x0000000263622ABELL, // tan(1.17425478832808) = 2.38821665897519
-    0x0000000268B2A185LL, // tan(1.17732875374255) = 2.40897569197053
-    0x000000026E1764E2LL, // tan(1.18040271915703) = 2.43004446536357
-    0x000000027390F0D7LL, // tan(1.18347668457150) = 2.45143037079942
-    0x00000002791FC55DLL, // tan(1.18655064998597) = 2.47314103630289
-    0x000000027EC4668FLL, // tan(1.18962461540044) = 2.49518433581044
-    0x00000002847F5CD3LL, // tan(1.19269858081491) = 2.51756839916710
-    0x000000028A513507LL, // tan(1.19577254622938) = 2.54030162261494
-    0x00000002903A80AELL, // tan(1.19884651164385) = 2.56339267980181
-    0x00000002963BD628LL, // tan(1.20192047705833) = 2.58685053334030
-    0x000000029C55D0DFLL, // tan(1.20499444247280) = 2.61068444694966
-    0x00000002A2891184LL, // tan(1.20806840788727) = 2.63490399821503
-    0x00000002A8D63E43LL, // tan(1.21114237330174) = 2.65951909200098
-    0x00000002AF3E0303LL, // tan(1.21421633871621) = 2.68453997455889
-    0x00000002B5C111A6LL, // tan(1.21729030413068) = 2.70997724837034
-    0x00000002BC60224BLL, // tan(1.22036426954515) = 2.73584188777167
-    0x00000002C31BF392LL, // tan(1.22343823495963) = 2.76214525540829
-    0x00000002C9F54AEELL, // tan(1.22651220037410) = 2.78889911957033
-    0x00000002D0ECF4EALL, // tan(1.22958616578857) = 2.81611567246541
-    0x00000002D803C585LL, // tan(1.23266013120304) = 2.84380754948814
-    0x00000002DF3A9880LL, // tan(1.23573409661751) = 2.87198784955019
-    0x00000002E69251C2LL, // tan(1.23880806203198) = 2.90067015653999
-    0x00000002EE0BDDB7LL, // tan(1.24188202744645) = 2.92986856198560
-    0x00000002F5A831B3LL, // tan(1.24495599286093) = 2.95959768900048
-    0x00000002FD684C65LL, // tan(1.24802995827540) = 2.98987271759753
-    0x00000003054D3644LL, // tan(1.25110392368987) = 3.02070941146361
-    0x000000030D58020FLL, // tan(1.25417788910434) = 3.05212414629367
-    0x000000031589CD47LL, // tan(1.25725185451881) = 3.08413393979166
-    0x000000031DE3C0BELL, // tan(1.26032581993328) = 3.11675648345355
-    0x0000000326671121LL, // tan(1.26339978534775) = 3.15001017625747
-    0x000000032F14FF98LL, // tan(1.26647375076223) = 3.18391416039559
-    0x0000000337EEDA65LL, // tan(1.26954771617670) = 3.21848835919364
-    0x0000000340F5FD92LL, // tan(1.27262168159117) = 3.25375351737603
-    0x000000034A2BD3A8LL, // tan(1.27569564700564) = 3.28973124384746
-    0x000000035391D675LL, // tan(1.27876961242011) = 3.32644405717662
-    0x000000035D298FD7LL, // tan(1.28184357783458) = 3.36391543398297
-    0x0000000366F49A9ELL, // tan(1.28491754324905) = 3.40216986044537
-    0x0000000370F4A374LL, // tan(1.28799150866353) = 3.44123288716985
-    0x000000037B2B69DCLL, // tan(1.29106547407800) = 3.48113118767513
-    0x00000003859AC13ALL, // tan(1.29413943949247) = 3.52189262077711
-    0x00000003904491F4LL, // tan(1.29721340490694) = 3.56354629717903
-    0x000000039B2ADAA1LL, // tan(1.30028737032141) = 3.60612265060193
-    0x00000003A64FB153LL, // tan(1.30336133573588) = 3.64965351382062
-    0x00000003B1B544F0LL, // tan(1.30643530115035) = 3.69417220000444
-    0x00000003BD5DDEACLL, // tan(1.30950926656483) = 3.73971358979980
-    0x00000003C94BE397LL, // tan(1.31258323197930) = 3.78631422463280
-    0x00000003D581D64BLL, // tan(1.31565719739377) = 3.83401240675671
-    0x00000003E20258BCLL, // tan(1.31873116280824) = 3.88284830661987
-    0x00000003EED02E23LL, // tan(1.32180512822271) = 3.93286407818690
-    0x00000003FBEE3D16LL, // tan(1.32487909363718) = 3.98410398290889
-    0x00000004095F91C3LL, // tan(1.32795305905165) = 4.03661452310909
-    0x0000000417276059LL, // tan(1.33102702446613) = 4.09044458562900
-    0x00000004254907A2LL, // tan(1.33410098988060) = 4.14564559666771
-    0x0000000433C813D0LL, // tan(1.33717495529507) = 4.20227168884530
-    0x0000000442A84184LL, // tan(1.34024892070954) = 4.26037988163142
-    0x0000000451ED8112LL, // tan(1.34332288612401) = 4.32003027640311
-    0x00000004619BFA11LL, // tan(1.34639685153848) = 4.38128626753482
-    0x0000000471B80F2ALL, // tan(1.34947081695295) = 4.44421477107924
-    0x0000000482466245LL, // tan(1.35254478236743) = 4.50888647277324
-    0x00000004934BD910LL, // tan(1.35561874778190) = 4.57537609730152
-    0x00000004A4CDA1E3LL, // tan(1.35869271319637) = 4.64376270097440
-    0x00000004B6D13919LL, // tan(1.36176667861084) = 4.71412999023021
-    0x00000004C95C6EE6LL, // tan(1.36484064402531) = 4.78656666866014
-    0x00000004DC756DADLL, // tan(1.36791460943978) = 4.86116681558097
-    0x00000004F022C0F3LL, // tan(1.37098857485425) = 4.93803029955282
-    0x00000005046B5CF3LL, // tan(1.37406254026873) = 5.01726323066424
-    0x000000051956A6EFLL, // tan(1.37713650568320) = 5.09897845589207
-    0x000000052EEC7E4DLL, // tan(1.38021047109767) = 5.18329610239937
-    0x000000054535469BLL, // tan(1.38328443651214) = 5.27034417427236
-    0x000000055C39F290LL, // tan(1.38635840192661) = 5.36025920893122
-    0x0000000574041031LL, // tan(1.38943236734108) = 5.45318700029440
-    0x000000058C9DD631LL, // tan(1.39250633275555) = 5.54928339675305
-    0x00000005A61232C0LL, // tan(1.39558029817003) = 5.64871518314277
-    0x00000005C06CDBEALL, // tan(1.39865426358450) = 5.75166105721233
-    0x00000005DBBA61C6LL, // tan(1.40172822899897) = 5.85831271261619
-    0x00000005F80842A3LL, // tan(1.40480219441344) = 5.96887604223961
-    0x0000000615650182LL, // tan(1.40787615982791) = 6.08357247774909
-    0x0000000633E03F2ALL, // tan(1.41095012524238) = 6.20264048370650
-    0x00000006538AD627LL, // tan(1.41402409065685) = 6.32633722746114
-    0x000000067476FA2FLL, // tan(1.41709805607133) = 6.45494044942900
-    0x0000000696B85B5ALL, // tan(1.42017202148580) = 6.58875056238570
-    0x00000006BA644DC0LL, // tan(1.42324598690027) = 6.72809301317107
-    0x00000006DF91F625LL, // tan(1.42631995231474) = 6.87332094588792
-    0x00000007065A7C82LL, // tan(1.42939391772921) = 7.02481821247457
-    0x000000072ED9453FLL, // tan(1.43246788314368) = 7.18300278468699
-    0x00000007592C323DLL, // tan(1.43554184855815) = 7.34833063135130
-    0x000000078573ECFELL, // tan(1.43861581397263) = 7.52130013662815
-    0x00000007B3D43B53LL, // tan(1.44168977938710) = 7.70245714945778
-    0x00000007E4746082LL, // tan(1.44476374480157) = 7.89240077194823
-    0x00000008177F8CECLL, // tan(1.44783771021604) = 8.09179001602175
-    0x000000084D255EF1LL, // tan(1.45091167563051) = 8.30135148416068
-    0x00000008859A781DLL, // tan(1.45398564104498) = 8.52188826290262
-    0x00000008C1192A98LL, // tan(1.45705960645945) = 8.75429025852409
-    0x00000008FFE2436DLL, // tan(1.46013357187393) = 8.99954625533798
-    0x00000009423DF78CLL, // tan(1.46320753728840) = 9.25875804112781
-    0x00000009887CFA93LL, // tan(1.46628150270287) = 9.53315702530563
-    0x00000009D2F9C852LL, // tan(1.46935546811734) = 9.82412387855317
-    0x0000000A221A2C10LL, // tan(1.47242943353181) = 10.13321185489565
-    0x0000000A7651138FLL, // tan(1.47550339894628) = 10.46217462772541
-    0x0000000AD020BF75LL, // tan(1.47857736436075) = 10.81299969303020
-    0x0000000B301D67A9LL, // tan(1.48165132977523) = 11.18794868363424
-    0x0000000B96F0709FLL, // tan(1.48472529518970) = 11.58960632220521
-    0x0000000C055C5724LL, // tan(1.48779926060417) = 12.02094025270713
-    0x0000000C7C4183D5LL, // tan(1.49087322601864) = 12.48537467911178
-    0x0000000CFCA44711LL, // tan(1.49394719143311) = 12.98688167740056
-    0x0000000D87B453F2LL, // tan(1.49702115684758) = 13.53009533556712
-    0x0000000E1ED62EC8LL, // tan(1.50009512226205) = 14.12045566927254
-    0x0000000EC3AF2E1FLL, // tan(1.50316908767653) = 14.76439178722480
-    0x0000000F7834E9BFLL, // tan(1.50624305309100) = 15.46955738952378
-    0x000000103EC14AFBLL, // tan(1.50931701850547) = 16.24513691550967
-    0x000000111A2CF2FCLL, // tan(1.51239098391994) = 17.10224836987934
-    0x000000120DF26DD8LL, // tan(1.51546494933441) = 18.05448042417475
-    0x000000131E5DD1FCLL, // tan(1.51853891474888) = 19.11861908350262
-    0x0000001450CE3B6FLL, // tan(1.52161288016335) = 20.31564685327388
-    0x00000015AC117858LL, // tan(1.52468684557783) = 21.67214157263888
-    0x0000001738E6FF75LL, // tan(1.52776081099230) = 23.22227474796629
-    0x0000001902BF5856LL, // tan(1.53083477640677) = 25.01073219408138
-    0x0000001B18DB37B8LL, // tan(1.53390874182124) = 27.09709499612344
-    0x0000001D900736F3LL, // tan(1.53698270723571) = 29.56261008696180
-    0x000000208561C648LL, // tan(1.54005667265018) = 32.52102317106132
-    0x0000002422FA6B61LL, // tan(1.54313063806465) = 36.13663359759160
-    0x00000028A7E86EB7LL, // tan(1.54620460347913) = 40.65589038836796
-    0x0000002E775066B7LL, // tan(1.54927856889360) = 46.46607057545611
-    0x00000036366F4E07LL, // tan(1.55235253430807) = 54.21263587638135
-    0x000000410EB2E7C7LL, // tan(1.55542649972254) = 65.05741737958891
-    0x0000005152F6BA28LL, // tan(1.55850046513701) = 81.32407725809442
-    0x0000006C6F3AFE2FLL, // tan(1.56157443055148) = 108.43449391043538
-    0x000000A2A7805EC8LL, // tan(1.56464839596595) = 162.65430252447683
-    0x000001454FCA324FLL, // tan(1.56772236138043) = 325.31167902405042
-    0x7FFFFFFFFFFFFFFFLL, // tan(1.57079632679490) = 2147483648.00000000000000
-    0x7FFFFFFFFFFFFFFFLL  // tan(1.57079632679490) = 2147483648.00000000000000
+    0x0000000000C91004LL, // tan(0.00306796157577) = 0.00306797120142
+    0x0000000001922100LL, // tan(0.00613592315154) = 0.00613600015762
+    0x00000000025B33ECLL, // tan(0.00920388472731) = 0.00920414462773
+    0x00000000032449C1LL, // tan(0.01227184630309) = 0.01227246237957
+    0x0000000003ED6375LL, // tan(0.01533980787886) = 0.01534101119401
+    0x0000000004B68203LL, // tan(0.01840776945463) = 0.01840984886934
+    0x00000000057FA661LL, // tan(0.02147573103040) = 0.02147903322559
+    0x000000000648D189LL, // tan(0.02454369260617) = 0.02454862210893
+    0x0000000007120473LL, // tan(0.02761165418194) = 0.02761867339598
+    0x0000000007DB4018LL, // tan(0.03067961575771) = 0.03068924499824
+    0x0000000008A48570LL, // tan(0.03374757733348) = 0.03376039486642
+    0x00000000096DD575LL, // tan(0.03681553890926) = 0.03683218099485
+    0x000000000A373120LL, // tan(0.03988350048503) = 0.03990466142583
+    0x000000000B00996ALL, // tan(0.04295146206080) = 0.04297789425406
+    0x000000000BCA0F4ELL, // tan(0.04601942363657) = 0.04605193763104
+    0x000000000C9393C5LL, // tan(0.04908738521234) = 0.04912684976947
+    0x000000000D5D27CALL, // tan(0.05215534678811) = 0.05220268894766
+    0x000000000E26CC57LL, // tan(0.05522330836388) = 0.05527951351399
+    0x000000000EF08267LL, // tan(0.05829126993965) = 0.05835738189135
+    0x000000000FBA4AF5LL, // tan(0.06135923151543) = 0.06143635258159
+    0x00000000108426FELL, // tan(0.06442719309120) = 0.06451648416998
+    0x00000000114E177CLL, // tan(0.06749515466697) = 0.06759783532971
+    0x0000000012181D6DLL, // tan(0.07056311624274) = 0.07068046482636
+    0x0000000012E239CDLL, // tan(0.07363107781851) = 0.07376443152245
+    0x0000000013AC6D9ALL, // tan(0.07669903939428) = 0.07684979438194
+    0x000000001476B9D0LL, // tan(0.07976700097005) = 0.07993661247478
+    0x0000000015411F6FLL, // tan(0.08283496254582) = 0.08302494498146
+    0x00000000160B9F76LL, // tan(0.08590292412160) = 0.08611485119763
+    0x0000000016D63AE2LL, // tan(0.08897088569737) = 0.08920639053862
+    0x0000000017A0F2B4LL, // tan(0.09203884727314) = 0.09229962254415
+    0x00000000186BC7EDLL, // tan(0.09510680884891) = 0.09539460688289
+    0x000000001936BB8CLL, // tan(0.09817477042468) = 0.09849140335716
+    0x000000001A01CE94LL, // tan(0.10124273200045) = 0.10159007190760
+    0x000000001ACD0207LL, // tan(0.10431069357622) = 0.10469067261785
+    0x000000001B9856E7LL, // tan(0.10737865515199) = 0.10779326571933
+    0x000000001C63CE37LL, // tan(0.11044661672777) = 0.11089791159591
+    0x000000001D2F68FDLL, // tan(0.11351457830354) = 0.11400467078878
+    0x000000001DFB283BLL, // tan(0.11658253987931) = 0.11711360400116
+    0x000000001EC70CF8LL, // tan(0.11965050145508) = 0.12022477210319
+    0x000000001F93183BLL, // tan(0.12271846303085) = 0.12333823613674
+    0x00000000205F4B09LL, // tan(0.12578642460662) = 0.12645405732033
+    0x00000000212BA66ALL, // tan(0.12885438618239) = 0.12957229705403
+    0x0000000021F82B68LL, // tan(0.13192234775817) = 0.13269301692438
+    0x0000000022C4DB0BLL, // tan(0.13499030933394) = 0.13581627870939
+    0x000000002391B65ELL, // tan(0.13805827090971) = 0.13894214438352
+    0x00000000245EBE6CLL, // tan(0.14112623248548) = 0.14207067612275
+    0x00000000252BF440LL, // tan(0.14419419406125) = 0.14520193630963
+    0x0000000025F958E7LL, // tan(0.14726215563702) = 0.14833598753835
+    0x0000000026C6ED70LL, // tan(0.15033011721279) = 0.15147289261995
+    0x000000002794B2E9LL, // tan(0.15339807878856) = 0.15461271458745
+    0x000000002862AA61LL, // tan(0.15646604036434) = 0.15775551670107
+    0x000000002930D4EALL, // tan(0.15953400194011) = 0.16090136245349
+    0x0000000029FF3394LL, // tan(0.16260196351588) = 0.16405031557512
+    0x000000002ACDC774LL, // tan(0.16566992509165) = 0.16720244003946
+    0x000000002B9C919CLL, // tan(0.16873788666742) = 0.17035780006844
+    0x000000002C6B9322LL, // tan(0.17180584824319) = 0.17351646013786
+    0x000000002D3ACD1BLL, // tan(0.17487380981896) = 0.17667848498282
+    0x000000002E0A409FLL, // tan(0.17794177139473) = 0.17984393960325
+    0x000000002ED9EEC6LL, // tan(0.18100973297051) = 0.18301288926943
+    0x000000002FA9D8AALL, // tan(0.18407769454628) = 0.18618539952758
+    0x000000003079FF65LL, // tan(0.18714565612205) = 0.18936153620552
+    0x00000000314A6414LL, // tan(0.19021361769782) = 0.19254136541832
+    0x00000000321B07D3LL, // tan(0.19328157927359) = 0.19572495357407
+    0x0000000032EBEBC1LL, // tan(0.19634954084936) = 0.19891236737966
+    0x0000000033BD10FELL, // tan(0.19941750242513) = 0.20210367384659
+    0x00000000348E78AALL, // tan(0.20248546400090) = 0.20529894029689
+    0x00000000356023EALL, // tan(0.20555342557668) = 0.20849823436904
+    0x00000000363213E0LL, // tan(0.20862138715245) = 0.21170162402398
+    0x00000000370449B1LL, // tan(0.21168934872822) = 0.21490917755117
+    0x0000000037D6C685LL, // tan(0.21475731030399) = 0.21812096357468
+    0x0000000038A98B84LL, // tan(0.21782527187976) = 0.22133705105937
+    0x00000000397C99D7LL, // tan(0.22089323345553) = 0.22455750931713
+    0x000000003A4FF2A9LL, // tan(0.22396119503130) = 0.22778240801314
+    0x000000003B239728LL, // tan(0.22702915660707) = 0.23101181717226
+    0x000000003BF78881LL, // tan(0.23009711818285) = 0.23424580718541
+    0x000000003CCBC7E5LL, // tan(0.23316507975862) = 0.23748444881607
+    0x000000003DA05685LL, // tan(0.23623304133439) = 0.24072781320682
+    0x000000003E753594LL, // tan(0.23930100291016) = 0.24397597188596
+    0x000000003F4A6648LL, // tan(0.24236896448593) = 0.24722899677418
+    0x00000000401FE9D6LL, // tan(0.24543692606170) = 0.25048696019131
+    0x0000000040F5C178LL, // tan(0.24850488763747) = 0.25374993486315
+    0x0000000041CBEE66LL, // tan(0.25157284921325) = 0.25701799392838
+    0x0000000042A271DELL, // tan(0.25464081078902) = 0.26029121094550
+    0x0000000043794D1DLL, // tan(0.25770877236479) = 0.26356965989992
+    0x0000000044508163LL, // tan(0.26077673394056) = 0.26685341521102
+    0x0000000045280FF1LL, // tan(0.26384469551633) = 0.27014255173943
+    0x0000000045FFFA0ALL, // tan(0.26691265709210) = 0.27343714479424
+    0x0000000046D840F5LL, // tan(0.26998061866787) = 0.27673727014041
+    0x0000000047B0E5F8LL, // tan(0.27304858024364) = 0.28004300400623
+    0x000000004889EA5CLL, // tan(0.27611654181942) = 0.28335442309078
+    0x0000000049634F6ELL, // tan(0.27918450339519) = 0.28667160457166
+    0x000000004A3D167BLL, // tan(0.28225246497096) = 0.28999462611261
+    0x000000004B1740D3LL, // tan(0.28532042654673) = 0.29332356587133
+    0x000000004BF1CFC6LL, // tan(0.28838838812250) = 0.29665850250742
+    0x000000004CCCC4ABLL, // tan(0.29145634969827) = 0.29999951519031
+    0x000000004DA820D5LL, // tan(0.29452431127404) = 0.30334668360734
+    0x000000004E83E5A0LL, // tan(0.29759227284981) = 0.30670008797200
+    0x000000004F601464LL, // tan(0.30066023442559) = 0.31005980903214
+    0x00000000503CAE7FLL, // tan(0.30372819600136) = 0.31342592807838
+    0x000000005119B551LL, // tan(0.30679615757713) = 0.31679852695260
+    0x0000000051F72A3BLL, // tan(0.30986411915290) = 0.32017768805651
+    0x0000000052D50EA2LL, // tan(0.31293208072867) = 0.32356349436034
+    0x0000000053B363EELL, // tan(0.31600004230444) = 0.32695602941167
+    0x0000000054922B86LL, // tan(0.31906800388021) = 0.33035537734433
+    0x00000000557166D7LL, // tan(0.32213596545598) = 0.33376162288743
+    0x0000000056511750LL, // tan(0.32520392703176) = 0.33717485137449
+    0x0000000057313E61LL, // tan(0.32827188860753) = 0.34059514875273
+    0x000000005811DD7FLL, // tan(0.33133985018330) = 0.34402260159243
+    0x0000000058F2F620LL, // tan(0.33440781175907) = 0.34745729709644
+    0x0000000059D489BDLL, // tan(0.33747577333484) = 0.35089932310981
+    0x000000005AB699D2LL, // tan(0.34054373491061) = 0.35434876812956
+    0x000000005B9927DFLL, // tan(0.34361169648638) = 0.35780572131452
+    0x000000005C7C3565LL, // tan(0.34667965806215) = 0.36127027249542
+    0x000000005D5FC3E9LL, // tan(0.34974761963793) = 0.36474251218496
+    0x000000005E43D4F3LL, // tan(0.35281558121370) = 0.36822253158815
+    0x000000005F286A0DLL, // tan(0.35588354278947) = 0.37171042261274
+    0x00000000600D84C5LL, // tan(0.35895150436524) = 0.37520627787976
+    0x0000000060F326ACLL, // tan(0.36201946594101) = 0.37871019073424
+    0x0000000061D95156LL, // tan(0.36508742751678) = 0.38222225525609
+    0x0000000062C0065BLL, // tan(0.36815538909255) = 0.38574256627112
+    0x0000000063A74754LL, // tan(0.37122335066833) = 0.38927121936217
+    0x00000000648F15E1LL, // tan(0.37429131224410) = 0.39280831088046
+    0x00000000657773A1LL, // tan(0.37735927381987) = 0.39635393795706
+    0x000000006660623ALL, // tan(0.38042723539564) = 0.39990819851454
+    0x000000006749E353LL, // tan(0.38349519697141) = 0.40347119127877
+    0x000000006833F899LL, // tan(0.38656315854718) = 0.40704301579092
+    0x00000000691EA3BALL, // tan(0.38963112012295) = 0.41062377241958
+    0x000000006A09E668LL, // tan(0.39269908169872) = 0.41421356237310
+    0x000000006AF5C25BLL, // tan(0.39576704327450) = 0.41781248771208
+    0x000000006BE2394BLL, // tan(0.39883500485027) = 0.42142065136208
+    0x000000006CCF4CF8LL, // tan(0.40190296642604) = 0.42503815712648
+    0x000000006DBCFF23LL, // tan(0.40497092800181) = 0.42866510969950
+    0x000000006EAB5191LL, // tan(0.40803888957758) = 0.43230161467952
+    0x000000006F9A460CLL, // tan(0.41110685115335) = 0.43594777858247
+    0x000000007089DE61LL, // tan(0.41417481272912) = 0.43960370885551
+    0x00000000717A1C61LL, // tan(0.41724277430489) = 0.44326951389086
+    0x00000000726B01E4LL, // tan(0.42031073588067) = 0.44694530303989
+    0x00000000735C90C1LL, // tan(0.42337869745644) = 0.45063118662733
+    0x00000000744ECAD8LL, // tan(0.42644665903221) = 0.45432727596585
+    0x000000007541B20BLL, // tan(0.42951462060798) = 0.45803368337067
+    0x0000000076354840LL, // tan(0.43258258218375) = 0.46175052217457
+    0x0000000077298F62LL, // tan(0.43565054375952) = 0.46547790674300
+    0x00000000781E8963LL, // tan(0.43871850533529) = 0.46921595248950
+    0x0000000079143835LL, // tan(0.44178646691106) = 0.47296477589132
+    0x000000007A0A9DD1LL, // tan(0.44485442848684) = 0.47672449450530
+    0x000000007B01BC36LL, // tan(0.44792239006261) = 0.48049522698401
+    0x000000007BF99565LL, // tan(0.45099035163838) = 0.48427709309207
+    0x000000007CF22B66LL, // tan(0.45405831321415) = 0.48807021372286
+    0x000000007DEB8045LL, // tan(0.45712627478992) = 0.49187471091535
+    0x000000007EE59613LL, // tan(0.46019423636569) = 0.49569070787129
+    0x000000007FE06EE7LL, // tan(0.46326219794146) = 0.49951832897264
+    0x0000000080DC0CDBLL, // tan(0.46633015951723) = 0.50335769979929
+    0x0000000081D87210LL, // tan(0.46939812109301) = 0.50720894714705
+    0x0000000082D5A0ADLL, // tan(0.47246608266878) = 0.51107219904594
+    0x0000000083D39ADCLL, // tan(0.47553404424455) = 0.51494758477875
+    0x0000000084D262CELL, // tan(0.47860200582032) = 0.51883523489998
+    0x0000000085D1FAB9LL, // tan(0.48166996739609) = 0.52273528125496
+    0x0000000086D264DALL, // tan(0.48473792897186) = 0.52664785699943
+    0x0000000087D3A372LL, // tan(0.48780589054763) = 0.53057309661929
+    0x0000000088D5B8C8LL, // tan(0.49087385212341) = 0.53451113595079
+    0x0000000089D8A72ALL, // tan(0.49394181369918) = 0.53846211220104
+    0x000000008ADC70EBLL, // tan(0.49700977527495) = 0.54242616396876
+    0x000000008BE11864LL, // tan(0.50007773685072) = 0.54640343126553
+    0x000000008CE69FF4LL, // tan(0.50314569842649) = 0.55039405553726
+    0x000000008DED0A03LL, // tan(0.50621366000226) = 0.55439817968611
+    0x000000008EF458FBLL, // tan(0.50928162157803) = 0.55841594809271
+    0x000000008FFC8F4FLL, // tan(0.51234958315380) = 0.56244750663883
+    0x000000009105AF78LL, // tan(0.51541754472958) = 0.56649300273034
+    0x00000000920FBBF7LL, // tan(0.51848550630535) = 0.57055258532070
+    0x00000000931AB751LL, // tan(0.52155346788112) = 0.57462640493467
+    0x000000009426A414LL, // tan(0.52462142945689) = 0.57871461369258
+    0x00000000953384D4LL, // tan(0.52768939103266) = 0.58281736533498
+    0x0000000096415C2CLL, // tan(0.53075735260843) = 0.58693481524762
+    0x0000000097502CC0LL, // tan(0.53382531418420) = 0.59106712048703
+    0x00000000985FF939LL, // tan(0.53689327575997) = 0.59521443980638
+    0x000000009970C448LL, // tan(0.53996123733575) = 0.59937693368192
+    0x000000009A8290A6LL, // tan(0.54302919891152) = 0.60355476433981
+    0x000000009B956114LL, // tan(0.54609716048729) = 0.60774809578343
+    0x000000009CA93859LL, // tan(0.54916512206306) = 0.61195709382120
+    0x000000009DBE1945LL, // tan(0.55223308363883) = 0.61618192609487
+    0x000000009ED406B1LL, // tan(0.55530104521460) = 0.62042276210833
+    0x000000009FEB037DLL, // tan(0.55836900679037) = 0.62467977325691
+    0x00000000A1031290LL, // tan(0.56143696836614) = 0.62895313285723
+    0x00000000A21C36DDLL, // tan(0.56450492994192) = 0.63324301617757
+    0x00000000A336735CLL, // tan(0.56757289151769) = 0.63754960046878
+    0x00000000A451CB0ELL, // tan(0.57064085309346) = 0.64187306499580
+    0x00000000A56E4100LL, // tan(0.57370881466923) = 0.64621359106966
+    0x00000000A68BD844LL, // tan(0.57677677624500) = 0.65057136208015
+    0x00000000A7AA93F7LL, // tan(0.57984473782077) = 0.65494656352908
+    0x00000000A8CA773FLL, // tan(0.58291269939654) = 0.65933938306406
+    0x00000000A9EB854CLL, // tan(0.58598066097231) = 0.66375001051302
+    0x00000000AB0DC156LL, // tan(0.58904862254809) = 0.66817863791930
+    0x00000000AC312E9FLL, // tan(0.59211658412386) = 0.67262545957741
+    0x00000000AD55D075LL, // tan(0.59518454569963) = 0.67709067206943
+    0x00000000AE7BAA2DLL, // tan(0.59825250727540) = 0.68157447430216
+    0x00000000AFA2BF28LL, // tan(0.60132046885117) = 0.68607706754486
+    0x00000000B0CB12D0LL, // tan(0.60438843042694) = 0.69059865546782
+    0x00000000B1F4A89BLL, // tan(0.60745639200271) = 0.69513944418152
+    0x00000000B31F8409LL, // tan(0.61052435357849) = 0.69969964227671
+    0x00000000B44BA8A4LL, // tan(0.61359231515426) = 0.70427946086504
+    0x00000000B5791A02LL, // tan(0.61666027673003) = 0.70887911362068
+    0x00000000B6A7DBC4LL, // tan(0.61972823830580) = 0.71349881682255
+    0x00000000B7D7F196LL, // tan(0.62279619988157) = 0.71813878939749
+    0x00000000B9095F31LL, // tan(0.62586416145734) = 0.72279925296421
+    0x00000000BA3C2857LL, // tan(0.62893212303311) = 0.72748043187808
+    0x00000000BB7050D9LL, // tan(0.63200008460888) = 0.73218255327684
+    0x00000000BCA5DC92LL, // tan(0.63506804618466) = 0.73690584712715
+    0x00000000BDDCCF69LL, // tan(0.63813600776043) = 0.74165054627204
+    0x00000000BF152D55LL, // tan(0.64120396933620) = 0.74641688647937
+    0x00000000C04EFA55LL, // tan(0.64427193091197) = 0.75120510649118
+    0x00000000C18A3A79LL, // tan(0.64733989248774) = 0.75601544807401
+    0x00000000C2C6F1DCLL, // tan(0.65040785406351) = 0.76084815607025
+    0x00000000C40524A6LL, // tan(0.65347581563928) = 0.76570347845053
+    0x00000000C544D710LL, // tan(0.65654377721505) = 0.77058166636706
+    0x00000000C6860D5DLL, // tan(0.65961173879083) = 0.77548297420820
+    0x00000000C7C8CBE0LL, // tan(0.66267970036660) = 0.78040765965394
+    0x00000000C90D16FALL, // tan(0.66574766194237) = 0.78535598373268
+    0x00000000CA52F31BLL, // tan(0.66881562351814) = 0.79032821087901
+    0x00000000CB9A64C1LL, // tan(0.67188358509391) = 0.79532460899278
+    0x00000000CCE3707BLL, // tan(0.67495154666968) = 0.80034544949932
+    0x00000000CE2E1AE5LL, // tan(0.67801950824545) = 0.80539100741088
+    0x00000000CF7A68ADLL, // tan(0.68108746982122) = 0.81046156138938
+    0x00000000D0C85E8ELL, // tan(0.68415543139700) = 0.81555739381043
+    0x00000000D2180157LL, // tan(0.68722339297277) = 0.82067879082866
+    0x00000000D36955E4LL, // tan(0.69029135454854) = 0.82582604244446
+    0x00000000D4BC6125LL, // tan(0.69335931612431) = 0.83099944257204
+    0x00000000D6112818LL, // tan(0.69642727770008) = 0.83619928910900
+    0x00000000D767AFCELL, // tan(0.69949523927585) = 0.84142588400725
+    0x00000000D8BFFD6ALL, // tan(0.70256320085162) = 0.84667953334559
+    0x00000000DA1A1621LL, // tan(0.70563116242739) = 0.85196054740362
+    0x00000000DB75FF39LL, // tan(0.70869912400317) = 0.85726924073743
+    0x00000000DCD3BE0CLL, // tan(0.71176708557894) = 0.86260593225674
+    0x00000000DE335808LL, // tan(0.71483504715471) = 0.86797094530380
+    0x00000000DF94D2ACLL, // tan(0.71790300873048) = 0.87336460773390
+    0x00000000E0F8338BLL, // tan(0.72097097030625) = 0.87878725199772
+    0x00000000E25D804FLL, // tan(0.72403893188202) = 0.88423921522535
+    0x00000000E3C4BEB3LL, // tan(0.72710689345779) = 0.88972083931221
+    0x00000000E52DF489LL, // tan(0.73017485503357) = 0.89523247100683
+    0x00000000E69927B7LL, // tan(0.73324281660934) = 0.90077446200054
+    0x00000000E8065E3ALL, // tan(0.73631077818511) = 0.90634716901915
+    0x00000000E9759E23LL, // tan(0.73937873976088) = 0.91195095391662
+    0x00000000EAE6ED9BLL, // tan(0.74244670133665) = 0.91758618377085
+    0x00000000EC5A52E1LL, // tan(0.74551466291242) = 0.92325323098156
+    0x00000000EDCFD44DLL, // tan(0.74858262448819) = 0.92895247337037
+    0x00000000EF47784CLL, // tan(0.75165058606396) = 0.93468429428314
+    0x00000000F0C14566LL, // tan(0.75471854763974) = 0.94044908269458
+    0x00000000F23D4239LL, // tan(0.75778650921551) = 0.94624723331524
+    0x00000000F3BB757ELL, // tan(0.76085447079128) = 0.95207914670093
+    0x00000000F53BE607LL, // tan(0.76392243236705) = 0.95794522936459
+    0x00000000F6BE9AC1LL, // tan(0.76699039394282) = 0.96384589389080
+    0x00000000F8439AB0LL, // tan(0.77005835551859) = 0.96978155905282
+    0x00000000F9CAECF8LL, // tan(0.77312631709436) = 0.97575264993238
+    0x00000000FB5498D6LL, // tan(0.77619427867013) = 0.98175959804223
+    0x00000000FCE0A5A3LL, // tan(0.77926224024591) = 0.98780284145153
+    0x00000000FE6F1AD5LL, // tan(0.78233020182168) = 0.99388282491415
+    0x0000000100000000LL, // tan(0.78539816339745) = 1.00000000000000
+};
+
+// Cubic segment of tan in the local variable t in [0,1):
+// tan(x) ~= ((a*t + b)*t + c)*t + d, interpolating tan at the segment's Chebyshev nodes
+struct TanSegment {
+    int32_t a;
+    int32_t b;
+    int32_t c;
+    uint32_t d;
 };
 
+// Table maps each of 128 segments of [0,pi/4] to its cubic coefficients
+alignas(64) inline constexpr std::array<TanSegment, 128> kTanTable = {{
+    {331, 0, 26353589, 0x00000000},       // [0.00000000000, 0.00613592315]
+    {331, 992, 26354582, 0x01922100},     // [0.00613592315, 0.01227184630]
+    {331, 1985, 26357558, 0x032449C1},    // [0.01227184630, 0.01840776945]
+    {331, 2978, 26362521, 0x04B68203},    // [0.01840776945, 0.02454369261]
+    {332, 3972, 26369471, 0x0648D189},    // [0.02454369261, 0.03067961576]
+    {332, 4967, 26378410, 0x07DB4018},    // [0.03067961576, 0.03681553891]
+    {333, 5964, 26389341, 0x096DD575},    // [0.03681553891, 0.04295146206]
+    {334, 6962, 26402267, 0x0B00996A},    // [0.04295146206, 0.04908738521]
+    {334, 7963, 26417192, 0x0C9393C5},    // [0.04908738521, 0.05522330836]
+    {335, 8966, 26434121, 0x0E26CC57},    // [0.05522330836, 0.06135923152]
+    {336, 9972, 26453059, 0x0FBA4AF5},    // [0.06135923152, 0.06749515467]
+    {337, 10980, 26474011, 0x114E177C},   // [0.06749515467, 0.07363107782]
+    {339, 11992, 26496984, 0x12E239CD},   // [0.07363107782, 0.07976700097]
+    {340, 13008, 26521985, 0x1476B9D0},   // [0.07976700097, 0.08590292412]
+    {341, 14028, 26549021, 0x160B9F76},   // [0.08590292412, 0.09203884727]
+    {343, 15052, 26578101, 0x17A0F2B4},   // [0.09203884727, 0.09817477042]
+    {344, 16080, 26609234, 0x1936BB8C},   // [0.09817477042, 0.10431069358]
+    {346, 17114, 26642428, 0x1ACD0207},   // [0.10431069358, 0.11044661673]
+    {348, 18153, 26677695, 0x1C63CE37},   // [0.11044661673, 0.11658253988]
+    {350, 19197, 26715045, 0x1DFB283B},   // [0.11658253988, 0.12271846303]
+    {352, 20247, 26754489, 0x1F93183B},   // [0.12271846303, 0.12885438618]
+    {354, 21303, 26796039, 0x212BA66A},   // [0.12885438618, 0.13499030933]
+    {357, 22366, 26839709, 0x22C4DB0B},   // [0.13499030933, 0.14112623249]
+    {359, 23436, 26885512, 0x245EBE6C},   // [0.14112623249, 0.14726215564]
+    {362, 24513, 26933462, 0x25F958E7},   // [0.14726215564, 0.15339807879]
+    {364, 25598, 26983574, 0x2794B2E9},   // [0.15339807879, 0.15953400194]
+    {367, 26691, 27035864, 0x2930D4EA},   // [0.15953400194, 0.16566992509]
+    {370, 27792, 27090348, 0x2ACDC774},   // [0.16566992509, 0.17180584824]
+    {373, 28902, 27147042, 0x2C6B9322},   // [0.17180584824, 0.17794177139]
+    {376, 30021, 27205966, 0x2E0A409F},   // [0.17794177139, 0.18407769455]
+    {379, 31149, 27267137, 0x2FA9D8AA},   // [0.18407769455, 0.19021361770]
+    {383, 32288, 27330574, 0x314A6414},   // [0.19021361770, 0.19634954085]
+    {386, 33436, 27396299, 0x32EBEBC1},   // [0.19634954085, 0.20248546400]
+    {390, 34596, 27464331, 0x348E78AA},   // [0.20248546400, 0.20862138715]
+    {394, 35766, 27534694, 0x363213E0},   // [0.20862138715, 0.21475731030]
+    {398, 36948, 27607408, 0x37D6C685},   // [0.21475731030, 0.22089323346]
+    {402, 38142, 27682498, 0x397C99D7},   // [0.22089323346, 0.22702915661]
+    {406, 39348, 27759987, 0x3B239728},   // [0.22702915661, 0.23316507976]
+    {411, 40567, 27839902, 0x3CCBC7E5},   // [0.23316507976, 0.23930100291]
+    {415, 41799, 27922268, 0x3E753594},   // [0.23930100291, 0.24543692606]
+    {420, 43045, 28007112, 0x401FE9D6},   // [0.24543692606, 0.25157284921]
+    {425, 44305, 28094462, 0x41CBEE66},   // [0.25157284921, 0.25770877236]
+    {430, 45579, 28184346, 0x43794D1D},   // [0.25770877236, 0.26384469552]
+    {435, 46869, 28276795, 0x45280FF1},   // [0.26384469552, 0.26998061867]
+    {441, 48175, 28371840, 0x46D840F5},   // [0.26998061867, 0.27611654182]
+    {446, 49496, 28469512, 0x4889EA5C},   // [0.27611654182, 0.28225246497]
+    {452, 50835, 28569844, 0x4A3D167B},   // [0.28225246497, 0.28838838812]
+    {458, 52191, 28672871, 0x4BF1CFC6},   // [0.28838838812, 0.29452431127]
+    {464, 53564, 28778626, 0x4DA820D5},   // [0.29452431127, 0.30066023443]
+    {470, 54956, 28887147, 0x4F601464},   // [0.30066023443, 0.30679615758]
+    {477, 56367, 28998470, 0x5119B551},   // [0.30679615758, 0.31293208073]
+    {483, 57797, 29112635, 0x52D50EA2},   // [0.31293208073, 0.31906800388]
+    {490, 59247, 29229680, 0x54922B86},   // [0.31906800388, 0.32520392703]
+    {498, 60719, 29349647, 0x56511750},   // [0.32520392703, 0.33133985018]
+    {505, 62211, 29472578, 0x5811DD7F},   // [0.33133985018, 0.33747577333]
+    {512, 63726, 29598516, 0x59D489BD},   // [0.33747577333, 0.34361169649]
+    {520, 65263, 29727506, 0x5B9927DF},   // [0.34361169649, 0.34974761964]
+    {528, 66824, 29859595, 0x5D5FC3E9},   // [0.34974761964, 0.35588354279]
+    {537, 68409, 29994829, 0x5F286A0D},   // [0.35588354279, 0.36201946594]
+    {545, 70019, 30133259, 0x60F326AC},   // [0.36201946594, 0.36815538909]
+    {554, 71655, 30274933, 0x62C0065B},   // [0.36815538909, 0.37429131224]
+    {563, 73316, 30419906, 0x648F15E1},   // [0.37429131224, 0.38042723540]
+    {572, 75006, 30568229, 0x6660623A},   // [0.38042723540, 0.38656315855]
+    {582, 76723, 30719958, 0x6833F899},   // [0.38656315855, 0.39269908170]
+    {592, 78469, 30875151, 0x6A09E668},   // [0.39269908170, 0.39883500485]
+    {602, 80244, 31033865, 0x6BE2394B},   // [0.39883500485, 0.40497092800]
+    {613, 82051, 31196161, 0x6DBCFF23},   // [0.40497092800, 0.41110685115]
+    {623, 83888, 31362102, 0x6F9A460C},   // [0.41110685115, 0.41724277430]
+    {635, 85759, 31531750, 0x717A1C61},   // [0.41724277430, 0.42337869746]
+    {646, 87662, 31705173, 0x735C90C1},   // [0.42337869746, 0.42951462061]
+    {658, 89601, 31882437, 0x7541B20B},   // [0.42951462061, 0.43565054376]
+    {670, 91574, 32063614, 0x77298F62},   // [0.43565054376, 0.44178646691]
+    {683, 93584, 32248774, 0x79143835},   // [0.44178646691, 0.44792239006]
+    {696, 95632, 32437992, 0x7B01BC36},   // [0.44792239006, 0.45405831321]
+    {709, 97719, 32631345, 0x7CF22B66},   // [0.45405831321, 0.46019423637]
+    {723, 99845, 32828912, 0x7EE59613},   // [0.46019423637, 0.46633015952]
+    {737, 102013, 33030772, 0x80DC0CDB},  // [0.46633015952, 0.47246608267]
+    {751, 104223, 33237010, 0x82D5A0AD},  // [0.47246608267, 0.47860200582]
+    {766, 106477, 33447713, 0x84D262CE},  // [0.47860200582, 0.48473792897]
+    {782, 108776, 33662968, 0x86D264DA},  // [0.48473792897, 0.49087385212]
+    {798, 111121, 33882868, 0x88D5B8C8},  // [0.49087385212, 0.49700977527]
+    {814, 113514, 34107505, 0x8ADC70EB},  // [0.49700977527, 0.50314569843]
+    {831, 115957, 34336978, 0x8CE69FF4},  // [0.50314569843, 0.50928162158]
+    {849, 118450, 34571387, 0x8EF458FB},  // [0.50928162158, 0.51541754473]
+    {867, 120995, 34810835, 0x9105AF78},  // [0.51541754473, 0.52155346788]
+    {885, 123595, 35055427, 0x931AB751},  // [0.52155346788, 0.52768939103]
+    {904, 126250, 35305274, 0x953384D4},  // [0.52768939103, 0.53382531418]
+    {924, 128962, 35560489, 0x97502CC0},  // [0.53382531418, 0.53996123734]
+    {944, 131734, 35821189, 0x9970C448},  // [0.53996123734, 0.54609716049]
+    {965, 134567, 36087493, 0x9B956114},  // [0.54609716049, 0.55223308364]
+    {987, 137463, 36359526, 0x9DBE1945},  // [0.55223308364, 0.55836900679]
+    {1009, 140424, 36637415, 0x9FEB037D}, // [0.55836900679, 0.56450492994]
+    {1032, 143452, 36921294, 0xA21C36DD}, // [0.56450492994, 0.57064085309]
+    {1056, 146549, 37211297, 0xA451CB0E}, // [0.57064085309, 0.57677677625]
+    {1081, 149717, 37507566, 0xA68BD844}, // [0.57677677625, 0.58291269940]
+    {1106, 152959, 37810245, 0xA8CA773F}, // [0.58291269940, 0.58904862255]
+    {1132, 156278, 38119485, 0xAB0DC156}, // [0.58904862255, 0.59518454570]
+    {1159, 159674, 38435441, 0xAD55D075}, // [0.59518454570, 0.60132046885]
+    {1187, 163152, 38758271, 0xAFA2BF28}, // [0.60132046885, 0.60745639200]
+    {1216, 166714, 39088142, 0xB1F4A89B}, // [0.60745639200, 0.61359231515]
+    {1246, 170363, 39425223, 0xB44BA8A4}, // [0.61359231515, 0.61972823831]
+    {1277, 174101, 39769691, 0xB6A7DBC4}, // [0.61972823831, 0.62586416146]
+    {1309, 177931, 40121728, 0xB9095F31}, // [0.62586416146, 0.63200008461]
+    {1342, 181857, 40481521, 0xBB7050D9}, // [0.63200008461, 0.63813600776]
+    {1376, 185882, 40849265, 0xBDDCCF69}, // [0.63813600776, 0.64427193091]
+    {1411, 190010, 41225162, 0xC04EFA55}, // [0.64427193091, 0.65040785406]
+    {1447, 194242, 41609419, 0xC2C6F1DB}, // [0.65040785406, 0.65654377722]
+    {1485, 198584, 42002250, 0xC544D710}, // [0.65654377722, 0.66267970037]
+    {1524, 203040, 42403879, 0xC7C8CBE0}, // [0.66267970037, 0.66881562352]
+    {1565, 207612, 42814536, 0xCA52F31B}, // [0.66881562352, 0.67495154667]
+    {1606, 212305, 43234458, 0xCCE3707B}, // [0.67495154667, 0.68108746982]
+    {1650, 217124, 43663893, 0xCF7A68AD}, // [0.68108746982, 0.68722339297]
+    {1694, 222072, 44103095, 0xD2180157}, // [0.68722339297, 0.69335931612]
+    {1741, 227155, 44552329, 0xD4BC6125}, // [0.69335931612, 0.69949523928]
+    {1789, 232378, 45011868, 0xD767AFCE}, // [0.69949523928, 0.70563116243]
+    {1839, 237744, 45481997, 0xDA1A1620}, // [0.70563116243, 0.71176708558]
+    {1891, 243260, 45963008, 0xDCD3BE0C}, // [0.71176708558, 0.71790300873]
+    {1944, 248932, 46455208, 0xDF94D2AC}, // [0.71790300873, 0.72403893188]
+    {2000, 254764, 46958911, 0xE25D804F}, // [0.72403893188, 0.73017485503]
+    {2057, 260763, 47474445, 0xE52DF489}, // [0.73017485503, 0.73631077819]
+    {2117, 266934, 48002149, 0xE8065E3A}, // [0.73631077819, 0.74244670134]
+    {2179, 273285, 48542377, 0xEAE6ED9A}, // [0.74244670134, 0.74858262449]
+    {2244, 279823, 49095494, 0xEDCFD44D}, // [0.74858262449, 0.75471854764]
+    {2311, 286554, 49661880, 0xF0C14566}, // [0.75471854764, 0.76085447079]
+    {2380, 293485, 50241929, 0xF3BB757E}, // [0.76085447079, 0.76699039394]
+    {2453, 300626, 50836049, 0xF6BE9AC1}, // [0.76699039394, 0.77312631709]
+    {2528, 307983, 51444668, 0xF9CAECF8}, // [0.77312631709, 0.77926224025]
+    {2606, 315565, 52068226, 0xFCE0A5A3}, // [0.77926224025, 0.78539816340]
+}};
+
 // Fast lookup tan(x) with linear interpolation between table entries
-// Input x is in fixed-point format with specified fraction bits representing angle in radians
-// Precision: ~1.5e-5 when input_fraction_bits=32
-inline constexpr auto LookupTanFast(int64_t x, int input_fraction_bits) noexcept -> int64_t {
+// Input x is in fixed-point format with InputFractionBits fraction bits representing angle in radians
+// Precision: ~1.5e-5 when InputFractionBits=32
+template <int InputFractionBits = 32>
+inline constexpr auto LookupTanFast(int64_t x) noexcept -> int64_t {
     // Constants
-    constexpr int64_t kPi = 0x00000003243F6A88LL;  // pi = 3.141592653589793
-    constexpr int64_t kPiOver2 = 0x00000001921FB544LL;  // pi/2 = 1.5707963267948966
-    constexpr int64_t kLutInterval = 0x00000145500D592ELL;  // LUT conversion factor
+    constexpr uint64_t kRadiansToHalfTurns = 0x517CC1B727220A94ULL;  // 2^64 / pi
     constexpr int kOutputFractionBits = 32;  // Output format: Q31.32
 
-    // Convert input to Q{int_bits}.{fraction_bits} format if needed
-    if (input_fraction_bits != kOutputFractionBits) {
-        if (input_fraction_bits < kOutputFractionBits) {
-            x <<= (kOutputFractionBits - input_fraction_bits);
-        } else {
-            x >>= (input_fraction_bits - kOutputFractionBits);
+    // Convert input to internal format
+    if constexpr (InputFractionBits != kOutputFractionBits) {
+        x = Primitives::ShiftFractionBits(x, InputFractionBits, kOutputFractionBits);
+    }
+
+    // Small angles skip the reduction and the table: for |x| <= 0.000887 the leading
+    // terms of tan(x) = x + x^3/3 + 2x^5/15 + ... are within one ulp. The unsigned sum
+    // tests both bounds with one compare
+    constexpr uint64_t kSmallAngle = 3810778;
+    if (static_cast<uint64_t>(x) + kSmallAngle <= 2 * kSmallAngle) {
+        int64_t result = x;
+        if constexpr (InputFractionBits != kOutputFractionBits) {
+            result = Primitives::ShiftFractionBits(result, kOutputFractionBits, InputFractionBits);
         }
+        return result;
     }
 
-    // 1. Normalize angle to [-pi, pi]
-    x = x % kPi;
+    // 1. Normalize angle to [0, pi) as a Q0.64 phase in half turns, no division needed:
+    // the product wraps modulo 2^64, one period of tan. The unsigned multiply reads a
+    // negative x as x + 2^64, which adds kRadiansToHalfTurns << (64 - kOutputFractionBits)
+    // to the shifted product; subtract that back
+    const uint64_t phase =
+        Primitives::MulU64Shifted(static_cast<uint64_t>(x), kRadiansToHalfTurns, kOutputFractionBits)
+        - ((kRadiansToHalfTurns << (64 - kOutputFractionBits)) & static_cast<uint64_t>(x >> 63));
 
-    // 2. Handle negative angles
-    bool flip = false;
-    if (x < 0) {
-        x = -x;
-        flip = true;
-    }
+    // 2. The top phase bit selects (pi/2, pi), map it to [0, pi/2] with tan(x) = -tan(pi - x),
+    // using masks instead of branches, the half of a mixed-angle input is unpredictable
+    const int64_t negate_mask = -static_cast<int64_t>(phase >> 63);
+    const uint64_t fold_mask = static_cast<uint64_t>(negate_mask);
+    uint64_t octant = (phase ^ fold_mask) - fold_mask;
 
-    // 3. Handle angles > pi/2 by using tan(pi-x) = -tan(x)
-    if (x > kPiOver2) {
-        x = kPi - x;
-        flip = !flip;
-    }
+    // 3. Handle angles >= pi/4 by using tan(x) = 1/tan(pi/2-x), selected with a mask as well
+    constexpr uint64_t kQuarterPi = uint64_t{1} << 62;
+    const bool reciprocal = octant >= kQuarterPi;
+    octant ^= (0 - static_cast<uint64_t>(reciprocal)) & (octant ^ (2 * kQuarterPi - octant));
+    octant -= octant >> 62;  // pi/4 itself is read as the end of the last interval
 
-    // 4. Calculate lookup table index and fractional part
-    int64_t idx_scaled = Primitives::Fixed64Mul(x, kLutInterval, kOutputFractionBits);
-    int idx = static_cast<int>(idx_scaled >> kOutputFractionBits);
-    int64_t frac = idx_scaled & ((1LL << kOutputFractionBits) - 1);
+    // 4. Calculate lookup table index and fractional part: an octant spans a power
+    // of two intervals, so the table position is a shift of it
+    const int64_t idx_scaled = static_cast<int64_t>(octant >> 22);
+    const int idx = static_cast<int>(idx_scaled >> kOutputFractionBits);
+    const int64_t t = idx_scaled & ((1LL << kOutputFractionBits) - 1);  // Fractional part [0,1)
 
     // 5. Linear interpolation between table entries
     int64_t y0 = kTanLut[idx];
     int64_t y1 = kTanLut[idx + 1];
     int64_t diff = y1 - y0;
-    int64_t interpolated_value = y0 + Primitives::Fixed64Mul(diff, frac, kOutputFractionBits);
+    int64_t result = y0 + Primitives::Fixed64Mul(diff, t, kOutputFractionBits);
 
-    // 6. Apply sign flip if necessary
-    int64_t result = flip ? -interpolated_value : interpolated_value;
+    // 6. Undo the octant reduction and apply sign flip, a no-op for a zero mask
+    if (reciprocal) {
+        // Saturate where the reciprocal would not fit the input format, so that the
+        // left shift of a wider format cannot wrap it and the sign flip gives +-max
+        constexpr int64_t kSaturation = std::numeric_limits<int64_t>::max() >>
+            (InputFractionBits > kOutputFractionBits ? InputFractionBits - kOutputFractionBits : 0);
+        result = result < 3
+            ? kSaturation
+            : Primitives::Fixed64Div(int64_t{1} << kOutputFractionBits, result, kOutputFractionBits);
+        result = result > kSaturation ? kSaturation : result;
+    }
+    result = (result ^ negate_mask) - negate_mask;
 
     // 7. Convert result back to original input format if needed
-    if (input_fraction_bits != kOutputFractionBits) {
-        if (input_fraction_bits < kOutputFractionBits) {
-            result >>= (kOutputFractionBits - input_fraction_bits);
-        } else {
-            result <<= (input_fraction_bits - kOutputFractionBits);
-        }
+    if constexpr (InputFractionBits != kOutputFractionBits) {
+        result = Primitives::ShiftFractionBits(result, kOutputFractionBits, InputFractionBits);
     }
 
     return result;
 }
 
-// Lookup tan(x) with optimized Hermite cubic interpolation between table entries
-// Input x is in fixed-point format with specified fraction bits representing angle in radians
-// Precision: ~2.0e-9 when input_fraction_bits=32 (about 1500x more accurate than fast version)
-inline constexpr auto LookupTan(int64_t x, int input_fraction_bits) noexcept -> int64_t {
-    // Constants
-    constexpr int64_t kPi = 0x00000003243F6A88LL;  // pi = 3.141592653589793
-    constexpr int64_t kPiOver2 = 0x00000001921FB544LL;  // pi/2 = 1.5707963267948966
-    constexpr int64_t kLutInterval = 0x00000145500D592ELL;  // LUT conversion factor
-    constexpr int kOutputFractionBits = 32;  // Output format: Q31.32
-    constexpr int64_t kOne = 1LL << kOutputFractionBits;  // 1.0 in fixed-point
-
-    // Convert input to Q{int_bits}.{fraction_bits} format if needed
-    if (input_fraction_bits != kOutputFractionBits) {
-        if (input_fraction_bits < kOutputFractionBits) {
-            x <<= (kOutputFractionBits - input_fraction_bits);
-        } else {
-            x >>= (input_fraction_bits - kOutputFractionBits);
+// Four LookupTanFast evaluations at once, bit-identical to calling it per element
+// With AVX2 the reduction and the table interpolation run in 64-bit vector lanes and
+// only the reciprocal of [pi/4,pi/2] divides per lane; without it each element goes
+// through LookupTanFast
+template <int InputFractionBits = 32>
+inline auto LookupTanFastx4(const int64_t* x, int64_t* out) noexcept -> void {
+#if defined(__AVX2__)
+    constexpr uint64_t kRadiansToHalfTurns = 0x517CC1B727220A94ULL;  // 2^64 / pi
+    constexpr int kOutputFractionBits = 32;  // Internal calculation format
+    const __m256i zero = _mm256_setzero_si256();
+    const __m256i low_mask = _mm256_set1_epi64x(0xFFFFFFFFLL);
+    __m256i v = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(x));
+
+    // AVX2 has no 64-bit arithmetic right shift: shift logically, then sign-extend
+    // from the new top bit m with (w ^ m) - m
+    const auto shift_right_arithmetic = [](__m256i w, int n) {
+        const __m256i m = _mm256_set1_epi64x(int64_t{1} << (63 - n));
+        return _mm256_sub_epi64(_mm256_xor_si256(_mm256_srli_epi64(w, n), m), m);
+    };
+
+    // Convert input to internal format
+    if constexpr (InputFractionBits < kOutputFractionBits) {
+        v = _mm256_slli_epi64(v, kOutputFractionBits - InputFractionBits);
+    } else if constexpr (InputFractionBits > kOutputFractionBits) {
+        v = shift_right_arithmetic(v, InputFractionBits - kOutputFractionBits);
+    }
+
+    // 1. Phase in half turns: bits 32..95 of v * kRadiansToHalfTurns from four
+    // 32x32->64 products, then the same fix-up for negative lanes as the scalar path
+    const __m256i k_lo = _mm256_set1_epi64x(static_cast<int64_t>(kRadiansToHalfTurns & 0xFFFFFFFF));
+    const __m256i k_hi = _mm256_set1_epi64x(static_cast<int64_t>(kRadiansToHalfTurns >> 32));
+    const __m256i v_hi = _mm256_srli_epi64(v, 32);
+    __m256i phase = _mm256_srli_epi64(_mm256_mul_epu32(v, k_lo), 32);
+    phase = _mm256_add_epi64(phase, _mm256_mul_epu32(v, k_hi));
+    phase = _mm256_add_epi64(phase, _mm256_mul_epu32(v_hi, k_lo));
+    phase = _mm256_add_epi64(phase, _mm256_slli_epi64(_mm256_mul_epu32(v_hi, k_hi), 32));
+    const __m256i negative = _mm256_cmpgt_epi64(zero, v);
+    const __m256i wrap = _mm256_set1_epi64x(static_cast<int64_t>(kRadiansToHalfTurns << 32));
+    phase = _mm256_sub_epi64(phase, _mm256_and_si256(wrap, negative));
+
+    // 2. The top phase bit folds (pi/2, pi) onto [0, pi/2] and sets the sign
+    const __m256i negate_mask = _mm256_cmpgt_epi64(zero, phase);
+    __m256i octant = _mm256_sub_epi64(_mm256_xor_si256(phase, negate_mask), negate_mask);
+
+    // 3. Mirror angles >= pi/4 to pi/2 - x, as in the scalar path
+    const __m256i reciprocal = _mm256_cmpgt_epi64(_mm256_srli_epi64(octant, 62), zero);
+    const __m256i half_pi = _mm256_set1_epi64x(static_cast<int64_t>(uint64_t{1} << 63));
+    octant = _mm256_blendv_epi8(octant, _mm256_sub_epi64(half_pi, octant), reciprocal);
+    octant = _mm256_sub_epi64(octant, _mm256_srli_epi64(octant, 62));
+
+    // 4. Table index and fraction, a shift of the octant as in the scalar path
+    const __m256i idx_scaled = _mm256_srli_epi64(octant, 22);
+    const __m256i idx = _mm256_srli_epi64(idx_scaled, kOutputFractionBits);
+    const __m256i t = _mm256_and_si256(idx_scaled, low_mask);
+
+    // 5. Linear interpolation: the table increases by less than 2^32 per entry, so
+    // one 32x32->64 multiply per lane is exact, truncated like Fixed64Mul
+    const __m256i y0 =
+        _mm256_i64gather_epi64(reinterpret_cast<const long long*>(kTanLut.data()), idx, 8);
+    const __m256i y1 =
+        _mm256_i64gather_epi64(reinterpret_cast<const long long*>(kTanLut.data() + 1), idx, 8);
+    const __m256i diff = _mm256_sub_epi64(y1, y0);
+    __m256i result =
+        _mm256_add_epi64(y0, _mm256_srli_epi64(_mm256_mul_epu32(diff, t), kOutputFractionBits));
+
+    // 6. Undo the octant reduction per lane, there is no vector division, and apply
+    // the sign flip
+    if (!_mm256_testz_si256(reciprocal, reciprocal)) {
+        alignas(32) int64_t lanes[4];
+        alignas(32) int64_t lane_reciprocal[4];
+        _mm256_store_si256(reinterpret_cast<__m256i*>(lanes), result);
+        _mm256_store_si256(reinterpret_cast<__m256i*>(lane_reciprocal), reciprocal);
+        // Saturate where the reciprocal would not fit the input format, so that the
+        // left shift of a wider format cannot wrap it and the sign flip gives +-max
+        constexpr int64_t kSaturation = std::numeric_limits<int64_t>::max() >>
+            (InputFractionBits > kOutputFractionBits ? InputFractionBits - kOutputFractionBits : 0);
+        for (int i = 0; i < 4; ++i) {
+            if (lane_reciprocal[i]) {
+                lanes[i] = lanes[i] < 3
+                    ? kSaturation
+                    : Primitives::Fixed64Div(
+                          int64_t{1} << kOutputFractionBits, lanes[i], kOutputFractionBits);
+                lanes[i] = lanes[i] > kSaturation ? kSaturation : lanes[i];
+            }
         }
+        result = _mm256_load_si256(reinterpret_cast<const __m256i*>(lanes));
     }
+    result = _mm256_sub_epi64(_mm256_xor_si256(result, negate_mask), negate_mask);
 
-    // 1. Normalize angle to [-pi, pi]
-    x = x % kPi;
+    // Lanes within the small-angle bound return x, as in the scalar path
+    const __m256i small_angle = _mm256_set1_epi64x(3810778);
+    const __m256i small = _mm256_andnot_si256(
+        _mm256_cmpgt_epi64(v, small_angle),
+        _mm256_cmpgt_epi64(v, _mm256_sub_epi64(_mm256_set1_epi64x(-1), small_angle)));
+    result = _mm256_blendv_epi8(result, v, small);
 
-    // 2. Handle negative angles
-    bool flip = false;
-    if (x < 0) {
-        x = -x;
-        flip = true;
+    // 7. Convert result back to original input format if needed
+    if constexpr (InputFractionBits < kOutputFractionBits) {
+        result = shift_right_arithmetic(result, kOutputFractionBits - InputFractionBits);
+    } else if constexpr (InputFractionBits > kOutputFractionBits) {
+        result = _mm256_slli_epi64(result, InputFractionBits - kOutputFractionBits);
     }
+    _mm256_storeu_si256(reinterpret_cast<__m256i*>(out), result);
+#else
+    for (int i = 0; i < 4; ++i) {
+        out[i] = LookupTanFast<InputFractionBits>(x[i]);
+    }
+#endif
+}
 
-    // 3. Handle angles > pi/2 by using tan(pi-x) = -tan(x)
-    if (x > kPiOver2) {
-        x = kPi - x;
-        flip = !flip;
+// LookupTanFast over count elements, four at a time through LookupTanFastx4
+// and the remaining tail per element; out may be the same array as x
+template <int InputFractionBits = 32>
+inline auto LookupTanFastBatch(const int64_t* x, int64_t* out, size_t count) noexcept -> void {
+    size_t i = 0;
+    for (; i + 4 <= count; i += 4) {
+        LookupTanFastx4<InputFractionBits>(x + i, out + i);
+    }
+    for (; i < count; ++i) {
+        out[i] = LookupTanFast<InputFractionBits>(x[i]);
     }
+}
+
+// Lookup tan(x) with a precomputed cubic per segment, interpolating at Chebyshev nodes
+// Input x is in fixed-point format with InputFractionBits fraction bits representing angle in radians
+// Precision: ~2.0e-9 when InputFractionBits=32 (about 1500x more accurate than fast version)
+template <int InputFractionBits = 32>
+inline constexpr auto LookupTan(int64_t x) noexcept -> int64_t {
+    // Constants
+    constexpr uint64_t kRadiansToHalfTurns = 0x517CC1B727220A94ULL;  // 2^64 / pi
+    constexpr int kOutputFractionBits = 32;  // Output format: Q31.32
 
-    // 4. Calculate lookup table index and fractional part
-    int64_t idx_scaled = Primitives::Fixed64Mul(x, kLutInterval, kOutputFractionBits);
-    int idx = static_cast<int>(idx_scaled >> kOutputFractionBits);
-    int64_t t = idx_scaled & ((1LL << kOutputFractionBits) - 1);  // Fractional part [0,1)
-
-    // 5. Get points from table
-    int64_t p0 = kTanLut[idx];      // Point at left endpoint
-    int64_t p1 = kTanLut[idx + 1];  // Point at right endpoint
-
-    // 6. Compute derivatives using the fact that tan'(x) = 1 + tan²(x)
-    int64_t p0_squared = Primitives::Fixed64Mul(p0, p0, kOutputFractionBits);
-    int64_t p1_squared = Primitives::Fixed64Mul(p1, p1, kOutputFractionBits);
-    int64_t m0 = kOne + p0_squared;  // Derivative at left endpoint
-    int64_t m1 = kOne + p1_squared;  // Derivative at right endpoint
-
-    // Scale derivatives by step size
-    constexpr int64_t kStepSize = Primitives::Fixed64Div(
-        kPiOver2, static_cast<int64_t>(kTanLut.size() - 2) << kOutputFractionBits, kOutputFractionBits);
-    m0 = Primitives::Fixed64Mul(m0, kStepSize, kOutputFractionBits);
-    m1 = Primitives::Fixed64Mul(m1, kStepSize, kOutputFractionBits);
-
-    // 7. Compute optimized Hermite coefficients
-    // p(t) = ((a*t + b)*t + c)*t + d  (Horner's method)
-    // where:
-    // a = 2(p₀-p₁) + m₀+m₁
-    // b = 3(p₁-p₀) - 2m₀-m₁
-    // c = m₀
-    // d = p₀
-    int64_t p0_minus_p1 = p0 - p1;
-    int64_t a = p0_minus_p1 * 2 + m0 + m1;
-    int64_t b = -p0_minus_p1 * 3 - m0 * 2 - m1;
-    int64_t c = m0;
-    int64_t d = p0;
-
-    // 8. Compute interpolation using Horner's method
-    int64_t result =
-        d
-        + Primitives::Fixed64Mul(
-            t,
-            c
-                + Primitives::Fixed64Mul(
-                    t, b + Primitives::Fixed64Mul(t, a, kOutputFractionBits), kOutputFractionBits),
-            kOutputFractionBits);
-
-    // 9. Apply sign flip if necessary
-    if (flip) {
-        result = -result;
+    // Convert input to internal format
+    if constexpr (InputFractionBits != kOutputFractionBits) {
+        x = Primitives::ShiftFractionBits(x, InputFractionBits, kOutputFractionBits);
     }
 
-    // 10. Convert result back to original input format if needed
-    if (input_fraction_bits != kOutputFractionBits) {
-        if (input_fraction_bits < kOutputFractionBits) {
-            result >>= (kOutputFractionBits - input_fraction_bits);
-        } else {
-            result <<= (input_fraction_bits - kOutputFractionBits);
+    // Small angles skip the reduction and the table: for |x| <= 0.0177 the leading
+    // terms of tan(x) = x + x^3/3 + 2x^5/15 + ... are within one ulp. The unsigned sum
+    // tests both bounds with one compare
+    constexpr uint64_t kSmallAngle = 76099208;
+    if (static_cast<uint64_t>(x) + kSmallAngle <= 2 * kSmallAngle) {
+        const int64_t x2 = Primitives::Fixed64Mul(x, x, kOutputFractionBits);
+        int64_t result = x + Primitives::Fixed64Mul(x2, x, kOutputFractionBits) / 3;
+        if constexpr (InputFractionBits != kOutputFractionBits) {
+            result = Primitives::ShiftFractionBits(result, kOutputFractionBits, InputFractionBits);
         }
+        return result;
+    }
+
+    // 1. Normalize angle to [0, pi) as a Q0.64 phase in half turns, no division needed:
+    // the product wraps modulo 2^64, one period of tan. The unsigned multiply reads a
+    // negative x as x + 2^64, which adds kRadiansToHalfTurns << (64 - kOutputFractionBits)
+    // to the shifted product; subtract that back
+    const uint64_t phase =
+        Primitives::MulU64Shifted(static_cast<uint64_t>(x), kRadiansToHalfTurns, kOutputFractionBits)
+        - ((kRadiansToHalfTurns << (64 - kOutputFractionBits)) & static_cast<uint64_t>(x >> 63));
+
+    // 2. The top phase bit selects (pi/2, pi), map it to [0, pi/2] with tan(x) = -tan(pi - x),
+    // using masks instead of branches, the half of a mixed-angle input is unpredictable
+    const int64_t negate_mask = -static_cast<int64_t>(phase >> 63);
+    const uint64_t fold_mask = static_cast<uint64_t>(negate_mask);
+    uint64_t octant = (phase ^ fold_mask) - fold_mask;
+
+    // 3. Handle angles >= pi/4 by using tan(x) = 1/tan(pi/2-x), selected with a mask as well
+    constexpr uint64_t kQuarterPi = uint64_t{1} << 62;
+    const bool reciprocal = octant >= kQuarterPi;
+    octant ^= (0 - static_cast<uint64_t>(reciprocal)) & (octant ^ (2 * kQuarterPi - octant));
+    octant -= octant >> 62;  // pi/4 itself is read as the end of the last interval
+
+    // 4. Calculate lookup table index and fractional part: an octant spans a power
+    // of two intervals, so the table position is a shift of it
+    const int64_t idx_scaled = static_cast<int64_t>(octant >> 23);
+    const int idx = static_cast<int>(idx_scaled >> kOutputFractionBits);
+    const int64_t t = idx_scaled & ((1LL << kOutputFractionBits) - 1);  // Fractional part [0,1)
+
+    // 5. Evaluate the precomputed segment p(t) = ((a*t + b)*t + c)*t + d using
+    // Horner's method; the generator checked that every operand stays below
+    // 2^26, so t * operand fits in 64 bits
+    const TanSegment& seg = kTanTable[idx];
+    int64_t result = Primitives::Fixed64MulNarrow(t, seg.a, kOutputFractionBits) + seg.b;
+    result = Primitives::Fixed64MulNarrow(t, result, kOutputFractionBits) + seg.c;
+    result = Primitives::Fixed64MulNarrow(t, result, kOutputFractionBits) + seg.d;
+
+    // 6. Undo the octant reduction and apply sign flip, a no-op for a zero mask
+    if (reciprocal) {
+        // Saturate where the reciprocal would not fit the input format, so that the
+        // left shift of a wider format cannot wrap it and the sign flip gives +-max
+        constexpr int64_t kSaturation = std::numeric_limits<int64_t>::max() >>
+            (InputFractionBits > kOutputFractionBits ? InputFractionBits - kOutputFractionBits : 0);
+        result = result < 3
+            ? kSaturation
+            : Primitives::Fixed64Div(int64_t{1} << kOutputFractionBits, result, kOutputFractionBits);
+        result = result > kSaturation ? kSaturation : result;
+    }
+    result = (result ^ negate_mask) - negate_mask;
+
+    // 7. Convert result back to original input format if needed
+    if constexpr (InputFractionBits != kOutputFractionBits) {
+        result = Primitives::ShiftFractionBits(result, kOutputFractionBits, InputFractionBits);
     }
 
     return result;
 }
 
-}  // namespace math::fp::detail
\ No newline at end of file
+// LookupTanFast for input_fraction_bits known only at runtime
+inline constexpr auto LookupTanFast(int64_t x, int input_fraction_bits) noexcept -> int64_t {
+    // Formats of the Fixed64 aliases get their shifts folded at compile time
+    switch (input_fraction_bits) {
+        case 16:
+            return LookupTanFast<16>(x);
+        case 32:
+            return LookupTanFast<32>(x);
+        case 40:
+            return LookupTanFast<40>(x);
+        default:
+            break;
+    }
+
+    constexpr int kOutputFractionBits = 32;
+    x = Primitives::ShiftFractionBits(x, input_fraction_bits, kOutputFractionBits);
+    int64_t result = LookupTanFast<kOutputFractionBits>(x);
+    if (input_fraction_bits > kOutputFractionBits) {
+        const int64_t limit =
+            std::numeric_limits<int64_t>::max() >> (input_fraction_bits - kOutputFractionBits);
+        result = result > limit ? limit : (result < -limit ? -limit : result);
+    }
+    return Primitives::ShiftFractionBits(result, kOutputFractionBits, input_fraction_bits);
+}
+
+// LookupTan for input_fraction_bits known only at runtime
+inline constexpr auto LookupTan(int64_t x, int input_fraction_bits) noexcept -> int64_t {
+    // Formats of the Fixed64 aliases get their shifts folded at compile time
+    switch (input_fraction_bits) {
+        case 16:
+            return LookupTan<16>(x);
+        case 32:
+            return LookupTan<32>(x);
+        case 40:
+            return LookupTan<40>(x);
+        default:
+            break;
+    }
+
+    constexpr int kOutputFractionBits = 32;
+    x = Primitives::ShiftFractionBits(x, input_fraction_bits, kOutputFractionBits);
+    int64_t result = LookupTan<kOutputFractionBits>(x);
+    if (input_fraction_bits > kOutputFractionBits) {
+        const int64_t limit =
+            std::numeric_limits<int64_t>::max() >> (input_fraction_bits - kOutputFractionBits);
+        result = result > limit ? limit : (result < -limit ? -limit : result);
+    }
+    return Primitives::ShiftFractionBits(result, kOutputFractionBits, input_fraction_bits);
+}
+
+}  // namespace math::fp::detail
@@ -420,9 +420,9 @@ class Fixed64Math {
         requires(P >= kTrigFractionBits)
     [[nodiscard]] static auto Sin(Fixed64<P> x) noexcept -> Fixed64<P> {
         if constexpr (FIXED64_MATH_USE_FAST_TRIG) {
-            return Fixed64<P>(detail::LookupSinFast(x.value(), P), detail::nothing{});
+            return Fixed64<P>(detail::LookupSinFast<P>(x.value()), detail::nothing{});
         } else {
-            return Fixed64<P>(detail::LookupSin(x.value(), P), detail::nothing{});
+            return Fixed64<P>(detail::LookupSin<P>(x.value()), detail::nothing{});
         }
     }
 
@@ -446,9 +446,9 @@ class Fixed64Math {
         requires(P >= kTrigFractionBits)
     [[nodiscard]] static auto Tan(Fixed64<P> x) noexcept -> Fixed64<P> {
         if constexpr (FIXED64_MATH_USE_FAST_TRIG) {
-            return Fixed64<P>(detail::LookupTanFast(x.value(), P), detail::nothing{});
+            return Fixed64<P>(detail::LookupTanFast<P>(x.value()), detail::nothing{});
         } else {
-            return Fixed64<P>(detail::LookupTan(x.value(), P), detail::nothing{});
+            return Fixed64<P>(detail::LookupTan<P>(x.value()), detail::nothing{});
         }
     }
 
@@ -501,9 +501,9 @@ class Fixed64Math {
     template <int P>
     static auto Atan(Fixed64<P> x) noexcept -> Fixed64<P> {
         if constexpr (FIXED64_MATH_USE_FAST_TRIG) {
-            return Fixed64<P>(detail::LookupAtanFast(x.value(), P), detail::nothing{});
+            return Fixed64<P>(detail::LookupAtanFast<P>(x.value()), detail::nothing{});
         } else {
-            return Fixed64<P>(detail::LookupAtan(x.value(), P), detail::nothing{});
+            return Fixed64<P>(detail::LookupAtan<P>(x.value()), detail::nothing{});
         }
     }
 
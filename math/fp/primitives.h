@@ -661,6 +661,20 @@ class Primitives {
             return static_cast<int64_t>(result);
     }
 
+    /**
+     * @brief Convert a fixed-point value from one number of fraction bits to another
+     *
+     * @param value Fixed-point value with fromBits fraction bits
+     * @param fromBits Number of fraction bits of the input value
+     * @param toBits Number of fraction bits of the result
+     * @return value shifted left (more fraction bits) or right (fewer fraction bits)
+     */
+    [[nodiscard]] static constexpr auto ShiftFractionBits(int64_t value,
+                                                          int fromBits,
+                                                          int toBits) noexcept -> int64_t {
+        return toBits >= fromBits ? value << (toBits - fromBits) : value >> (fromBits - toBits);
+    }
+
     /**
      * @brief Multiply two 64-bit unsigned integers, returning a 64-bit unsigned result
      *
@@ -760,6 +774,23 @@ class Primitives {
             return static_cast<int64_t>(result);
     }
 
+    /**
+     * @brief Signed fixed-point multiplication for operands whose product fits in 64 bits
+     *
+     * Uses a single 64-bit multiply instead of the 128-bit path of Fixed64Mul, and rounds the
+     * result to nearest rather than truncating it.
+     *
+     * @param a First operand
+     * @param b Second operand
+     * @param fractionBits Number of fraction bits, must be greater than 0
+     * @return a * b rounded to fractionBits; the caller must guarantee |a * b| < 2^62
+     */
+    [[nodiscard]] static constexpr auto Fixed64MulNarrow(int64_t a,
+                                                         int64_t b,
+                                                         int fractionBits) noexcept -> int64_t {
+        return (a * b + (int64_t{1} << (fractionBits - 1))) >> fractionBits;
+    }
+
     /**
      * @brief Divide 128-bit number by 64-bit number, returning 64-bit quotient
      *
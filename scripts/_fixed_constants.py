@@ -0,0 +1,44 @@
+"""Mathematical constants shared by the generator scripts
+
+Every generator used to rebuild pi/2 and friends and format them as hex on
+its own; this module evaluates each constant once at 100 digits and caches
+its truncated fixed-point value per scale."""
+
+import functools
+import mpmath as mp
+
+# Working precision for the constant values, matching the generators
+CONSTANT_DPS = 100
+
+CONSTANTS = {
+    "Pi": lambda: mp.pi,
+    "TwoPi": lambda: 2 * mp.pi,
+    "HalfPi": lambda: mp.pi / 2,
+    "QuarterPi": lambda: mp.pi / 4,
+    "InvPi": lambda: 1 / mp.pi,
+    "E": lambda: mp.e,
+    "Ln2": lambda: mp.log(2),
+    "Log2E": lambda: mp.log(mp.e, 2),  # log base 2 of e
+    "Log10Of2": lambda: mp.log10(2),
+    "Deg2Rad": lambda: mp.pi / 180,
+    "Rad2Deg": lambda: 180 / mp.pi,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def constant_value(name):
+    """Return the named constant as an mpf with CONSTANT_DPS digits"""
+    with mp.workdps(CONSTANT_DPS):
+        return +CONSTANTS[name]()
+
+
+@functools.lru_cache(maxsize=None)
+def scaled_constant(name, scale_bits):
+    """Return the named constant scaled by 2^scale_bits, truncated toward zero"""
+    with mp.workdps(CONSTANT_DPS):
+        return int(mp.ldexp(constant_value(name), scale_bits))
+
+
+def as_hex64(value):
+    """Format a signed integer as a two's complement 64-bit C++ literal"""
+    return f"0x{value & 0xFFFFFFFFFFFFFFFF:016X}LL"
@@ -0,0 +1,38 @@
+"""Streaming header output shared by the generator scripts"""
+
+import contextlib
+import os
+import sys
+
+
+class LineWriter:
+    """Stand-in for the `lines` list of the generators that writes each line
+    to a stream as soon as it is appended"""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def append(self, line):
+        self.stream.write(line)
+        self.stream.write("\n")
+
+
+@contextlib.contextmanager
+def open_output(output_file):
+    """Yield a LineWriter for output_file, or for stdout when it is empty
+
+    The header is streamed to a temporary file next to output_file through a
+    1 MiB buffer and only moved into place once generation succeeded, so a
+    failed run never leaves a truncated header behind."""
+    if not output_file:
+        yield LineWriter(sys.stdout)
+        return
+
+    temp_file = output_file + ".tmp"
+    try:
+        with open(temp_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+            yield LineWriter(f)
+        os.replace(temp_file, output_file)
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
@@ -0,0 +1,225 @@
+"""Lookup entry points shared by the sin, tan and atan generator scripts
+
+The four-lane LookupXxxFastx4 functions, their Batch loops, the AVX2 steps
+the lanes have in common (input conversion, the Q0.64 phase product, the
+table position, gathers and the output conversion), the Horner evaluation
+of a cubic segment and the runtime-format overloads used to be pasted into
+every generator; emitting them from here keeps the headers in step."""
+
+# Fraction bits of the Fixed64_16/32/40 aliases in fixed64.h, which the
+# runtime-format overloads dispatch to their template instantiations
+ALIAS_FRACTION_BITS = (16, 32, 40)
+
+
+def avx2_conditional_negate(value, mask):
+    """Return the AVX2 expression for value negated in the lanes where mask
+    is all ones, (value ^ mask) - mask, a no-op for a zero mask"""
+    return f"_mm256_sub_epi64(_mm256_xor_si256({value}, {mask}), {mask})"
+
+
+def append_lookup_x4(lines, name, fraction_bits, comment, vector_body=None, fall_through=False):
+    """Append `name`x4, four `name` evaluations at once
+
+    comment holds the lines describing the vector path. vector_body(lines)
+    emits the AVX2 body; without it each element goes through `name`. With
+    fall_through the body returns once it stored all four lanes and falls
+    through to the per-element loop otherwise, else the loop is only the
+    non-AVX2 branch."""
+    lines.append(f"// Four {name} evaluations at once, bit-identical to calling it per element")
+    for line in comment:
+        lines.append(f"// {line}")
+    lines.append(f"template <int InputFractionBits = {fraction_bits}>")
+    lines.append(f"inline auto {name}x4(const int64_t* x, int64_t* out) noexcept -> void {{")
+    if vector_body is not None:
+        lines.append("#if defined(__AVX2__)")
+        vector_body(lines)
+        lines.append("#endif" if fall_through else "#else")
+    lines.append("    for (int i = 0; i < 4; ++i) {")
+    lines.append(f"        out[i] = {name}<InputFractionBits>(x[i]);")
+    lines.append("    }")
+    if vector_body is not None and not fall_through:
+        lines.append("#endif")
+    lines.append("}")
+    lines.append("")
+
+
+def append_lookup_batch(lines, name, fraction_bits):
+    """Append `name`Batch, which runs `name` over an array in `name`x4
+    blocks"""
+    lines.append(f"// {name} over count elements, four at a time through {name}x4")
+    lines.append("// and the remaining tail per element; out may be the same array as x")
+    lines.append(f"template <int InputFractionBits = {fraction_bits}>")
+    lines.append(
+        f"inline auto {name}Batch(const int64_t* x, int64_t* out, size_t count) noexcept -> void {{")
+    lines.append("    size_t i = 0;")
+    lines.append("    for (; i + 4 <= count; i += 4) {")
+    lines.append(f"        {name}x4<InputFractionBits>(x + i, out + i);")
+    lines.append("    }")
+    lines.append("    for (; i < count; ++i) {")
+    lines.append(f"        out[i] = {name}<InputFractionBits>(x[i]);")
+    lines.append("    }")
+    lines.append("}")
+    lines.append("")
+
+
+def append_avx2_input(lines, declarations, fraction_bits):
+    """Append the start of a vector body: the constant declarations, the
+    lane constants, the load of x into v and its conversion to the internal
+    format with an arithmetic shift"""
+    for declaration in declarations:
+        lines.append(declaration)
+    lines.append(f"    constexpr int kOutputFractionBits = {fraction_bits};  // Internal calculation format")
+    lines.append("    const __m256i zero = _mm256_setzero_si256();")
+    lines.append("    const __m256i low_mask = _mm256_set1_epi64x(0xFFFFFFFFLL);")
+    lines.append("    __m256i v = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(x));")
+    lines.append("")
+    lines.append("    // AVX2 has no 64-bit arithmetic right shift: shift logically, then sign-extend")
+    lines.append("    // from the new top bit m with (w ^ m) - m")
+    lines.append("    const auto shift_right_arithmetic = [](__m256i w, int n) {")
+    lines.append("        const __m256i m = _mm256_set1_epi64x(int64_t{1} << (63 - n));")
+    lines.append("        return _mm256_sub_epi64(_mm256_xor_si256(_mm256_srli_epi64(w, n), m), m);")
+    lines.append("    };")
+    lines.append("")
+    lines.append("    // Convert input to internal format")
+    lines.append("    if constexpr (InputFractionBits < kOutputFractionBits) {")
+    lines.append("        v = _mm256_slli_epi64(v, kOutputFractionBits - InputFractionBits);")
+    lines.append("    } else if constexpr (InputFractionBits > kOutputFractionBits) {")
+    lines.append("        v = shift_right_arithmetic(v, InputFractionBits - kOutputFractionBits);")
+    lines.append("    }")
+    lines.append("")
+
+
+def append_avx2_phase(lines, step, constant, unit):
+    """Append the vector phase: the Q0.64 product of v and the reduction
+    constant, in `unit` per radian, as the scalar MulU64Shifted computes it
+    for a 32-bit fraction"""
+    lines.append(f"    // {step}. Phase in {unit}: bits 32..95 of v * {constant} from four")
+    lines.append("    // 32x32->64 products, then the same fix-up for negative lanes as the scalar path")
+    lines.append(
+        f"    const __m256i k_lo = _mm256_set1_epi64x(static_cast<int64_t>({constant} & 0xFFFFFFFF));")
+    lines.append(f"    const __m256i k_hi = _mm256_set1_epi64x(static_cast<int64_t>({constant} >> 32));")
+    lines.append("    const __m256i v_hi = _mm256_srli_epi64(v, 32);")
+    lines.append("    __m256i phase = _mm256_srli_epi64(_mm256_mul_epu32(v, k_lo), 32);")
+    lines.append("    phase = _mm256_add_epi64(phase, _mm256_mul_epu32(v, k_hi));")
+    lines.append("    phase = _mm256_add_epi64(phase, _mm256_mul_epu32(v_hi, k_lo));")
+    lines.append("    phase = _mm256_add_epi64(phase, _mm256_slli_epi64(_mm256_mul_epu32(v_hi, k_hi), 32));")
+    lines.append("    const __m256i negative = _mm256_cmpgt_epi64(zero, v);")
+    lines.append(f"    const __m256i wrap = _mm256_set1_epi64x(static_cast<int64_t>({constant} << 32));")
+    lines.append("    phase = _mm256_sub_epi64(phase, _mm256_and_si256(wrap, negative));")
+    lines.append("")
+
+
+def append_avx2_table_position(lines, step, reduced, position_shift):
+    """Append idx and t, the table interval and fraction of the reduced
+    phase in the variable `reduced`"""
+    lines.append(f"    // {step}. Table index and fraction, a shift of the {reduced} as in the scalar path")
+    lines.append(f"    const __m256i idx_scaled = _mm256_srli_epi64({reduced}, {position_shift});")
+    lines.append("    const __m256i idx = _mm256_srli_epi64(idx_scaled, kOutputFractionBits);")
+    lines.append("    const __m256i t = _mm256_and_si256(idx_scaled, low_mask);")
+    lines.append("")
+
+
+def append_avx2_gather(lines, var, table, element_type, offset=0):
+    """Append the gather of table[idx + offset] into the 64-bit lanes of
+    var, widening 32-bit elements of element_type"""
+    data = f"{table}.data()" if offset == 0 else f"{table}.data() + {offset}"
+    if element_type == "int64_t":
+        lines.append(f"    const __m256i {var} =")
+        lines.append(f"        _mm256_i64gather_epi64(reinterpret_cast<const long long*>({data}), idx, 8);")
+        return
+    widen = {"int32_t": "_mm256_cvtepi32_epi64", "uint32_t": "_mm256_cvtepu32_epi64"}
+    if element_type not in widen:
+        raise ValueError(f"No AVX2 gather for {element_type} table entries")
+    lines.append(f"    const __m256i {var} = {widen[element_type]}(")
+    lines.append(f"        _mm256_i64gather_epi32(reinterpret_cast<const int*>({data}), idx, 4));")
+
+
+def append_avx2_output(lines, step):
+    """Append the conversion of the result lanes back to the input format
+    and their store to out"""
+    lines.append(f"    // {step}. Convert result back to original input format if needed")
+    lines.append("    if constexpr (InputFractionBits < kOutputFractionBits) {")
+    lines.append("        result = shift_right_arithmetic(result, kOutputFractionBits - InputFractionBits);")
+    lines.append("    } else if constexpr (InputFractionBits > kOutputFractionBits) {")
+    lines.append("        result = _mm256_slli_epi64(result, InputFractionBits - kOutputFractionBits);")
+    lines.append("    }")
+    lines.append("    _mm256_storeu_si256(reinterpret_cast<__m256i*>(out), result);")
+
+
+def append_horner_cubic(lines, step, what, segments, fraction_bits, segment=None):
+    """Append the evaluation of `what`, the cubic segment seg with the
+    coefficients (a, b, c, d) of one of segments, at t with three narrow
+    Horner steps; segment, a (type, table) pair, declares seg as
+    table[idx] first
+
+    Raises ValueError when a Horner operand could overflow the 64-bit
+    product of Fixed64MulNarrow."""
+    # |t| < 1, so each Horner step grows the running value by at most the
+    # next coefficient (plus rounding); t < 2^fraction_bits, so t * operand
+    # (plus the rounding term) fits in 64 bits when every other operand stays
+    # below 2^(62 - fraction_bits)
+    horner_bound = max(abs(a) + abs(b) + abs(c) + 2 for a, b, c, _ in segments)
+    if horner_bound >= 1 << (62 - fraction_bits):
+        raise ValueError(
+            f"Cubic coefficients up to {horner_bound} overflow a 64-bit Horner step")
+    lines.append(f"    // {step}. Evaluate {what} p(t) = ((a*t + b)*t + c)*t + d using")
+    lines.append("    // Horner's method; the generator checked that every operand stays below")
+    lines.append(f"    // 2^{horner_bound.bit_length()}, so t * operand fits in 64 bits")
+    if segment is not None:
+        segment_type, table = segment
+        lines.append(f"    const {segment_type}& seg = {table}[idx];")
+    lines.append("    int64_t result = Primitives::Fixed64MulNarrow(t, seg.a, kOutputFractionBits) + seg.b;")
+    lines.append("    result = Primitives::Fixed64MulNarrow(t, result, kOutputFractionBits) + seg.c;")
+    lines.append("    result = Primitives::Fixed64MulNarrow(t, result, kOutputFractionBits) + seg.d;")
+    lines.append("")
+
+
+def append_runtime_wrapper(lines, name, fraction_bits, fold_sign=False, saturate=False):
+    """Append an overload of `name` taking the fraction bits at runtime; the
+    Fixed64 alias formats go to their own instantiation, anything else is
+    converted to the internal format and forwarded to the template
+
+    With fold_sign the conversions run on |x| and the sign is restored
+    afterwards, which keeps an odd function odd although the shifts round
+    towards negative infinity. With saturate a result too large for a wider
+    input format is clamped to its largest magnitude instead of wrapping in
+    the conversion back."""
+    lines.append(f"// {name} for input_fraction_bits known only at runtime")
+    lines.append(
+        f"inline constexpr auto {name}(int64_t x, int input_fraction_bits) noexcept -> int64_t {{")
+    lines.append("    // Formats of the Fixed64 aliases get their shifts folded at compile time")
+    lines.append("    switch (input_fraction_bits) {")
+    for bits in ALIAS_FRACTION_BITS:
+        lines.append(f"        case {bits}:")
+        lines.append(f"            return {name}<{bits}>(x);")
+    lines.append("        default:")
+    lines.append("            break;")
+    lines.append("    }")
+    lines.append("")
+    lines.append(f"    constexpr int kOutputFractionBits = {fraction_bits};")
+    if fold_sign:
+        lines.append("    const int64_t sign_mask = x >> 63;")
+        lines.append("    x = (x ^ sign_mask) - sign_mask;")
+    lines.append(
+        "    x = Primitives::ShiftFractionBits(x, input_fraction_bits, kOutputFractionBits);")
+    if fold_sign:
+        lines.append(f"    int64_t result = {name}<kOutputFractionBits>(x);")
+        lines.append(
+            "    result = Primitives::ShiftFractionBits(result, kOutputFractionBits, input_fraction_bits);")
+        lines.append("    return (result ^ sign_mask) - sign_mask;")
+    elif saturate:
+        lines.append(f"    int64_t result = {name}<kOutputFractionBits>(x);")
+        lines.append("    if (input_fraction_bits > kOutputFractionBits) {")
+        lines.append("        const int64_t limit =")
+        lines.append(
+            "            std::numeric_limits<int64_t>::max() >> (input_fraction_bits - kOutputFractionBits);")
+        lines.append("        result = result > limit ? limit : (result < -limit ? -limit : result);")
+        lines.append("    }")
+        lines.append(
+            "    return Primitives::ShiftFractionBits(result, kOutputFractionBits, input_fraction_bits);")
+    else:
+        lines.append(f"    const int64_t result = {name}<kOutputFractionBits>(x);")
+        lines.append(
+            "    return Primitives::ShiftFractionBits(result, kOutputFractionBits, input_fraction_bits);")
+    lines.append("}")
+    lines.append("")
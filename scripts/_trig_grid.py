@@ -0,0 +1,35 @@
+"""Sin and cos on an evenly spaced angle grid, shared by the generator scripts
+
+The sin and tan tables both sample [0,pi/2] at a fixed step; stepping the
+angle-addition formulas along the grid replaces a fresh mp.sin/mp.cos or
+mp.tan per entry with a handful of multiplies."""
+
+import mpmath as mp
+
+# Grid points between direct mp.sin/mp.cos evaluations in sin_cos_grid
+GRID_RESYNC_INTERVAL = 64
+
+
+def sin_cos_grid(points, angle_step, dps):
+    """Return (x, sin(x), cos(x)) at x = i * angle_step for i in range(points)
+
+    The angles form an arithmetic progression, so x advances by one addition
+    and the angle-addition formulas step sin and cos from one point to the
+    next with four multiplies instead of a fresh mp.sin and mp.cos each;
+    every GRID_RESYNC_INTERVAL points all three are evaluated directly again
+    so the rounding of the recurrence cannot build up. Everything runs at
+    dps digits."""
+    grid = []
+    with mp.workdps(dps):
+        sin_step = mp.sin(angle_step)
+        cos_step = mp.cos(angle_step)
+        for i in range(points):
+            if i % GRID_RESYNC_INTERVAL == 0:
+                angle = mp.mpf(i) * angle_step
+                sin_x, cos_x = mp.sin(angle), mp.cos(angle)
+            else:
+                angle += angle_step
+                sin_x, cos_x = (sin_x * cos_step + cos_x * sin_step,
+                                cos_x * cos_step - sin_x * sin_step)
+            grid.append((angle, sin_x, cos_x))
+    return grid
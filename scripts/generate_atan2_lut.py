@@ -27,6 +27,17 @@ def generate_atan2_lut(table_size=256, output_file="atan2_lut.h"):
     # Add an extra entry that's a copy of the last item (257th entry)
     fixed_values.append(fixed_values[-1])
     
+    # Split the table into a sparse int64 base grid (every 16th entry) plus
+    # per-entry deltas from that base, stored in the narrowest type that fits
+    base_shift = 4
+    base_values = fixed_values[::1 << base_shift]
+    delta_values = [val - base_values[i >> base_shift] for i, val in enumerate(fixed_values)]
+    for delta_type, delta_bits in (("int16_t", 16), ("int32_t", 32)):
+        if all(-(1 << (delta_bits - 1)) <= d < (1 << (delta_bits - 1)) for d in delta_values):
+            break
+    else:
+        raise ValueError("atan2 LUT deltas do not fit in 32 bits")
+    
     # Write to header file
     with open(output_file, "w") as f:
         f.write("#pragma once\n\n")
@@ -38,19 +49,28 @@ def generate_atan2_lut(table_size=256, output_file="atan2_lut.h"):
         f.write(f"// Arctangent lookup table with {table_size + 1} entries for atan2 implementation\n")
         f.write(f"// Input range: [0, 1], Output: atan(x) in radians [0, pi/4]\n")
         f.write(f"// Fixed-point format: Q31.32\n")
-        f.write(f"inline constexpr std::array<int64_t, {table_size + 1}> kAtan2LUT = {{\n")
+        f.write(f"// Stored as an int64_t base for every {1 << base_shift}th entry plus a per-entry {delta_type}\n")
+        f.write(f"// delta: atan(ratio_i) = kAtan2Base[i >> {base_shift}] + kAtan2Delta[i]\n")
+        f.write(f"// Aligned to a 64-byte cache line so neighboring entries share a line\n")
+        f.write(f"alignas(64) inline constexpr std::array<int64_t, {len(base_values)}> kAtan2Base = {{\n")
+        for i, val in enumerate(base_values):
+            separator = "," if i < len(base_values) - 1 else " "
+            f.write(f"    {val}LL{separator}  // entry {i << base_shift}\n")
+        f.write("};\n\n")
+        
+        f.write(f"alignas(64) inline constexpr std::array<{delta_type}, {table_size + 1}> kAtan2Delta = {{\n")
         
         # Format the values with comments indicating actual values
-        for i, val in enumerate(fixed_values):
+        for i, val in enumerate(delta_values):
             if i < table_size:
                 x = inputs[i]
                 atan_x = atan_values[i]
-                f.write(f"    {val}LL,  // ratio={x:.11f}, angle={atan_x:.11f}\n")
+                f.write(f"    {val},  // ratio={x:.11f}, angle={atan_x:.11f}\n")
             else:
                 # Last entry (copy of the last value)
                 x = 1.0
                 atan_x = atan_values[-1]
-                f.write(f"    {val}LL   // ratio={x:.11f}, angle={atan_x:.11f}\n")
+                f.write(f"    {val}   // ratio={x:.11f}, angle={atan_x:.11f}\n")
         
         f.write("};\n\n")
         
@@ -86,8 +106,9 @@ def generate_atan2_lut(table_size=256, output_file="atan2_lut.h"):
         f.write(f"    int64_t frac = scaled_x % kIndexScale;\n\n")
         
         f.write(f"    // Perform linear interpolation\n")
-        f.write(f"    int64_t y0 = kAtan2LUT[index];\n")
-        f.write(f"    int64_t y1 = kAtan2LUT[index + 1];\n")
+        f.write(f"    constexpr int kBaseShift = {base_shift};\n")
+        f.write(f"    int64_t y0 = kAtan2Base[index >> kBaseShift] + kAtan2Delta[index];\n")
+        f.write(f"    int64_t y1 = kAtan2Base[(index + 1) >> kBaseShift] + kAtan2Delta[index + 1];\n")
         f.write(f"    int64_t result = y0 + ((y1 - y0) * frac) / kIndexScale;\n\n")
         
         f.write(f"    // Adjust precision if needed\n")
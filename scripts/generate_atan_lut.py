@@ -1,306 +1,510 @@
+import functools
+import math
 import mpmath as mp
 import sys
 
+from _fixed_constants import as_hex64, constant_value, scaled_constant
+from _generator_output import open_output
+from _lookup_emitters import (
+    append_horner_cubic,
+    append_lookup_batch,
+    append_lookup_x4,
+    append_runtime_wrapper,
+    avx2_conditional_negate,
+)
+
 # Set very high precision
 mp.mp.dps = 100
 
-
-def generate_atan_lut(output_file=None, entries=512, fraction_bits=32):
-    """Generate a lookup table for atan in the range [0,1]"""
-
-    int_bits = 63 - fraction_bits
-
-    # Prepare the output with proper headers
-    lines = []
-    lines.append("#pragma once")
-    lines.append("")
-    lines.append("#include <stdint.h>")
-    lines.append("#include <array>")
-    lines.append("#include \"primitives.h\"")
-    lines.append("")
-    lines.append(f"// Atan lookup table with {entries + 1} entries")
-    lines.append(
-        f"// Covers the range [0,1] with values in Q{int_bits}.{fraction_bits} format")
-    lines.append(
-        f"// Generated with mpmath library at {mp.mp.dps} digits precision")
-    lines.append("")
-
-    # Generate the table header
-    lines.append("namespace math::fp::detail {")
-    lines.append("// Table maps x in [0,1] to atan(x)")
-    lines.append(f"// Values stored in Q{int_bits}.{fraction_bits} fixed-point format")
-    lines.append(
-        f"inline constexpr std::array<int64_t, {entries + 1}> kAtanLut = {{")
-
-    # Generate the table entries
-    scale = mp.mpf(2) ** fraction_bits
-    pi_over_2 = mp.pi / 2
-    pi_over_2_scaled = int(pi_over_2 * scale)  # Truncate
-    pi_over_2_hex = f"0x{pi_over_2_scaled & 0xFFFFFFFFFFFFFFFF:016X}LL"
+# Working precision for the table entries: enough to truncate Q31.32 (and
+# wider) values correctly without paying for the global 100 digits per entry
+TABLE_DPS = 30
+
+
+# Number of odd-power terms in the optional table-free LookupAtanFast
+# polynomial (7 terms = degree 13, max error ~2.5e-7 on [0,1])
+POLY_TERMS = 7
+
+
+def fit_atan_minimax(terms, iterations=8, grid_size=1000):
+    """Fit atan(x) ~= sum(c[k] * x^(2k+1)) on [0,1] with the Remez exchange
+    algorithm, minimizing the maximum absolute error.
+
+    The equioscillation system is solved in mpmath; the error curve is only
+    used to locate extrema, so it is scanned in double precision, which
+    resolves errors of this size with many digits to spare.
+
+    Returns the coefficient list and the maximum error of the fit."""
+    grid = [i / grid_size for i in range(1, grid_size + 1)]
+    targets = [math.atan(x) for x in grid]
+    with mp.workdps(40):
+        reference = [mp.mpf(j + 1) / (terms + 1) for j in range(terms + 1)]
+        for _ in range(iterations):
+            # Solve for coefficients that equioscillate on the reference points
+            a = mp.matrix(terms + 1, terms + 1)
+            b = mp.matrix(terms + 1, 1)
+            for row, x in enumerate(reference):
+                for k in range(terms):
+                    a[row, k] = x ** (2 * k + 1)
+                a[row, terms] = (-1) ** row
+                b[row] = mp.atan(x)
+            solution = mp.lu_solve(a, b)
+            coeffs = [solution[k] for k in range(terms)]
+
+            # Move the reference to the alternating extrema of the error curve
+            horner = [float(c) for c in reversed(coeffs)]
+            errors = []
+            for x, y in zip(grid, targets):
+                x2 = x * x
+                p = 0.0
+                for c in horner:
+                    p = p * x2 + c
+                errors.append(p * x - y)
+            # Take the largest error within each run of equal sign
+            extrema = []
+            for i, e in enumerate(errors):
+                if extrema and (extrema[-1][1] > 0) == (e > 0):
+                    if abs(e) > abs(extrema[-1][1]):
+                        extrema[-1] = (i, e)
+                else:
+                    extrema.append((i, e))
+            while len(extrema) > terms + 1:
+                extrema.pop(0 if abs(extrema[0][1]) < abs(extrema[-1][1]) else -1)
+            reference = [mp.mpf(i + 1) / grid_size for i, _ in extrema]
+
+        return coeffs, max(abs(e) for e in errors)
+
+
+@functools.lru_cache(maxsize=None)
+def atan_grid_value(i, entries):
+    """Return atan(i / entries), memoized so runs that only change
+    fraction_bits reuse the same atan evaluations"""
+    return mp.atan(mp.mpf(i) / entries)
+
+
+def round_div(num, den):
+    """Return num / den rounded to the nearest integer, ties to even like
+    mp.nint, for integers num >= 0 and den > 0"""
+    q, r = divmod(num, den)
+    return q + (2 * r > den or (2 * r == den and q & 1))
+
+
+def atan_segments(entries, scale):
+    """Return the Hermite coefficients (a, b, c, d) of the cubics that
+    interpolate atan on each [i/entries, (i+1)/entries] in the local variable
+    t in [0,1), followed by the constant segment atan(1)
+
+    The endpoint values and step-scaled derivatives are rounded to the
+    nearest fixed-point value first and a, b are derived from those integers,
+    so p(0) and p(1) hit the rounded endpoint values exactly. Each grid node
+    is evaluated once and shared by the two segments that meet there."""
+    with mp.workdps(TABLE_DPS):
+        values = [int(mp.nint(atan_grid_value(i, entries) * scale))
+                  for i in range(entries + 1)]
+    # h * atan'(x) = h / (1 + x^2) with x = i/entries, h = 1/entries is the
+    # exact rational entries / (entries^2 + i^2), so no mpmath is needed
+    slopes = [round_div(scale * entries, entries * entries + i * i)
+              for i in range(entries + 1)]
+
+    segments = []
     for i in range(entries):
-        x = mp.mpf(i) / (entries - 1)
-        atan_x = mp.atan(x)
-        scaled_value = int(atan_x * scale)  # Truncate instead of round
-
-        # Format the value as a hexadecimal literal with LL suffix
-        hex_value = f"0x{scaled_value & 0xFFFFFFFFFFFFFFFF:016X}LL"
-
-        # Generate a shorter comment with just the first ~20 digits of precision
-        # Convert to float first to avoid mpf formatting issues
-        x_float = float(x)
-        atan_x_float = float(atan_x)
-        comment = f"// atan({x_float:.11f}) = {atan_x_float:.11f}"
-
-        # Add the entry to the table
-        if i < entries - 1:
-            lines.append(f"    {hex_value},  {comment}")
-        else:
-            # For the last entry, add it twice to avoid index out of bounds
-            lines.append(f"    {hex_value},  {comment}")
-            lines.append(f"    {hex_value}   {comment}")
-
-    # Close the table
-    lines.append("};")
-    lines.append("")
-
-    # Add the LookupAtanFast function (renamed from original LookupAtan)
-    lines.append(
-        "// Fast lookup atan(x) with linear interpolation between table entries")
-    lines.append(
-        "// Input x is in fixed-point format with specified fraction bits representing a value in [-1,1]")
-    lines.append(
-        f"// Output is in fixed-point format with the same fraction bits representing atan(x)")
-    lines.append("// Precision: ~3.1e-7 when fraction_bits=32")
-    lines.append(
-        "inline constexpr auto LookupAtanFast(int64_t x, int input_fraction_bits) noexcept -> int64_t {")
+        p0, p1 = values[i], values[i + 1]
+        m0, m1 = slopes[i], slopes[i + 1]
+        a = 2 * (p0 - p1) + m0 + m1
+        b = 3 * (p1 - p0) - 2 * m0 - m1
+        segments.append((a, b, m0, p0))
+    segments.append((0, 0, 0, values[entries]))
+    return segments
+
+
+def append_atan_prologue(lines, fraction_bits):
+    """Append the code shared by every LookupAtan variant up to the point
+    where x is reduced to [0,1]: constants, sign removal, format conversion
+    and the reciprocal reduction for x > 1"""
+    pi_over_2 = constant_value("HalfPi")
+    pi_over_2_hex = as_hex64(scaled_constant("HalfPi", fraction_bits))
     lines.append("    // Constants")
     lines.append(
         f"    constexpr int kOutputFractionBits = {fraction_bits};  // Internal calculation format")
     lines.append("    constexpr int64_t kOne = 1LL << kOutputFractionBits;")
+    lines.append(
+        f"    constexpr int64_t kPiOver2 = {pi_over_2_hex};  // pi/2 = {float(pi_over_2)}")
     lines.append("")
 
-    lines.append("    // Handle negative input")
-    lines.append("    bool is_negative = false;")
-    lines.append("    if (x < 0) {")
-    lines.append("        x = -x;")
-    lines.append("        is_negative = true;")
-    lines.append("    }")
+    lines.append("    // Handle negative input without branching: sign_mask is 0 or -1")
+    lines.append("    const int64_t sign_mask = x >> 63;")
+    lines.append("    x = (x ^ sign_mask) - sign_mask;")
     lines.append("")
 
-    lines.append("    // Convert input to internal format if needed")
-    lines.append("    if (input_fraction_bits != kOutputFractionBits) {")
-    lines.append("        if (input_fraction_bits < kOutputFractionBits) {")
+    lines.append("    // Convert input to internal format")
+    lines.append("    if constexpr (InputFractionBits != kOutputFractionBits) {")
     lines.append(
-        "            x <<= (kOutputFractionBits - input_fraction_bits);")
-    lines.append("        } else {")
-    lines.append(
-        "            x >>= (input_fraction_bits - kOutputFractionBits);")
-    lines.append("        }")
+        "        x = Primitives::ShiftFractionBits(x, InputFractionBits, kOutputFractionBits);")
     lines.append("    }")
     lines.append("")
 
     lines.append("    // 1. Ensure x is in [0,1] range")
-    lines.append("    if (x <= 0) {")
+    lines.append("    if (x <= 0) [[unlikely]] {")
     lines.append("        return 0;")
     lines.append("    }")
 
     lines.append("    bool use_reciprocal = false;")
-    lines.append("    if (x >= kOne) {")
+    lines.append("    if (x > kOne) [[unlikely]] {")
     lines.append("        // For x > 1, use atan(x) = π/2 - atan(1/x)")
     lines.append("        use_reciprocal = true;")
-    lines.append("        // Calculate 1/x in fixed-point")
-    lines.append(
-        "        x = Primitives::Fixed64Div(kOne, x, kOutputFractionBits);")
+    append_atan_reciprocal(lines, fraction_bits)
     lines.append("    }")
     lines.append("")
 
-    lines.append("    // 2. Scale x to table index")
-    lines.append(
-        "    constexpr int64_t kScale = static_cast<int64_t>(kAtanLut.size() - 2);")
-    lines.append(
-        "    const int64_t idx_scaled = Primitives::Fixed64Mul(x, kScale << kOutputFractionBits, kOutputFractionBits);")
-    lines.append("    const int64_t idx = idx_scaled >> kOutputFractionBits;")
-    lines.append(
-        "    const int64_t t = idx_scaled & ((1LL << kOutputFractionBits) - 1);  // Fractional part [0,1)")
-    lines.append("")
 
-    lines.append("    // 4. Get table values for interpolation")
-    lines.append("    const int64_t y0 = kAtanLut[idx];")
-    lines.append("    const int64_t y1 = kAtanLut[idx + 1];")
-    lines.append("")
+def append_atan_reciprocal(lines, fraction_bits):
+    """Append x = 1/x for x > 1, which is floor(2^(2 * fraction_bits) / x) in
+    fixed-point and so needs no 128-bit division while that fits 64 bits"""
+    if fraction_bits < 32:
+        lines.append("        // Calculate 1/x in fixed-point: 2^(2 * kOutputFractionBits) fits in 64 bits")
+        lines.append("        x = (int64_t{1} << (2 * kOutputFractionBits)) / x;")
+    elif fraction_bits == 32:
+        lines.append("        // Calculate 1/x = 2^64 / x in fixed-point with one 64-bit division:")
+        lines.append("        // (2^64 - 1) / x is one short of it only when x is a power of two")
+        lines.append("        const uint64_t ux = static_cast<uint64_t>(x);")
+        lines.append(
+            "        x = static_cast<int64_t>(UINT64_MAX / ux + ((ux & (ux - 1)) == 0 ? 1 : 0));")
+    else:
+        lines.append("        // Calculate 1/x in fixed-point")
+        lines.append(
+            "        x = Primitives::Fixed64Div(kOne, x, kOutputFractionBits);")
 
-    lines.append("    // 5. Linear interpolation")
-    lines.append(
-        "    int64_t result = y0 + (((y1 - y0) * t) >> kOutputFractionBits);")
-    lines.append("")
 
+def append_atan_epilogue(lines):
+    """Append the code shared by every LookupAtan variant after `result`
+    holds atan of the reduced argument: undo the reduction, convert back
+    to the input format and restore the sign"""
     lines.append("    // Apply reciprocal formula if needed")
-    lines.append("    if (use_reciprocal) {")
-    lines.append("        // π/2 in our fixed-point format")
-    lines.append(
-        f"        constexpr int64_t kHalfPi = {pi_over_2_hex};  // pi/2 = {float(pi_over_2)}")
-    lines.append("        result = kHalfPi - result;")
+    lines.append("    if (use_reciprocal) [[unlikely]] {")
+    lines.append("        result = kPiOver2 - result;")
     lines.append("    }")
     lines.append("")
 
-    lines.append("    // 6. Convert result back to input format if needed")
-    lines.append("    if (input_fraction_bits != kOutputFractionBits) {")
-    lines.append("        if (input_fraction_bits < kOutputFractionBits) {")
+    lines.append("    // 6. Convert result back to input format")
+    lines.append("    if constexpr (InputFractionBits != kOutputFractionBits) {")
     lines.append(
-        "            result >>= (kOutputFractionBits - input_fraction_bits);")
-    lines.append("        } else {")
-    lines.append(
-        "            result <<= (input_fraction_bits - kOutputFractionBits);")
-    lines.append("        }")
+        "        result = Primitives::ShiftFractionBits(result, kOutputFractionBits, InputFractionBits);")
     lines.append("    }")
     lines.append("")
 
     lines.append("    // Apply sign")
-    lines.append("    return is_negative ? -result : result;")
+    lines.append("    return (result ^ sign_mask) - sign_mask;")
     lines.append("}")
     lines.append("")
 
-    # Add a new quadratic interpolation version
-    lines.append(
-        "// High precision lookup atan(x) with quadratic interpolation between table entries")
-    lines.append(
-        "// Input x is in fixed-point format with specified fraction bits representing a value in [-1,1]")
-    lines.append(
-        f"// Output is in fixed-point format with the same fraction bits representing atan(x)")
-    lines.append("// Precision: ~5.5e-10 when fraction_bits=32")
-    lines.append(
-        "inline constexpr auto LookupAtan(int64_t x, int input_fraction_bits) noexcept -> int64_t {")
-    lines.append("    // Constants")
-    lines.append(
-        f"    constexpr int kOutputFractionBits = {fraction_bits};  // Internal calculation format")
-    lines.append("    constexpr int64_t kOne = 1LL << kOutputFractionBits;")
-    lines.append("")
 
-    lines.append("    // Handle negative input")
-    lines.append("    bool is_negative = false;")
-    lines.append("    if (x < 0) {")
-    lines.append("        x = -x;")
-    lines.append("        is_negative = true;")
-    lines.append("    }")
+def segments_fit_32bit(segments):
+    """Return whether every segment fits in int32_t a, b, c and uint32_t d
+
+    a, b and c are a step-size fraction of atan(1) and d is at most atan(1),
+    so Q31.32 tables fit; wider formats fall back to int64_t fields."""
+    coeff_max = max(max(abs(a), abs(b), abs(c)) for a, b, c, _ in segments)
+    value_max = max(d for *_, d in segments)
+    return coeff_max < 1 << 31 and value_max < 1 << 32
+
+
+def append_atan_table(lines, entries, fraction_bits):
+    """Append kAtanLutBits, AtanSegment and the kAtanTable definition, and
+    return the segment coefficients"""
+    lut_bits = entries.bit_length() - 1
+    int_bits = 63 - fraction_bits
+    scale = 1 << fraction_bits
+
+    # The segment past the end is the constant atan(1), so x == 1.0 reads a
+    # valid segment with t == 0
+    segments = atan_segments(entries, scale)
+
+    if segments_fit_32bit(segments):
+        coeff_type, value_type, value_format = "int32_t", "uint32_t", "0x{:08X}"
+    else:
+        coeff_type, value_type, value_format = "int64_t", "int64_t", "0x{:016X}LL"
+
+    lines.append("// The table splits [0,1] into 2^kAtanLutBits intervals")
+    lines.append(f"inline constexpr int kAtanLutBits = {lut_bits};")
+    lines.append("")
+    lines.append("// Cubic Hermite segment of atan in the local variable t in [0,1):")
+    lines.append("// atan(x) ~= ((a*t + b)*t + c)*t + d, with the derivatives scaled by the step size")
+    lines.append("struct AtanSegment {")
+    lines.append(f"    {coeff_type} a;")
+    lines.append(f"    {coeff_type} b;")
+    lines.append(f"    {coeff_type} c;")
+    lines.append(f"    {value_type} d;")
+    lines.append("};")
     lines.append("")
+    lines.append("// Table maps each interval of [0,1] to its Hermite coefficients, built from")
+    lines.append("// the endpoint values atan(x) and derivatives atan'(x) = 1/(1+x^2)")
+    lines.append(f"// Values stored in Q{int_bits}.{fraction_bits} fixed-point format")
+    lines.append("// On ELF targets the table gets its own .rodata.math_trig_lut.* input section so a")
+    lines.append("// linker script can group the trig tables, e.g. KEEP(*(SORT(.rodata.math_trig_lut.*)))")
+    lines.append("// inside .rodata; the default scripts simply fold it into .rodata")
+    lines.append("#if defined(__GNUC__) && defined(__ELF__)")
+    lines.append("[[gnu::section(\".rodata.math_trig_lut.atan\")]]")
+    lines.append("#endif")
+    lines.append(
+        f"alignas(64) inline constexpr std::array<AtanSegment, {entries + 1}> kAtanTable = {{{{")
+    rows = [f"{{{a}, {b}, {c}, {value_format.format(d)}}}" for a, b, c, d in segments]
+    width = max(len(row) for row in rows) + 2
+    # entries is a power of two, so i / entries is exact in double precision
+    # and the interval bounds need no mpmath
+    for i, row in enumerate(rows):
+        separator = "," if i < entries else " "
+        x0 = i / entries
+        x1 = min(i + 1, entries) / entries
+        lines.append(f"    {row + separator:<{width}}// [{x0:.11f}, {x1:.11f}]")
+    lines.append("}};")
+    lines.append("")
+    return segments
+
 
-    lines.append("    // Convert input to internal format if needed")
-    lines.append("    if (input_fraction_bits != kOutputFractionBits) {")
-    lines.append("        if (input_fraction_bits < kOutputFractionBits) {")
+def append_atan_poly(lines, fraction_bits):
+    """Append the kAtanPoly coefficients and return the fit's max error"""
+    int_bits = 63 - fraction_bits
+    scale = 1 << fraction_bits
+    poly_coeffs, poly_error = fit_atan_minimax(POLY_TERMS)
     lines.append(
-        "            x <<= (kOutputFractionBits - input_fraction_bits);")
-    lines.append("        } else {")
+        f"// Minimax polynomial atan(x) ~= x * sum(kAtanPoly[k] * x^(2k)) on [0,1], max error {float(poly_error):.1e}")
     lines.append(
-        "            x >>= (input_fraction_bits - kOutputFractionBits);")
-    lines.append("        }")
-    lines.append("    }")
+        f"// Coefficients fitted with the Remez algorithm, stored in Q{int_bits}.{fraction_bits} fixed-point format")
+    lines.append(
+        f"inline constexpr std::array<int64_t, {POLY_TERMS}> kAtanPoly = {{")
+    for k, c in enumerate(poly_coeffs):
+        scaled_value = int(mp.nint(c * scale))
+        separator = "," if k < POLY_TERMS - 1 else " "
+        lines.append(
+            f"    {f'{scaled_value}LL{separator}':<16}// x^{2 * k + 1}: {float(c):.12f}")
+    lines.append("};")
     lines.append("")
+    return poly_error
 
-    lines.append("    // 1. Ensure x is in [0,1] range")
-    lines.append("    if (x <= 0) {")
-    lines.append("        return 0;")
-    lines.append("    }")
 
-    lines.append("    bool use_reciprocal = false;")
-    lines.append("    if (x >= kOne) {")
-    lines.append("        // For x > 1, use atan(x) = π/2 - atan(1/x)")
-    lines.append("        use_reciprocal = true;")
-    lines.append("        // Calculate 1/x in fixed-point")
+def append_lookup_atan_fast(lines, segments, fraction_bits, poly_error):
+    """Append LookupAtanFast: linear interpolation, or kAtanPoly when
+    FIXED64_MATH_ATAN_FAST_USE_POLY is set"""
     lines.append(
-        "        x = Primitives::Fixed64Div(kOne, x, kOutputFractionBits);")
-    lines.append("    }")
-    lines.append("")
-
-    lines.append("    // 2. Scale x to table index")
+        "// Fast lookup atan(x) with linear interpolation between table entries")
     lines.append(
-        "    constexpr int64_t kScale = static_cast<int64_t>(kAtanLut.size() - 2);")
+        "// Input x is in fixed-point format with InputFractionBits fraction bits representing any value;")
     lines.append(
-        "    const int64_t idx_scaled = Primitives::Fixed64Mul(x, kScale << kOutputFractionBits, kOutputFractionBits);")
-    lines.append("    const int64_t idx = idx_scaled >> kOutputFractionBits;")
+        "// |x| > 1 is reduced to [0,1] with atan(x) = pi/2 - atan(1/x)")
     lines.append(
-        "    const int64_t t = idx_scaled & ((1LL << kOutputFractionBits) - 1);  // Fractional part [0,1)")
-    lines.append("")
+        f"// Output is in fixed-point format with the same fraction bits representing atan(x)")
+    lines.append("// Precision: ~3.1e-7 when fraction_bits=32")
+    lines.append(
+        f"// With FIXED64_MATH_ATAN_FAST_USE_POLY the table is replaced by kAtanPoly (~{float(poly_error):.1e})")
+    lines.append(f"template <int InputFractionBits = {fraction_bits}>")
+    lines.append("inline constexpr auto LookupAtanFast(int64_t x) noexcept -> int64_t {")
+    append_atan_prologue(lines, fraction_bits)
 
-    lines.append("    // 4. Get table values for quadratic interpolation")
-    lines.append("    // Need three points: (x0,y0), (x1,y1), (x2,y2)")
+    lines.append("    int64_t result;")
+    lines.append("    if constexpr (FIXED64_MATH_ATAN_FAST_USE_POLY) {")
+    lines.append("        // 2. Evaluate x * P(x^2) with Horner's method")
     lines.append(
-        "    const int64_t y1 = kAtanLut[idx];       // Current point")
-    lines.append("    const int64_t y2 = kAtanLut[idx + 1];   // Next point")
-    lines.append("    // For the previous point, handle the boundary case")
-    lines.append("    int64_t y0;")
-    lines.append("    if (idx > 0) {")
-    lines.append("        y0 = kAtanLut[idx - 1];  // Previous point")
+        "        const int64_t x2 = Primitives::Fixed64Mul(x, x, kOutputFractionBits);")
+    lines.append(f"        int64_t y = kAtanPoly[{POLY_TERMS - 1}];")
+    for k in range(POLY_TERMS - 2, -1, -1):
+        lines.append(
+            f"        y = kAtanPoly[{k}] + Primitives::Fixed64Mul(x2, y, kOutputFractionBits);")
+    lines.append(
+        "        result = Primitives::Fixed64Mul(x, y, kOutputFractionBits);")
     lines.append("    } else {")
+    lines.append("        // 2. Split x into table index and fraction")
     lines.append(
-        "        // At the boundary, mirror the slope for better extrapolation")
-    lines.append("        y0 = y1 - (y2 - y1);")
-    lines.append("    }")
+        "        const int64_t idx = x >> (kOutputFractionBits - kAtanLutBits);")
+    lines.append(
+        "        const int64_t t = (x << kAtanLutBits) & ((1LL << kOutputFractionBits) - 1);  // Fractional part [0,1)")
+    lines.append("")
+
+    lines.append("        // 4. Get the segment endpoints: p(0) = d and p(1) - p(0) = a + b + c")
+    lines.append("        const AtanSegment& seg = kAtanTable[idx];")
+    lines.append("        const int64_t y0 = seg.d;")
+    lines.append("        const int64_t dy = int64_t{seg.a} + seg.b + seg.c;")
     lines.append("")
 
-    lines.append("    // 5. Quadratic interpolation")
+    # Round the interpolated step to nearest; t < 2^fraction_bits, so dy * t
+    # (plus the rounding term) fits in 64 bits while dy < 2^(62 - fraction_bits)
+    max_step = max(a + b + c for a, b, c, _ in segments)
+    if max_step >= 1 << (62 - fraction_bits):
+        raise ValueError(f"Segment step {max_step} overflows a 64-bit interpolation")
+    lines.append("        // 5. Linear interpolation, rounded to nearest")
     lines.append(
-        "    // The correct Lagrange quadratic formula coefficients for points at (-1,y0), (0,y1), (1,y2):")
-    lines.append("    // a = (y0 + y2)/2 - y1")
-    lines.append("    // b = (y2 - y0)/2")
-    lines.append("    // c = y1")
-    lines.append("    // c = y0")
-    lines.append("    const int64_t a = (y0 + y2)/2 - y1;")
-    lines.append("    const int64_t b = (y2 - y0)/2;")
-    lines.append("    const int64_t c = y1;")
+        "        result = y0 + Primitives::Fixed64MulNarrow(dy, t, kOutputFractionBits);")
+    lines.append("    }")
     lines.append("")
 
-    lines.append("    // Calculate polynomial a*t^2 + b*t + c")
+    append_atan_epilogue(lines)
+
+
+def append_lookup_atan(lines, segments, fraction_bits):
+    """Append LookupAtan: cubic Hermite interpolation on kAtanTable"""
     lines.append(
-        "    const int64_t t_squared = Primitives::Fixed64Mul(t, t, kOutputFractionBits);")
-    lines.append("    int64_t result = c;")
+        "// High precision lookup atan(x) with Hermite cubic interpolation between table entries")
     lines.append(
-        "    result += Primitives::Fixed64Mul(b, t, kOutputFractionBits);")
+        "// Input x is in fixed-point format with InputFractionBits fraction bits representing any value;")
     lines.append(
-        "    result += Primitives::Fixed64Mul(a, t_squared, kOutputFractionBits);")
-    lines.append("")
-
-    lines.append("    // Apply reciprocal formula if needed")
-    lines.append("    if (use_reciprocal) {")
-    lines.append("        // π/2 in our fixed-point format")
+        "// |x| > 1 is reduced to [0,1] with atan(x) = pi/2 - atan(1/x)")
     lines.append(
-        f"    constexpr int64_t kHalfPi = {pi_over_2_hex};  // pi/2 = {float(pi_over_2)}")
-    lines.append("        result = kHalfPi - result;")
-    lines.append("    }")
-    lines.append("")
+        f"// Output is in fixed-point format with the same fraction bits representing atan(x)")
+    lines.append("// Precision: ~4.2e-10 when fraction_bits=32")
+    lines.append(f"template <int InputFractionBits = {fraction_bits}>")
+    lines.append("inline constexpr auto LookupAtan(int64_t x) noexcept -> int64_t {")
+    append_atan_prologue(lines, fraction_bits)
 
-    lines.append("    // 6. Convert result back to input format if needed")
-    lines.append("    if (input_fraction_bits != kOutputFractionBits) {")
-    lines.append("        if (input_fraction_bits < kOutputFractionBits) {")
+    lines.append("    // 2. Split x into table index and fraction")
     lines.append(
-        "            result >>= (kOutputFractionBits - input_fraction_bits);")
-    lines.append("        } else {")
+        "    const int64_t idx = x >> (kOutputFractionBits - kAtanLutBits);")
     lines.append(
-        "            result <<= (input_fraction_bits - kOutputFractionBits);")
-    lines.append("        }")
-    lines.append("    }")
+        "    const int64_t t = (x << kAtanLutBits) & ((1LL << kOutputFractionBits) - 1);  // Fractional part [0,1)")
     lines.append("")
 
-    lines.append("    // Apply sign")
-    lines.append("    return is_negative ? -result : result;")
-    lines.append("}")
+    lines.append("    // 4. Get the precomputed Hermite coefficients of this segment")
+    lines.append("    const AtanSegment& seg = kAtanTable[idx];")
     lines.append("")
 
-    # Keep the original linear interpolation function
-    lines.append(
-        "// Fast lookup atan(x) with linear interpolation between table entries")
+    append_horner_cubic(lines, 5, "the cubic", segments, fraction_bits)
+
+    append_atan_epilogue(lines)
+
+
+def append_lookup_atan_fast_x4(lines, segments, fraction_bits):
+    """Append LookupAtanFastx4, which evaluates four LookupAtanFast calls at
+    once, with an AVX2 body when the table uses the packed 32-bit layout"""
+    def vector_body(lines):
+        lines.append("    if constexpr (!FIXED64_MATH_ATAN_FAST_USE_POLY) {")
+        lines.append(
+            f"        constexpr int kOutputFractionBits = {fraction_bits};  // Internal calculation format")
+        lines.append("        const __m256i zero = _mm256_setzero_si256();")
+        lines.append("        __m256i v = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(x));")
+        lines.append("")
+        lines.append("        // Handle negative input without branching: sign_mask is 0 or -1")
+        lines.append("        const __m256i sign_mask = _mm256_cmpgt_epi64(zero, v);")
+        lines.append(f"        v = {avx2_conditional_negate('v', 'sign_mask')};")
+        lines.append("")
+        lines.append("        // Convert input to internal format; v is non-negative, so logical shifts")
+        lines.append("        // match the scalar arithmetic ones")
+        lines.append("        if constexpr (InputFractionBits < kOutputFractionBits) {")
+        lines.append("            v = _mm256_slli_epi64(v, kOutputFractionBits - InputFractionBits);")
+        lines.append("        } else if constexpr (InputFractionBits > kOutputFractionBits) {")
+        lines.append("            v = _mm256_srli_epi64(v, InputFractionBits - kOutputFractionBits);")
+        lines.append("        }")
+        lines.append("")
+        lines.append("        // Only take the vector path when every lane is already in [0,1]")
+        lines.append("        const __m256i one = _mm256_set1_epi64x(1LL << kOutputFractionBits);")
+        lines.append(
+            "        const __m256i outside = _mm256_or_si256(_mm256_cmpgt_epi64(v, one), _mm256_cmpgt_epi64(zero, v));")
+        lines.append("        if (_mm256_testz_si256(outside, outside)) {")
+        lines.append("            // Split x into table index and fraction")
+        lines.append(
+            "            const __m256i idx = _mm256_srli_epi64(v, kOutputFractionBits - kAtanLutBits);")
+        lines.append("            const __m256i low_mask = _mm256_set1_epi64x(0xFFFFFFFFLL);")
+        lines.append(
+            "            const __m256i t = _mm256_and_si256(_mm256_slli_epi64(v, kAtanLutBits), low_mask);")
+        lines.append("")
+        lines.append("            // Each AtanSegment is two 64-bit words, {a, b} and {c, d}")
+        lines.append("            static_assert(sizeof(AtanSegment) == 16);")
+        lines.append(
+            "            const auto* words = reinterpret_cast<const long long*>(kAtanTable.data());")
+        lines.append("            const __m256i word_idx = _mm256_slli_epi64(idx, 1);")
+        lines.append("            const __m256i ab = _mm256_i64gather_epi64(words, word_idx, 8);")
+        lines.append("            const __m256i cd = _mm256_i64gather_epi64(words + 1, word_idx, 8);")
+        lines.append("")
+        lines.append("            // Sign-extend a, b and c from 32 bits: (v ^ 2^31) - 2^31")
+        lines.append("            const __m256i bias = _mm256_set1_epi64x(0x80000000LL);")
+        lines.append("            const auto sign_extend = [&](__m256i w) {")
+        lines.append("                return _mm256_sub_epi64(_mm256_xor_si256(w, bias), bias);")
+        lines.append("            };")
+        lines.append("            const __m256i a = sign_extend(_mm256_and_si256(ab, low_mask));")
+        lines.append("            const __m256i b = sign_extend(_mm256_srli_epi64(ab, 32));")
+        lines.append("            const __m256i c = sign_extend(_mm256_and_si256(cd, low_mask));")
+        lines.append("            const __m256i d = _mm256_srli_epi64(cd, 32);")
+        lines.append("")
+        lines.append("            // Linear interpolation: p(1) - p(0) = a + b + c is in [0, 2^32), and so is t,")
+        lines.append("            // so one 32x32->64 multiply per lane is exact; round to nearest like the scalar path")
+        lines.append("            const __m256i dy = _mm256_add_epi64(_mm256_add_epi64(a, b), c);")
+        lines.append("            const __m256i half = _mm256_set1_epi64x(1LL << (kOutputFractionBits - 1));")
+        lines.append(
+            "            const __m256i step = _mm256_add_epi64(_mm256_mul_epu32(dy, t), half);")
+        lines.append(
+            "            __m256i result = _mm256_add_epi64(d, _mm256_srli_epi64(step, kOutputFractionBits));")
+        lines.append("")
+        lines.append("            // Convert result back to input format")
+        lines.append("            if constexpr (InputFractionBits < kOutputFractionBits) {")
+        lines.append(
+            "                result = _mm256_srli_epi64(result, kOutputFractionBits - InputFractionBits);")
+        lines.append("            } else if constexpr (InputFractionBits > kOutputFractionBits) {")
+        lines.append(
+            "                result = _mm256_slli_epi64(result, InputFractionBits - kOutputFractionBits);")
+        lines.append("            }")
+        lines.append("")
+        lines.append("            // Apply sign")
+        lines.append(f"            result = {avx2_conditional_negate('result', 'sign_mask')};")
+        lines.append("            _mm256_storeu_si256(reinterpret_cast<__m256i*>(out), result);")
+        lines.append("            return;")
+        lines.append("        }")
+        lines.append("    }")
+
+    append_lookup_x4(lines, "LookupAtanFast", fraction_bits, [
+        "With AVX2 the table interpolation runs in 64-bit vector lanes; if any lane needs",
+        "the |x| > 1 reduction, or without AVX2, each element goes through LookupAtanFast",
+    ], vector_body if segments_fit_32bit(segments) else None, fall_through=True)
+
+
+def generate_atan_lut(output_file=None, entries=512, fraction_bits=32):
+    """Generate a lookup table for atan in the range [0,1]
+
+    The table covers [0,1] with `entries` intervals. entries must be a power
+    of two so the runtime can split x into index and fraction with shifts."""
+
+    if entries <= 0 or entries & (entries - 1):
+        raise ValueError(f"entries must be a power of two, got {entries}")
+
+    with open_output(output_file) as lines:
+        write_atan_lut(lines, entries, fraction_bits)
+
+
+def write_atan_lut(lines, entries, fraction_bits):
+    """Emit the whole atan_lut.h header through lines.append"""
+    int_bits = 63 - fraction_bits
+
+    # Prepare the output with proper headers
+    lines.append("#pragma once")
+    lines.append("")
+    lines.append("#include <stdint.h>")
+    lines.append("#include <array>")
+    lines.append("#include \"primitives.h\"")
+    lines.append("")
+    lines.append("#if defined(__AVX2__)")
+    lines.append("#include <immintrin.h>")
+    lines.append("#endif")
+    lines.append("")
+    lines.append("// Set to 1 to evaluate LookupAtanFast with a table-free minimax polynomial")
+    lines.append("// instead of the lookup table (smaller footprint, slower per call)")
+    lines.append("#ifndef FIXED64_MATH_ATAN_FAST_USE_POLY")
+    lines.append("#define FIXED64_MATH_ATAN_FAST_USE_POLY 0")
+    lines.append("#endif")
+    lines.append("")
+    lines.append(f"// Atan lookup table with {entries + 1} segments ({entries} intervals plus the atan(1) end sentinel)")
     lines.append(
-        "// Input x is in fixed-point format with specified fraction bits representing a value in [-1,1]")
+        f"// Covers the range [0,1] with values in Q{int_bits}.{fraction_bits} format")
     lines.append(
-        f"// Output is in fixed-point format with the same fraction bits representing atan(x)")
+        f"// Generated with mpmath library at {TABLE_DPS} digits precision")
+    lines.append("")
 
-    lines.append("}  // namespace math::fp::detail")
+    lines.append("namespace math::fp::detail {")
+    segments = append_atan_table(lines, entries, fraction_bits)
+    poly_error = append_atan_poly(lines, fraction_bits)
+    append_lookup_atan_fast(lines, segments, fraction_bits, poly_error)
+    append_lookup_atan(lines, segments, fraction_bits)
+    append_lookup_atan_fast_x4(lines, segments, fraction_bits)
+    append_lookup_batch(lines, "LookupAtanFast", fraction_bits)
+    append_runtime_wrapper(lines, "LookupAtanFast", fraction_bits, fold_sign=True)
+    append_runtime_wrapper(lines, "LookupAtan", fraction_bits, fold_sign=True)
 
-    # Write to file or stdout
-    if output_file:
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
-    else:
-        print("\n".join(lines))
+    lines.append("}  // namespace math::fp::detail")
 
 
 if __name__ == "__main__":
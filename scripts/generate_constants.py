@@ -1,6 +1,8 @@
 import mpmath as mp
 import sys
 
+from _fixed_constants import CONSTANTS, constant_value
+
 # Set precision to much higher than default
 mp.mp.dps = 100  # 100 decimal digits of precision
 
@@ -50,19 +52,7 @@ if len(sys.argv) > 1:
         sys.exit(1)
 else:
     # No input - generate all constants
-    constants = {
-        "Pi": mp.pi,
-        "TwoPi": 2 * mp.pi,
-        "HalfPi": mp.pi / 2,
-        "QuarterPi": mp.pi / 4,
-        "InvPi": 1 / mp.pi,
-        "E": mp.e,
-        "Ln2": mp.log(2),
-        "Log2E": mp.log(mp.e, 2),  # log base 2 of e
-        "Log10Of2": mp.log10(2),
-        "Deg2Rad": mp.pi / 180,
-        "Rad2Deg": 180 / mp.pi
-    }
+    constants = {name: constant_value(name) for name in CONSTANTS}
 
     print("// Constants for Fixed64 with 100 digits of precision\n")
     for name, value in constants.items():
@@ -1,14 +1,42 @@
 import mpmath as mp
 import sys
 
+from _generator_output import open_output
+
 # Set high precision
 mp.mp.dps = 100
 
+def atan_pow2_inv(i):
+    """Return atan(2^-i) at the working precision
+
+    For i >= 8 the Taylor series u - u^3/3 + u^5/5 - ... converges by at least
+    16 bits per term, so it is summed directly instead of calling mp.atan"""
+    u = mp.mpf(1) / mp.mpf(2**i)
+    if i < 8:
+        return mp.atan(u)
+    u2 = u * u
+    angle = mp.mpf(0)
+    power = u
+    k = 1
+    while power > mp.eps * u:
+        term = power / k
+        angle = angle - term if k % 4 == 3 else angle + term
+        power *= u2
+        k += 2
+    return angle
+
 def generate_cordic_table(output_file=None, iterations=32, scale_bits=63):
     """Generate CORDIC angle table for atan2 implementation"""
-    
+    with open_output(output_file) as lines:
+        write_cordic_table(lines, iterations, scale_bits)
+    if output_file:
+        print(f"CORDIC table written to {output_file}")
+
+
+def write_cordic_table(lines, iterations, scale_bits):
+    """Emit the whole CORDIC table header through lines.append"""
+
     # Prepare the output with proper headers
-    lines = []
     lines.append("#pragma once")
     lines.append("")
     lines.append("#include <stdint.h>")
@@ -25,15 +53,13 @@ def generate_cordic_table(output_file=None, iterations=32, scale_bits=63):
     lines.append(f"namespace detail {{")
     lines.append(f"// Table contains atan(2^-i) values for CORDIC algorithm")
     lines.append(f"// Values scaled by 2^{scale_bits}")
-    lines.append(f"constexpr std::array<int64_t, {iterations}> CordicTable = {{")
-    
-    # Scale factor
-    scale = mp.mpf(2) ** scale_bits
+    lines.append(f"// Aligned to a cache line so the CORDIC loop walks whole lines from the start")
+    lines.append(f"alignas(64) constexpr std::array<int64_t, {iterations}> CordicTable = {{")
     
     # Generate table entries
     for i in range(iterations):
-        angle = mp.atan(mp.mpf(1) / mp.mpf(2**i))
-        scaled_value = int(angle * scale)
+        angle = atan_pow2_inv(i)
+        scaled_value = int(mp.ldexp(angle, scale_bits))
         
         # Format as hex for compactness and readability
         hex_val = f"0x{scaled_value & ((1 << 64) - 1):016x}LL"
@@ -50,16 +76,24 @@ def generate_cordic_table(output_file=None, iterations=32, scale_bits=63):
     
     # Close the table
     lines.append("};")
+    lines.append("")
+
+    # Cumulative gain correction: after n rotations the vector has grown by
+    # 1/K_n, so scaling by K_n replaces a division by the CORDIC gain
+    lines.append(f"// Cumulative CORDIC gain correction K_n = prod(cos(atan(2^-i))) for i=0...n-1")
+    lines.append(f"// Entry n-1 holds K_n scaled by 2^{scale_bits}")
+    lines.append(f"alignas(64) constexpr std::array<int64_t, {iterations}> CordicGainTable = {{")
+    gain = mp.mpf(1)
+    for i in range(iterations):
+        gain /= mp.sqrt(1 + mp.mpf(4) ** -i)
+        scaled_value = int(mp.ldexp(gain, scale_bits))
+        hex_val = f"0x{scaled_value & ((1 << 64) - 1):016x}LL"
+        comment = f"// K_{i + 1} = {mp.nstr(gain, 30)}"
+        separator = "," if i < iterations - 1 else " "
+        lines.append(f"    {hex_val}{separator}  {comment}")
+    lines.append("};")
     lines.append("} // namespace detail")
     lines.append("} // namespace math::fp")
-    
-    # Output to file or stdout
-    if output_file:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
-        print(f"CORDIC table written to {output_file}")
-    else:
-        print('\n'.join(lines))
 
 if __name__ == "__main__":
     iterations = 32  # Default number of iterations
@@ -1,347 +1,585 @@
-import mpmath as mp
-import sys
-
-# Set very high precision
-mp.mp.dps = 100
-
-
-def generate_sin_lut(output_file=None, int_bits=31, fraction_bits=32):
-    """Generate a lookup table for sin in the range [0,pi/2]"""
-
-    # Use exactly 512 entries for the first quadrant
-    lut_size = 512
-
-    # Prepare the output with proper headers
-    lines = []
-    lines.append("#pragma once")
-    lines.append("")
-    lines.append("#include <stdint.h>")
-    lines.append("#include <array>")
-    lines.append("#include \"primitives.h\"")
-    lines.append("")
-    lines.append(f"// Sin lookup table with {lut_size} entries")
-    lines.append(
-        f"// Covers the range [0,pi/2] with values in Q{int_bits}.{fraction_bits} format")
-    lines.append(
-        f"// Generated with mpmath library at {mp.mp.dps} digits precision")
-    lines.append("")
-
-    # Generate the table header
-    lines.append("namespace math::fp::detail {")
-    lines.append("// Table maps x in [0,pi/2] to sin(x)")
-    lines.append(
-        f"// Values stored in Q{int_bits}.{fraction_bits} fixed-point format")
-    lines.append(
-        f"inline constexpr std::array<int64_t, {lut_size + 1}> kSinLut = {{")
-
-    # Generate the table entries in Q31.32 format
-    scale = mp.mpf(2) ** fraction_bits
-    pi_over_2 = mp.pi / 2
-    angle_step = pi_over_2 / (lut_size - 1)
-
-    for i in range(lut_size + 1):
-        angle = mp.mpf(i) * angle_step
-        if i >= lut_size:
-            angle = pi_over_2
-        sin_x = mp.sin(angle)
-
-        # Use truncation instead of rounding
-        scaled_value = int(sin_x * scale)  # Truncate instead of round
-
-        # Format the value as a hexadecimal literal with LL suffix
-        hex_value = f"0x{scaled_value & 0xFFFFFFFFFFFFFFFF:016X}LL"
-        if scaled_value < 0:
-            hex_value = f"-0x{-scaled_value & 0xFFFFFFFFFFFFFFFF:016X}LL"
-
-        # Generate a comment showing the floating point representation
-        angle_float = float(angle)
-        sin_x_float = float(sin_x)
-
-        comment = f"// sin({angle_float:.14f}) = {sin_x_float:.14f}"
-
-        # Add the entry with comment
-        if i < lut_size:
-            lines.append(f"    {hex_value}, {comment}")
-        else:
-            lines.append(f"    {hex_value}  {comment}")
-
-    lines.append("};")
-    lines.append("")
-
-    # Calculate constants in Q31.32 format with truncation
-    pi = mp.pi
-    pi_over_2 = pi / 2
-    two_pi = pi * 2
-    pi_scaled = int(pi * scale)  # Truncate
-    pi_over_2_scaled = int(pi_over_2 * scale)  # Truncate
-    two_pi_scaled = int(two_pi * scale)  # Truncate
-    lut_interval_scaled = int(
-        (lut_size - 1) / float(pi_over_2) * scale)  # Truncate
-
-    pi_hex = f"0x{pi_scaled & 0xFFFFFFFFFFFFFFFF:016X}LL"
-    pi_over_2_hex = f"0x{pi_over_2_scaled & 0xFFFFFFFFFFFFFFFF:016X}LL"
-    two_pi_hex = f"0x{two_pi_scaled & 0xFFFFFFFFFFFFFFFF:016X}LL"
-    lut_interval_hex = f"0x{lut_interval_scaled & 0xFFFFFFFFFFFFFFFF:016X}LL"
-
-    # Generate the Fast Sin lookup function (linear interpolation)
-    lines.append(
-        "// Fast lookup sin(x) with linear interpolation between table entries")
-    lines.append(
-        "// Input x is in fixed-point format with specified fraction bits representing angle in radians")
-    lines.append(
-        f"// Output is in Q{int_bits}.{fraction_bits} fixed-point format representing sin(x)")
-    lines.append("// Precision: ~1e-6 when input_fraction_bits=32")
-    lines.append(
-        "inline constexpr auto LookupSinFast(int64_t x, int input_fraction_bits) noexcept -> int64_t {")
-    lines.append("    // Constants")
-    lines.append(f"    constexpr int64_t kPi = {pi_hex};  // pi = {float(pi)}")
-    lines.append(
-        f"    constexpr int64_t kPiOver2 = {pi_over_2_hex};  // pi/2 = {float(pi_over_2)}")
-    lines.append(
-        f"    constexpr int64_t kTwoPi = {two_pi_hex};  // 2*pi = {float(two_pi)}")
-    lines.append(
-        f"    constexpr int64_t kLutInterval = {lut_interval_hex};  // LUT conversion factor")
-    lines.append(
-        f"    constexpr int kOutputFractionBits = {fraction_bits};  // Output format: Q{int_bits}.{fraction_bits}")
-    lines.append("")
-
-    lines.append("    // Convert input to Q{int_bits}.{fraction_bits} format if needed")
-    lines.append("    if (input_fraction_bits != kOutputFractionBits) {")
-    lines.append("        if (input_fraction_bits < kOutputFractionBits) {")
-    lines.append(
-        "            x <<= (kOutputFractionBits - input_fraction_bits);")
-    lines.append("        } else {")
-    lines.append(
-        "            x >>= (input_fraction_bits - kOutputFractionBits);")
-    lines.append("        }")
-    lines.append("    }")
-    lines.append("")
-
-    lines.append("    // 1. Normalize angle to [0, 2*pi)")
-    lines.append("    x = x % kTwoPi;")
-    lines.append("    if (x < 0) {")
-    lines.append("        x += kTwoPi;")
-    lines.append("    }")
-    lines.append("")
-
-    lines.append("    // 2. Determine quadrant and map to [0, pi/2]")
-    lines.append("    bool flip_sign = false;")
-    lines.append("    if (x > kPi) {")
-    lines.append("        // 3rd and 4th quadrants: sin(x) = -sin(x - pi)")
-    lines.append("        x -= kPi;")
-    lines.append("        flip_sign = true;")
-    lines.append("    }")
-    lines.append("    if (x > kPiOver2) {")
-    lines.append("        // 2nd and 4th quadrants: sin(x) = sin(pi - x)")
-    lines.append("        x = kPi - x;")
-    lines.append("    }")
-    lines.append("")
-
-    lines.append("    // 3. Calculate lookup table index and fractional part")
-    lines.append(
-        "    int64_t idx_scaled = Primitives::Fixed64Mul(x, kLutInterval, kOutputFractionBits);")
-    lines.append(
-        "    int idx = static_cast<int>(idx_scaled >> kOutputFractionBits);")
-    lines.append(
-        "    int64_t frac = idx_scaled & ((1LL << kOutputFractionBits) - 1);")
-    lines.append("")
-
-    lines.append("    // 4. Linear interpolation between table entries")
-    lines.append("    int64_t y0 = kSinLut[idx];")
-    lines.append("    int64_t y1 = kSinLut[idx + 1];")
-    lines.append("    int64_t diff = y1 - y0;")
-    lines.append(
-        "    int64_t interpolated_value = y0 + ((diff * frac) >> kOutputFractionBits);")
-    lines.append("")
-
-    lines.append("    // 5. Apply sign flip if necessary")
-    lines.append("    if (flip_sign) {")
-    lines.append("        interpolated_value = -interpolated_value;")
-    lines.append("    }")
-    lines.append("")
-
-    lines.append(
-        "    // 6. Convert result back to original input format if needed")
-    lines.append("    if (input_fraction_bits != kOutputFractionBits) {")
-    lines.append("        if (input_fraction_bits < kOutputFractionBits) {")
-    lines.append(
-        "            interpolated_value >>= (kOutputFractionBits - input_fraction_bits);")
-    lines.append("        } else {")
-    lines.append(
-        "            interpolated_value <<= (input_fraction_bits - kOutputFractionBits);")
-    lines.append("        }")
-    lines.append("    }")
-    lines.append("")
-
-    lines.append("    return interpolated_value;")
-    lines.append("}")
-    lines.append("")
-
-    # Generate the Hermite interpolation version
-    lines.append(
-        "// Lookup sin(x) with optimized Hermite cubic interpolation between table entries")
-    lines.append(
-        "// Input x is in fixed-point format with specified fraction bits representing angle in radians")
-    lines.append(
-        f"// Output is in Q{int_bits}.{fraction_bits} fixed-point format representing sin(x)")
-    lines.append(
-        "// Precision: ~1.0e-9 when input_fraction_bits=32 (about 1500x more accurate than fast version)")
-    lines.append(
-        "inline constexpr auto LookupSin(int64_t x, int input_fraction_bits) noexcept -> int64_t {")
-    lines.append("    // Constants")
-    lines.append(f"    constexpr int64_t kPi = {pi_hex};  // pi = {float(pi)}")
-    lines.append(
-        f"    constexpr int64_t kPiOver2 = {pi_over_2_hex};  // pi/2 = {float(pi_over_2)}")
-    lines.append(
-        f"    constexpr int64_t kTwoPi = {two_pi_hex};  // 2*pi = {float(two_pi)}")
-    lines.append(
-        f"    constexpr int64_t kLutInterval = {lut_interval_hex};  // LUT conversion factor")
-    lines.append(
-        f"    constexpr int kOutputFractionBits = {fraction_bits};  // Output format: Q{int_bits}.{fraction_bits}")
-    lines.append("")
-
-    lines.append("    // Convert input to Q{int_bits}.{fraction_bits} format if needed")
-    lines.append("    if (input_fraction_bits != kOutputFractionBits) {")
-    lines.append("        if (input_fraction_bits < kOutputFractionBits) {")
-    lines.append(
-        "            x <<= (kOutputFractionBits - input_fraction_bits);")
-    lines.append("        } else {")
-    lines.append(
-        "            x >>= (input_fraction_bits - kOutputFractionBits);")
-    lines.append("        }")
-    lines.append("    }")
-    lines.append("")
-
-    lines.append("    // 1. Normalize angle to [0, 2*pi)")
-    lines.append("    x = x % kTwoPi;")
-    lines.append("    if (x < 0) {")
-    lines.append("        x += kTwoPi;")
-    lines.append("    }")
-    lines.append("")
-
-    lines.append("    // 2. Determine quadrant and map to [0, pi/2]")
-    lines.append("    bool flip_sign = false;")
-    lines.append("    if (x > kPi) {")
-    lines.append("        // 3rd and 4th quadrants: sin(x) = -sin(x - pi)")
-    lines.append("        x -= kPi;")
-    lines.append("        flip_sign = true;")
-    lines.append("    }")
-    lines.append("    if (x > kPiOver2) {")
-    lines.append("        // 2nd and 4th quadrants: sin(x) = sin(pi - x)")
-    lines.append("        x = kPi - x;")
-    lines.append("    }")
-    lines.append("")
-
-    lines.append("    // 3. Calculate lookup table index and fractional part")
-    lines.append(
-        "    int64_t idx_scaled = Primitives::Fixed64Mul(x, kLutInterval, kOutputFractionBits);")
-    lines.append(
-        "    int idx = static_cast<int>(idx_scaled >> kOutputFractionBits);")
-    lines.append(
-        "    int64_t t = idx_scaled & ((1LL << kOutputFractionBits) - 1);  // Fractional part [0,1)")
-    lines.append("")
-
-    lines.append("    // 4. Get points from table")
-    lines.append(
-        "    int64_t p0 = kSinLut[idx];      // Point at left endpoint")
-    lines.append(
-        "    int64_t p1 = kSinLut[idx + 1];  // Point at right endpoint")
-    lines.append("")
-
-    lines.append(
-        "    // 5. Compute derivatives using the fact that sin'(x) = cos(x)")
-    lines.append("    // We can use the identity cos(x) = sin(x + pi/2)")
-    lines.append(
-        "    // For the first quadrant, we can use cos(x) = sin(pi/2 - x) when x is in [0,pi/2]")
-    lines.append(
-        "    int cos_idx = static_cast<int>(kSinLut.size()) - 2 - idx;")
-    lines.append(
-        "    int64_t m0 = kSinLut[cos_idx];  // Derivative (cos) at left endpoint")
-    lines.append(
-        "    int64_t m1 = cos_idx > 0 ? kSinLut[cos_idx - 1] : 0;  // Derivative at right endpoint")
-    lines.append("")
-
-    lines.append("    // Scale derivatives by step size")
-    lines.append("    constexpr int64_t kStepSize = kPiOver2/(kSinLut.size() - 2);")
-    lines.append("    m0 = (m0 * kStepSize) >> kOutputFractionBits;")
-    lines.append("    m1 = (m1 * kStepSize) >> kOutputFractionBits;")
-    lines.append("")
-
-    lines.append("    // 6. Compute optimized Hermite coefficients")
-    lines.append("    // p(t) = ((a*t + b)*t + c)*t + d  (Horner's method)")
-    lines.append("    // where:")
-    lines.append("    // a = 2(p₀-p₁) + m₀+m₁")
-    lines.append("    // b = 3(p₁-p₀) - 2m₀-m₁")
-    lines.append("    // c = m₀")
-    lines.append("    // d = p₀")
-    lines.append("    int64_t p0_minus_p1 = p0 - p1;")
-    lines.append("    int64_t a = p0_minus_p1 * 2 + m0 + m1;")
-    lines.append("    int64_t b = -p0_minus_p1 * 3 - m0 * 2 - m1;")
-    lines.append("    int64_t c = m0;")
-    lines.append("    int64_t d = p0;")
-    lines.append("")
-
-    lines.append("    // 7. Compute interpolation using Horner's method")
-    lines.append("    int64_t result =")
-    lines.append("        d")
-    lines.append("        + Primitives::Fixed64Mul(")
-    lines.append("            t,")
-    lines.append("            c")
-    lines.append("                + Primitives::Fixed64Mul(")
-    lines.append(
-        "                    t, b + Primitives::Fixed64Mul(t, a, kOutputFractionBits), kOutputFractionBits),")
-    lines.append("            kOutputFractionBits);")
-    lines.append("")
-
-    lines.append("    // 8. Apply sign flip if necessary")
-    lines.append("    if (flip_sign) {")
-    lines.append("        result = -result;")
-    lines.append("    }")
-    lines.append("")
-
-    lines.append(
-        "    // 9. Convert result back to original input format if needed")
-    lines.append("    if (input_fraction_bits != kOutputFractionBits) {")
-    lines.append("        if (input_fraction_bits < kOutputFractionBits) {")
-    lines.append(
-        "            result >>= (kOutputFractionBits - input_fraction_bits);")
-    lines.append("        } else {")
-    lines.append(
-        "            result <<= (input_fraction_bits - kOutputFractionBits);")
-    lines.append("        }")
-    lines.append("    }")
-    lines.append("")
-
-    lines.append("    return result;")
-    lines.append("}")
-    lines.append("")
-
-    lines.append("}  // namespace math::fp::detail")
-
-    # Write to file or stdout
-    if output_file:
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
-    else:
-        print("\n".join(lines))
-
-
-if __name__ == "__main__":
-    int_bits = 31       # 31 bits for integer part
-    fraction_bits = 32  # 32 bits for fractional part
-    output_file = None
-
-    # Parse command line arguments if provided
-    if len(sys.argv) > 1:
-        output_file = sys.argv[1]
-
-    if len(sys.argv) > 2:
-        try:
-            fraction_bits = int(sys.argv[2])
-            int_bits = 63 - fraction_bits  # Ensure we stay within 64-bit
-        except ValueError:
-            print(f"Error: Invalid fraction bits: {sys.argv[2]}")
-            sys.exit(1)
-
-    # Generate the sin lookup table
-    generate_sin_lut(output_file, int_bits, fraction_bits)
+import mpmath as mp
+import sys
+
+from _fixed_constants import constant_value, scaled_constant
+from _generator_output import open_output
+from _lookup_emitters import (
+    append_avx2_gather,
+    append_avx2_input,
+    append_avx2_output,
+    append_avx2_phase,
+    append_avx2_table_position,
+    append_horner_cubic,
+    append_lookup_batch,
+    append_lookup_x4,
+    append_runtime_wrapper,
+    avx2_conditional_negate,
+)
+from _trig_grid import sin_cos_grid
+
+# Set very high precision
+mp.mp.dps = 100
+
+# Working precision for the table entries: enough to truncate Q31.32 (and
+# wider) values correctly without paying for the global 100 digits per entry
+TABLE_DPS = 30
+
+# Index bits of each of the two LookupSinBipartite tables: the coarse one
+# steps a quarter turn in 2^6 angles, the fine one each coarse step in 2^6
+BIPARTITE_BITS = 6
+
+
+def generate_sin_lut(output_file=None, int_bits=31, fraction_bits=32, comments=True,
+                     truncate=False):
+    """Generate a lookup table for sin in the range [0,pi/2]
+
+    comments=False drops the per-entry verification comments of the tables,
+    which make up about half of the header. truncate=True truncates the
+    kSinLut values toward zero as older headers did instead of rounding them
+    to nearest."""
+    with open_output(output_file) as lines:
+        write_sin_lut(lines, int_bits, fraction_bits, comments, truncate)
+
+
+def write_sin_lut(lines, int_bits, fraction_bits, comments=True, truncate=False):
+    """Emit the whole sin_lut.h header through lines.append"""
+
+    # Split the first quadrant into exactly 512 intervals, a power of two so
+    # the lookups find the interval with a shift instead of a multiply
+    lut_size = 512
+
+    # Prepare the output with proper headers
+    lines.append("#pragma once")
+    lines.append("")
+    lines.append("#include <stdint.h>")
+    lines.append("#include <array>")
+    lines.append("#include \"primitives.h\"")
+    lines.append("")
+    lines.append("#if defined(__AVX2__)")
+    lines.append("#include <immintrin.h>")
+    lines.append("#endif")
+    lines.append("")
+    intervals = lut_size
+    lines.append(f"// Sin lookup tables with {intervals} entries, one per interval")
+    lines.append(
+        f"// Cover the range [0,pi/2] with values in Q{int_bits}.{fraction_bits} format")
+    lines.append(
+        f"// Generated with mpmath library at {mp.mp.dps} digits precision")
+    lines.append("")
+
+    # Generate the table entries in Q31.32 format
+    pi_over_2 = mp.pi / 2
+    angle_step = pi_over_2 / intervals
+
+    grid = sin_cos_grid(intervals + 1, angle_step, TABLE_DPS)
+    values = []
+    for angle, sin_x, _ in grid:
+        # ldexp only moves the exponent; round to nearest like the Hermite
+        # table unless the truncated values of older headers are asked for
+        scaled = mp.ldexp(sin_x, fraction_bits)
+        values.append((int(scaled) if truncate else int(mp.nint(scaled)), angle, sin_x))
+
+    # sin(pi/2) = 1.0 is only ever reached as the end of the last interval,
+    # so the stored values stay below 1.0 and fit the fraction bits alone
+    # whenever the format has at most 32 of them
+    if fraction_bits <= 32:
+        value_type, value_format = "uint32_t", "0x{:08X}"
+        value_note = f"// Values stored as the fraction bits of Q{int_bits}.{fraction_bits}, sin(x) < 1 on [0,pi/2)"
+    else:
+        value_type, value_format = "int64_t", "0x{:016X}LL"
+        value_note = f"// Values stored in Q{int_bits}.{fraction_bits} fixed-point format"
+    deltas = [values[i + 1][0] - values[i][0] for i in range(intervals)]
+    delta_type = "int32_t" if max(abs(d) for d in deltas) < 1 << 31 else "int64_t"
+
+    # Generate the table header
+    lines.append("namespace math::fp::detail {")
+    lines.append(f"// Table maps x in [0,pi/2) to sin(x), {'truncated' if truncate else 'rounded to nearest'}")
+    lines.append(value_note)
+    lines.append("// The sin tables are aligned to cache lines and, on ELF targets, each get their own")
+    lines.append("// .rodata.math_trig_lut.* input section like kAtanTable, so a linker script can")
+    lines.append("// group the trig tables; the default scripts simply fold them into .rodata")
+    append_table_section(lines, "sin")
+    lines.append(
+        f"alignas(64) inline constexpr std::array<{value_type}, {intervals}> kSinLut = {{")
+    # Every entry, the last one included, ends in a comma, which braced
+    # initializers allow
+    for scaled_value, angle, sin_x in values[:intervals]:
+        entry = f"    {value_format.format(scaled_value)},"
+        if comments:
+            # Show the floating point representation next to the entry
+            entry += f" // sin({float(angle):.17g}) = {float(sin_x):.17g}"
+        lines.append(entry)
+
+    lines.append("};")
+    lines.append("")
+
+    lines.append("// Difference to the next kSinLut entry, kept as a parallel array so linear")
+    lines.append("// interpolation reads base and slope from two gathers and skips the subtract;")
+    lines.append("// the last one ends at sin(pi/2)")
+    append_table_section(lines, "sin_delta")
+    lines.append(
+        f"alignas(64) inline constexpr std::array<{delta_type}, {intervals}> kSinLutDelta = {{")
+    for i, delta in enumerate(deltas):
+        entry = f"{delta},"
+        if comments:
+            entry = f"{entry:<10}// sin(x[{i + 1}]) - sin(x[{i}])"
+        lines.append(f"    {entry}")
+    lines.append("};")
+    lines.append("")
+
+    segments = write_sin_segment_table(lines, grid, fraction_bits, angle_step, comments)
+    write_sin_bipartite_tables(lines, fraction_bits, comments)
+
+    append_lookup_sin_fast(lines, deltas, int_bits, fraction_bits, lut_size)
+    # The vector path needs the 32-bit tables, non-negative steps for its
+    # unsigned multiplies and a 32-bit fraction for the phase product
+    packed = value_type == "uint32_t" and delta_type == "int32_t" and min(deltas) >= 0
+    append_lookup_sin_fast_x4(lines, packed and fraction_bits == 32, fraction_bits, lut_size)
+    append_lookup_batch(lines, "LookupSinFast", fraction_bits)
+    append_lookup_sin(lines, segments, int_bits, fraction_bits, lut_size)
+    append_lookup_sin_bipartite(lines, int_bits, fraction_bits, lut_size)
+
+    append_lookup_sin_unit(lines, int_bits, fraction_bits, lut_size)
+
+    append_runtime_wrapper(lines, "LookupSinFast", fraction_bits)
+    append_runtime_wrapper(lines, "LookupSin", fraction_bits)
+    append_runtime_wrapper(lines, "LookupSinBipartite", fraction_bits)
+
+    lines.append("}  // namespace math::fp::detail")
+
+
+def append_table_section(lines, name):
+    """Append the ELF section attribute for one table; every table needs its
+    own section name, GCC otherwise merges the inline variables sharing a
+    section into a single COMDAT group"""
+    lines.append("#if defined(__GNUC__) && defined(__ELF__)")
+    lines.append(f"[[gnu::section(\".rodata.math_trig_lut.{name}\")]]")
+    lines.append("#endif")
+
+
+def write_sin_segment_table(lines, grid, fraction_bits, angle_step, comments=True):
+    """Emit SinSegment and kSinTable, the Hermite coefficients (a, b, c, d) of
+    the cubic interpolating sin on each kSinLut interval in the local variable
+    t in [0,1), from the sin_cos_grid points, and return them
+
+    The endpoint values and step-scaled derivatives cos(x) * step are rounded
+    to the nearest fixed-point value first and a, b are derived from those
+    integers, so p(0) and p(1) hit the rounded endpoint values exactly, and
+    x == pi/2 is read as the end of the last segment."""
+    lut_size = len(grid) - 1
+    values = []
+    slopes = []
+    for _, sin_x, cos_x in grid:
+        with mp.workdps(TABLE_DPS):
+            values.append(int(mp.nint(mp.ldexp(sin_x, fraction_bits))))
+            slopes.append(int(mp.nint(mp.ldexp(cos_x * angle_step, fraction_bits))))
+
+    segments = []
+    for i in range(lut_size):
+        p0, p1 = values[i], values[i + 1]
+        m0, m1 = slopes[i], slopes[i + 1]
+        a = 2 * (p0 - p1) + m0 + m1
+        b = 3 * (p1 - p0) - 2 * m0 - m1
+        segments.append((a, b, m0, p0))
+
+    # As with kAtanTable, pack the segment into 16 bytes when the
+    # coefficients and the value below 1.0 allow it
+    coeff_max = max(max(abs(a), abs(b), abs(c)) for a, b, c, _ in segments)
+    value_max = max(d for *_, d in segments)
+    if coeff_max < 1 << 31 and value_max < 1 << 32:
+        coeff_type, value_type, value_format = "int32_t", "uint32_t", "0x{:08X}"
+    else:
+        coeff_type, value_type, value_format = "int64_t", "int64_t", "0x{:016X}LL"
+
+    lines.append("// Cubic Hermite segment of sin in the local variable t in [0,1):")
+    lines.append("// sin(x) ~= ((a*t + b)*t + c)*t + d, with the derivatives scaled by the step size")
+    lines.append("struct SinSegment {")
+    lines.append(f"    {coeff_type} a;")
+    lines.append(f"    {coeff_type} b;")
+    lines.append(f"    {coeff_type} c;")
+    lines.append(f"    {value_type} d;")
+    lines.append("};")
+    lines.append("")
+    lines.append("// Table maps each kSinLut interval of [0,pi/2] to its Hermite coefficients, built")
+    lines.append("// from the endpoint values sin(x) and derivatives sin'(x) = cos(x)")
+    append_table_section(lines, "sin_hermite")
+    lines.append(
+        f"alignas(64) inline constexpr std::array<SinSegment, {lut_size}> kSinTable = {{{{")
+    rows = [f"{{{a}, {b}, {c}, {value_format.format(d)}}}" for a, b, c, d in segments]
+    width = max(len(row) for row in rows) + 2
+    for i, row in enumerate(rows):
+        if comments:
+            x0 = float(grid[i][0])
+            x1 = float(grid[i + 1][0])
+            lines.append(f"    {row + ',':<{width}}// [{x0:.11f}, {x1:.11f}]")
+        else:
+            lines.append(f"    {row},")
+    lines.append("}};")
+    lines.append("")
+    return segments
+
+
+def write_sin_bipartite_tables(lines, fraction_bits, comments=True):
+    """Emit kSinBipartiteHi and kSinBipartiteLo, the two small tables of
+    LookupSinBipartite: sin at the coarse angles h = i * pi/2^(k+1) on
+    [0,pi/2], and sin and 1 - cos at the fine angles l = j * pi/2^(2k+1)
+    within one coarse step, for k = BIPARTITE_BITS, all rounded to nearest"""
+    steps = 1 << BIPARTITE_BITS
+    with mp.workdps(TABLE_DPS):
+        coarse_step = mp.pi / 2 / steps
+        fine_step = coarse_step / steps
+        coarse = [int(mp.nint(mp.ldexp(mp.sin(i * coarse_step), fraction_bits)))
+                  for i in range(steps + 1)]
+        fine = [(int(mp.nint(mp.ldexp(mp.sin(j * fine_step), fraction_bits))),
+                 int(mp.nint(mp.ldexp(1 - mp.cos(j * fine_step), fraction_bits))))
+                for j in range(steps)]
+
+    # The fine values are tiny, so every product of LookupSinBipartite has
+    # a factor below 2^(fraction_bits - 6) and stays clear of 2^62
+    if max(coarse) * max(max(pair) for pair in fine) >= 1 << 62:
+        raise ValueError(f"{fraction_bits} fraction bits overflow the bipartite products")
+    coarse_type = "int32_t" if max(coarse) < 1 << 31 else "int64_t"
+
+    lines.append("// Coarse table of LookupSinBipartite: sin(h) at h = i*pi/" f"{2 * steps}" " on [0,pi/2];")
+    lines.append("// cos(h) is the mirrored entry sin(pi/2 - h)")
+    append_table_section(lines, "sin_bipartite_hi")
+    lines.append(
+        f"alignas(64) inline constexpr std::array<{coarse_type}, {steps + 1}> kSinBipartiteHi = {{")
+    for i, value in enumerate(coarse):
+        entry = f"{value},"
+        if comments:
+            entry = f"{entry:<13}// sin({float(i * coarse_step):.11f})"
+        lines.append(f"    {entry}")
+    lines.append("};")
+    lines.append("")
+
+    lines.append("// Rotation by a fine angle l, with the versine 1 - cos(l) in place of cos(l) so both")
+    lines.append("// stay small")
+    lines.append("struct SinRotation {")
+    lines.append("    int32_t sin;")
+    lines.append("    int32_t versin;")
+    lines.append("};")
+    lines.append("")
+    lines.append(f"// Fine table of LookupSinBipartite: l = j*pi/{2 * steps * steps} within one coarse step")
+    append_table_section(lines, "sin_bipartite_lo")
+    lines.append(
+        f"alignas(64) inline constexpr std::array<SinRotation, {steps}> kSinBipartiteLo = {{{{")
+    for j, (sin_l, versin_l) in enumerate(fine):
+        entry = f"{{{sin_l}, {versin_l}}},"
+        if comments:
+            entry = f"{entry:<20}// l = {float(j * fine_step):.11f}"
+        lines.append(f"    {entry}")
+    lines.append("}};")
+    lines.append("")
+
+
+def sin_reduction(fraction_bits, lut_size):
+    """Return the constants of the angle reduction shared by the scalar and
+    vector lookups: 2^64 / (2*pi) as a C++ literal, the phase bit of a
+    quarter turn and the shift from the quarter to the table position"""
+    # 2^64 / (2*pi) truncated: multiplying a Q31.32 angle by it and dropping
+    # fraction_bits bits leaves the angle in turns as a Q0.64 phase, whose
+    # wrap-around modulo 2^64 is the reduction modulo 2*pi
+    radians_to_turns = scaled_constant("InvPi", 63)
+    radians_to_turns_hex = f"0x{radians_to_turns:016X}ULL"
+
+    # A quarter turn is 2^62 in the phase and spans lut_size = 2^k intervals,
+    # so the table position with fraction_bits fraction bits is the quarter
+    # shifted down by 62 - k - fraction_bits
+    if lut_size <= 0 or lut_size & (lut_size - 1):
+        raise ValueError(f"lut_size must be a power of two, got {lut_size}")
+    quarter_bits = 62
+    position_shift = quarter_bits - (lut_size.bit_length() - 1) - fraction_bits
+    if position_shift < 0:
+        raise ValueError(f"{fraction_bits} fraction bits leave no room to scale the phase")
+    return radians_to_turns_hex, quarter_bits, position_shift
+
+
+def append_sin_prologue(lines, int_bits, fraction_bits, lut_size, table_position=True):
+    """Append the code shared by every LookupSin variant up to the point
+    where idx and t locate the reduced angle in the quarter-wave tables:
+    constants, format conversion and the quadrant reduction; without
+    table_position it stops at the folded quarter"""
+    radians_to_turns_hex, quarter_bits, position_shift = sin_reduction(
+        fraction_bits, lut_size)
+
+    lines.append("    // Constants")
+    lines.append(
+        f"    constexpr uint64_t kRadiansToTurns = {radians_to_turns_hex};  // 2^64 / (2*pi)")
+    lines.append(
+        f"    constexpr int kOutputFractionBits = {fraction_bits};  // Output format: Q{int_bits}.{fraction_bits}")
+    lines.append("")
+
+    lines.append("    // Convert input to internal format")
+    lines.append("    if constexpr (InputFractionBits != kOutputFractionBits) {")
+    lines.append(
+        "        x = Primitives::ShiftFractionBits(x, InputFractionBits, kOutputFractionBits);")
+    lines.append("    }")
+    lines.append("")
+
+    lines.append("    // 1. Normalize angle to [0, 2*pi) as a Q0.64 phase in turns, no division needed:")
+    lines.append("    // the product wraps modulo 2^64, one turn. The unsigned multiply reads a negative x")
+    lines.append("    // as x + 2^64, which adds kRadiansToTurns << (64 - kOutputFractionBits) to the")
+    lines.append("    // shifted product; subtract that back")
+    lines.append("    const uint64_t phase =")
+    lines.append("        Primitives::MulU64Shifted(static_cast<uint64_t>(x), kRadiansToTurns, kOutputFractionBits)")
+    lines.append("        - ((kRadiansToTurns << (64 - kOutputFractionBits)) & static_cast<uint64_t>(x >> 63));")
+    lines.append("")
+
+    append_sin_quadrant_fold(lines, quarter_bits)
+    if table_position:
+        append_sin_table_position(lines, lut_size, position_shift)
+
+
+def append_sin_quadrant_fold(lines, quarter_bits):
+    """Append step 2 of the reduction, which folds the Q0.64 `phase` in
+    turns into the `quarter` of a turn and the sign mask"""
+    lines.append("    // 2. The top two phase bits are the quadrant, map it to [0, pi/2] with masks")
+    lines.append("    // instead of branches, the quadrant of a mixed-angle input is unpredictable")
+    lines.append("    // 3rd and 4th quadrants: sin(x) = -sin(x - pi)")
+    lines.append("    const int64_t negate_mask = -static_cast<int64_t>(phase >> 63);")
+    lines.append("    // 2nd and 4th quadrants: sin(x) = sin(pi - x)")
+    lines.append("    const uint64_t mirror_mask = 0 - ((phase >> 62) & 1);")
+    lines.append(f"    constexpr uint64_t kQuarterTurn = uint64_t{{1}} << {quarter_bits};")
+    lines.append("    uint64_t quarter = phase & (kQuarterTurn - 1);")
+    lines.append("    quarter += (kQuarterTurn - 2 * quarter) & mirror_mask;")
+    lines.append("    quarter -= quarter >> 62;  // pi/2 itself is read as the end of the last interval")
+    lines.append("")
+
+
+def append_sin_table_position(lines, lut_size, position_shift):
+    """Append step 3 of the reduction, the kSinLut index idx and the
+    fraction t of the `quarter`"""
+    lines.append("    // 3. Calculate lookup table index and fractional part: a quarter turn spans")
+    lines.append(f"    // {lut_size} intervals, a power of two, so the table position is a shift of it")
+    lines.append(
+        f"    const int64_t idx_scaled = static_cast<int64_t>(quarter >> {position_shift});")
+    lines.append(
+        "    const int idx = static_cast<int>(idx_scaled >> kOutputFractionBits);")
+    lines.append(
+        "    const int64_t t = idx_scaled & ((1LL << kOutputFractionBits) - 1);  // Fractional part [0,1)")
+    lines.append("")
+
+
+def append_sin_epilogue(lines):
+    """Append the code shared by every LookupSin variant after `result`
+    holds sin of the reduced angle: restore the sign and convert back to the
+    input format"""
+    lines.append("    // 5. Apply sign flip, a no-op for a zero mask")
+    lines.append("    result = (result ^ negate_mask) - negate_mask;")
+    lines.append("")
+
+    lines.append("    // 6. Convert result back to original input format if needed")
+    lines.append("    if constexpr (InputFractionBits != kOutputFractionBits) {")
+    lines.append(
+        "        result = Primitives::ShiftFractionBits(result, kOutputFractionBits, InputFractionBits);")
+    lines.append("    }")
+    lines.append("")
+
+    lines.append("    return result;")
+    lines.append("}")
+    lines.append("")
+
+
+def append_lookup_sin_fast(lines, deltas, int_bits, fraction_bits, lut_size):
+    """Append LookupSinFast, linear interpolation in kSinLut"""
+    lines.append(
+        "// Fast lookup sin(x) with linear interpolation between table entries")
+    lines.append(
+        "// Input x is in fixed-point format with InputFractionBits fraction bits representing angle in radians")
+    lines.append(
+        f"// Output is in Q{int_bits}.{fraction_bits} fixed-point format representing sin(x)")
+    lines.append("// Precision: ~1e-6 when InputFractionBits=32")
+    lines.append(f"template <int InputFractionBits = {fraction_bits}>")
+    lines.append("inline constexpr auto LookupSinFast(int64_t x) noexcept -> int64_t {")
+    append_sin_prologue(lines, int_bits, fraction_bits, lut_size)
+
+    # Round the interpolated step to nearest; t < 2^fraction_bits, so diff * t
+    # (plus the rounding term) fits in 64 bits while diff < 2^(62 - fraction_bits)
+    max_delta = max(abs(d) for d in deltas)
+    if max_delta >= 1 << (62 - fraction_bits):
+        raise ValueError(f"Table step {max_delta} overflows a 64-bit interpolation")
+    lines.append("    // 4. Linear interpolation between table entries, rounded to nearest")
+    lines.append("    const int64_t y0 = kSinLut[idx];")
+    lines.append("    const int64_t diff = kSinLutDelta[idx];")
+    lines.append("    int64_t result = y0 + Primitives::Fixed64MulNarrow(diff, t, kOutputFractionBits);")
+    lines.append("")
+
+    append_sin_epilogue(lines)
+
+
+def append_lookup_sin(lines, segments, int_bits, fraction_bits, lut_size):
+    """Append LookupSin, the cubic Hermite evaluation over kSinTable"""
+    lines.append(
+        "// Lookup sin(x) with optimized Hermite cubic interpolation between table entries")
+    lines.append(
+        "// Input x is in fixed-point format with InputFractionBits fraction bits representing angle in radians")
+    lines.append(
+        f"// Output is in Q{int_bits}.{fraction_bits} fixed-point format representing sin(x)")
+    lines.append(
+        "// Precision: ~1.0e-9 when InputFractionBits=32 (about 1500x more accurate than fast version)")
+    lines.append(f"template <int InputFractionBits = {fraction_bits}>")
+    lines.append("inline constexpr auto LookupSin(int64_t x) noexcept -> int64_t {")
+    append_sin_prologue(lines, int_bits, fraction_bits, lut_size)
+
+    append_horner_cubic(lines, 4, "the precomputed Hermite segment", segments, fraction_bits,
+                        segment=("SinSegment", "kSinTable"))
+
+    append_sin_epilogue(lines)
+
+
+def append_lookup_sin_bipartite(lines, int_bits, fraction_bits, lut_size):
+    """Append LookupSinBipartite, sin from the two small bipartite tables
+    and the angle-addition formulas"""
+    steps = 1 << BIPARTITE_BITS
+    _, quarter_bits, _ = sin_reduction(fraction_bits, lut_size)
+    coarse_shift = quarter_bits - BIPARTITE_BITS
+    fine_shift = coarse_shift - BIPARTITE_BITS
+    # The residual keeps its top 30 bits: a product with pi/2 scaled by
+    # 2^(fraction_bits - 10) then yields it in radians with fraction_bits
+    # fraction bits after dropping 32 bits
+    residual_drop = fine_shift - 30
+    residual_scale_bits = fraction_bits - (quarter_bits - residual_drop - 32)
+    with mp.workdps(TABLE_DPS):
+        residual_scale = int(mp.nint(mp.ldexp(constant_value("HalfPi"), residual_scale_bits)))
+
+    lines.append(
+        "// Lookup sin(x) from the two small bipartite tables instead of the 512-entry ones: about")
+    lines.append(
+        f"// 1 KiB of tables next to the 12 KiB of kSinLut, kSinLutDelta and kSinTable, for callers")
+    lines.append("// whose working set leaves little room in L1")
+    lines.append(
+        "// Input x is in fixed-point format with InputFractionBits fraction bits representing angle in radians")
+    lines.append(
+        f"// Output is in Q{int_bits}.{fraction_bits} fixed-point format representing sin(x)")
+    lines.append("// Precision: ~1e-9 when InputFractionBits=32, like LookupSin")
+    lines.append(f"template <int InputFractionBits = {fraction_bits}>")
+    lines.append("inline constexpr auto LookupSinBipartite(int64_t x) noexcept -> int64_t {")
+    append_sin_prologue(lines, int_bits, fraction_bits, lut_size, table_position=False)
+
+    lines.append(f"    // 3. Split the quarter into a coarse angle h = hi*pi/{2 * steps}, a fine angle")
+    lines.append(f"    // l = lo*pi/{2 * steps * steps} and a residual r below pi/{2 * steps * steps} in radians")
+    lines.append(f"    constexpr int64_t kResidualToRadians = {residual_scale};  // pi/2 * 2^{residual_scale_bits}")
+    lines.append(f"    const int hi = static_cast<int>(quarter >> {coarse_shift});")
+    lines.append(f"    const int lo = static_cast<int>(quarter >> {fine_shift}) & {steps - 1};")
+    lines.append(
+        f"    const int64_t residual = static_cast<int64_t>((quarter & ((uint64_t{{1}} << {fine_shift}) - 1)) >> {residual_drop});")
+    lines.append("    const int64_t r = Primitives::Fixed64MulNarrow(residual, kResidualToRadians, 32);")
+    lines.append("")
+
+    lines.append("    // 4. sin and cos of h + l by the angle-addition formulas, then rotate by r with")
+    lines.append("    // sin(r) ~= r and cos(r) ~= 1 - r^2/2; the r^3/6 term is below 1e-11")
+    lines.append("    const int64_t sin_h = kSinBipartiteHi[hi];")
+    lines.append(f"    const int64_t cos_h = kSinBipartiteHi[{steps} - hi];")
+    lines.append("    const SinRotation& rot = kSinBipartiteLo[lo];")
+    lines.append("    const int64_t sin_hl = sin_h - Primitives::Fixed64MulNarrow(sin_h, rot.versin, kOutputFractionBits)")
+    lines.append("                           + Primitives::Fixed64MulNarrow(cos_h, rot.sin, kOutputFractionBits);")
+    lines.append("    const int64_t cos_hl = cos_h - Primitives::Fixed64MulNarrow(cos_h, rot.versin, kOutputFractionBits)")
+    lines.append("                           - Primitives::Fixed64MulNarrow(sin_h, rot.sin, kOutputFractionBits);")
+    lines.append("    const int64_t half_r2 = Primitives::Fixed64MulNarrow(r, r, kOutputFractionBits + 1);")
+    lines.append("    int64_t result = sin_hl + Primitives::Fixed64MulNarrow(cos_hl, r, kOutputFractionBits)")
+    lines.append("                     - Primitives::Fixed64MulNarrow(sin_hl, half_r2, kOutputFractionBits);")
+    lines.append("")
+
+    append_sin_epilogue(lines)
+
+
+def append_lookup_sin_unit(lines, int_bits, fraction_bits, lut_size):
+    """Append LookupSinUnit, LookupSinFast for an angle that already is a
+    Q0.32 fraction of a turn"""
+    _, quarter_bits, position_shift = sin_reduction(fraction_bits, lut_size)
+
+    lines.append("// Fast lookup sin(x) for an angle given as a Q0.32 fraction of a turn, such as a")
+    lines.append("// wrapping uint32_t phase accumulator: 0 is 0 and 0x80000000 is pi. The angle is")
+    lines.append("// already reduced modulo 2*pi, so only the quadrant fold and the interpolation remain")
+    lines.append(
+        f"// Output is in Q{int_bits}.{fraction_bits} fixed-point format representing sin(x)")
+    lines.append("inline constexpr auto LookupSinUnit(uint32_t unit_phase) noexcept -> int64_t {")
+    lines.append(
+        f"    constexpr int kOutputFractionBits = {fraction_bits};  // Output format: Q{int_bits}.{fraction_bits}")
+    lines.append("")
+    lines.append("    // 1. Widen the turns to the Q0.64 phase of the radian lookups")
+    lines.append("    const uint64_t phase = static_cast<uint64_t>(unit_phase) << 32;")
+    lines.append("")
+    append_sin_quadrant_fold(lines, quarter_bits)
+    append_sin_table_position(lines, lut_size, position_shift)
+    lines.append("    // 4. Linear interpolation between table entries, rounded to nearest")
+    lines.append("    const int64_t y0 = kSinLut[idx];")
+    lines.append("    const int64_t diff = kSinLutDelta[idx];")
+    lines.append("    int64_t result = y0 + Primitives::Fixed64MulNarrow(diff, t, kOutputFractionBits);")
+    lines.append("")
+    lines.append("    // 5. Apply sign flip, a no-op for a zero mask")
+    lines.append("    return (result ^ negate_mask) - negate_mask;")
+    lines.append("}")
+    lines.append("")
+
+
+def append_lookup_sin_fast_x4(lines, vectorize, fraction_bits, lut_size):
+    """Append LookupSinFastx4, which evaluates four LookupSinFast calls at
+    once, with an AVX2 body when vectorize is set"""
+    radians_to_turns_hex, quarter_bits, position_shift = sin_reduction(
+        fraction_bits, lut_size)
+
+    def vector_body(lines):
+        append_avx2_input(lines, [
+            f"    constexpr uint64_t kRadiansToTurns = {radians_to_turns_hex};  // 2^64 / (2*pi)",
+        ], fraction_bits)
+        append_avx2_phase(lines, 1, "kRadiansToTurns", "turns")
+        lines.append("    // 2. Quadrant masks from the top two phase bits, fold into [0, pi/2]")
+        lines.append("    const __m256i negate_mask = _mm256_cmpgt_epi64(zero, phase);")
+        lines.append("    const __m256i mirror_mask = _mm256_cmpgt_epi64(zero, _mm256_slli_epi64(phase, 1));")
+        lines.append(f"    const __m256i quarter_turn = _mm256_set1_epi64x(int64_t{{1}} << {quarter_bits});")
+        lines.append(
+            "    __m256i quarter = _mm256_and_si256(phase, _mm256_sub_epi64(quarter_turn, _mm256_set1_epi64x(1)));")
+        lines.append("    quarter = _mm256_add_epi64(")
+        lines.append(
+            "        quarter, _mm256_and_si256(_mm256_sub_epi64(quarter_turn, _mm256_slli_epi64(quarter, 1)), mirror_mask));")
+        lines.append(f"    quarter = _mm256_sub_epi64(quarter, _mm256_srli_epi64(quarter, {quarter_bits}));")
+        lines.append("")
+        append_avx2_table_position(lines, 3, "quarter", position_shift)
+        lines.append("    // 4. Linear interpolation: the steps are non-negative and below 2^31 and t is")
+        lines.append("    // below 2^32, so one 32x32->64 multiply per lane is exact; round to nearest like")
+        lines.append("    // the scalar path")
+        lines.append("    static_assert(sizeof(kSinLut[0]) == 4 && sizeof(kSinLutDelta[0]) == 4);")
+        append_avx2_gather(lines, "y0", "kSinLut", "uint32_t")
+        append_avx2_gather(lines, "diff", "kSinLutDelta", "uint32_t")
+        lines.append("    const __m256i half = _mm256_set1_epi64x(1LL << (kOutputFractionBits - 1));")
+        lines.append("    const __m256i step = _mm256_add_epi64(_mm256_mul_epu32(diff, t), half);")
+        lines.append("    __m256i result = _mm256_add_epi64(y0, _mm256_srli_epi64(step, kOutputFractionBits));")
+        lines.append("")
+        lines.append("    // 5. Apply sign flip, a no-op for a zero mask")
+        lines.append(f"    result = {avx2_conditional_negate('result', 'negate_mask')};")
+        lines.append("")
+        append_avx2_output(lines, 6)
+
+    append_lookup_x4(lines, "LookupSinFast", fraction_bits, [
+        "With AVX2 the reduction and the table interpolation run in 64-bit vector lanes;",
+        "without it each element goes through LookupSinFast",
+    ], vector_body if vectorize else None)
+
+
+if __name__ == "__main__":
+    int_bits = 31       # 31 bits for integer part
+    fraction_bits = 32  # 32 bits for fractional part
+    output_file = None
+
+    # --no-comments and --truncate may appear anywhere, the rest are positional
+    flags = ("--no-comments", "--truncate")
+    comments = "--no-comments" not in sys.argv
+    truncate = "--truncate" in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg not in flags]
+
+    # Parse command line arguments if provided
+    if len(args) > 0:
+        output_file = args[0]
+
+    if len(args) > 1:
+        try:
+            fraction_bits = int(args[1])
+            int_bits = 63 - fraction_bits  # Ensure we stay within 64-bit
+        except ValueError:
+            print(f"Error: Invalid fraction bits: {args[1]}")
+            sys.exit(1)
+
+    # Generate the sin lookup table
+    generate_sin_lut(output_file, int_bits, fraction_bits, comments, truncate)
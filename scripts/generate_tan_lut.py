@@ -1,174 +1,316 @@
 import mpmath as mp
 import sys
 
-# Set very high precision
-mp.mp.dps = 100
-
-
-def generate_tan_lut(output_file=None, int_bits=23, fraction_bits=40):
-    """Generate a lookup table for tan in the range [0,pi/2]"""
-
-    # Use exactly 512 entries
-    lut_size = 512
+from _fixed_constants import scaled_constant
+from _generator_output import open_output
+from _lookup_emitters import (
+    append_avx2_gather,
+    append_avx2_input,
+    append_avx2_output,
+    append_avx2_phase,
+    append_avx2_table_position,
+    append_horner_cubic,
+    append_lookup_batch,
+    append_lookup_x4,
+    append_runtime_wrapper,
+    avx2_conditional_negate,
+)
+from _trig_grid import sin_cos_grid
+
+# Cubic segments of kTanTable over [0,pi/4]: each cubic interpolates tan at
+# the four Chebyshev nodes of its segment, which keeps the interpolation
+# error near 4e-11, below the Q31.32 resolution, with half the intervals
+# kTanLut needs for linear interpolation
+CUBIC_SEGMENTS = 128
+
+
+def working_dps(fraction_bits):
+    """Decimal digits of mpmath precision for a Q*.fraction_bits header:
+    fraction_bits / 3.3 digits resolve one output ulp, and the margin keeps
+    the rounding of every entry exact without the cost of 100 digits"""
+    return max(30, fraction_bits // 3 + 8)
+
+
+def generate_tan_lut(output_file=None, int_bits=23, fraction_bits=40, comments=True):
+    """Generate a lookup table for tan in the range [0,pi/4]; the lookups
+    reach (pi/4,pi/2] through tan(x) = 1/tan(pi/2 - x)
+
+    comments=False drops the per-entry verification comments of the tables,
+    which make up about half of the header.
+
+    All mpmath work runs under a local working precision, so importing or
+    calling the generator leaves the global mpmath precision untouched."""
+    with mp.workdps(working_dps(fraction_bits)), open_output(output_file) as lines:
+        write_tan_lut(lines, int_bits, fraction_bits, comments)
+
+
+def write_tan_lut(lines, int_bits, fraction_bits, comments=True):
+    """Emit the whole tan_lut.h header through lines.append, at the current
+    mpmath working precision"""
+
+    # Split the first octant into exactly 256 intervals, a power of two so
+    # the lookups find the interval with a shift instead of a multiply
+    lut_size = 256
 
     # Prepare the output with proper headers
-    lines = []
     lines.append("#pragma once")
     lines.append("")
     lines.append("#include <stdint.h>")
     lines.append("#include <array>")
+    lines.append("#include <limits>")
     lines.append("#include \"primitives.h\"")
     lines.append("")
+    lines.append("#if defined(__AVX2__)")
+    lines.append("#include <immintrin.h>")
+    lines.append("#endif")
+    lines.append("")
     lines.append(f"// Tan lookup table with {lut_size + 1} entries")
     lines.append(
-        f"// Covers the range [0,pi/2] with values in Q{int_bits}.{fraction_bits} format")
+        f"// Covers the range [0,pi/4] with values in Q{int_bits}.{fraction_bits} format")
     lines.append(
         f"// Generated with mpmath library at {mp.mp.dps} digits precision")
     lines.append("")
 
+    # Generate the table entries in Q23.40 format
+    pi_over_4 = mp.pi / 4
+    angle_step = pi_over_4 / lut_size
+
+    grid = sin_cos_grid(lut_size + 1, angle_step, mp.mp.dps)
+    values = []
+    for angle, sin_x, cos_x in grid:
+        # tan = sin/cos from the grid, at most 1 on [0,pi/4]
+        tan_x = sin_x / cos_x
+
+        # Round to nearest: the reciprocal for (pi/4,pi/2] would triple a
+        # truncation bias near pi/3; ldexp only moves the exponent
+        values.append((int(mp.nint(mp.ldexp(tan_x, fraction_bits))), angle, tan_x))
+
+    # The table is non-negative and ends at tan(pi/4) = 1.0, so with at most
+    # 31 fraction bits every entry fits 32 bits and the table halves; the
+    # lookups widen the entries to int64_t on load
+    if values[-1][0] < 1 << 32:
+        value_type, value_format = "uint32_t", "0x{:08X}"
+    else:
+        value_type, value_format = "int64_t", "0x{:016X}LL"
+
     # Generate the table header
     lines.append("namespace math::fp::detail {")
-    lines.append("// Table maps x in [0,pi/2] to tan(x)")
+    lines.append("// Table maps x in [0,pi/4] to tan(x); (pi/4,pi/2] is the reciprocal of the mirrored")
+    lines.append("// angle, so the table stays within [0,1] and the steep end of tan needs no entries")
     lines.append(
         f"// Values stored in Q{int_bits}.{fraction_bits} fixed-point format")
     lines.append(
-        f"inline constexpr std::array<int64_t, {lut_size + 1}> kTanLut = {{")
+        f"inline constexpr std::array<{value_type}, {lut_size + 1}> kTanLut = {{")
 
-    # Generate the table entries in Q23.40 format
-    scale = mp.mpf(2) ** fraction_bits
-    pi_over_2 = mp.pi / 2
-    angle_step = pi_over_2 / (lut_size - 1)
-
-    # Max value representable in Q23.40
-    max_value = mp.mpf(2**int_bits - 1) + mp.mpf(2**fraction_bits - 1)/scale
+    # Every entry, the last one included, ends in a comma, which braced
+    # initializers allow
+    for scaled_value, angle, tan_x in values:
+        line = f"    {value_format.format(scaled_value)},"
+        if comments:
+            # Show the floating point representation next to the entry
+            line += f" // tan({float(angle):.14f}) = {float(tan_x):.14f}"
+        lines.append(line)
 
-    for i in range(lut_size):
-        angle = mp.mpf(i) * angle_step
-        tan_x = mp.tan(angle)
+    lines.append("};")
+    lines.append("")
 
-        # Cap extremely large values
-        if tan_x > max_value:
-            tan_x = max_value
+    segments = write_tan_segment_table(lines, fraction_bits, CUBIC_SEGMENTS, comments)
 
-        # Use truncation instead of rounding
-        scaled_value = int(tan_x * scale)  # Truncate instead of round
+    # Constants shared by both lookups, truncated to the output format
+    constants = tan_constants(fraction_bits)
 
-        # Format the value as a hexadecimal literal with LL suffix
-        hex_value = f"0x{scaled_value & 0xFFFFFFFFFFFFFFFF:016X}LL"
-        if scaled_value < 0:
-            hex_value = f"-0x{-scaled_value & 0xFFFFFFFFFFFFFFFF:016X}LL"
+    append_lookup_tan_fast(lines, constants, int_bits, fraction_bits, lut_size)
+    # The vector lanes split the phase product into 32-bit halves, which
+    # holds for a 32-bit fraction only
+    append_lookup_tan_fast_x4(lines, constants, fraction_bits == 32, fraction_bits, lut_size, value_type)
+    append_lookup_batch(lines, "LookupTanFast", fraction_bits)
+    append_lookup_tan(lines, constants, segments, int_bits, fraction_bits)
 
-        # Generate a comment showing the floating point representation
-        angle_float = float(angle)
-        tan_x_float = float(tan_x)
+    append_runtime_wrapper(lines, "LookupTanFast", fraction_bits, saturate=True)
+    append_runtime_wrapper(lines, "LookupTan", fraction_bits, saturate=True)
 
-        comment = f"// tan({angle_float:.14f}) = {tan_x_float:.14f}"
+    lines.append("}  // namespace math::fp::detail")
 
-        # Add the entry with comment
-        if i < lut_size - 1:
-            lines.append(f"    {hex_value}, {comment}")
-        else:
-            # For the last entry, add it twice to avoid index out of bounds
-            lines.append(f"    {hex_value}, {comment}")
-            lines.append(f"    {hex_value}  {comment}")
 
+def write_tan_segment_table(lines, fraction_bits, segment_count, comments=True):
+    """Emit TanSegment and kTanTable, the coefficients (a, b, c, d) of the
+    cubic in the local variable t in [0,1) that interpolates tan at the four
+    Chebyshev nodes of each of segment_count segments of [0,pi/4], and
+    return them
+
+    Chebyshev nodes spread the interpolation error evenly over the segment,
+    about 8x below the Hermite cubic through the endpoint values and
+    derivatives of the same segment."""
+    segment_step = (mp.pi / 4) / segment_count
+    nodes = [(1 - mp.cos((2 * k + 1) * mp.pi / 8)) / 2 for k in range(4)]
+    # The nodes are the same in every segment, so one inverse of their
+    # Vandermonde matrix turns the node values into monomial coefficients
+    from_nodes = mp.inverse(mp.matrix([[t ** j for j in range(4)] for t in nodes]))
+
+    segments = []
+    for i in range(segment_count):
+        x0 = i * segment_step
+        ys = mp.matrix([mp.tan(x0 + t * segment_step) for t in nodes])
+        d, c, b, a = (int(mp.nint(mp.ldexp(coeff, fraction_bits)))
+                      for coeff in from_nodes * ys)
+        segments.append((a, b, c, d))
+
+    # As with kSinTable, pack the segment into 16 bytes when the
+    # coefficients and the value below 1.0 allow it
+    coeff_max = max(max(abs(a), abs(b), abs(c)) for a, b, c, _ in segments)
+    value_max = max(d for *_, d in segments)
+    value_min = min(d for *_, d in segments)
+    if coeff_max < 1 << 31 and 0 <= value_min and value_max < 1 << 32:
+        coeff_type, value_type, value_format = "int32_t", "uint32_t", "0x{:08X}"
+    else:
+        coeff_type, value_type, value_format = "int64_t", "int64_t", "{}LL"
+
+    lines.append("// Cubic segment of tan in the local variable t in [0,1):")
+    lines.append("// tan(x) ~= ((a*t + b)*t + c)*t + d, interpolating tan at the segment's Chebyshev nodes")
+    lines.append("struct TanSegment {")
+    lines.append(f"    {coeff_type} a;")
+    lines.append(f"    {coeff_type} b;")
+    lines.append(f"    {coeff_type} c;")
+    lines.append(f"    {value_type} d;")
     lines.append("};")
     lines.append("")
+    lines.append(f"// Table maps each of {segment_count} segments of [0,pi/4] to its cubic coefficients")
+    lines.append(
+        f"alignas(64) inline constexpr std::array<TanSegment, {segment_count}> kTanTable = {{{{")
+    rows = [f"{{{a}, {b}, {c}, {value_format.format(d)}}}" for a, b, c, d in segments]
+    width = max(len(row) for row in rows) + 2
+    for i, row in enumerate(rows):
+        if comments:
+            x0 = float(i * segment_step)
+            x1 = float((i + 1) * segment_step)
+            lines.append(f"    {row + ',':<{width}}// [{x0:.11f}, {x1:.11f}]")
+        else:
+            lines.append(f"    {row},")
+    lines.append("}};")
+    lines.append("")
+    return segments
+
+
+def tan_constants(fraction_bits):
+    """Return the constant declarations shared by both tan lookups and the
+    saturation threshold of their reciprocal"""
+    # 2^64 / pi truncated: multiplying a Q31.32 angle by it and dropping
+    # fraction_bits bits leaves the angle in half turns as a Q0.64 phase,
+    # whose wrap-around modulo 2^64 is the reduction modulo pi, the period
+    radians_to_half_turns = scaled_constant("InvPi", 64)
+    radians_to_half_turns_hex = f"0x{radians_to_half_turns:016X}ULL"
+
+    # Smallest octant value whose reciprocal 2^(2*fraction_bits) / value
+    # still fits below 2^63; smaller ones, tan(pi/2) included, saturate
+    min_divisor = (1 << (2 * fraction_bits)) // ((1 << 63) - 1) + 1
+
+    declarations = [
+        f"    constexpr uint64_t kRadiansToHalfTurns = {radians_to_half_turns_hex};  // 2^64 / pi",
+    ]
+    return declarations, min_divisor
+
+
+def tan_position_shift(fraction_bits, intervals):
+    """Return the shift from the reduced octant to the position in a table
+    of `intervals` intervals over [0,pi/4]"""
+    # An octant is 2^62 in the phase and spans intervals = 2^k intervals, so
+    # the table position with fraction_bits fraction bits is the octant
+    # shifted down by 62 - k - fraction_bits
+    if intervals <= 0 or intervals & (intervals - 1):
+        raise ValueError(f"intervals must be a power of two, got {intervals}")
+    position_shift = 62 - (intervals.bit_length() - 1) - fraction_bits
+    if position_shift < 0:
+        raise ValueError(f"{fraction_bits} fraction bits leave no room to scale the phase")
+    return position_shift
+
+
+def tan_small_angle(fraction_bits, series_terms):
+    """Return the largest Q*.fraction_bits angle below which the first
+    series_terms terms of tan(x) = x + x^3/3 + 2x^5/15 + ... are within one
+    output ulp, so the lookups can return the series without the table"""
+    # The first dropped term bounds the error of the truncated series
+    dropped = {1: mp.mpf(1) / 3, 2: mp.mpf(2) / 15}[series_terms]
+    power = 2 * series_terms + 1
+    return int(mp.ldexp(mp.root(mp.ldexp(1, -fraction_bits) / dropped, power), fraction_bits))
+
+
+def append_tan_prologue(lines, constants, int_bits, fraction_bits, intervals,
+                        small_angle, small_angle_terms):
+    """Append the code shared by both LookupTan variants up to the point
+    where idx and t locate the reduced angle in a table of `intervals`
+    intervals: constants, format conversion, the small-angle return of
+    small_angle_terms for |x| <= small_angle and the octant reduction"""
+    declarations, _ = constants
+    position_shift = tan_position_shift(fraction_bits, intervals)
 
-    # Generate constants for the Fast Tan lookup function (linear interpolation)
-    lines.append(
-        "// Fast lookup tan(x) with linear interpolation between table entries")
-    lines.append(
-        "// Input x is in fixed-point format with specified fraction bits representing angle in radians")
-    lines.append("// Precision: ~1.5e-5 when input_fraction_bits=32")
-    lines.append(
-        "inline constexpr auto LookupTanFast(int64_t x, int input_fraction_bits) noexcept -> int64_t {")
     lines.append("    // Constants")
-
-    # Calculate constants in Q23.40 format with truncation
-    pi = mp.pi
-    pi_over_2 = pi / 2
-    pi_scaled = int(pi * scale)  # Truncate
-    pi_over_2_scaled = int(pi_over_2 * scale)  # Truncate
-    lut_interval_scaled = int(
-        (lut_size - 1) / float(pi_over_2) * scale)  # Truncate
-
-    pi_hex = f"0x{pi_scaled & 0xFFFFFFFFFFFFFFFF:016X}LL"
-    pi_over_2_hex = f"0x{pi_over_2_scaled & 0xFFFFFFFFFFFFFFFF:016X}LL"
-    lut_interval_hex = f"0x{lut_interval_scaled & 0xFFFFFFFFFFFFFFFF:016X}LL"
-
-    lines.append(f"    constexpr int64_t kPi = {pi_hex};  // pi = {float(pi)}")
-    lines.append(
-        f"    constexpr int64_t kPiOver2 = {pi_over_2_hex};  // pi/2 = {float(pi_over_2)}")
-    lines.append(
-        f"    constexpr int64_t kLutInterval = {lut_interval_hex};  // LUT conversion factor")
+    for declaration in declarations:
+        lines.append(declaration)
     lines.append(
         f"    constexpr int kOutputFractionBits = {fraction_bits};  // Output format: Q{int_bits}.{fraction_bits}")
     lines.append("")
 
-    lines.append("    // Convert input to Q{int_bits}.{fraction_bits} format if needed")
-    lines.append("    if (input_fraction_bits != kOutputFractionBits) {")
-    lines.append("        if (input_fraction_bits < kOutputFractionBits) {")
-    lines.append(
-        "            x <<= (kOutputFractionBits - input_fraction_bits);")
-    lines.append("        } else {")
+    lines.append("    // Convert input to internal format")
+    lines.append("    if constexpr (InputFractionBits != kOutputFractionBits) {")
     lines.append(
-        "            x >>= (input_fraction_bits - kOutputFractionBits);")
-    lines.append("        }")
+        "        x = Primitives::ShiftFractionBits(x, InputFractionBits, kOutputFractionBits);")
     lines.append("    }")
     lines.append("")
 
-    lines.append("    // 1. Normalize angle to [-pi, pi]")
-    lines.append("    x = x % kPi;")
-    lines.append("")
-
-    lines.append("    // 2. Handle negative angles")
-    lines.append("    bool flip = false;")
-    lines.append("    if (x < 0) {")
-    lines.append("        x = -x;")
-    lines.append("        flip = true;")
+    small_angle_radians = float(mp.ldexp(small_angle, -fraction_bits))
+    lines.append(f"    // Small angles skip the reduction and the table: for |x| <= {small_angle_radians:.3g} the leading")
+    lines.append("    // terms of tan(x) = x + x^3/3 + 2x^5/15 + ... are within one ulp. The unsigned sum")
+    lines.append("    // tests both bounds with one compare")
+    lines.append(f"    constexpr uint64_t kSmallAngle = {small_angle};")
+    lines.append("    if (static_cast<uint64_t>(x) + kSmallAngle <= 2 * kSmallAngle) {")
+    for line in small_angle_terms:
+        lines.append(f"        {line}")
+    lines.append("        if constexpr (InputFractionBits != kOutputFractionBits) {")
+    lines.append(
+        "            result = Primitives::ShiftFractionBits(result, kOutputFractionBits, InputFractionBits);")
+    lines.append("        }")
+    lines.append("        return result;")
     lines.append("    }")
     lines.append("")
 
-    lines.append("    // 3. Handle angles > pi/2 by using tan(pi-x) = -tan(x)")
-    lines.append("    if (x > kPiOver2) {")
-    lines.append("        x = kPi - x;")
-    lines.append("        flip = !flip;")
-    lines.append("    }")
+    lines.append("    // 1. Normalize angle to [0, pi) as a Q0.64 phase in half turns, no division needed:")
+    lines.append("    // the product wraps modulo 2^64, one period of tan. The unsigned multiply reads a")
+    lines.append("    // negative x as x + 2^64, which adds kRadiansToHalfTurns << (64 - kOutputFractionBits)")
+    lines.append("    // to the shifted product; subtract that back")
+    lines.append("    const uint64_t phase =")
+    lines.append("        Primitives::MulU64Shifted(static_cast<uint64_t>(x), kRadiansToHalfTurns, kOutputFractionBits)")
+    lines.append("        - ((kRadiansToHalfTurns << (64 - kOutputFractionBits)) & static_cast<uint64_t>(x >> 63));")
     lines.append("")
 
-    lines.append("    // 4. Calculate lookup table index and fractional part")
+    append_tan_octant_fold(lines)
+
+    lines.append("    // 4. Calculate lookup table index and fractional part: an octant spans a power")
+    lines.append("    // of two intervals, so the table position is a shift of it")
     lines.append(
-        "    int64_t idx_scaled = Primitives::Fixed64Mul(x, kLutInterval, kOutputFractionBits);")
+        f"    const int64_t idx_scaled = static_cast<int64_t>(octant >> {position_shift});")
     lines.append(
-        "    int idx = static_cast<int>(idx_scaled >> kOutputFractionBits);")
+        "    const int idx = static_cast<int>(idx_scaled >> kOutputFractionBits);")
     lines.append(
-        "    int64_t frac = idx_scaled & ((1LL << kOutputFractionBits) - 1);")
+        "    const int64_t t = idx_scaled & ((1LL << kOutputFractionBits) - 1);  // Fractional part [0,1)")
     lines.append("")
 
-    lines.append("    // 5. Linear interpolation between table entries")
-    lines.append("    int64_t y0 = kTanLut[idx];")
-    lines.append("    int64_t y1 = kTanLut[idx + 1];")
-    lines.append("    int64_t diff = y1 - y0;")
-    lines.append(
-        "    int64_t interpolated_value = y0 + Primitives::Fixed64Mul(diff, frac, kOutputFractionBits);")
-    lines.append("")
 
-    lines.append("    // 6. Apply sign flip if necessary")
-    lines.append(
-        "    int64_t result = flip ? -interpolated_value : interpolated_value;")
+def append_tan_epilogue(lines, constants, step):
+    """Append the code shared by both LookupTan variants after `result`
+    holds tan of the reduced angle, numbering its comments from step: undo
+    the octant reduction, restore the sign and convert back to the input
+    format"""
+    _, min_divisor = constants
+
+    lines.append(f"    // {step}. Undo the octant reduction and apply sign flip, a no-op for a zero mask")
+    append_tan_reciprocal(lines, "result", min_divisor)
+    lines.append("    result = (result ^ negate_mask) - negate_mask;")
     lines.append("")
 
+    lines.append(f"    // {step + 1}. Convert result back to original input format if needed")
+    lines.append("    if constexpr (InputFractionBits != kOutputFractionBits) {")
     lines.append(
-        "    // 7. Convert result back to original input format if needed")
-    lines.append("    if (input_fraction_bits != kOutputFractionBits) {")
-    lines.append("        if (input_fraction_bits < kOutputFractionBits) {")
-    lines.append(
-        "            result >>= (kOutputFractionBits - input_fraction_bits);")
-    lines.append("        } else {")
-    lines.append(
-        "            result <<= (input_fraction_bits - kOutputFractionBits);")
-    lines.append("        }")
+        "        result = Primitives::ShiftFractionBits(result, kOutputFractionBits, InputFractionBits);")
     lines.append("    }")
     lines.append("")
 
@@ -176,153 +318,158 @@ def generate_tan_lut(output_file=None, int_bits=23, fraction_bits=40):
     lines.append("}")
     lines.append("")
 
-    # Generate the Hermite interpolation version with optimized Horner method
-    lines.append(
-        "// Lookup tan(x) with optimized Hermite cubic interpolation between table entries")
-    lines.append(
-        "// Input x is in fixed-point format with specified fraction bits representing angle in radians")
-    lines.append(
-        "// Precision: ~2.0e-9 when input_fraction_bits=32 (about 1500x more accurate than fast version)")
-    lines.append(
-        "inline constexpr auto LookupTan(int64_t x, int input_fraction_bits) noexcept -> int64_t {")
-    lines.append("    // Constants")
-    lines.append(f"    constexpr int64_t kPi = {pi_hex};  // pi = {float(pi)}")
-    lines.append(
-        f"    constexpr int64_t kPiOver2 = {pi_over_2_hex};  // pi/2 = {float(pi_over_2)}")
-    lines.append(
-        f"    constexpr int64_t kLutInterval = {lut_interval_hex};  // LUT conversion factor")
-    lines.append(
-        f"    constexpr int kOutputFractionBits = {fraction_bits};  // Output format: Q{int_bits}.{fraction_bits}")
-    lines.append(
-        "    constexpr int64_t kOne = 1LL << kOutputFractionBits;  // 1.0 in fixed-point")
-    lines.append("")
-
-    lines.append("    // Convert input to Q{int_bits}.{fraction_bits} format if needed")
-    lines.append("    if (input_fraction_bits != kOutputFractionBits) {")
-    lines.append("        if (input_fraction_bits < kOutputFractionBits) {")
-    lines.append(
-        "            x <<= (kOutputFractionBits - input_fraction_bits);")
-    lines.append("        } else {")
-    lines.append(
-        "            x >>= (input_fraction_bits - kOutputFractionBits);")
-    lines.append("        }")
-    lines.append("    }")
-    lines.append("")
-
-    lines.append("    // 1. Normalize angle to [-pi, pi]")
-    lines.append("    x = x % kPi;")
-    lines.append("")
-
-    lines.append("    // 2. Handle negative angles")
-    lines.append("    bool flip = false;")
-    lines.append("    if (x < 0) {")
-    lines.append("        x = -x;")
-    lines.append("        flip = true;")
-    lines.append("    }")
-    lines.append("")
-
-    lines.append("    // 3. Handle angles > pi/2 by using tan(pi-x) = -tan(x)")
-    lines.append("    if (x > kPiOver2) {")
-    lines.append("        x = kPi - x;")
-    lines.append("        flip = !flip;")
-    lines.append("    }")
-    lines.append("")
 
-    lines.append("    // 4. Calculate lookup table index and fractional part")
+def append_lookup_tan_fast(lines, constants, int_bits, fraction_bits, lut_size):
+    """Append LookupTanFast, linear interpolation in kTanLut"""
     lines.append(
-        "    int64_t idx_scaled = Primitives::Fixed64Mul(x, kLutInterval, kOutputFractionBits);")
-    lines.append(
-        "    int idx = static_cast<int>(idx_scaled >> kOutputFractionBits);")
+        "// Fast lookup tan(x) with linear interpolation between table entries")
     lines.append(
-        "    int64_t t = idx_scaled & ((1LL << kOutputFractionBits) - 1);  // Fractional part [0,1)")
-    lines.append("")
+        "// Input x is in fixed-point format with InputFractionBits fraction bits representing angle in radians")
+    lines.append("// Precision: ~1.5e-5 when InputFractionBits=32")
+    lines.append("template <int InputFractionBits = 32>")
+    lines.append("inline constexpr auto LookupTanFast(int64_t x) noexcept -> int64_t {")
+    append_tan_prologue(lines, constants, int_bits, fraction_bits, lut_size,
+                        tan_small_angle(fraction_bits, 1), ["int64_t result = x;"])
 
-    lines.append("    // 5. Get points from table")
-    lines.append(
-        "    int64_t p0 = kTanLut[idx];      // Point at left endpoint")
+    lines.append("    // 5. Linear interpolation between table entries")
+    lines.append("    int64_t y0 = kTanLut[idx];")
+    lines.append("    int64_t y1 = kTanLut[idx + 1];")
+    lines.append("    int64_t diff = y1 - y0;")
     lines.append(
-        "    int64_t p1 = kTanLut[idx + 1];  // Point at right endpoint")
+        "    int64_t result = y0 + Primitives::Fixed64Mul(diff, t, kOutputFractionBits);")
     lines.append("")
 
-    lines.append(
-        "    // 6. Compute derivatives using the fact that tan'(x) = 1 + tan²(x)")
-    lines.append(
-        "    int64_t p0_squared = Primitives::Fixed64Mul(p0, p0, kOutputFractionBits);")
-    lines.append(
-        "    int64_t p1_squared = Primitives::Fixed64Mul(p1, p1, kOutputFractionBits);")
-    lines.append(
-        "    int64_t m0 = kOne + p0_squared;  // Derivative at left endpoint")
-    lines.append(
-        "    int64_t m1 = kOne + p1_squared;  // Derivative at right endpoint")
+    append_tan_epilogue(lines, constants, 6)
+
+
+def append_lookup_tan_fast_x4(lines, constants, vectorize, fraction_bits, lut_size, value_type):
+    """Append LookupTanFastx4, which evaluates four LookupTanFast calls at
+    once, with an AVX2 body when vectorize is set"""
+    declarations, min_divisor = constants
+    position_shift = tan_position_shift(fraction_bits, lut_size)
+
+    def vector_body(lines):
+        append_avx2_input(lines, declarations, fraction_bits)
+        append_avx2_phase(lines, 1, "kRadiansToHalfTurns", "half turns")
+        lines.append("    // 2. The top phase bit folds (pi/2, pi) onto [0, pi/2] and sets the sign")
+        lines.append("    const __m256i negate_mask = _mm256_cmpgt_epi64(zero, phase);")
+        lines.append(f"    __m256i octant = {avx2_conditional_negate('phase', 'negate_mask')};")
+        lines.append("")
+        lines.append("    // 3. Mirror angles >= pi/4 to pi/2 - x, as in the scalar path")
+        lines.append("    const __m256i reciprocal = _mm256_cmpgt_epi64(_mm256_srli_epi64(octant, 62), zero);")
+        lines.append("    const __m256i half_pi = _mm256_set1_epi64x(static_cast<int64_t>(uint64_t{1} << 63));")
+        lines.append("    octant = _mm256_blendv_epi8(octant, _mm256_sub_epi64(half_pi, octant), reciprocal);")
+        lines.append("    octant = _mm256_sub_epi64(octant, _mm256_srli_epi64(octant, 62));")
+        lines.append("")
+        append_avx2_table_position(lines, 4, "octant", position_shift)
+        lines.append("    // 5. Linear interpolation: the table increases by less than 2^32 per entry, so")
+        lines.append("    // one 32x32->64 multiply per lane is exact, truncated like Fixed64Mul")
+        append_avx2_gather(lines, "y0", "kTanLut", value_type)
+        append_avx2_gather(lines, "y1", "kTanLut", value_type, offset=1)
+        lines.append("    const __m256i diff = _mm256_sub_epi64(y1, y0);")
+        lines.append("    __m256i result =")
+        lines.append("        _mm256_add_epi64(y0, _mm256_srli_epi64(_mm256_mul_epu32(diff, t), kOutputFractionBits));")
+        lines.append("")
+        lines.append("    // 6. Undo the octant reduction per lane, there is no vector division, and apply")
+        lines.append("    // the sign flip")
+        lines.append("    if (!_mm256_testz_si256(reciprocal, reciprocal)) {")
+        lines.append("        alignas(32) int64_t lanes[4];")
+        lines.append("        alignas(32) int64_t lane_reciprocal[4];")
+        lines.append("        _mm256_store_si256(reinterpret_cast<__m256i*>(lanes), result);")
+        lines.append("        _mm256_store_si256(reinterpret_cast<__m256i*>(lane_reciprocal), reciprocal);")
+        append_tan_saturation(lines, "        ")
+        lines.append("        for (int i = 0; i < 4; ++i) {")
+        lines.append("            if (lane_reciprocal[i]) {")
+        lines.append(f"                lanes[i] = lanes[i] < {min_divisor}")
+        lines.append("                    ? kSaturation")
+        lines.append("                    : Primitives::Fixed64Div(")
+        lines.append("                          int64_t{1} << kOutputFractionBits, lanes[i], kOutputFractionBits);")
+        lines.append("                lanes[i] = lanes[i] > kSaturation ? kSaturation : lanes[i];")
+        lines.append("            }")
+        lines.append("        }")
+        lines.append("        result = _mm256_load_si256(reinterpret_cast<const __m256i*>(lanes));")
+        lines.append("    }")
+        lines.append(f"    result = {avx2_conditional_negate('result', 'negate_mask')};")
+        lines.append("")
+        lines.append("    // Lanes within the small-angle bound return x, as in the scalar path")
+        lines.append(f"    const __m256i small_angle = _mm256_set1_epi64x({tan_small_angle(fraction_bits, 1)});")
+        lines.append("    const __m256i small = _mm256_andnot_si256(")
+        lines.append("        _mm256_cmpgt_epi64(v, small_angle),")
+        lines.append("        _mm256_cmpgt_epi64(v, _mm256_sub_epi64(_mm256_set1_epi64x(-1), small_angle)));")
+        lines.append("    result = _mm256_blendv_epi8(result, v, small);")
+        lines.append("")
+        append_avx2_output(lines, 7)
+
+    append_lookup_x4(lines, "LookupTanFast", fraction_bits, [
+        "With AVX2 the reduction and the table interpolation run in 64-bit vector lanes and",
+        "only the reciprocal of [pi/4,pi/2] divides per lane; without it each element goes",
+        "through LookupTanFast",
+    ], vector_body if vectorize else None)
+
+
+def append_lookup_tan(lines, constants, segments, int_bits, fraction_bits):
+    """Append LookupTan, the cubic evaluation over kTanTable"""
+    lines.append(
+        "// Lookup tan(x) with a precomputed cubic per segment, interpolating at Chebyshev nodes")
+    lines.append(
+        "// Input x is in fixed-point format with InputFractionBits fraction bits representing angle in radians")
+    lines.append(
+        "// Precision: ~2.0e-9 when InputFractionBits=32 (about 1500x more accurate than fast version)")
+    lines.append("template <int InputFractionBits = 32>")
+    lines.append("inline constexpr auto LookupTan(int64_t x) noexcept -> int64_t {")
+    # x^2 needs the 128-bit product for wide formats
+    small_angle_terms = [
+        "const int64_t x2 = Primitives::Fixed64Mul(x, x, kOutputFractionBits);",
+        "int64_t result = x + Primitives::Fixed64Mul(x2, x, kOutputFractionBits) / 3;",
+    ]
+    append_tan_prologue(lines, constants, int_bits, fraction_bits, len(segments),
+                        tan_small_angle(fraction_bits, 2), small_angle_terms)
+
+    append_horner_cubic(lines, 5, "the precomputed segment", segments, fraction_bits,
+                        segment=("TanSegment", "kTanTable"))
+
+    append_tan_epilogue(lines, constants, 6)
+
+
+def append_tan_octant_fold(lines):
+    """Append steps 2 and 3 of the reduction, which fold the Q0.64 `phase`
+    in half turns into the `octant` of [0,pi/4] and leave the sign in
+    negate_mask and the mirror about pi/4 in reciprocal"""
+    lines.append("    // 2. The top phase bit selects (pi/2, pi), map it to [0, pi/2] with tan(x) = -tan(pi - x),")
+    lines.append("    // using masks instead of branches, the half of a mixed-angle input is unpredictable")
+    lines.append("    const int64_t negate_mask = -static_cast<int64_t>(phase >> 63);")
+    lines.append("    const uint64_t fold_mask = static_cast<uint64_t>(negate_mask);")
+    lines.append("    uint64_t octant = (phase ^ fold_mask) - fold_mask;")
     lines.append("")
-
-    lines.append("    // Scale derivatives by step size")
-    lines.append("    constexpr int64_t kStepSize = Primitives::Fixed64Div(")
-    lines.append(
-        "        kPiOver2, static_cast<int64_t>(kTanLut.size() - 2) << kOutputFractionBits, kOutputFractionBits);")
-    lines.append(
-        "    m0 = Primitives::Fixed64Mul(m0, kStepSize, kOutputFractionBits);")
-    lines.append(
-        "    m1 = Primitives::Fixed64Mul(m1, kStepSize, kOutputFractionBits);")
+    lines.append("    // 3. Handle angles >= pi/4 by using tan(x) = 1/tan(pi/2-x), selected with a mask as well")
+    lines.append("    constexpr uint64_t kQuarterPi = uint64_t{1} << 62;")
+    lines.append("    const bool reciprocal = octant >= kQuarterPi;")
+    lines.append("    octant ^= (0 - static_cast<uint64_t>(reciprocal)) & (octant ^ (2 * kQuarterPi - octant));")
+    lines.append("    octant -= octant >> 62;  // pi/4 itself is read as the end of the last interval")
     lines.append("")
 
-    lines.append("    // 7. Compute optimized Hermite coefficients")
-    lines.append("    // p(t) = ((a*t + b)*t + c)*t + d  (Horner's method)")
-    lines.append("    // where:")
-    lines.append("    // a = 2(p₀-p₁) + m₀+m₁")
-    lines.append("    // b = 3(p₁-p₀) - 2m₀-m₁")
-    lines.append("    // c = m₀")
-    lines.append("    // d = p₀")
-    lines.append("    int64_t p0_minus_p1 = p0 - p1;")
-    lines.append("    int64_t a = p0_minus_p1 * 2 + m0 + m1;")
-    lines.append("    int64_t b = -p0_minus_p1 * 3 - m0 * 2 - m1;")
-    lines.append("    int64_t c = m0;")
-    lines.append("    int64_t d = p0;")
-    lines.append("")
 
-    lines.append("    // 8. Compute interpolation using Horner's method")
-    lines.append("    int64_t result =")
-    lines.append("        d")
-    lines.append("        + Primitives::Fixed64Mul(")
-    lines.append("            t,")
-    lines.append("            c")
-    lines.append("                + Primitives::Fixed64Mul(")
+def append_tan_saturation(lines, indent):
+    """Append kSaturation, the largest result whose conversion to the input
+    format does not overflow"""
+    lines.append(f"{indent}// Saturate where the reciprocal would not fit the input format, so that the")
+    lines.append(f"{indent}// left shift of a wider format cannot wrap it and the sign flip gives +-max")
+    lines.append(f"{indent}constexpr int64_t kSaturation = std::numeric_limits<int64_t>::max() >>")
     lines.append(
-        "                    t, b + Primitives::Fixed64Mul(t, a, kOutputFractionBits), kOutputFractionBits),")
-    lines.append("            kOutputFractionBits);")
-    lines.append("")
+        f"{indent}    (InputFractionBits > kOutputFractionBits ? InputFractionBits - kOutputFractionBits : 0);")
 
-    lines.append("    // 9. Apply sign flip if necessary")
-    lines.append("    if (flip) {")
-    lines.append("        result = -result;")
-    lines.append("    }")
-    lines.append("")
 
+def append_tan_reciprocal(lines, name, min_divisor):
+    """Append the reciprocal that maps the octant value `name` back to
+    (pi/4,pi/2], saturating where it would not fit"""
+    lines.append("    if (reciprocal) {")
+    append_tan_saturation(lines, "        ")
+    lines.append(f"        {name} = {name} < {min_divisor}")
+    lines.append("            ? kSaturation")
     lines.append(
-        "    // 10. Convert result back to original input format if needed")
-    lines.append("    if (input_fraction_bits != kOutputFractionBits) {")
-    lines.append("        if (input_fraction_bits < kOutputFractionBits) {")
-    lines.append(
-        "            result >>= (kOutputFractionBits - input_fraction_bits);")
-    lines.append("        } else {")
-    lines.append(
-        "            result <<= (input_fraction_bits - kOutputFractionBits);")
-    lines.append("        }")
+        f"            : Primitives::Fixed64Div(int64_t{{1}} << kOutputFractionBits, {name}, kOutputFractionBits);")
+    lines.append(f"        {name} = {name} > kSaturation ? kSaturation : {name};")
     lines.append("    }")
-    lines.append("")
-
-    lines.append("    return result;")
-    lines.append("}")
-    lines.append("")
-
-    lines.append("}  // namespace math::fp::detail")
-
-    # Write to file or stdout
-    if output_file:
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
-    else:
-        print("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -330,17 +477,21 @@ if __name__ == "__main__":
     fraction_bits = 32  # 32 bits for fractional part
     output_file = None
 
+    # --no-comments may appear anywhere, the rest are positional
+    comments = "--no-comments" not in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != "--no-comments"]
+
     # Parse command line arguments if provided
-    if len(sys.argv) > 1:
-        output_file = sys.argv[1]
+    if len(args) > 0:
+        output_file = args[0]
 
-    if len(sys.argv) > 2:
+    if len(args) > 1:
         try:
-            fraction_bits = int(sys.argv[2])
+            fraction_bits = int(args[1])
             int_bits = 63 - fraction_bits  # Ensure we stay within 64-bit
         except ValueError:
-            print(f"Error: Invalid fraction bits: {sys.argv[2]}")
+            print(f"Error: Invalid fraction bits: {args[1]}")
             sys.exit(1)
 
     # Generate the tan lookup table
-    generate_tan_lut(output_file, int_bits, fraction_bits)
+    generate_tan_lut(output_file, int_bits, fraction_bits, comments)
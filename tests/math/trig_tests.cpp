@@ -1,5 +1,7 @@
+#include <array>
 #include <cmath>
 #include <limits>
+#include <string>
 #include <vector>
 
 #include "fixed64.h"
@@ -252,6 +254,41 @@ TEST_F(Fixed64TrigTest, EdgeCases) {
         << "Atan2(0,0) should return 0";
 }
 
+TEST_F(Fixed64TrigTest, TanSaturatesInWideFormats) {
+    // Q23.40 holds up to 2^23, far below tan within 1e-7 of the pole: the result saturates to
+    // the largest value of the format at the Q31.32 resolution of the lookup, with the sign of
+    // the side it approaches from
+    using Fixed40 = Fixed64<40>;
+    constexpr int64_t kMax40 = std::numeric_limits<int64_t>::max() & ~int64_t{0xFF};
+    const std::array<std::pair<double, int64_t>, 4> poles = {{
+        {M_PI_2 - 1e-8, kMax40},
+        {M_PI_2 + 1e-8, -kMax40},
+        {-M_PI_2 + 1e-8, -kMax40},
+        {-M_PI_2 - 1e-8, kMax40},
+    }};
+    for (const auto& [angle, expected] : poles) {
+        const int64_t x = Fixed40(angle).value();
+        EXPECT_EQ(detail::LookupTan<40>(x), expected) << angle;
+        EXPECT_EQ(detail::LookupTanFast<40>(x), expected) << angle;
+        EXPECT_EQ(detail::LookupTan(x, 40), expected) << angle;
+        EXPECT_EQ(detail::LookupTanFast(x, 40), expected) << angle;
+        EXPECT_EQ(Fixed64Math::Tan(Fixed40(angle)).value(), expected) << angle;
+
+        // Formats without an alias take the runtime conversion, which saturates as well
+        constexpr int64_t kMax48 = std::numeric_limits<int64_t>::max() & ~int64_t{0xFFFF};
+        const int64_t x48 = Fixed64<48>(angle).value();
+        EXPECT_EQ(detail::LookupTan(x48, 48), expected > 0 ? kMax48 : -kMax48) << angle;
+        EXPECT_EQ(detail::LookupTanFast(x48, 48), expected > 0 ? kMax48 : -kMax48) << angle;
+    }
+    EXPECT_EQ(std::abs(Fixed64Math::Tan(Fixed40::HalfPi()).value()), kMax40);
+
+    // Short of saturation the reciprocal converts to the wide formats without wrapping
+    const double angle = M_PI_2 - 1e-4;
+    EXPECT_NEAR(static_cast<double>(Fixed64Math::Tan(Fixed40(angle))), std::tan(angle), 10.0);
+    const double result48 = static_cast<double>(detail::LookupTan(Fixed64<48>(angle).value(), 48));
+    EXPECT_NEAR(std::ldexp(result48, -48), std::tan(angle), 10.0);
+}
+
 // Lookup table implementation specific tests
 TEST_F(Fixed64TrigTest, LookupTableImplementation) {
     // Test small increments for lookup table changes
@@ -323,4 +360,234 @@ TEST_F(Fixed64TrigTest, LookupTableImplementation) {
     }
 }
 
+// Each lookup family pairs LookupXxxFast with its four-lane and batch versions,
+// which must match it bit for bit, and both lookups with their runtime-format
+// overloads
+struct AtanLookups {
+    static constexpr const char* kName = "Atan";
+
+    template <int Bits>
+    static auto Precise(int64_t x) -> int64_t {
+        return detail::LookupAtan<Bits>(x);
+    }
+
+    static auto Precise(int64_t x, int bits) -> int64_t {
+        return detail::LookupAtan(x, bits);
+    }
+
+    template <int Bits>
+    static auto Fast(int64_t x) -> int64_t {
+        return detail::LookupAtanFast<Bits>(x);
+    }
+
+    static auto Fast(int64_t x, int bits) -> int64_t {
+        return detail::LookupAtanFast(x, bits);
+    }
+
+    static auto FastX4(const int64_t* x, int64_t* out) -> void {
+        detail::LookupAtanFastx4<32>(x, out);
+    }
+
+    static auto FastBatch(const int64_t* x, int64_t* out, size_t count) -> void {
+        detail::LookupAtanFastBatch<32>(x, out, count);
+    }
+
+    // Blocks inside [-1,1] take the vector path when available; blocks with a
+    // lane outside it take the per-element fallback
+    static inline const std::vector<std::array<double, 4>> kBlocks = {
+        {0.0, 0.25, -0.5, 1.0},
+        {-1.0, 0.999, -0.001, 0.7071},
+        {0.5, 2.0, -0.75, 0.1},
+        {-100.0, 3.0, 1e-9, -0.3},
+    };
+    static inline const std::vector<double> kTail = {0.3, -2.5, 50.0};
+};
+
+struct SinLookups {
+    static constexpr const char* kName = "Sin";
+
+    template <int Bits>
+    static auto Precise(int64_t x) -> int64_t {
+        return detail::LookupSin<Bits>(x);
+    }
+
+    static auto Precise(int64_t x, int bits) -> int64_t {
+        return detail::LookupSin(x, bits);
+    }
+
+    template <int Bits>
+    static auto Fast(int64_t x) -> int64_t {
+        return detail::LookupSinFast<Bits>(x);
+    }
+
+    static auto Fast(int64_t x, int bits) -> int64_t {
+        return detail::LookupSinFast(x, bits);
+    }
+
+    static auto FastX4(const int64_t* x, int64_t* out) -> void {
+        detail::LookupSinFastx4<32>(x, out);
+    }
+
+    static auto FastBatch(const int64_t* x, int64_t* out, size_t count) -> void {
+        detail::LookupSinFastBatch<32>(x, out, count);
+    }
+
+    // Every quadrant, both signs and angles past one turn
+    static inline const std::vector<std::array<double, 4>> kBlocks = {
+        {0.0, 0.5, -0.5, 1.5707963},
+        {3.14159, -3.14159, 4.0, -7.5},
+        {100.0, -1000.0, 1e-9, 4.712389},
+    };
+    static inline const std::vector<double> kTail = {-1e-9, 0.3, -50.0};
+};
+
+struct TanLookups {
+    static constexpr const char* kName = "Tan";
+
+    template <int Bits>
+    static auto Precise(int64_t x) -> int64_t {
+        return detail::LookupTan<Bits>(x);
+    }
+
+    static auto Precise(int64_t x, int bits) -> int64_t {
+        return detail::LookupTan(x, bits);
+    }
+
+    template <int Bits>
+    static auto Fast(int64_t x) -> int64_t {
+        return detail::LookupTanFast<Bits>(x);
+    }
+
+    static auto Fast(int64_t x, int bits) -> int64_t {
+        return detail::LookupTanFast(x, bits);
+    }
+
+    static auto FastX4(const int64_t* x, int64_t* out) -> void {
+        detail::LookupTanFastx4<32>(x, out);
+    }
+
+    static auto FastBatch(const int64_t* x, int64_t* out, size_t count) -> void {
+        detail::LookupTanFastBatch<32>(x, out, count);
+    }
+
+    // Both octants, both signs, the small-angle bound, the saturated pole and
+    // angles past one period
+    static inline const std::vector<std::array<double, 4>> kBlocks = {
+        {0.0, 0.5, -0.5, 0.7853981},
+        {1.0, -1.2, 1.5707963267948966, -1.5707963267948966},
+        {2.0, -3.0, 3.14159, 1e-9},
+        {4.0, -7.5, 100.0, 0.0009},
+    };
+    static inline const std::vector<double> kTail = {0.3, -0.0008, -50.0};
+};
+
+template <typename Lookups>
+class Fixed64VectorLookupTest : public ::testing::Test {
+ protected:
+    // The x4 blocks followed by the tail, which leaves three elements after
+    // the last block for the batch lookups
+    static auto Values() -> std::vector<double> {
+        std::vector<double> values;
+        for (const auto& block : Lookups::kBlocks) {
+            values.insert(values.end(), block.begin(), block.end());
+        }
+        values.insert(values.end(), Lookups::kTail.begin(), Lookups::kTail.end());
+        return values;
+    }
+
+    static auto Inputs() -> std::vector<int64_t> {
+        std::vector<int64_t> x;
+        for (double value : Values()) {
+            x.push_back(Fixed64<32>(value).value());
+        }
+        return x;
+    }
+};
+
+// Names the typed tests after the lookup family instead of its index
+class VectorLookupNames {
+ public:
+    template <typename Lookups>
+    static auto GetName(int /*index*/) -> std::string {
+        return Lookups::kName;
+    }
+};
+
+using VectorLookupTypes = ::testing::Types<AtanLookups, SinLookups, TanLookups>;
+TYPED_TEST_SUITE(Fixed64VectorLookupTest, VectorLookupTypes, VectorLookupNames);
+
+TYPED_TEST(Fixed64VectorLookupTest, Fastx4MatchesScalar) {
+    const std::vector<double> values = TestFixture::Values();
+    const std::vector<int64_t> x = TestFixture::Inputs();
+    for (size_t block = 0; block + 4 <= x.size(); block += 4) {
+        std::array<int64_t, 4> out{};
+        TypeParam::FastX4(x.data() + block, out.data());
+        for (size_t i = 0; i < out.size(); ++i) {
+            EXPECT_EQ(out[i], TypeParam::template Fast<32>(x[block + i]))
+                << "x4 should match the scalar lookup at " << values[block + i];
+        }
+    }
+}
+
+TYPED_TEST(Fixed64VectorLookupTest, FastBatchMatchesScalar) {
+    const std::vector<double> values = TestFixture::Values();
+    std::vector<int64_t> x = TestFixture::Inputs();
+    std::vector<int64_t> out(x.size());
+    TypeParam::FastBatch(x.data(), out.data(), x.size());
+    for (size_t i = 0; i < x.size(); ++i) {
+        EXPECT_EQ(out[i], TypeParam::template Fast<32>(x[i]))
+            << "Batch should match the scalar lookup at " << values[i];
+    }
+
+    // In place
+    TypeParam::FastBatch(x.data(), x.data(), x.size());
+    EXPECT_EQ(x, out);
+}
+
+TYPED_TEST(Fixed64VectorLookupTest, RuntimeFormatMatchesTemplate) {
+    // 16, 32 and 40 dispatch to their instantiation, 24 takes the generic conversion
+    for (double value : TestFixture::Values()) {
+        const int64_t x16 = Fixed64<16>(value).value();
+        const int64_t x24 = Fixed64<24>(value).value();
+        const int64_t x32 = Fixed64<32>(value).value();
+        const int64_t x40 = Fixed64<40>(value).value();
+        EXPECT_EQ(TypeParam::Precise(x16, 16), TypeParam::template Precise<16>(x16)) << value;
+        EXPECT_EQ(TypeParam::Precise(x24, 24), TypeParam::template Precise<24>(x24)) << value;
+        EXPECT_EQ(TypeParam::Precise(x32, 32), TypeParam::template Precise<32>(x32)) << value;
+        EXPECT_EQ(TypeParam::Precise(x40, 40), TypeParam::template Precise<40>(x40)) << value;
+        EXPECT_EQ(TypeParam::Fast(x24, 24), TypeParam::template Fast<24>(x24)) << value;
+        EXPECT_EQ(TypeParam::Fast(x40, 40), TypeParam::template Fast<40>(x40)) << value;
+    }
+}
+
+TEST_F(Fixed64TrigTest, SinBipartiteAccuracy) {
+    // The bipartite tables are an alternative to the Hermite ones at the same precision
+    for (double value = -40.0; value <= 40.0; value += 0.0137) {
+        const int64_t x = Fixed(value).value();
+        const double angle = static_cast<double>(x) / 4294967296.0;
+        const double result = static_cast<double>(detail::LookupSinBipartite<32>(x)) / 4294967296.0;
+        EXPECT_NEAR(result, std::sin(angle), 2e-9) << "angle " << angle;
+    }
+    EXPECT_EQ(detail::LookupSinBipartite<32>(Fixed::HalfPi().value()), int64_t{1} << 32);
+
+    const int64_t x16 = Fixed64<16>(2.5).value();
+    EXPECT_EQ(detail::LookupSinBipartite(x16, 16), detail::LookupSinBipartite<16>(x16));
+}
+
+TEST_F(Fixed64TrigTest, SinUnitPhase) {
+    // Q0.32 turns: the quadrant boundaries are exact
+    EXPECT_EQ(detail::LookupSinUnit(0x00000000u), 0);
+    EXPECT_EQ(detail::LookupSinUnit(0x40000000u), int64_t{1} << 32);
+    EXPECT_EQ(detail::LookupSinUnit(0x80000000u), 0);
+    EXPECT_EQ(detail::LookupSinUnit(0xC0000000u), -(int64_t{1} << 32));
+
+    // Sweep the whole turn with an odd stride so every quadrant and table interval is hit
+    for (uint64_t phase = 12345; phase < (uint64_t{1} << 32); phase += 0x00100007) {
+        const double angle = 2.0 * M_PI * static_cast<double>(phase) / 4294967296.0;
+        const double result =
+            static_cast<double>(detail::LookupSinUnit(static_cast<uint32_t>(phase))) / 4294967296.0;
+        EXPECT_NEAR(result, std::sin(angle), 1.5e-5) << "phase " << phase;
+    }
+}
+
 }  // namespace math::fp::tests
\ No newline at end of file